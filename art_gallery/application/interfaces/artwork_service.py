@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional, Union, BinaryIO
 from datetime import datetime
 from art_gallery.domain.artwork import Artwork, ArtworkType
+from art_gallery.repository.specifications.base_specification import Specification
 
 class IArtworkService(ABC):
     @abstractmethod
@@ -36,8 +37,8 @@ class IArtworkService(ABC):
         pass
         
     @abstractmethod
-    def get_artwork_image_url(self, artwork_id: int) -> Optional[str]:
-        """Получает URL изображения экспоната"""
+    def get_artwork_image_url(self, artwork_id: int, max_size: Optional[int] = None) -> Optional[str]:
+        """Получает URL изображения экспоната (наименьшей версии не меньше max_size пикселей, если задан)"""
         pass
 
     @abstractmethod
@@ -55,6 +56,11 @@ class IArtworkService(ABC):
         """Получает все экспонаты"""
         pass
 
+    @abstractmethod
+    def find_artworks(self, specification: Specification[Artwork]) -> List[Artwork]:
+        """Находит экспонаты по спецификации"""
+        pass
+
     @abstractmethod
     def filter_by_type(self, artwork_type: ArtworkType) -> List[Artwork]:
         """Фильтрует экспонаты по типу"""
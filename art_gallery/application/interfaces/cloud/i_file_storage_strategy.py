@@ -2,7 +2,9 @@
 Interface for file storage strategies.
 """
 from abc import ABC, abstractmethod
-from typing import Optional, Union, BinaryIO
+from typing import Iterable, Iterator, Optional, Union, BinaryIO
+
+from art_gallery.infrastructure.config.constants import DEFAULT_STREAM_CHUNK_SIZE
 
 
 class IFileStorageStrategy(ABC):
@@ -16,6 +18,10 @@ class IFileStorageStrategy(ABC):
         """
         Upload a file associated with an entity.
         
+        In content-addressed mode the file is stored once per content and the
+        upload of already stored content is skipped. When image derivatives are
+        enabled, thumbnails and web variants of the image are generated as well.
+        
         Args:
             entity_id: ID of the entity the file belongs to
             file_data: File contents as bytes or file-like object
@@ -27,12 +33,17 @@ class IFileStorageStrategy(ABC):
         pass
         
     @abstractmethod
-    def get_file_url(self, file_path: str) -> Optional[str]:
+    def get_file_url(self, file_path: str, max_size: Optional[int] = None) -> Optional[str]:
         """
         Get a URL to access the file.
         
+        When image derivatives are enabled and max_size is given, the URL of the
+        smallest derivative whose longest side covers max_size is returned
+        (generated on first request if missing); otherwise the original.
+        
         Args:
             file_path: Path or identifier of the file
+            max_size: Longest side in pixels the image is displayed at, None for the original
             
         Returns:
             Optional[str]: URL to access the file, or None if file not found
@@ -40,14 +51,51 @@ class IFileStorageStrategy(ABC):
         pass
         
     @abstractmethod
-    def delete_file(self, file_path: str) -> bool:
+    def stream_file(self, file_path: str, offset: int = 0, length: Optional[int] = None,
+                    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> Optional[Iterator[bytes]]:
+        """
+        Read a file (or a byte range of it) in chunks without loading it whole.
+        
+        Args:
+            file_path: Path or identifier of the file
+            offset: First byte to read
+            length: Number of bytes to read, None to read to the end of the file
+            chunk_size: Maximum size of a yielded chunk
+            
+        Returns:
+            Optional[Iterator[bytes]]: Chunks of the file data, or None if file not found
+        """
+        pass
+        
+    @abstractmethod
+    def delete_file(self, file_path: str, entity_id: Optional[int] = None) -> bool:
         """
         Delete a file.
         
+        Content-addressed files (see content_addressed mode of the strategies) may
+        be shared: only the entity's reference is dropped, and the file is
+        deleted with its last reference. Without entity_id they are kept.
+        
         Args:
             file_path: Path or identifier of the file
+            entity_id: ID of the entity the file belongs to
             
         Returns:
             bool: True if deletion was successful, False otherwise
         """
         pass
+        
+    @abstractmethod
+    def delete_entity_files(self, entity_id: int, file_paths: Iterable[str] = ()) -> bool:
+        """
+        Delete all files stored for an entity at once.
+        
+        Args:
+            entity_id: ID of the entity the files belong to
+            file_paths: Paths of other files to delete together with them
+                (e.g. a recorded path outside the entity's storage location)
+            
+        Returns:
+            bool: True if all files were deleted, False otherwise
+        """
+        pass
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from datetime import datetime
 from art_gallery.domain import Exhibition
+from art_gallery.repository.specifications.base_specification import Specification
 
 class IExhibitionService(ABC):
     @abstractmethod
@@ -45,6 +46,11 @@ class IExhibitionService(ABC):
         """Получает все выставки"""
         pass
 
+    @abstractmethod
+    def find_exhibitions(self, specification: Specification[Exhibition]) -> List[Exhibition]:
+        """Находит выставки по спецификации"""
+        pass
+
     @abstractmethod
     def get_active_exhibitions(self) -> List[Exhibition]:
         """Получает активные выставки"""
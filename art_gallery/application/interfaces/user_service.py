@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Optional, List
 from art_gallery.domain import User, UserRole # Добавили UserRole
 from datetime import datetime # Добавили datetime
+from art_gallery.repository.specifications.base_specification import Specification
 
 class IUserService(ABC):
 
@@ -32,6 +33,11 @@ class IUserService(ABC):
         """Получает список всех пользователей"""
         pass
 
+    @abstractmethod
+    def find_users(self, specification: Specification[User]) -> List[User]:
+        """Находит пользователей по спецификации"""
+        pass
+
     @abstractmethod
     def change_password(self, user_id: int, old_password: str, new_password: str) -> bool:
         """Изменяет пароль пользователя"""
@@ -0,0 +1,125 @@
+"""
+Выполнение запросов языка запросов.
+Фильтр передается в сервисы как спецификация (репозитории сами выбирают колоночный
+движок, параллельный просмотр или последовательный обход), сортировка с limit
+выполняется выбором k лучших через кучу без полной сортировки.
+"""
+import heapq
+import time
+from dataclasses import dataclass
+from enum import Enum
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from art_gallery.application.interfaces.artwork_service import IArtworkService
+from art_gallery.application.interfaces.exhibition_service import IExhibitionService
+from art_gallery.application.interfaces.user_service import IUserService
+from art_gallery.application.query.query_parser import ParsedQuery, QueryParser
+from art_gallery.repository.specifications.base_specification import Specification
+
+
+@dataclass
+class QueryResult:
+    """Результат запроса с замерами времени этапов (в секундах)"""
+    query: ParsedQuery
+    items: List[Any]
+    matched: int
+    parse_time: float
+    filter_time: float
+    select_time: float
+
+    @property
+    def total_time(self) -> float:
+        return self.parse_time + self.filter_time + self.select_time
+
+
+def _sort_key(attribute: str, descending: bool) -> Callable[[Any], Tuple[bool, Any]]:
+    """
+    Ключ сортировки по атрибуту. Пустые значения (None) всегда идут в конце,
+    перечисления сравниваются по значению.
+    """
+    get = attrgetter(attribute)
+
+    def key(item: Any) -> Tuple[bool, Any]:
+        value = get(item)
+        if value is None:
+            return (not descending, 0)
+        if isinstance(value, Enum):
+            value = value.value
+        return (descending, value)
+    return key
+
+
+def select(items: List[Any], order_by: Optional[str], descending: bool = False,
+           limit: Optional[int] = None) -> List[Any]:
+    """
+    Упорядочивает и ограничивает результат.
+    При заданном limit используется heapq.nsmallest/nlargest: O(n log k) вместо O(n log n).
+
+    Args:
+        items: Отфильтрованные сущности
+        order_by: Атрибут сортировки (None - порядок репозитория)
+        descending: Сортировка по убыванию
+        limit: Максимальное количество результатов
+
+    Returns:
+        List[Any]: Упорядоченный результат
+    """
+    if order_by is None:
+        return items if limit is None else items[:limit]
+
+    key = _sort_key(order_by, descending)
+    if limit is None:
+        return sorted(items, key=key, reverse=descending)
+    if limit == 0:
+        return []
+    if descending:
+        return heapq.nlargest(limit, items, key=key)
+    return heapq.nsmallest(limit, items, key=key)
+
+
+class QueryExecutor:
+    """Разбирает и выполняет запросы по экспонатам, выставкам и пользователям"""
+
+    def __init__(self, artwork_service: IArtworkService,
+                 exhibition_service: IExhibitionService,
+                 user_service: IUserService):
+        self._parser = QueryParser()
+        self._finders: Dict[str, Callable[[Specification], List[Any]]] = {
+            'artworks': artwork_service.find_artworks,
+            'exhibitions': exhibition_service.find_exhibitions,
+            'users': user_service.find_users
+        }
+
+    def execute(self, args: Sequence[str]) -> QueryResult:
+        """
+        Выполняет запрос.
+
+        Args:
+            args: Аргументы команды query, например
+                ['artworks', 'where', 'type=painting', 'order', 'by', 'year', 'desc', 'limit', '20']
+
+        Returns:
+            QueryResult: Результат и время выполнения этапов
+
+        Raises:
+            ValueError: Если запрос некорректен
+        """
+        started = time.perf_counter()
+        query = self._parser.parse(args)
+        parsed = time.perf_counter()
+
+        items = self._finders[query.entity](query.specification)
+        filtered = time.perf_counter()
+
+        selected = select(items, query.order_by, query.descending, query.limit)
+        finished = time.perf_counter()
+
+        return QueryResult(
+            query=query,
+            items=selected,
+            matched=len(items),
+            parse_time=parsed - started,
+            filter_time=filtered - parsed,
+            select_time=finished - filtered
+        )
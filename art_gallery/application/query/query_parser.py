@@ -0,0 +1,229 @@
+"""
+Разбор языка запросов.
+
+Грамматика (ключевые слова без учета регистра):
+    query     := entity [WHERE condition] [ORDER BY field [ASC|DESC]] [LIMIT n]
+    condition := term (OR term)*
+    term      := factor (AND factor)*
+    factor    := NOT factor | '(' condition ')' | comparison
+    comparison:= field op value | field BETWEEN value AND value | field CONTAINS value
+    op        := = | != | < | <= | > | >=
+
+Пример: artworks where type=painting and year between 1800 and 1900 order by year desc limit 20
+"""
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+from art_gallery.repository.specifications.base_specification import (
+    Specification,
+    AndSpecification,
+    OrSpecification,
+    NotSpecification,
+    TrueSpecification
+)
+from art_gallery.application.query.query_schema import SCHEMAS, COMPARISON_OPERATORS
+
+# Условие, записанное одним аргументом: year>=1800, type=painting
+_INLINE_COMPARISON = re.compile(r'^([A-Za-z_]\w*)(<=|>=|!=|=|<|>)(.*)$', re.DOTALL)
+
+_KEYWORDS = frozenset({'where', 'and', 'or', 'not', 'between', 'contains', 'order', 'by', 'asc', 'desc', 'limit'})
+
+
+@dataclass
+class ParsedQuery:
+    """Разобранный запрос: спецификация фильтра, сортировка и ограничение"""
+    entity: str
+    specification: Specification
+    order_by: Optional[str] = None
+    descending: bool = False
+    limit: Optional[int] = None
+
+
+class QuotedArgument(str):
+    """
+    Аргумент команды, записанный в кавычках (полностью или частично) или с экранированием.
+    Такой аргумент - литерал: он не может быть ключевым словом, а скобками считаются
+    только символы вне кавычек. raw - аргумент в том виде, как он был введен.
+    """
+
+    raw: str
+
+    def __new__(cls, value: str, raw: Optional[str] = None) -> 'QuotedArgument':
+        argument = super().__new__(cls, value)
+        argument.raw = value if raw is None else raw
+        return argument
+
+
+@dataclass(frozen=True)
+class _Token:
+    text: str
+    # Литерал (значение в кавычках или правая часть inline-условия) не может быть ключевым словом
+    literal: bool = False
+
+    def is_keyword(self, keyword: str) -> bool:
+        return not self.literal and self.text.lower() == keyword
+
+
+def tokenize(args: Sequence[str]) -> List[_Token]:
+    """
+    Разбивает аргументы команды на лексемы.
+    Аргументы уже разобраны shlex, поэтому значение в кавычках приходит одним аргументом
+    и сохраняет пробелы; такие аргументы разборщик команд передает как QuotedArgument.
+    """
+    tokens: List[_Token] = []
+    for arg in args:
+        # Скобки, прилегающие к словам: (type=painting or year<1900)
+        quoted = isinstance(arg, QuotedArgument)
+        if quoted:
+            # Скобки - только символы вне кавычек в начале и в конце введенного аргумента
+            raw = arg.raw.strip()
+            opening = len(raw) - len(raw.lstrip('('))
+            closing = len(raw) - len(raw.rstrip(')'))
+            arg = str(arg)[opening:len(arg) - closing]
+        else:
+            stripped = arg.lstrip('(')
+            opening = len(arg) - len(stripped) if stripped else 0
+            arg = arg[opening:]
+            closing = 0
+            while len(arg) > 1 and arg.endswith(')'):
+                closing += 1
+                arg = arg[:-1]
+        tokens.extend(_Token('(') for _ in range(opening))
+
+        match = _INLINE_COMPARISON.match(arg)
+        if match and match.group(3):
+            tokens.append(_Token(match.group(1)))
+            tokens.append(_Token(match.group(2)))
+            tokens.append(_Token(match.group(3), literal=True))
+        elif match:
+            # Значение отделено пробелом: year>= 1800
+            tokens.append(_Token(match.group(1)))
+            tokens.append(_Token(match.group(2)))
+        else:
+            tokens.append(_Token(arg, literal=quoted))
+        tokens.extend(_Token(')') for _ in range(closing))
+    return tokens
+
+
+class QueryParser:
+    """Рекурсивный нисходящий разбор запроса в ParsedQuery"""
+
+    def parse(self, args: Sequence[str]) -> ParsedQuery:
+        """
+        Разбирает запрос.
+
+        Args:
+            args: Аргументы команды query
+
+        Returns:
+            ParsedQuery: Разобранный запрос
+
+        Raises:
+            ValueError: Если запрос некорректен
+        """
+        self._tokens = tokenize(args)
+        self._position = 0
+
+        entity_token = self._next("entity name")
+        schema = SCHEMAS.get(entity_token.text.lower())
+        if schema is None:
+            raise ValueError(f"Unknown entity '{entity_token.text}', expected one of: {', '.join(SCHEMAS)}")
+        self._schema = schema
+        query = ParsedQuery(entity=schema.name, specification=TrueSpecification())
+
+        if self._accept('where'):
+            query.specification = self._parse_or()
+        if self._accept('order'):
+            self._expect('by')
+            field_name = self._next("field name").text
+            query_field = schema.get_field(field_name)
+            if not query_field.sortable:
+                raise ValueError(f"Cannot order by field '{query_field.name}'")
+            query.order_by = query_field.attribute
+            if self._accept('desc'):
+                query.descending = True
+            else:
+                self._accept('asc')
+        if self._accept('limit'):
+            limit_text = self._next("limit value").text
+            if not limit_text.isdigit():
+                raise ValueError(f"Limit must be a non-negative integer, got '{limit_text}'")
+            query.limit = int(limit_text)
+
+        if self._peek() is not None:
+            raise ValueError(f"Unexpected '{self._peek().text}'")
+        return query
+
+    # --- Лексемы ---
+
+    def _peek(self) -> Optional[_Token]:
+        if self._position < len(self._tokens):
+            return self._tokens[self._position]
+        return None
+
+    def _next(self, expected: str) -> _Token:
+        token = self._peek()
+        if token is None:
+            raise ValueError(f"Unexpected end of query, expected {expected}")
+        self._position += 1
+        return token
+
+    def _accept(self, keyword: str) -> bool:
+        token = self._peek()
+        if token is not None and token.is_keyword(keyword):
+            self._position += 1
+            return True
+        return False
+
+    def _expect(self, keyword: str) -> None:
+        if not self._accept(keyword):
+            token = self._peek()
+            found = f"'{token.text}'" if token else "end of query"
+            raise ValueError(f"Expected '{keyword.upper()}', found {found}")
+
+    # --- Условия ---
+
+    def _parse_or(self) -> Specification:
+        specifications = [self._parse_and()]
+        while self._accept('or'):
+            specifications.append(self._parse_and())
+        return specifications[0] if len(specifications) == 1 else OrSpecification(*specifications)
+
+    def _parse_and(self) -> Specification:
+        specifications = [self._parse_factor()]
+        while self._accept('and'):
+            specifications.append(self._parse_factor())
+        return specifications[0] if len(specifications) == 1 else AndSpecification(*specifications)
+
+    def _parse_factor(self) -> Specification:
+        if self._accept('not'):
+            return NotSpecification(self._parse_factor())
+        token = self._peek()
+        if token is not None and token.text == '(' and not token.literal:
+            self._position += 1
+            specification = self._parse_or()
+            closing = self._next("')'")
+            if closing.text != ')':
+                raise ValueError(f"Expected ')', found '{closing.text}'")
+            return specification
+        return self._parse_comparison()
+
+    def _parse_comparison(self) -> Specification:
+        field_token = self._next("field name")
+        if not field_token.literal and field_token.text.lower() in _KEYWORDS:
+            raise ValueError(f"Expected field name, found '{field_token.text}'")
+        query_field = self._schema.get_field(field_token.text)
+
+        op_token = self._next("operator")
+        op = op_token.text.lower()
+        if op == 'between' and not op_token.literal:
+            low = self._next("lower bound").text
+            self._expect('and')
+            high = self._next("upper bound").text
+            return query_field.build_specification('between', [low, high])
+        if op == 'contains' and not op_token.literal:
+            return query_field.build_specification('contains', [self._next("value").text])
+        if op in COMPARISON_OPERATORS and not op_token.literal:
+            return query_field.build_specification(op, [self._next("value").text])
+        raise ValueError(f"Expected operator after '{field_token.text}', found '{op_token.text}'")
@@ -0,0 +1,252 @@
+"""
+Описание сущностей, доступных в языке запросов: поля, преобразование литералов
+и перевод условий в спецификации. Для условий, которые умеют обслуживать
+специализированные спецификации (колоночный движок, индексы), строится именно
+такая спецификация, остальные сводятся к универсальным сравнениям по атрибуту.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Type
+
+from art_gallery.domain import ArtworkType, UserRole
+from art_gallery.repository.specifications.base_specification import (
+    Specification,
+    AndSpecification,
+    NotSpecification
+)
+from art_gallery.repository.specifications.field_specifications import (
+    FieldComparisonSpecification,
+    FieldContainsSpecification
+)
+from art_gallery.repository.specifications.artwork_specifications import (
+    ArtworkByTypeSpecification,
+    ArtworkByYearRangeSpecification,
+    ArtworkCreatedBetweenSpecification,
+    ArtworkByArtistSpecification,
+    ArtworkDescriptionContainsSpecification
+)
+from art_gallery.repository.specifications.exhibition_specifications import (
+    ActiveExhibitionSpecification,
+    HasArtworkSpecification
+)
+
+# Операторы сравнения языка запросов и соответствующие имена из модуля operator
+COMPARISON_OPERATORS: Dict[str, str] = {
+    '=': 'eq',
+    '!=': 'ne',
+    '<': 'lt',
+    '<=': 'le',
+    '>': 'gt',
+    '>=': 'ge'
+}
+
+ORDERED_OPERATORS: FrozenSet[str] = frozenset(COMPARISON_OPERATORS)
+EQUALITY_OPERATORS: FrozenSet[str] = frozenset({'=', '!='})
+
+# Построитель спецификации для условия: (оператор, значения) -> спецификация или None
+SpecificationBuilder = Callable[[str, List[Any]], Optional[Specification]]
+
+
+def parse_int(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"Expected an integer, got '{value}'")
+
+
+def parse_datetime(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Expected a date in ISO format (YYYY-MM-DD[THH:MM]), got '{value}'")
+
+
+def parse_bool(value: str) -> bool:
+    lowered = value.lower()
+    if lowered in ('true', 'yes', '1'):
+        return True
+    if lowered in ('false', 'no', '0'):
+        return False
+    raise ValueError(f"Expected true or false, got '{value}'")
+
+
+def enum_parser(enum_type: Type[Enum]) -> Callable[[str], Enum]:
+    def parse(value: str) -> Enum:
+        for member in enum_type:
+            if member.value == value.lower() or member.name == value.upper():
+                return member
+        allowed = ', '.join(member.value for member in enum_type)
+        raise ValueError(f"Unknown value '{value}', expected one of: {allowed}")
+    return parse
+
+
+@dataclass(frozen=True)
+class QueryField:
+    """
+    Поле сущности в языке запросов.
+
+    Attributes:
+        name: Имя поля в запросе
+        attribute: Имя атрибута сущности (None - поле вычисляемое и доступно только через builder)
+        parse: Преобразование литерала из запроса в значение поля
+        operators: Допустимые операторы сравнения
+        supports_contains: Поддерживается ли оператор contains
+        sortable: Можно ли сортировать по полю
+        builder: Построитель специализированной спецификации (None - универсальное сравнение)
+    """
+    name: str
+    attribute: Optional[str]
+    parse: Callable[[str], Any] = str
+    operators: FrozenSet[str] = ORDERED_OPERATORS
+    supports_contains: bool = False
+    sortable: bool = True
+    builder: Optional[SpecificationBuilder] = None
+
+    def build_specification(self, op: str, raw_values: List[str]) -> Specification:
+        """
+        Строит спецификацию для условия над полем.
+
+        Args:
+            op: Оператор (=, !=, <, <=, >, >=, between, contains)
+            raw_values: Литералы из запроса (два для between, иначе один)
+
+        Returns:
+            Specification: Спецификация условия
+        """
+        if op == 'contains':
+            if not self.supports_contains:
+                raise ValueError(f"Field '{self.name}' does not support 'contains'")
+            values = list(raw_values)
+        else:
+            if op == 'between':
+                if not {'>=', '<='} <= self.operators:
+                    raise ValueError(f"Field '{self.name}' does not support 'between'")
+            elif op not in self.operators:
+                raise ValueError(f"Operator '{op}' is not supported for field '{self.name}'")
+            values = [self.parse(value) for value in raw_values]
+
+        if self.builder is not None:
+            specification = self.builder(op, values)
+            if specification is not None:
+                return specification
+        if self.attribute is None:
+            raise ValueError(f"Operator '{op}' is not supported for field '{self.name}'")
+
+        if op == 'contains':
+            return FieldContainsSpecification(self.attribute, values[0])
+        if op == 'between':
+            return AndSpecification(
+                FieldComparisonSpecification(self.attribute, 'ge', values[0]),
+                FieldComparisonSpecification(self.attribute, 'le', values[1])
+            )
+        return FieldComparisonSpecification(self.attribute, COMPARISON_OPERATORS[op], values[0])
+
+
+@dataclass(frozen=True)
+class EntitySchema:
+    """Сущность, по которой можно выполнять запросы"""
+    name: str
+    fields: Dict[str, QueryField] = field(default_factory=dict)
+
+    def get_field(self, name: str) -> QueryField:
+        query_field = self.fields.get(name.lower())
+        if query_field is None:
+            allowed = ', '.join(self.fields)
+            raise ValueError(f"Unknown field '{name}' for {self.name}, expected one of: {allowed}")
+        return query_field
+
+
+def _schema(name: str, *fields: QueryField) -> EntitySchema:
+    return EntitySchema(name, {query_field.name: query_field for query_field in fields})
+
+
+# --- Специализированные спецификации экспонатов ---
+
+def _artwork_type(op: str, values: List[Any]) -> Optional[Specification]:
+    specification = ArtworkByTypeSpecification(values[0])
+    return specification if op == '=' else NotSpecification(specification)
+
+
+def _artwork_year(op: str, values: List[Any]) -> Optional[Specification]:
+    ranges = {
+        '=': (values[0], values[0]),
+        '<=': (None, values[0]),
+        '<': (None, values[0] - 1),
+        '>=': (values[0], None),
+        '>': (values[0] + 1, None),
+        'between': tuple(values)
+    }
+    if op not in ranges:
+        return None
+    return ArtworkByYearRangeSpecification(*ranges[op])
+
+
+def _artwork_created_at(op: str, values: List[Any]) -> Optional[Specification]:
+    ranges = {
+        '<=': (None, values[0]),
+        '>=': (values[0], None),
+        'between': tuple(values)
+    }
+    if op not in ranges:
+        return None
+    return ArtworkCreatedBetweenSpecification(*ranges[op])
+
+
+def _artwork_artist(op: str, values: List[Any]) -> Optional[Specification]:
+    return ArtworkByArtistSpecification(values[0]) if op == '=' else None
+
+
+def _artwork_description(op: str, values: List[Any]) -> Optional[Specification]:
+    return ArtworkDescriptionContainsSpecification(values[0]) if op == 'contains' else None
+
+
+# --- Специализированные спецификации выставок ---
+
+def _exhibition_active(op: str, values: List[Any]) -> Optional[Specification]:
+    specification = ActiveExhibitionSpecification()
+    return specification if (op == '=') == values[0] else NotSpecification(specification)
+
+
+def _exhibition_artwork(op: str, values: List[Any]) -> Optional[Specification]:
+    specification = HasArtworkSpecification(values[0])
+    return specification if op == '=' else NotSpecification(specification)
+
+
+SCHEMAS: Dict[str, EntitySchema] = {
+    schema.name: schema for schema in (
+        _schema(
+            'artworks',
+            QueryField('id', 'id', parse_int),
+            QueryField('title', 'title', supports_contains=True),
+            QueryField('artist', 'artist', supports_contains=True, builder=_artwork_artist),
+            QueryField('year', 'year', parse_int, builder=_artwork_year),
+            QueryField('description', 'description', supports_contains=True, builder=_artwork_description),
+            QueryField('type', 'type', enum_parser(ArtworkType), EQUALITY_OPERATORS, builder=_artwork_type),
+            QueryField('created_at', 'created_at', parse_datetime, builder=_artwork_created_at)
+        ),
+        _schema(
+            'exhibitions',
+            QueryField('id', 'id', parse_int),
+            QueryField('title', 'title', supports_contains=True),
+            QueryField('description', 'description', supports_contains=True),
+            QueryField('start_date', 'start_date', parse_datetime),
+            QueryField('end_date', 'end_date', parse_datetime),
+            QueryField('created_at', 'created_at', parse_datetime),
+            QueryField('max_capacity', 'max_capacity', parse_int),
+            QueryField('active', None, parse_bool, EQUALITY_OPERATORS, sortable=False,
+                       builder=_exhibition_active),
+            QueryField('artwork', None, parse_int, EQUALITY_OPERATORS, sortable=False,
+                       builder=_exhibition_artwork)
+        ),
+        _schema(
+            'users',
+            QueryField('id', 'id', parse_int),
+            QueryField('username', 'username', supports_contains=True),
+            QueryField('role', 'role', enum_parser(UserRole), EQUALITY_OPERATORS),
+            QueryField('active', 'is_active', parse_bool, EQUALITY_OPERATORS),
+            QueryField('created_at', 'created_at', parse_datetime),
+            QueryField('last_login', 'last_login', parse_datetime)
+        )
+    )
+}
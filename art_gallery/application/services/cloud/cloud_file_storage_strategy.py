@@ -2,26 +2,47 @@
 Cloud file storage strategy implementation.
 """
 import logging
-from typing import Optional, Union, BinaryIO
+import mimetypes
+import os
+import pathlib
+import tempfile
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional, Set, Union, BinaryIO
 
 from art_gallery.application.interfaces.cloud.i_file_storage_strategy import IFileStorageStrategy
 from art_gallery.infrastructure.interfaces.cloud.i_storage_service import IStorageService
-from art_gallery.exceptions.cloud_exceptions import CloudStorageError
+from art_gallery.infrastructure.cloud.content_store import ContentAddressedStore, is_content_path
+from art_gallery.infrastructure.config.constants import DEFAULT_STREAM_CHUNK_SIZE
+from art_gallery.infrastructure.imaging.derivatives import (
+    DERIVATIVE_SPECS,
+    DerivativeGenerator,
+    derivative_path,
+    select_spec
+)
+from art_gallery.exceptions.cloud_exceptions import CloudStorageError, ObjectNotFoundError
 
 
 class CloudFileStorageStrategy(IFileStorageStrategy):
     """Implementation of file storage strategy that uses cloud storage service."""
     
-    def __init__(self, storage_service: IStorageService, default_bucket_name: str):
+    def __init__(self, storage_service: IStorageService, default_bucket_name: str,
+                 content_addressed: bool = False, derivatives: Optional[DerivativeGenerator] = None):
         """
         Initialize cloud file storage strategy.
         
         Args:
             storage_service: Storage service implementation for cloud storage
             default_bucket_name: The default bucket name to use for operations
+            content_addressed: Store files once per content under sha256/ instead of per entity
+            derivatives: Generator of image thumbnails and web variants, None to serve originals only
         """
         self.storage_service = storage_service
         self.default_bucket_name = default_bucket_name
+        self.content_addressed = content_addressed
+        self.derivatives = derivatives
+        self.content_store = ContentAddressedStore(storage_service, default_bucket_name)
+        # Derivatives known to be stored: repeated requests for them don't check the bucket
+        self._stored_variants: Set[str] = set()
         self.logger = logging.getLogger(__name__)
     
     def upload_file(self, entity_id: int, file_data: Union[bytes, BinaryIO], filename: str) -> Optional[str]:
@@ -37,20 +58,24 @@ class CloudFileStorageStrategy(IFileStorageStrategy):
             Optional[str]: Path to the stored file or None if failed
         """
         try:
-            # Convert entity_id to string for the cloud storage
-            entity_id_str = str(entity_id)
-            
             # Формируем путь для хранения файла
-            object_path = f"artworks/{entity_id_str}/{filename}"
+            object_path = f"{self._entity_prefix(entity_id)}{filename}"
             
             # Определяем тип контента на основе расширения файла
-            content_type = "application/octet-stream"  # По умолчанию
-            if filename.lower().endswith(('.jpg', '.jpeg')):
-                content_type = "image/jpeg"
-            elif filename.lower().endswith('.png'):
-                content_type = "image/png"
-            elif filename.lower().endswith('.gif'):
-                content_type = "image/gif"
+            # (в том числе image/tiff для сканов высокого разрешения)
+            content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+            
+            # Начало данных, чтобы после загрузки прочитать их для производных изображений
+            start = file_data.tell() if self._has_derivatives(content_type) and self._seekable(file_data) else None
+            
+            if self.content_addressed:
+                # Одинаковое содержимое хранится один раз, повторная загрузка пропускается
+                object_path = self.content_store.store(file_data, filename, content_type, str(entity_id))
+                self.logger.info(f"Stored content-addressed file for entity {entity_id}: {object_path}")
+                # Производные общего содержимого уже созданы при его первой загрузке
+                if self._has_derivatives(content_type) and not self._derivatives_exist(object_path):
+                    self._store_upload_derivatives(object_path, file_data, start)
+                return object_path
             
             # Используем storage_service для загрузки файла
             success = self.storage_service.upload_data(
@@ -62,6 +87,8 @@ class CloudFileStorageStrategy(IFileStorageStrategy):
             
             if success:
                 self.logger.info(f"Successfully uploaded file for entity {entity_id} to cloud storage")
+                if self._has_derivatives(content_type):
+                    self._store_upload_derivatives(object_path, file_data, start)
                 # Возвращаем путь к файлу в облачном хранилище
                 return object_path
             else:
@@ -75,17 +102,31 @@ class CloudFileStorageStrategy(IFileStorageStrategy):
             self.logger.error(f"Unexpected error uploading file for entity {entity_id}: {str(e)}")
             return None
     
-    def get_file_url(self, file_path: str) -> Optional[str]:
+    def get_file_url(self, file_path: str, max_size: Optional[int] = None) -> Optional[str]:
         """
         Get a URL to access the file from cloud storage.
         
+        If the storage service keeps local copies (media cache enabled), a file://
+        URL of the up-to-date local copy is returned, so viewing an unchanged
+        image doesn't download it again.
+        
         Args:
             file_path: Path to the file in cloud storage
+            max_size: Longest side in pixels the image is displayed at, None for the original
             
         Returns:
             Optional[str]: URL to the file or None if not found
         """
         try:
+            file_path = self._variant_path(file_path, max_size)
+            
+            try:
+                local_path = self.storage_service.get_local_path(self.default_bucket_name, file_path)
+                if local_path:
+                    return pathlib.Path(local_path).resolve().as_uri()
+            except CloudStorageError as e:
+                self.logger.warning(f"Local copy of {file_path} is unavailable, using a presigned URL: {str(e)}")
+            
             # Весь URL, включая имя бакета и объекта
             url = self.storage_service.get_object_url(
                 bucket_name=self.default_bucket_name,
@@ -107,21 +148,55 @@ class CloudFileStorageStrategy(IFileStorageStrategy):
             self.logger.error(f"Unexpected error getting URL for file {file_path}: {str(e)}")
             return None
     
-    def delete_file(self, file_path: str) -> bool:
+    def stream_file(self, file_path: str, offset: int = 0, length: Optional[int] = None,
+                    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> Optional[Iterator[bytes]]:
+        """
+        Read a file (or a byte range of it) from cloud storage in chunks.
+        
+        Args:
+            file_path: Path to the file in cloud storage
+            offset: First byte to read
+            length: Number of bytes to read, None to read to the end of the file
+            chunk_size: Maximum size of a yielded chunk
+            
+        Returns:
+            Optional[Iterator[bytes]]: Chunks of the file data or None if not found
+        """
+        try:
+            return self.storage_service.stream_data(
+                bucket_name=self.default_bucket_name,
+                object_name=file_path,
+                offset=offset,
+                length=length,
+                chunk_size=chunk_size
+            )
+        except ObjectNotFoundError:
+            self.logger.warning(f"File not found in cloud storage: {file_path}")
+            return None
+        except CloudStorageError as e:
+            self.logger.error(f"Cloud storage error reading file {file_path}: {str(e)}")
+            return None
+    
+    def delete_file(self, file_path: str, entity_id: Optional[int] = None) -> bool:
         """
         Delete a file from cloud storage.
         
         Args:
             file_path: Path to the file in cloud storage
+            entity_id: ID of the entity the file belongs to (releases shared content)
             
         Returns:
             bool: True if deleted successfully
         """
         try:
+            if is_content_path(file_path):
+                return self._release_content(file_path, entity_id)
+            
             success = self.storage_service.delete_object(
                 bucket_name=self.default_bucket_name,
                 object_name=file_path
             )
+            self._delete_derivatives(file_path)
             
             if success:
                 self.logger.info(f"Successfully deleted file: {file_path}")
@@ -136,3 +211,192 @@ class CloudFileStorageStrategy(IFileStorageStrategy):
         except Exception as e:
             self.logger.error(f"Unexpected error deleting file {file_path}: {str(e)}")
             return False
+
+    def delete_entity_files(self, entity_id: int, file_paths: Iterable[str] = ()) -> bool:
+        """
+        Delete all files of an entity from cloud storage.
+        
+        The entity's objects are listed once and deleted with multi-object
+        delete requests (one per 1000 objects) instead of a request per file.
+        
+        Args:
+            entity_id: ID of the entity the files belong to
+            file_paths: Paths of other files to delete together with them
+            
+        Returns:
+            bool: True if all files were deleted
+        """
+        try:
+            object_names = self.storage_service.list_objects(self.default_bucket_name, self._entity_prefix(entity_id))
+            success = True
+            for path in file_paths:
+                if not path:
+                    continue
+                if is_content_path(path):
+                    # Shared content is deleted only with its last reference
+                    success = self._release_content(path, entity_id) and success
+                else:
+                    object_names.append(path)
+                    object_names.extend(self._derivative_paths(path))
+            if not object_names:
+                return success
+            self._stored_variants.difference_update(object_names)
+            failed = self.storage_service.delete_objects(self.default_bucket_name, object_names)
+            if failed:
+                self.logger.error(f"Failed to delete {len(failed)} files of entity {entity_id}: {failed}")
+                return False
+            self.logger.info(f"Deleted {len(object_names)} files of entity {entity_id}")
+            return success
+        except CloudStorageError as e:
+            self.logger.error(f"Cloud storage error deleting files of entity {entity_id}: {str(e)}")
+            return False
+        except Exception as e:
+            self.logger.error(f"Unexpected error deleting files of entity {entity_id}: {str(e)}")
+            return False
+
+    def _release_content(self, file_path: str, entity_id: Optional[int]) -> bool:
+        """Drop the entity's reference to content-addressed file."""
+        if entity_id is None:
+            self.logger.warning(f"Content-addressed file {file_path} kept: owner not specified")
+            return True
+        if self.content_store.release(file_path, str(entity_id)):
+            self._delete_derivatives(file_path)
+        return True
+
+    def _has_derivatives(self, content_type: str) -> bool:
+        """Check whether derivatives are generated for files of the content type."""
+        return self.derivatives is not None and content_type.startswith("image/")
+
+    def _variant_path(self, file_path: str, max_size: Optional[int]) -> str:
+        """
+        Path of the smallest derivative covering max_size, generating it if missing.
+        
+        Falls back to the original when derivatives are disabled, the original is
+        the only adequate variant or the derivative can't be generated.
+        """
+        if self.derivatives is None:
+            return file_path
+        spec = select_spec(max_size, self.derivatives.specs)
+        if spec is None:
+            return file_path
+        variant = derivative_path(file_path, spec)
+        if variant in self._stored_variants:
+            return variant
+        try:
+            if self.storage_service.object_exists(self.default_bucket_name, variant):
+                self._stored_variants.add(variant)
+                return variant
+            local_path = self.storage_service.get_local_path(self.default_bucket_name, file_path)
+            if local_path is not None:
+                stored = self._store_derivatives(file_path, local_path)
+            else:
+                # The original is streamed to a temporary file instead of being held in memory
+                chunks = self.storage_service.stream_data(self.default_bucket_name, file_path)
+                with self._spooled(chunks) as spool_path:
+                    stored = self._store_derivatives(file_path, spool_path)
+        except (CloudStorageError, OSError) as e:
+            self.logger.warning(f"Derivative of {file_path} is unavailable, using the original: {str(e)}")
+            return file_path
+        return variant if stored else file_path
+
+    def _store_upload_derivatives(self, file_path: str, file_data: Union[bytes, BinaryIO],
+                                  start: Optional[int]) -> None:
+        """Generate the derivatives of an uploaded image from a temporary copy of its data."""
+        chunks = self._reread(file_data, start)
+        if chunks is None:
+            return
+        try:
+            with self._spooled(chunks) as spool_path:
+                self._store_derivatives(file_path, spool_path)
+        except OSError as e:
+            self.logger.warning(f"Failed to generate derivatives of {file_path}: {str(e)}")
+
+    def _store_derivatives(self, file_path: str, source_path: str) -> bool:
+        """Generate and upload the derivatives of an image stored in a local file."""
+        try:
+            variants = self.derivatives.generate(source_path)
+            for spec in self.derivatives.specs:
+                variant = derivative_path(file_path, spec)
+                self.storage_service.upload_data(self.default_bucket_name, variant, variants[spec.name], "image/jpeg")
+                self._stored_variants.add(variant)
+        except Exception as e:
+            self.logger.warning(f"Failed to generate derivatives of {file_path}: {str(e)}")
+            return False
+        self.logger.info(f"Stored derivatives of {file_path}")
+        return True
+
+    def _derivatives_exist(self, file_path: str) -> bool:
+        """Check whether the largest derivative of an image is stored."""
+        variant = derivative_path(file_path, self.derivatives.specs[-1])
+        if variant in self._stored_variants:
+            return True
+        try:
+            exists = self.storage_service.object_exists(self.default_bucket_name, variant)
+        except CloudStorageError:
+            return False
+        if exists:
+            self._stored_variants.add(variant)
+        return exists
+
+    def _delete_derivatives(self, file_path: str) -> None:
+        """Delete the derivatives of a deleted image (missing ones are ignored)."""
+        variants = self._derivative_paths(file_path)
+        self._stored_variants.difference_update(variants)
+        try:
+            failed = self.storage_service.delete_objects(self.default_bucket_name, variants)
+        except CloudStorageError as e:
+            failed = [str(e)]
+        if failed:
+            self.logger.warning(f"Failed to delete derivatives of {file_path}: {failed}")
+
+    def _derivative_paths(self, file_path: str) -> List[str]:
+        """Paths of all derivatives an image may have."""
+        specs = self.derivatives.specs if self.derivatives is not None else DERIVATIVE_SPECS
+        return [derivative_path(file_path, spec) for spec in specs]
+
+    @staticmethod
+    def _seekable(file_data: Union[bytes, BinaryIO]) -> bool:
+        """Check whether uploaded data can be read again."""
+        if isinstance(file_data, bytes):
+            return False
+        try:
+            return file_data.seekable()
+        except (AttributeError, ValueError):
+            return False
+
+    @staticmethod
+    def _reread(file_data: Union[bytes, BinaryIO], start: Optional[int]) -> Optional[Iterable[bytes]]:
+        """Read uploaded data again: bytes as is, a seekable stream in chunks from its start position."""
+        if isinstance(file_data, bytes):
+            return (file_data,)
+        if start is None:
+            # Derivatives of a non-seekable stream are generated on first request
+            return None
+        file_data.seek(start)
+        return iter(lambda: file_data.read(DEFAULT_STREAM_CHUNK_SIZE), b'')
+
+    @staticmethod
+    @contextmanager
+    def _spooled(chunks: Iterable[bytes]) -> Iterator[str]:
+        """
+        Write data to a temporary file, removed on exit.
+
+        Derivatives are generated from the file path, so large originals are
+        neither kept in memory nor pickled to the worker processes.
+        """
+        fd, spool_path = tempfile.mkstemp(suffix='.original')
+        try:
+            with os.fdopen(fd, 'wb') as spool:
+                for chunk in chunks:
+                    spool.write(chunk)
+            yield spool_path
+        finally:
+            try:
+                os.remove(spool_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _entity_prefix(entity_id: int) -> str:
+        """Object name prefix of an entity's files."""
+        return f"artworks/{entity_id}/"
@@ -4,23 +4,40 @@ Local file storage strategy implementation.
 import os
 import uuid
 import shutil
+import hashlib
 import logging
-from typing import Optional, Union, BinaryIO
+import tempfile
+import mimetypes
+from typing import Iterable, Iterator, Optional, Union, BinaryIO
 
 from art_gallery.application.interfaces.cloud.i_file_storage_strategy import IFileStorageStrategy
+from art_gallery.infrastructure.config.constants import DEFAULT_STREAM_CHUNK_SIZE
+from art_gallery.infrastructure.cloud.content_store import REFS_SUFFIX, content_path, is_content_path
+from art_gallery.infrastructure.cloud.streams import HASH_BLOCK_SIZE
+from art_gallery.infrastructure.imaging.derivatives import (
+    DERIVATIVE_SPECS,
+    DerivativeGenerator,
+    derivative_path,
+    select_spec
+)
 
 
 class LocalFileStorageStrategy(IFileStorageStrategy):
     """Implementation of file storage strategy that uses local filesystem."""
     
-    def __init__(self, base_path: str):
+    def __init__(self, base_path: str, content_addressed: bool = False,
+                 derivatives: Optional[DerivativeGenerator] = None):
         """
         Initialize local file storage strategy.
         
         Args:
             base_path: Base directory path for storing files
+            content_addressed: Store files once per content under sha256/ instead of per entity
+            derivatives: Generator of image thumbnails and web variants, None to serve originals only
         """
         self.base_path = os.path.abspath(base_path)
+        self.content_addressed = content_addressed
+        self.derivatives = derivatives
         self.logger = logging.getLogger(__name__)
         
         # Create base directory if it doesn't exist
@@ -46,6 +63,14 @@ class LocalFileStorageStrategy(IFileStorageStrategy):
             if not file_extension:
                 file_extension = ".jpg"  # Default extension
             
+            if self.content_addressed:
+                rel_path = self._store_content(entity_id, file_data, f"file{file_extension}")
+                # Derivatives of shared content are created with its first upload
+                if self._has_derivatives(rel_path) and not os.path.isfile(
+                        os.path.join(self.base_path, derivative_path(rel_path, self.derivatives.specs[-1]))):
+                    self._store_derivatives(rel_path)
+                return rel_path
+            
             # Create entity directory if needed
             entity_dir = os.path.join(self.base_path, f"artwork_{entity_id}")
             if not os.path.exists(entity_dir):
@@ -68,6 +93,9 @@ class LocalFileStorageStrategy(IFileStorageStrategy):
             rel_path = os.path.join(f"artwork_{entity_id}", unique_filename)
             rel_path = rel_path.replace('\\', '/')  # Normalize path separators
             
+            if self._has_derivatives(rel_path):
+                self._store_derivatives(rel_path)
+            
             self.logger.info(f"Stored file for entity {entity_id} at {rel_path}")
             return rel_path
             
@@ -75,18 +103,21 @@ class LocalFileStorageStrategy(IFileStorageStrategy):
             self.logger.error(f"Failed to store file for entity {entity_id}: {str(e)}")
             return None
     
-    def get_file_url(self, file_path: str) -> Optional[str]:
+    def get_file_url(self, file_path: str, max_size: Optional[int] = None) -> Optional[str]:
         """
         Get a URL or file path to access the file.
         For local storage, this returns a file:// URL.
         
         Args:
             file_path: Relative path to the file
+            max_size: Longest side in pixels the image is displayed at, None for the original
             
         Returns:
             Optional[str]: URL to the file or None if not found
         """
         try:
+            file_path = self._variant_path(file_path, max_size)
+            
             # Convert to absolute path and check if file exists
             abs_path = os.path.join(self.base_path, file_path)
             if not os.path.isfile(abs_path):
@@ -104,17 +135,60 @@ class LocalFileStorageStrategy(IFileStorageStrategy):
             self.logger.error(f"Failed to get URL for file {file_path}: {str(e)}")
             return None
     
-    def delete_file(self, file_path: str) -> bool:
+    def stream_file(self, file_path: str, offset: int = 0, length: Optional[int] = None,
+                    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> Optional[Iterator[bytes]]:
+        """
+        Read a file (or a byte range of it) from local storage in chunks.
+        
+        Args:
+            file_path: Relative path to the file
+            offset: First byte to read
+            length: Number of bytes to read, None to read to the end of the file
+            chunk_size: Maximum size of a yielded chunk
+            
+        Returns:
+            Optional[Iterator[bytes]]: Chunks of the file data or None if not found
+        """
+        if offset < 0 or (length is not None and length < 0):
+            raise ValueError(f"Invalid range: offset={offset}, length={length}")
+        abs_path = os.path.join(self.base_path, file_path)
+        try:
+            # The file is opened here so a missing file is reported by the call
+            file = open(abs_path, 'rb')
+        except OSError as e:
+            self.logger.warning(f"File not found: {abs_path} ({e})")
+            return None
+        return self._iter_file(file, offset, length, chunk_size)
+
+    @staticmethod
+    def _iter_file(file: BinaryIO, offset: int, length: Optional[int], chunk_size: int) -> Iterator[bytes]:
+        """Yield a byte range of an open file and close it."""
+        with file:
+            file.seek(offset)
+            remaining = length
+            while remaining is None or remaining > 0:
+                chunk = file.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+    
+    def delete_file(self, file_path: str, entity_id: Optional[int] = None) -> bool:
         """
         Delete a file from local storage.
         
         Args:
             file_path: Relative path to the file
+            entity_id: ID of the entity the file belongs to (releases shared content)
             
         Returns:
             bool: True if deleted successfully
         """
         try:
+            if is_content_path(file_path.replace('\\', '/')):
+                return self._release_content(file_path, entity_id)
+            
             # Convert to absolute path
             abs_path = os.path.join(self.base_path, file_path)
             
@@ -123,8 +197,9 @@ class LocalFileStorageStrategy(IFileStorageStrategy):
                 self.logger.warning(f"File to delete not found: {abs_path}")
                 return True  # Return True for idempotency
             
-            # Delete the file
+            # Delete the file and its derivatives
             os.remove(abs_path)
+            self._delete_derivatives(file_path)
             self.logger.info(f"Deleted file: {abs_path}")
             
             # Remove empty directory if possible
@@ -138,3 +213,151 @@ class LocalFileStorageStrategy(IFileStorageStrategy):
         except Exception as e:
             self.logger.error(f"Failed to delete file {file_path}: {str(e)}")
             return False
+
+    def delete_entity_files(self, entity_id: int, file_paths: Iterable[str] = ()) -> bool:
+        """
+        Delete all files of an entity from local storage.
+        
+        Args:
+            entity_id: ID of the entity the files belong to
+            file_paths: Relative paths of other files to delete together with them
+            
+        Returns:
+            bool: True if all files were deleted
+        """
+        success = True
+        entity_dir = os.path.join(self.base_path, f"artwork_{entity_id}")
+        try:
+            if os.path.isdir(entity_dir):
+                shutil.rmtree(entity_dir)
+                self.logger.info(f"Deleted files of entity {entity_id}: {entity_dir}")
+        except Exception as e:
+            self.logger.error(f"Failed to delete files of entity {entity_id}: {str(e)}")
+            success = False
+        for file_path in file_paths:
+            # Files inside the entity directory are already removed with it
+            abs_path = os.path.normpath(os.path.join(self.base_path, file_path)) if file_path else None
+            if abs_path and not abs_path.startswith(entity_dir + os.sep):
+                success = self.delete_file(file_path, entity_id) and success
+        return success
+
+    def _store_content(self, entity_id: int, file_data: Union[bytes, BinaryIO], filename: str) -> str:
+        """
+        Store a file once per content, hashing it while it is written.
+        
+        Args:
+            entity_id: ID of the entity referencing the file
+            file_data: File contents as bytes or file-like object
+            filename: File name with the extension to keep
+            
+        Returns:
+            str: Relative path of the content-addressed file
+        """
+        digest = hashlib.sha256()
+        fd, temp_path = tempfile.mkstemp(dir=self.base_path, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                if isinstance(file_data, bytes):
+                    digest.update(file_data)
+                    f.write(file_data)
+                else:
+                    for block in iter(lambda: file_data.read(HASH_BLOCK_SIZE), b''):
+                        digest.update(block)
+                        f.write(block)
+            rel_path = content_path(digest.hexdigest(), filename)
+            abs_path = os.path.join(self.base_path, rel_path)
+            if os.path.exists(abs_path):
+                self.logger.info(f"Content {rel_path} already stored, write skipped")
+            else:
+                os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+                os.replace(temp_path, abs_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        
+        # Reference marker of the entity next to the content
+        refs_dir = abs_path + REFS_SUFFIX.rstrip('/')
+        os.makedirs(refs_dir, exist_ok=True)
+        open(os.path.join(refs_dir, str(entity_id)), 'wb').close()
+        self.logger.info(f"Stored content-addressed file for entity {entity_id} at {rel_path}")
+        return rel_path
+
+    def _release_content(self, file_path: str, entity_id: Optional[int]) -> bool:
+        """
+        Drop the entity's reference to a content-addressed file, deleting it with the last one.
+        
+        Args:
+            file_path: Relative path of the content-addressed file
+            entity_id: ID of the entity referencing the file
+            
+        Returns:
+            bool: True if the reference was released
+        """
+        if entity_id is None:
+            self.logger.warning(f"Content-addressed file {file_path} kept: owner not specified")
+            return True
+        abs_path = os.path.join(self.base_path, file_path)
+        refs_dir = abs_path + REFS_SUFFIX.rstrip('/')
+        marker = os.path.join(refs_dir, str(entity_id))
+        if os.path.exists(marker):
+            os.remove(marker)
+        if os.path.isdir(refs_dir) and os.listdir(refs_dir):
+            self.logger.info(f"Content {file_path} is still referenced, kept")
+            return True
+        if os.path.isdir(refs_dir):
+            os.rmdir(refs_dir)
+        if os.path.isfile(abs_path):
+            os.remove(abs_path)
+            self.logger.info(f"Deleted unreferenced content {file_path}")
+        self._delete_derivatives(file_path)
+        return True
+
+    def _has_derivatives(self, file_path: str) -> bool:
+        """Check whether derivatives are generated for the file (an image)."""
+        content_type = mimetypes.guess_type(file_path)[0] or ""
+        return self.derivatives is not None and content_type.startswith("image/")
+
+    def _variant_path(self, file_path: str, max_size: Optional[int]) -> str:
+        """
+        Path of the smallest derivative covering max_size, generating it if missing.
+        
+        Falls back to the original when derivatives are disabled, the original is
+        the only adequate variant or the derivative can't be generated.
+        """
+        if self.derivatives is None:
+            return file_path
+        spec = select_spec(max_size, self.derivatives.specs)
+        if spec is None or not os.path.isfile(os.path.join(self.base_path, file_path)):
+            return file_path
+        variant = derivative_path(file_path, spec)
+        if os.path.isfile(os.path.join(self.base_path, variant)) or self._store_derivatives(file_path):
+            return variant
+        return file_path
+
+    def _store_derivatives(self, file_path: str) -> bool:
+        """Generate the derivatives of a stored image (worker processes read the file directly)."""
+        try:
+            variants = self.derivatives.generate(os.path.join(self.base_path, file_path))
+            for spec in self.derivatives.specs:
+                abs_path = os.path.join(self.base_path, derivative_path(file_path, spec))
+                os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+                # Written aside and replaced so a viewer never opens a partial file
+                with open(abs_path + '.tmp', 'wb') as f:
+                    f.write(variants[spec.name])
+                os.replace(abs_path + '.tmp', abs_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to generate derivatives of {file_path}: {str(e)}")
+            return False
+        self.logger.info(f"Stored derivatives of {file_path}")
+        return True
+
+    def _delete_derivatives(self, file_path: str) -> None:
+        """Delete the derivatives of a deleted image and their directory once empty."""
+        specs = self.derivatives.specs if self.derivatives is not None else DERIVATIVE_SPECS
+        for spec in specs:
+            abs_path = os.path.join(self.base_path, derivative_path(file_path, spec))
+            if os.path.isfile(abs_path):
+                os.remove(abs_path)
+        derivatives_dir = os.path.dirname(os.path.join(self.base_path, derivative_path(file_path, specs[0])))
+        if os.path.isdir(derivatives_dir) and not os.listdir(derivatives_dir):
+            os.rmdir(derivatives_dir)
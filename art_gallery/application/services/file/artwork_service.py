@@ -4,6 +4,11 @@ import logging
 
 from art_gallery.domain.artwork import Artwork, ArtworkType
 from art_gallery.repository.interfaces.base_repository import IBaseRepository
+from art_gallery.repository.specifications.base_specification import Specification
+from art_gallery.repository.specifications.artwork_specifications import (
+    ArtworkByTypeSpecification,
+    ArtworkByYearRangeSpecification
+)
 from art_gallery.application.interfaces.artwork_service import IArtworkService
 from art_gallery.application.interfaces.cloud.i_file_storage_strategy import IFileStorageStrategy
 
@@ -60,13 +65,17 @@ class ArtworkService(IArtworkService):
         if not artwork:
             raise ValueError(f"Artwork with id {artwork_id} not found")
             
-        # Delete associated image file if it exists and we have storage strategy
-        if self._file_storage_strategy and artwork.image_path:
+        # Delete all stored image files of the artwork (including the current one)
+        # in one batch if we have storage strategy
+        if self._file_storage_strategy:
             try:
-                self._file_storage_strategy.delete_file(artwork.image_path)
-                self._logger.info(f"Deleted image file for artwork {artwork_id}: {artwork.image_path}")
+                image_paths = [artwork.image_path] if artwork.image_path else []
+                if self._file_storage_strategy.delete_entity_files(artwork_id, image_paths):
+                    self._logger.info(f"Deleted image files for artwork {artwork_id}")
+                else:
+                    self._logger.error(f"Failed to delete some image files for artwork {artwork_id}")
             except Exception as e:
-                self._logger.error(f"Failed to delete image file for artwork {artwork_id}: {str(e)}")
+                self._logger.error(f"Failed to delete image files for artwork {artwork_id}: {str(e)}")
                 
         # Delete the artwork from repository
         self._repository.delete(artwork_id)
@@ -77,11 +86,11 @@ class ArtworkService(IArtworkService):
     def get_all_artworks(self) -> List[Artwork]:
         return self._repository.get_all()
 
+    def find_artworks(self, specification: Specification[Artwork]) -> List[Artwork]:
+        return self._repository.find(specification)
+
     def filter_by_type(self, artwork_type: ArtworkType) -> List[Artwork]:
-        return [
-            artwork for artwork in self._repository.get_all()
-            if artwork.type == artwork_type
-        ]
+        return self._repository.find(ArtworkByTypeSpecification(artwork_type))
 
     def filter_by_year(self, start_year: int, end_year: Optional[int] = None) -> List[Artwork]:
         if end_year is None:
@@ -90,10 +99,7 @@ class ArtworkService(IArtworkService):
         if start_year > end_year:
             raise ValueError("Start year cannot be greater than end year")
 
-        return [
-            artwork for artwork in self._repository.get_all()
-            if start_year <= artwork.year <= end_year
-        ]
+        return self._repository.find(ArtworkByYearRangeSpecification(start_year, end_year))
         
     def add_imported_artwork(self, title: str, artist: str, year: int, 
                           description: str, type: ArtworkType, 
@@ -208,7 +214,7 @@ class ArtworkService(IArtworkService):
             # Удаляем предыдущее изображение, если оно есть
             if artwork.image_path:
                 try:
-                    self._file_storage_strategy.delete_file(artwork.image_path)
+                    self._file_storage_strategy.delete_file(artwork.image_path, artwork_id)
                     self._logger.info(f"Deleted previous image for artwork {artwork_id}: {artwork.image_path}")
                 except Exception as e:
                     self._logger.warning(f"Failed to delete previous image: {str(e)}")
@@ -232,12 +238,14 @@ class ArtworkService(IArtworkService):
             self._logger.error(f"Error updating artwork image: {str(e)}")
             raise ValueError(f"Failed to update artwork image: {str(e)}")
     
-    def get_artwork_image_url(self, artwork_id: int) -> Optional[str]:
+    def get_artwork_image_url(self, artwork_id: int, max_size: Optional[int] = None) -> Optional[str]:
         """
         Получает URL изображения экспоната.
         
         Args:
             artwork_id: ID экспоната
+            max_size: Наибольшая сторона показываемого изображения в пикселях: возвращается
+                наименьшая подходящая производная версия (миниатюра, веб-версия), None - оригинал
             
         Returns:
             Optional[str]: URL изображения или None, если изображения нет
@@ -254,7 +262,7 @@ class ArtworkService(IArtworkService):
             
         try:
             # Получаем URL изображения
-            image_url = self._file_storage_strategy.get_file_url(artwork.image_path)
+            image_url = self._file_storage_strategy.get_file_url(artwork.image_path, max_size)
             return image_url
         except Exception as e:
             self._logger.error(f"Error getting image URL for artwork {artwork_id}: {str(e)}")
@@ -3,6 +3,7 @@ from typing import List, Optional
 from art_gallery.domain import Exhibition
 from art_gallery.repository.interfaces.exhibition_repository import IExhibitionRepository
 from art_gallery.repository.interfaces.artwork_repository import IArtworkRepository
+from art_gallery.repository.specifications.base_specification import Specification
 from art_gallery.application.interfaces.exhibition_service import IExhibitionService
 from art_gallery.application.validation.validators import BusinessRuleValidator
 
@@ -90,6 +91,9 @@ class ExhibitionService(IExhibitionService):
     def get_all_exhibitions(self) -> List[Exhibition]:
         return self._exhibition_repository.get_all()
 
+    def find_exhibitions(self, specification: Specification[Exhibition]) -> List[Exhibition]:
+        return self._exhibition_repository.find(specification)
+
     def get_active_exhibitions(self) -> List[Exhibition]:
         return self._exhibition_repository.get_active()
 
@@ -3,6 +3,7 @@ import hashlib
 from typing import Optional, List
 from art_gallery.domain import User, UserRole
 from art_gallery.repository.interfaces.user_repository import IUserRepository
+from art_gallery.repository.specifications.base_specification import Specification
 from art_gallery.application.interfaces.user_service import IUserService
 from art_gallery.application.validation.validators import BusinessRuleValidator
 
@@ -73,6 +74,10 @@ class UserService(IUserService):
         """Получает список всех пользователей"""
         return self._repository.get_all()
 
+    def find_users(self, specification: Specification[User]) -> List[User]:
+        """Находит пользователей по спецификации"""
+        return self._repository.find(specification)
+
     def change_password(self, user_id: int, old_password: str, new_password: str) -> bool:
         """Изменяет пароль пользователя"""
         user = self.get_user_by_id(user_id)
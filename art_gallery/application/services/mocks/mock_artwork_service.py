@@ -4,6 +4,7 @@ import logging
 
 from art_gallery.domain.artwork import Artwork, ArtworkType
 from art_gallery.application.interfaces.artwork_service import IArtworkService
+from art_gallery.repository.specifications.base_specification import Specification
 from art_gallery.application.interfaces.cloud.i_file_storage_strategy import IFileStorageStrategy
 
 class MockArtworkService(IArtworkService):
@@ -84,7 +85,7 @@ class MockArtworkService(IArtworkService):
             # Удаляем предыдущее изображение, если оно есть
             if artwork.image_path:
                 try:
-                    self._file_storage_strategy.delete_file(artwork.image_path)
+                    self._file_storage_strategy.delete_file(artwork.image_path, artwork_id)
                     self._logger.info(f"Deleted previous image for artwork {artwork_id}: {artwork.image_path}")
                 except Exception as e:
                     self._logger.warning(f"Failed to delete previous image: {str(e)}")
@@ -108,7 +109,7 @@ class MockArtworkService(IArtworkService):
             self._logger.error(f"Error updating artwork image: {str(e)}")
             raise ValueError(f"Failed to update artwork image: {str(e)}")
     
-    def get_artwork_image_url(self, artwork_id: int) -> Optional[str]:
+    def get_artwork_image_url(self, artwork_id: int, max_size: Optional[int] = None) -> Optional[str]:
         """
         Получает URL изображения экспоната.
         """
@@ -124,7 +125,7 @@ class MockArtworkService(IArtworkService):
             
         try:
             # Получаем URL изображения
-            image_url = self._file_storage_strategy.get_file_url(artwork.image_path)
+            image_url = self._file_storage_strategy.get_file_url(artwork.image_path, max_size)
             return image_url
         except Exception as e:
             self._logger.error(f"Error getting image URL for artwork {artwork_id}: {str(e)}")
@@ -160,6 +161,10 @@ class MockArtworkService(IArtworkService):
     def get_all_artworks(self) -> List[Artwork]:
         return list(self._artworks.values())
 
+    def find_artworks(self, specification: Specification[Artwork]) -> List[Artwork]:
+        predicate = specification.compile()
+        return [a for a in self._artworks.values() if predicate(a)]
+
     def filter_by_type(self, artwork_type: ArtworkType) -> List[Artwork]:
         return [a for a in self._artworks.values() if a.type == artwork_type]
 
@@ -2,6 +2,7 @@ from typing import List, Optional, Dict
 from datetime import datetime
 from art_gallery.domain.exhibition import Exhibition
 from art_gallery.application.interfaces.exhibition_service import IExhibitionService
+from art_gallery.repository.specifications.base_specification import Specification
 
 class MockExhibitionService(IExhibitionService):
     def __init__(self):
@@ -58,6 +59,10 @@ class MockExhibitionService(IExhibitionService):
     def get_all_exhibitions(self) -> List[Exhibition]:
         return list(self._exhibitions.values())
 
+    def find_exhibitions(self, specification: Specification[Exhibition]) -> List[Exhibition]:
+        predicate = specification.compile()
+        return [e for e in self._exhibitions.values() if predicate(e)]
+
     def get_active_exhibitions(self) -> List[Exhibition]:
         now = datetime.now()
         return [ex for ex in self._exhibitions.values() if ex.is_active()]
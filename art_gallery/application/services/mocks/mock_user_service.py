@@ -1,6 +1,7 @@
 from typing import Optional, List, Dict
 from art_gallery.domain import User, UserRole
 from art_gallery.application.interfaces.user_service import IUserService
+from art_gallery.repository.specifications.base_specification import Specification
 import hashlib
 from datetime import datetime
 
@@ -55,6 +56,10 @@ class MockUserService(IUserService):
     def get_all_users(self) -> List[User]:
         return list(self._users.values())
 
+    def find_users(self, specification: Specification[User]) -> List[User]:
+        predicate = specification.compile()
+        return [u for u in self._users.values() if predicate(u)]
+
     def change_password(self, user_id: int, old_password: str, new_password: str) -> bool:
         user = self.get_user_by_id(user_id)
         if not user:
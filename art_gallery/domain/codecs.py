@@ -0,0 +1,302 @@
+"""
+Специализированные кодеки сущностей для массовой загрузки и сохранения.
+
+Кодек преобразует сущность в словарь и обратно без общего пути
+to_dict/_get_entity_data/from_dict: поля читаются и записываются напрямую
+в __dict__ экземпляра, а конструктор dataclass не вызывается.
+Результат encode совпадает с to_dict (включая порядок ключей).
+
+Отображение полей в кодеках написано вручную: это самая горячая часть загрузки,
+и универсальное построение состояния по описанию полей съедает большую часть выигрыша.
+Чтобы кодек не разошелся с сущностью, при создании он проверяет себя круговым
+преобразованием пробной сущности, заполненной по полям ее dataclass: encode должен
+совпасть с to_dict, а decode и from_dict - восстановить то же состояние. Расхождение
+(например, новое поле сущности, не добавленное в кодек) - ошибка при импорте модуля.
+
+decode понимает только каноническую форму записи, которую пишет сам кодек
+(точные типы, значения перечислений, даты в ISO). Любая другая запись
+(строковый год, тип в верхнем регистре, "None" вместо даты, отсутствующие поля)
+передается в from_dict сущности, поэтому результат всегда тот же, что и у from_dict.
+
+В доверенном режиме (trusted=True) для канонических записей пропускается повторная
+проверка инвариантов (_validate): он предназначен для данных, которые приложение
+записало само. Проверка типов при этом сохраняется.
+
+Ускорение меньше трехкратного: на 100 000 экспонатов восстановление из словарей
+в доверенном режиме быстрее from_dict в 2.6-2.8 раза для экспонатов и в 1.6-2.1 раза
+для пользователей и выставок, загрузка файла целиком - в 1.0-1.5 раза
+(benchmarks/bench_entity_codecs.py).
+
+bulk_hydration() приостанавливает циклический сборщик мусора на время массового
+создания объектов: восстановленные сущности не образуют циклов, а повторные проходы
+сборщика по растущей коллекции занимают заметную часть времени загрузки.
+"""
+import dataclasses
+import gc
+import typing
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Generic, Iterator, Optional, Type, TypeVar, Union
+
+from art_gallery.domain.base_entity import BaseEntity
+from art_gallery.domain.artwork import Artwork, ArtworkType
+from art_gallery.domain.exhibition import Exhibition
+from art_gallery.domain.user import User, UserRole
+
+T = TypeVar('T', bound=BaseEntity)
+
+_fromisoformat = datetime.fromisoformat
+
+_ARTWORK_TYPES: Dict[str, ArtworkType] = {artwork_type.value: artwork_type for artwork_type in ArtworkType}
+_USER_ROLES: Dict[str, UserRole] = {role.value: role for role in UserRole}
+
+
+def _decode_id(data: Dict[str, Any]) -> Optional[int]:
+    """ID записи (0, если не задан или не положителен) или None для неканонического значения"""
+    id_value = data.get('id', 0)
+    if type(id_value) is not int:
+        return None
+    return id_value if id_value > 0 else 0
+
+
+def _sample_value(annotation: Any, name: str) -> Any:
+    """Пробное значение поля по аннотации (для необязательных полей - не None)"""
+    arguments = typing.get_args(annotation)
+    if typing.get_origin(annotation) is Union and type(None) in arguments:
+        inner = next(argument for argument in arguments if argument is not type(None))
+        return _sample_value(inner, name)
+    origin = typing.get_origin(annotation) or annotation
+    if isinstance(origin, type) and issubclass(origin, Enum):
+        return list(origin)[-1]
+    if origin is datetime:
+        return datetime(2001, 2, 3, 4, 5, 6, 7)
+    if origin is bool:
+        return False
+    if origin is int:
+        return 7
+    if origin is list:
+        return [1, 2]
+    if origin is set:
+        return {1, 2}
+    return f"{name} sample"
+
+
+@contextmanager
+def bulk_hydration() -> Iterator[None]:
+    """Приостанавливает циклический сборщик мусора на время массовой загрузки сущностей"""
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+class EntityCodec(ABC, Generic[T]):
+    """Базовый кодек сущности"""
+
+    entity_class: Type[T]
+
+    def __init__(self):
+        self._check_round_trip()
+
+    @abstractmethod
+    def encode(self, entity: T) -> Dict[str, Any]:
+        """
+        Преобразует сущность в словарь, совпадающий с entity.to_dict()
+
+        Args:
+            entity: Сущность
+
+        Returns:
+            Dict[str, Any]: Словарь для сериализации
+        """
+        pass
+
+    def decode(self, data: Dict[str, Any], trusted: bool = False) -> T:
+        """
+        Восстанавливает сущность из словаря
+
+        Args:
+            data: Словарь с данными сущности
+            trusted: Не проверять инварианты сущности повторно (данные записаны приложением)
+
+        Returns:
+            T: Восстановленная сущность
+
+        Raises:
+            ValueError, KeyError, TypeError: Если запись некорректна (как у from_dict)
+        """
+        try:
+            state = self._decode_state(data)
+        except (KeyError, TypeError, ValueError, AttributeError):
+            state = None
+        if state is None:
+            # Неканоническая запись: общий путь с нормализацией значений
+            return self.entity_class.from_dict(data)
+
+        entity_class = self.entity_class
+        entity = entity_class.__new__(entity_class)
+        entity.__dict__ = state
+        if not trusted:
+            entity._validate()
+        return entity
+
+    @abstractmethod
+    def _decode_state(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Состояние экземпляра (__dict__) для канонической записи
+        или None, если запись должна быть обработана from_dict
+        """
+        pass
+
+    def _check_round_trip(self) -> None:
+        """
+        Проверяет кодек на пробной сущности, заполненной по полям dataclass
+
+        Raises:
+            TypeError: Если кодек расходится с to_dict/from_dict сущности
+        """
+        entity_class = self.entity_class
+        hints = typing.get_type_hints(entity_class)
+        probe = entity_class.__new__(entity_class)
+        probe.__dict__ = {entity_field.name: _sample_value(hints[entity_field.name], entity_field.name)
+                          for entity_field in dataclasses.fields(entity_class)}
+        record = probe.to_dict()
+        problems = []
+        if list(self.encode(probe).items()) != list(record.items()):
+            problems.append("encode() differs from to_dict()")
+        state = self._decode_state(record)
+        if state != probe.__dict__:
+            problems.append("decode() doesn't restore the state written by to_dict()")
+        if entity_class.from_dict(record).__dict__ != probe.__dict__:
+            problems.append("from_dict() doesn't restore the state written by to_dict()")
+        if problems:
+            raise TypeError(f"{type(self).__name__} is out of sync with {entity_class.__name__}: "
+                            f"{'; '.join(problems)}")
+
+
+class ArtworkCodec(EntityCodec[Artwork]):
+    """Кодек экспонатов"""
+
+    entity_class = Artwork
+
+    def encode(self, entity: Artwork) -> Dict[str, Any]:
+        state = entity.__dict__
+        return {
+            'id': state['_id'],
+            'title': state['title'],
+            'artist': state['artist'],
+            'year': state['year'],
+            'description': state['description'],
+            'type': state['type'].value,
+            'image_path': state['image_path'],
+            'created_at': state['created_at'].isoformat()
+        }
+
+    def _decode_state(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        entity_id = _decode_id(data)
+        year = data['year']
+        artwork_type = _ARTWORK_TYPES.get(data['type'])
+        created_at = data.get('created_at')
+        if entity_id is None or type(year) is not int or artwork_type is None or type(created_at) is not str:
+            return None
+        return {
+            '_id': entity_id,
+            'title': data['title'],
+            'artist': data['artist'],
+            'year': year,
+            'description': data['description'],
+            'type': artwork_type,
+            'image_path': data.get('image_path'),
+            'created_at': _fromisoformat(created_at)
+        }
+
+
+class UserCodec(EntityCodec[User]):
+    """Кодек пользователей"""
+
+    entity_class = User
+
+    def encode(self, entity: User) -> Dict[str, Any]:
+        state = entity.__dict__
+        last_login = state['last_login']
+        return {
+            'id': state['_id'],
+            'username': state['username'],
+            'password_hash': state['password_hash'],
+            'role': state['role'].value,
+            'created_at': state['created_at'].isoformat(),
+            'last_login': last_login.isoformat() if last_login else None,
+            'is_active': state['is_active']
+        }
+
+    def _decode_state(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        entity_id = _decode_id(data)
+        role = _USER_ROLES.get(data['role'])
+        created_at = data.get('created_at')
+        last_login = data.get('last_login')
+        if entity_id is None or role is None or type(created_at) is not str:
+            return None
+        if last_login is not None:
+            if type(last_login) is not str:
+                return None
+            last_login = _fromisoformat(last_login)
+        return {
+            '_id': entity_id,
+            'username': data['username'],
+            'password_hash': data['password_hash'],
+            'role': role,
+            'created_at': _fromisoformat(created_at),
+            'last_login': last_login,
+            'is_active': data.get('is_active', True)
+        }
+
+
+class ExhibitionCodec(EntityCodec[Exhibition]):
+    """Кодек выставок"""
+
+    entity_class = Exhibition
+
+    def encode(self, entity: Exhibition) -> Dict[str, Any]:
+        state = entity.__dict__
+        return {
+            'id': state['_id'],
+            'title': state['title'],
+            'description': state['description'],
+            'start_date': state['start_date'].isoformat(),
+            'end_date': state['end_date'].isoformat(),
+            'created_at': state['created_at'].isoformat(),
+            'artwork_ids': state['artwork_ids'],
+            'max_capacity': state['max_capacity'],
+            'visitors': list(state['visitors'])
+        }
+
+    def _decode_state(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        entity_id = _decode_id(data)
+        start_date = data['start_date']
+        end_date = data['end_date']
+        created_at = data.get('created_at')
+        if (entity_id is None or type(start_date) is not str or type(end_date) is not str
+                or type(created_at) is not str):
+            return None
+        visitors = data.get('visitors')
+        return {
+            '_id': entity_id,
+            'title': data['title'],
+            'description': data['description'],
+            'start_date': _fromisoformat(start_date),
+            'end_date': _fromisoformat(end_date),
+            'created_at': _fromisoformat(created_at),
+            'artwork_ids': data.get('artwork_ids') or [],
+            'max_capacity': data.get('max_capacity'),
+            'visitors': set(visitors) if visitors else set()
+        }
+
+
+ARTWORK_CODEC = ArtworkCodec()
+USER_CODEC = UserCodec()
+EXHIBITION_CODEC = ExhibitionCodec()
@@ -62,7 +62,7 @@ def create_real_services(format_name: str = 'json'):
     os.makedirs(data_dir, exist_ok=True)
     
     # Проверяем и нормализуем формат
-    if format_name.lower() not in ['json', 'xml']:
+    if format_name.lower() not in ['json', 'xml', 'binary']:
         print(f"Предупреждение: Неподдерживаемый формат '{format_name}'. Используем JSON по умолчанию.")
         format_name = 'json'
     
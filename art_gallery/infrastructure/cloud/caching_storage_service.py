@@ -0,0 +1,236 @@
+"""
+Storage service decorator serving downloads from a local disk cache.
+"""
+import logging
+import threading
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from art_gallery.infrastructure.interfaces.cloud.i_storage_service import IStorageService
+from art_gallery.infrastructure.cloud.media_cache import MediaDiskCache
+from art_gallery.infrastructure.config.constants import DEFAULT_STREAM_CHUNK_SIZE
+from art_gallery.exceptions.cloud_exceptions import ObjectNotFoundError
+
+
+class _Fetch:
+    """Download of an object shared by concurrent callers."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.path: Optional[str] = None
+        self.error: Optional[BaseException] = None
+
+
+class CachingStorageService(IStorageService):
+    """
+    Read-through cache in front of another IStorageService.
+
+    Every read revalidates the cached copy with the object's ETag (a HEAD
+    request): an unchanged object is served from disk without transferring it,
+    a changed one is downloaded again. Concurrent reads of the same missing
+    object share one download. Writes and deletes go to the wrapped service and
+    drop the cached copy.
+    """
+
+    def __init__(self, storage_service: IStorageService, cache: MediaDiskCache):
+        """
+        Initialize the caching storage service.
+        
+        Args:
+            storage_service: Storage service to read from and write to
+            cache: Disk cache for downloaded objects
+        """
+        self.storage_service = storage_service
+        self.cache = cache
+        self.logger = logging.getLogger(__name__)
+        self._fetches: Dict[Tuple[str, str, str], _Fetch] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_local_path(self, bucket_name: str, object_name: str) -> Optional[str]:
+        """
+        Get the path of an up-to-date local copy of the object, downloading it if needed.
+        
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object
+            
+        Returns:
+            Optional[str]: Path of the cached file or None if the object doesn't exist
+        """
+        try:
+            return self._fetch(bucket_name, object_name)
+        except ObjectNotFoundError:
+            return None
+
+    def download_data(self, bucket_name: str, object_name: str) -> Optional[bytes]:
+        """
+        Download data, from the local cache if the object hasn't changed.
+        
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object to download
+            
+        Returns:
+            Optional[bytes]: Downloaded data
+            
+        Raises:
+            ObjectNotFoundError: If object doesn't exist
+            ObjectDownloadError: If download fails
+        """
+        return b''.join(self._read_cached(bucket_name, object_name, 0, None, DEFAULT_STREAM_CHUNK_SIZE))
+
+    def stream_data(self, bucket_name: str, object_name: str, offset: int = 0,
+                    length: Optional[int] = None,
+                    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Stream an object (or a byte range of it), from the local cache if possible.
+        
+        A whole object is cached before it is streamed. A range of an object
+        that isn't cached yet is read from the wrapped service without caching,
+        so previews of large objects don't download them whole.
+        
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object to read
+            offset: First byte to read
+            length: Number of bytes to read, None to read to the end of the object
+            chunk_size: Maximum size of a yielded chunk
+            
+        Returns:
+            Iterator[bytes]: Chunks of the object data
+            
+        Raises:
+            ValueError: If offset or length is negative
+            ObjectNotFoundError: If object doesn't exist
+        """
+        if offset < 0 or (length is not None and length < 0):
+            raise ValueError(f"Invalid range: offset={offset}, length={length}")
+        if offset or length is not None:
+            etag = self._current_etag(bucket_name, object_name)
+            path = self.cache.lookup(bucket_name, object_name, etag)
+            try:
+                file = open(path, 'rb') if path is not None else None
+            except FileNotFoundError:
+                file = None
+            if file is None:
+                return self.storage_service.stream_data(bucket_name, object_name, offset, length, chunk_size)
+            self.hits += 1
+            return self._iter_file(file, offset, length, chunk_size)
+        return self._read_cached(bucket_name, object_name, offset, length, chunk_size)
+
+    def _read_cached(self, bucket_name: str, object_name: str, offset: int, length: Optional[int],
+                     chunk_size: int) -> Iterator[bytes]:
+        path = self._fetch(bucket_name, object_name)
+        try:
+            # Opened here, so a blob evicted in the meantime is noticed before iteration
+            file = open(path, 'rb')
+        except FileNotFoundError:
+            # Evicted by a concurrent download: fetch it again
+            file = open(self._fetch(bucket_name, object_name), 'rb')
+        return self._iter_file(file, offset, length, chunk_size)
+
+    @staticmethod
+    def _iter_file(file: BinaryIO, offset: int, length: Optional[int], chunk_size: int) -> Iterator[bytes]:
+        """Yield a byte range of an open file and close it."""
+        with file:
+            file.seek(offset)
+            remaining = length
+            while remaining is None or remaining > 0:
+                chunk = file.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    def _current_etag(self, bucket_name: str, object_name: str) -> str:
+        etag = self.storage_service.get_object_etag(bucket_name, object_name)
+        if etag is None:
+            self.cache.invalidate(bucket_name, object_name)
+            raise ObjectNotFoundError(f"Object '{object_name}' not found in bucket '{bucket_name}'")
+        return etag
+
+    def _fetch(self, bucket_name: str, object_name: str) -> str:
+        """Return the path of an up-to-date cached copy, downloading it at most once at a time."""
+        etag = self._current_etag(bucket_name, object_name)
+        path = self.cache.lookup(bucket_name, object_name, etag)
+        if path is not None:
+            self.hits += 1
+            return path
+
+        key = (bucket_name, object_name, etag)
+        with self._lock:
+            fetch = self._fetches.get(key)
+            leader = fetch is None
+            if leader:
+                fetch = self._fetches[key] = _Fetch()
+        if not leader:
+            # Another thread is downloading the same version: wait for its result
+            fetch.done.wait()
+            if fetch.error is not None:
+                raise fetch.error
+            return fetch.path
+
+        self.misses += 1
+        try:
+            fetch.path = self.cache.store(bucket_name, object_name, etag,
+                                          self.storage_service.stream_data(bucket_name, object_name))
+            self.logger.debug(f"Cached object '{object_name}' from bucket '{bucket_name}'")
+            return fetch.path
+        except BaseException as e:
+            fetch.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._fetches[key]
+            fetch.done.set()
+
+    # --- Writes drop the cached copy ---
+
+    def upload_data(self, bucket_name: str, object_name: str, data, content_type: str,
+                    content_encoding: Optional[str] = None) -> bool:
+        try:
+            return self.storage_service.upload_data(bucket_name, object_name, data, content_type,
+                                                    content_encoding)
+        finally:
+            self.cache.invalidate(bucket_name, object_name)
+
+    def upload_file(self, bucket_name: str, object_name: str, file_path: str, content_type: str,
+                    content_encoding: Optional[str] = None) -> bool:
+        try:
+            return self.storage_service.upload_file(bucket_name, object_name, file_path, content_type,
+                                                    content_encoding)
+        finally:
+            self.cache.invalidate(bucket_name, object_name)
+
+    def delete_object(self, bucket_name: str, object_name: str) -> bool:
+        try:
+            return self.storage_service.delete_object(bucket_name, object_name)
+        finally:
+            self.cache.invalidate(bucket_name, object_name)
+
+    def delete_objects(self, bucket_name: str, object_names: Iterable[str]) -> List[str]:
+        object_names = list(object_names)
+        try:
+            return self.storage_service.delete_objects(bucket_name, object_names)
+        finally:
+            for object_name in object_names:
+                self.cache.invalidate(bucket_name, object_name)
+
+    # --- Other operations go to the wrapped service ---
+
+    def ensure_bucket_exists(self, bucket_name: str) -> bool:
+        return self.storage_service.ensure_bucket_exists(bucket_name)
+
+    def list_objects(self, bucket_name: str, prefix: str = "") -> List[str]:
+        return self.storage_service.list_objects(bucket_name, prefix)
+
+    def get_object_url(self, bucket_name: str, object_name: str, expires: int = 3600) -> Optional[str]:
+        return self.storage_service.get_object_url(bucket_name, object_name, expires)
+
+    def object_exists(self, bucket_name: str, object_name: str) -> bool:
+        return self.storage_service.object_exists(bucket_name, object_name)
+
+    def get_object_etag(self, bucket_name: str, object_name: str) -> Optional[str]:
+        return self.storage_service.get_object_etag(bucket_name, object_name)
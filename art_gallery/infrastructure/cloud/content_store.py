@@ -0,0 +1,124 @@
+"""
+Content-addressed storage of media objects with reference counting.
+"""
+import logging
+import os
+from typing import BinaryIO, List, Union
+
+from art_gallery.infrastructure.interfaces.cloud.i_storage_service import IStorageService
+from art_gallery.infrastructure.cloud.streams import hashed_stream
+
+# Root of content-addressed objects
+CONTENT_ROOT = 'sha256/'
+# Suffix of the prefix holding reference markers of an object
+REFS_SUFFIX = '.refs/'
+
+
+def is_content_path(path: str) -> bool:
+    """Check whether a path points to a content-addressed object."""
+    return path.startswith(CONTENT_ROOT)
+
+
+def content_path(digest: str, filename: str) -> str:
+    """
+    Path of the content with the given SHA-256, keeping the extension of the file name.
+
+    Args:
+        digest: Hex SHA-256 of the content
+        filename: Original file name
+
+    Returns:
+        str: Path like sha256/ab/abcdef....jpg
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    return f"{CONTENT_ROOT}{digest[:2]}/{digest}{extension}"
+
+
+class ContentAddressedStore:
+    """
+    Stores each distinct content once under sha256/<prefix>/<hash><ext>.
+
+    The content is hashed before the upload, and the upload is skipped if an
+    object with the same hash already exists. Every owner of the content (e.g. an
+    artwork) gets an empty reference marker object next to it; releasing the
+    last reference deletes the content. Markers are created and deleted
+    independently, so reference counts need no read-modify-write; a release
+    racing with a new reference to the same content may still remove it.
+    """
+
+    def __init__(self, storage_service: IStorageService, bucket_name: str):
+        """
+        Initialize the content-addressed store.
+        
+        Args:
+            storage_service: Storage service holding the objects
+            bucket_name: Bucket of the objects
+        """
+        self.storage_service = storage_service
+        self.bucket_name = bucket_name
+        self.logger = logging.getLogger(__name__)
+
+    def store(self, data: Union[bytes, BinaryIO], filename: str, content_type: str, reference: str) -> str:
+        """
+        Store content (once) and add a reference to it.
+        
+        Args:
+            data: Content as bytes or file-like object
+            filename: Original file name (its extension is kept)
+            content_type: MIME type of the content
+            reference: Identifier of the owner of the content
+            
+        Returns:
+            str: Path of the content-addressed object
+            
+        Raises:
+            ObjectUploadError: If the upload fails
+        """
+        with hashed_stream(data) as (digest, stream):
+            path = content_path(digest, filename)
+            if self.storage_service.object_exists(self.bucket_name, path):
+                self.logger.info(f"Content {path} already stored, upload skipped")
+            else:
+                self.storage_service.upload_data(self.bucket_name, path, stream, content_type)
+        self.storage_service.upload_data(self.bucket_name, self._marker(path, reference), b'',
+                                         'application/octet-stream')
+        return path
+
+    def references(self, path: str) -> List[str]:
+        """
+        List the owners referencing content.
+        
+        Args:
+            path: Path of the content-addressed object
+            
+        Returns:
+            List[str]: Identifiers of the owners
+        """
+        prefix = path + REFS_SUFFIX
+        return [name[len(prefix):] for name in self.storage_service.list_objects(self.bucket_name, prefix)]
+
+    def release(self, path: str, reference: str) -> bool:
+        """
+        Remove a reference to content, deleting the content with its last reference.
+        
+        Args:
+            path: Path of the content-addressed object
+            reference: Identifier of the owner
+            
+        Returns:
+            bool: True if the content was deleted, False if it is still referenced
+            
+        Raises:
+            ObjectDeleteError: If deletion fails
+        """
+        self.storage_service.delete_object(self.bucket_name, self._marker(path, reference))
+        if self.references(path):
+            self.logger.info(f"Content {path} is still referenced, kept")
+            return False
+        self.storage_service.delete_object(self.bucket_name, path)
+        self.logger.info(f"Deleted unreferenced content {path}")
+        return True
+
+    @staticmethod
+    def _marker(path: str, reference: str) -> str:
+        return f"{path}{REFS_SUFFIX}{reference}"
@@ -0,0 +1,226 @@
+"""
+Content-addressed local disk cache of downloaded media objects.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+from art_gallery.infrastructure.config.constants import DEFAULT_MEDIA_CACHE_MAX_BYTES
+
+# Version of the index file format
+INDEX_VERSION = 1
+
+
+@dataclass
+class CacheEntry:
+    """Cached copy of an object."""
+    bucket: str
+    object: str
+    etag: str
+    # SHA-256 of the content: objects with the same content share one file
+    digest: str
+    # Extension of the object name, kept so viewers recognize the file type
+    ext: str
+    size: int
+    # Logical time of the last use (LRU order)
+    used: int = 0
+
+
+class MediaDiskCache:
+    """
+    Disk cache of objects keyed by (bucket, object) and validated by ETag.
+
+    Content is stored once per SHA-256 digest under blobs/, and an index maps
+    object keys to digests. When the total size of stored content exceeds
+    max_bytes, the least recently used entries are evicted. The index is
+    written atomically on every change, so the cache survives restarts; a
+    missing or unreadable index just starts the cache empty.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MEDIA_CACHE_MAX_BYTES):
+        """
+        Args:
+            directory: Cache directory (created on first write)
+            max_bytes: Maximum total size of cached content
+        """
+        self.directory = directory
+        self.max_bytes = max(0, max_bytes)
+        self._logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, str], CacheEntry] = {}
+        # Blob sizes and number of entries referencing each blob
+        self._blobs: Dict[Tuple[str, str], int] = {}
+        self._refs: Dict[Tuple[str, str], int] = {}
+        self._clock = 0
+        self.total_bytes = 0
+        self._load_index()
+
+    def lookup(self, bucket_name: str, object_name: str, etag: str) -> Optional[str]:
+        """
+        Get the path of a cached copy with the given ETag and mark it as used.
+
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object
+            etag: Current ETag of the object
+
+        Returns:
+            Optional[str]: Path of the cached file or None if there is no valid copy
+        """
+        with self._lock:
+            entry = self._entries.get((bucket_name, object_name))
+            if entry is None:
+                return None
+            path = self._blob_path(entry.digest, entry.ext)
+            if entry.etag != etag or not os.path.exists(path):
+                # Stale or removed behind our back: forget it
+                self._remove(entry)
+                self._save_index()
+                return None
+            self._clock += 1
+            entry.used = self._clock
+            return path
+
+    def store(self, bucket_name: str, object_name: str, etag: str, chunks: Iterable[bytes]) -> str:
+        """
+        Store the content of an object read from chunks.
+
+        The content is hashed while it is written to a temporary file, so memory
+        use doesn't depend on the object size.
+
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object
+            etag: ETag of the stored content
+            chunks: Content of the object
+
+        Returns:
+            str: Path of the cached file
+        """
+        ext = os.path.splitext(object_name)[1].lower()
+        blob_dir = os.path.join(self.directory, 'blobs')
+        os.makedirs(blob_dir, exist_ok=True)
+        temp_path = os.path.join(blob_dir, f".{uuid.uuid4().hex}.tmp")
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with open(temp_path, 'wb') as file:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    file.write(chunk)
+                    size += len(chunk)
+            path = self._blob_path(digest.hexdigest(), ext)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Objects with identical content share the existing blob
+            if not os.path.exists(path):
+                os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        with self._lock:
+            previous = self._entries.get((bucket_name, object_name))
+            if previous is not None:
+                self._remove(previous)
+            self._clock += 1
+            entry = CacheEntry(bucket_name, object_name, etag, digest.hexdigest(), ext, size, self._clock)
+            self._add(entry)
+            self._evict(keep=entry)
+            self._save_index()
+        return path
+
+    def invalidate(self, bucket_name: str, object_name: str) -> None:
+        """
+        Drop the cached copy of an object.
+
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object
+        """
+        with self._lock:
+            entry = self._entries.get((bucket_name, object_name))
+            if entry is not None:
+                self._remove(entry)
+                self._save_index()
+
+    def clear(self) -> None:
+        """Drop all cached copies."""
+        with self._lock:
+            for entry in list(self._entries.values()):
+                self._remove(entry)
+            self._save_index()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _blob_path(self, digest: str, ext: str) -> str:
+        return os.path.join(self.directory, 'blobs', digest[:2], digest + ext)
+
+    def _add(self, entry: CacheEntry) -> None:
+        self._entries[(entry.bucket, entry.object)] = entry
+        blob = (entry.digest, entry.ext)
+        if blob not in self._blobs:
+            self._blobs[blob] = entry.size
+            self.total_bytes += entry.size
+        self._refs[blob] = self._refs.get(blob, 0) + 1
+
+    def _remove(self, entry: CacheEntry) -> None:
+        del self._entries[(entry.bucket, entry.object)]
+        blob = (entry.digest, entry.ext)
+        self._refs[blob] -= 1
+        if self._refs[blob] == 0:
+            del self._refs[blob]
+            self.total_bytes -= self._blobs.pop(blob)
+            try:
+                os.remove(self._blob_path(*blob))
+            except OSError:
+                pass
+
+    def _evict(self, keep: CacheEntry) -> None:
+        if self.total_bytes <= self.max_bytes:
+            return
+        for entry in sorted(self._entries.values(), key=lambda item: item.used):
+            if self.total_bytes <= self.max_bytes:
+                break
+            if entry is not keep:
+                self._remove(entry)
+                self._logger.debug(f"Evicted cached object '{entry.object}' ({entry.size} bytes)")
+
+    def _index_path(self) -> str:
+        return os.path.join(self.directory, 'index.json')
+
+    def _load_index(self) -> None:
+        try:
+            with open(self._index_path(), 'r', encoding='utf-8') as file:
+                index = json.load(file)
+            if index.get('version') != INDEX_VERSION:
+                return
+            for item in index.get('entries', []):
+                entry = CacheEntry(**item)
+                if os.path.exists(self._blob_path(entry.digest, entry.ext)):
+                    self._add(entry)
+                    self._clock = max(self._clock, entry.used)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError) as e:
+            self._logger.warning(f"Media cache index is unreadable, starting empty: {e}")
+            self._entries.clear()
+            self._blobs.clear()
+            self._refs.clear()
+            self.total_bytes = 0
+
+    def _save_index(self) -> None:
+        index = {'version': INDEX_VERSION, 'entries': [asdict(entry) for entry in self._entries.values()]}
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = self._index_path() + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(index, file)
+            os.replace(temp_path, self._index_path())
+        except OSError as e:
+            self._logger.warning(f"Failed to write media cache index: {e}")
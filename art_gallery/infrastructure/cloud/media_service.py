@@ -5,33 +5,39 @@ import os
 import uuid
 import logging
 import mimetypes
-from typing import Optional, List, BinaryIO, Union
+from typing import Iterable, Iterator, Optional, List, BinaryIO, Union
 
 from art_gallery.infrastructure.interfaces.cloud.i_storage_service import IStorageService
 from art_gallery.infrastructure.interfaces.cloud.i_media_service import IMediaService
 from art_gallery.infrastructure.config.minio_config import MinioConfig
+from art_gallery.infrastructure.config.constants import DEFAULT_STREAM_CHUNK_SIZE
+from art_gallery.infrastructure.cloud.content_store import ContentAddressedStore, is_content_path
 from art_gallery.exceptions.cloud_exceptions import (
     ObjectUploadError, 
     ObjectDownloadError,
     ObjectDeleteError, 
-    ObjectNotFoundError
+    ObjectNotFoundError,
+    CloudStorageError
 )
 
 
 class MediaService(IMediaService):
     """Service for handling media files storage and retrieval."""
 
-    def __init__(self, storage_service: IStorageService, config: MinioConfig):
+    def __init__(self, storage_service: IStorageService, config: MinioConfig, content_addressed: bool = False):
         """
         Initialize the media service.
         
         Args:
             storage_service: Storage service implementation
             config: MinIO configuration
+            content_addressed: Store each distinct image once under sha256/ instead of per artwork
         """
         self.storage_service = storage_service
         self.config = config
         self.bucket_name = config.default_bucket
+        self.content_addressed = content_addressed
+        self.content_store = ContentAddressedStore(storage_service, self.bucket_name)
         self.logger = logging.getLogger(__name__)
         
         # Ensure the default bucket exists
@@ -56,17 +62,23 @@ class MediaService(IMediaService):
             if not file_extension:
                 file_extension = ".jpg"  # Default extension if none provided
             
+            # Determine content type
+            content_type = mimetypes.guess_type(original_filename)[0]
+            if not content_type:
+                content_type = "image/jpeg"  # Default content type
+            
+            if self.content_addressed:
+                object_path = self.content_store.store(image_data, f"image{file_extension}", content_type,
+                                                       str(artwork_id))
+                self.logger.info(f"Stored image for artwork {artwork_id}: {object_path}")
+                return object_path
+            
             # Generate a unique file name with the original extension
             unique_filename = f"{uuid.uuid4().hex}{file_extension}"
             
             # Construct the full object path
             object_path = f"{self.config.artwork_prefix}{artwork_id}/{unique_filename}"
             
-            # Determine content type
-            content_type = mimetypes.guess_type(original_filename)[0]
-            if not content_type:
-                content_type = "image/jpeg"  # Default content type
-            
             # Upload the file
             success = self.storage_service.upload_data(
                 self.bucket_name, 
@@ -112,17 +124,50 @@ class MediaService(IMediaService):
             self.logger.error(f"Unexpected error getting artwork image: {str(e)}")
             return None
 
-    def delete_artwork_image(self, image_path: str) -> bool:
+    def stream_artwork_image(self, image_path: str, offset: int = 0, length: Optional[int] = None,
+                             chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> Optional[Iterator[bytes]]:
+        """
+        Stream an artwork image (or a byte range of it) in chunks.
+        
+        Args:
+            image_path: Path to the image
+            offset: First byte to read
+            length: Number of bytes to read, None to read to the end of the image
+            chunk_size: Maximum size of a yielded chunk
+            
+        Returns:
+            Optional[Iterator[bytes]]: Chunks of the image data or None if not found
+        """
+        try:
+            return self.storage_service.stream_data(self.bucket_name, image_path, offset, length, chunk_size)
+        except ObjectNotFoundError:
+            self.logger.warning(f"Image not found: {image_path}")
+            return None
+        except ObjectDownloadError as e:
+            self.logger.error(f"Error streaming artwork image: {str(e)}")
+            return None
+
+    def delete_artwork_image(self, image_path: str, artwork_id: Optional[str] = None) -> bool:
         """
         Delete an artwork image.
         
+        A content-addressed image is shared by artworks with the same image: the
+        artwork's reference is released and the image is deleted with the last one.
+        
         Args:
             image_path: Path to the image
+            artwork_id: ID of the artwork the image belongs to (required to release shared images)
             
         Returns:
             bool: True if deleted successfully
         """
         try:
+            if is_content_path(image_path):
+                if artwork_id is None:
+                    self.logger.warning(f"Shared image {image_path} kept: artwork not specified")
+                    return True
+                self.content_store.release(image_path, str(artwork_id))
+                return True
             success = self.storage_service.delete_object(self.bucket_name, image_path)
             if success:
                 self.logger.info(f"Deleted artwork image: {image_path}")
@@ -138,6 +183,30 @@ class MediaService(IMediaService):
             self.logger.error(f"Unexpected error deleting artwork image: {str(e)}")
             return False
 
+    def delete_artwork_images(self, image_paths: Iterable[str]) -> List[bool]:
+        """
+        Delete several artwork images in batched requests.
+        
+        Args:
+            image_paths: Paths to the images
+            
+        Returns:
+            List[bool]: True for each image deleted successfully
+        """
+        image_paths = list(image_paths)
+        # Shared images are released per artwork (delete_artwork_image), never deleted in bulk
+        shared = [path for path in image_paths if is_content_path(path)]
+        if shared:
+            self.logger.warning(f"{len(shared)} shared images kept: artwork not specified")
+        try:
+            failed = set(self.storage_service.delete_objects(
+                self.bucket_name, [path for path in image_paths if not is_content_path(path)]))
+        except CloudStorageError as e:
+            self.logger.error(f"Error deleting artwork images: {str(e)}")
+            return [False] * len(image_paths)
+        self.logger.info(f"Deleted {len(image_paths) - len(shared) - len(failed)} artwork images")
+        return [path not in failed for path in image_paths]
+
     def get_artwork_image_url(self, image_path: str, expires: int = 3600) -> Optional[str]:
         """
         Get a URL to access an artwork image.
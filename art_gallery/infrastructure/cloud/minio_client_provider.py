@@ -0,0 +1,81 @@
+"""
+Process-wide provider of MinIO services sharing connection pools.
+"""
+import logging
+import threading
+from typing import Dict, Tuple
+
+import urllib3
+
+from art_gallery.infrastructure.cloud.http_pool import ConnectionStats, collect_stats, create_http_client
+from art_gallery.infrastructure.cloud.minio_service import MinioService
+from art_gallery.infrastructure.config.minio_config import MinioConfig
+
+
+class MinioClientProvider:
+    """
+    Hands out one MinioService per endpoint and credentials for the whole process.
+
+    Repositories, media services and file storage strategies asking for the same
+    endpoint get the same service (and Minio client); clients of one endpoint with
+    different credentials still share a single tuned connection pool.
+    """
+
+    _services: Dict[Tuple, MinioService] = {}
+    _http_clients: Dict[Tuple, urllib3.PoolManager] = {}
+    _lookups: int = 0
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_service(cls, config: MinioConfig) -> MinioService:
+        """
+        Get the shared MinioService for the configuration.
+
+        Args:
+            config: MinioConfig instance with connection details
+
+        Returns:
+            MinioService: Service shared by all callers with the same endpoint and credentials
+
+        Raises:
+            ConnectionError: If the MinIO client can't be created
+        """
+        service_key = (config.endpoint, config.secure, config.access_key, config.secret_key)
+        pool_key = (config.endpoint, config.secure, config.pool_size, config.connect_timeout,
+                    config.read_timeout, config.max_retries)
+        with cls._lock:
+            cls._lookups += 1
+            service = cls._services.get(service_key)
+            if service is None:
+                http_client = cls._http_clients.get(pool_key)
+                if http_client is None:
+                    http_client = create_http_client(config)
+                    cls._http_clients[pool_key] = http_client
+                service = MinioService(config, http_client=http_client)
+                cls._services[service_key] = service
+                logging.getLogger(__name__).debug(f"Shared MinIO client created for {config.endpoint}")
+            return service
+
+    @classmethod
+    def stats(cls) -> ConnectionStats:
+        """
+        Get connection reuse statistics of the shared pools.
+
+        Returns:
+            ConnectionStats: Clients created, connections opened and requests sent
+        """
+        with cls._lock:
+            stats = collect_stats(cls._http_clients.values())
+            stats.clients = len(cls._services)
+            stats.client_lookups = cls._lookups
+        return stats
+
+    @classmethod
+    def clear(cls) -> None:
+        """Close pooled connections and forget all shared services."""
+        with cls._lock:
+            for http_client in cls._http_clients.values():
+                http_client.clear()
+            cls._http_clients.clear()
+            cls._services.clear()
+            cls._lookups = 0
@@ -4,13 +4,19 @@ MinioService implementation for cloud storage.
 import io
 import logging
 from datetime import timedelta
-from typing import List, Optional, Union, BinaryIO
+from typing import Iterable, Iterator, List, Optional, Set, Union, BinaryIO
 
+import urllib3
 from minio import Minio
+from minio.deleteobjects import DeleteObject
 from minio.error import S3Error
+from minio.helpers import MAX_MULTIPART_COUNT, MIN_PART_SIZE
 
 from art_gallery.infrastructure.interfaces.cloud.i_storage_service import IStorageService
+from art_gallery.infrastructure.cloud.http_pool import create_http_client
+from art_gallery.infrastructure.cloud.url_cache import PresignedUrlCache
 from art_gallery.infrastructure.config.minio_config import MinioConfig
+from art_gallery.infrastructure.config.constants import DEFAULT_STREAM_CHUNK_SIZE
 from art_gallery.exceptions.cloud_exceptions import (
     BucketCreationError, 
     ObjectUploadError, 
@@ -22,27 +28,44 @@ from art_gallery.exceptions.cloud_exceptions import (
     ConnectionError
 )
 
+# S3 error codes of a missing object or bucket
+_NOT_FOUND_CODES = {"NoSuchKey", "NoSuchBucket", "ResourceNotFound"}
+# S3 error codes of creating a bucket that already exists
+_BUCKET_EXISTS_CODES = {"BucketAlreadyOwnedByYou", "BucketAlreadyExists"}
+# Maximum number of keys in one S3 multi-object delete request
+_MAX_DELETE_BATCH = 1000
+
 
 class MinioService(IStorageService):
     """MinIO implementation of storage service interface."""
 
-    def __init__(self, config: MinioConfig):
+    def __init__(self, config: MinioConfig, http_client: Optional[urllib3.PoolManager] = None):
         """
         Initialize MinIO client with provided configuration.
         
+        Prefer MinioClientProvider.get_service(), which shares one client and
+        connection pool between all components using the same endpoint.
+        
         Args:
             config: MinioConfig instance with connection details
+            http_client: Connection pool to use (a new tuned pool is created if omitted)
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
         
         try:
+            self.http_client = http_client or create_http_client(config)
             self.client = Minio(
                 endpoint=config.endpoint,
                 access_key=config.access_key,
                 secret_key=config.secret_key,
-                secure=config.secure
+                secure=config.secure,
+                http_client=self.http_client
             )
+            # Buckets known to exist: checked or created once per service
+            self._known_buckets: Set[str] = set()
+            # Presigned URLs reused until shortly before they expire
+            self.url_cache = PresignedUrlCache(config.url_cache_size, config.url_safety_margin)
             self.logger.info(f"MinIO client initialized with endpoint {config.endpoint}")
         except Exception as e:
             self.logger.error(f"Failed to initialize MinIO client: {str(e)}")
@@ -51,6 +74,7 @@ class MinioService(IStorageService):
     def ensure_bucket_exists(self, bucket_name: str) -> bool:
         """
         Ensures that the bucket exists, creates it if it doesn't.
+        Buckets already seen by this service are not checked again.
         
         Args:
             bucket_name: Name of the bucket to check/create
@@ -61,24 +85,40 @@ class MinioService(IStorageService):
         Raises:
             BucketCreationError: If bucket creation fails
         """
+        if bucket_name in self._known_buckets:
+            return True
         try:
             if not self.client.bucket_exists(bucket_name):
-                self.client.make_bucket(bucket_name)
-                self.logger.info(f"Created bucket '{bucket_name}'")
+                try:
+                    self.client.make_bucket(bucket_name)
+                    self.logger.info(f"Created bucket '{bucket_name}'")
+                except S3Error as e:
+                    # Another client created it between the check and the request
+                    if e.code not in _BUCKET_EXISTS_CODES:
+                        raise
+            self._known_buckets.add(bucket_name)
             return True
         except S3Error as e:
             self.logger.error(f"Failed to ensure bucket exists: {str(e)}")
             raise BucketCreationError(f"Failed to create bucket '{bucket_name}': {str(e)}")
 
-    def upload_data(self, bucket_name: str, object_name: str, data: Union[bytes, BinaryIO], content_type: str) -> bool:
+    def upload_data(self, bucket_name: str, object_name: str, data: Union[bytes, BinaryIO], content_type: str,
+                    content_encoding: Optional[str] = None) -> bool:
         """
         Upload data to the storage.
         
+        Data larger than one part is sent as a multipart upload with
+        config.parallel_uploads parts in flight, so memory stays bounded by
+        part_size * parallel_uploads regardless of the object size.
+        
         Args:
             bucket_name: Name of the bucket
             object_name: Name of the object to store
-            data: Data to upload (can be bytes or file-like object)
+            data: Data to upload (bytes or file-like object; seekable streams are
+                sent from the current position with their Content-Length,
+                non-seekable ones in parts without knowing their length)
             content_type: MIME type of the data
+            content_encoding: Content-Encoding of compressed data (e.g. 'gzip')
             
         Returns:
             bool: True if upload succeeded
@@ -88,18 +128,22 @@ class MinioService(IStorageService):
             BucketNotFoundError: If bucket doesn't exist
         """
         try:
-            # Ensure the bucket exists
-            if not self.client.bucket_exists(bucket_name):
-                raise BucketNotFoundError(f"Bucket '{bucket_name}' not found")
-            
             # Convert bytes to file-like object if needed
             if isinstance(data, bytes):
                 data = io.BytesIO(data)
                 
-            # Get the length of the data
-            data.seek(0, io.SEEK_END)
-            length = data.tell()
-            data.seek(0)
+            if data.seekable():
+                # Get the length of the remaining data
+                start = data.tell()
+                length = data.seek(0, io.SEEK_END) - start
+                data.seek(start)
+            else:
+                # Streams of unknown length (e.g. streaming serializers) are sent
+                # as a multipart upload, buffering one part at a time
+                length = -1
+            
+            # Compressed collections keep their encoding in the object metadata
+            metadata = {'Content-Encoding': content_encoding} if content_encoding else None
             
             # Upload the object
             self.client.put_object(
@@ -107,14 +151,55 @@ class MinioService(IStorageService):
                 object_name=object_name,
                 data=data,
                 length=length,
-                content_type=content_type
+                content_type=content_type,
+                metadata=metadata,
+                part_size=self._part_size(length),
+                num_parallel_uploads=max(1, self.config.parallel_uploads)
             )
+            self.url_cache.invalidate(bucket_name, object_name)
             self.logger.info(f"Uploaded object '{object_name}' to bucket '{bucket_name}'")
             return True
         except S3Error as e:
+            # The bucket is not checked before the upload: a missing one is reported by the PUT itself
+            if e.code == "NoSuchBucket":
+                self._known_buckets.discard(bucket_name)
+                raise BucketNotFoundError(f"Bucket '{bucket_name}' not found")
             self.logger.error(f"Failed to upload object '{object_name}': {str(e)}")
             raise ObjectUploadError(f"Failed to upload '{object_name}': {str(e)}")
 
+    def upload_file(self, bucket_name: str, object_name: str, file_path: str, content_type: str,
+                    content_encoding: Optional[str] = None) -> bool:
+        """
+        Upload a local file as a parallel multipart upload with known Content-Length.
+        
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object to store
+            file_path: Path to the local file
+            content_type: MIME type of the data
+            content_encoding: Content-Encoding of compressed data (e.g. 'gzip')
+            
+        Returns:
+            bool: True if upload succeeded
+            
+        Raises:
+            ObjectUploadError: If the file can't be read or upload fails
+            BucketNotFoundError: If bucket doesn't exist
+        """
+        try:
+            file = open(file_path, 'rb')
+        except OSError as e:
+            raise ObjectUploadError(f"Failed to read '{file_path}': {str(e)}")
+        with file:
+            return self.upload_data(bucket_name, object_name, file, content_type, content_encoding)
+
+    def _part_size(self, length: int) -> int:
+        """Part size for an upload: configured size, raised to fit S3 part limits."""
+        part_size = max(self.config.part_size, MIN_PART_SIZE)
+        if length > 0:
+            part_size = max(part_size, -(-length // MAX_MULTIPART_COUNT))
+        return part_size
+
     def download_data(self, bucket_name: str, object_name: str) -> Optional[bytes]:
         """
         Download data from the storage.
@@ -131,26 +216,81 @@ class MinioService(IStorageService):
             ObjectNotFoundError: If object doesn't exist
         """
         try:
-            # Check if object exists
-            if not self.object_exists(bucket_name, object_name):
-                raise ObjectNotFoundError(f"Object '{object_name}' not found in bucket '{bucket_name}'")
-                
-            # Get the object
+            # Get the object (a missing object is reported by the GET itself)
             response = self.client.get_object(bucket_name, object_name)
-            data = response.read()
-            response.close()
-            response.release_conn()
+            try:
+                data = response.read()
+            finally:
+                response.close()
+                response.release_conn()
             
             self.logger.info(f"Downloaded object '{object_name}' from bucket '{bucket_name}'")
             return data
         except S3Error as e:
+            if e.code in _NOT_FOUND_CODES:
+                raise ObjectNotFoundError(f"Object '{object_name}' not found in bucket '{bucket_name}'")
             self.logger.error(f"Failed to download object '{object_name}': {str(e)}")
             raise ObjectDownloadError(f"Failed to download '{object_name}': {str(e)}")
 
+    def stream_data(self, bucket_name: str, object_name: str, offset: int = 0,
+                    length: Optional[int] = None,
+                    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Stream an object (or a byte range of it) in chunks.
+        
+        The range is requested from the server, so only the requested bytes are
+        transferred, and at most one chunk is held in memory. The request is sent
+        by the call itself; the connection returns to the pool once the iterator
+        is exhausted or closed.
+        
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object to read
+            offset: First byte to read
+            length: Number of bytes to read, None to read to the end of the object
+            chunk_size: Maximum size of a yielded chunk
+            
+        Returns:
+            Iterator[bytes]: Chunks of the object data
+            
+        Raises:
+            ValueError: If offset or length is negative
+            ObjectDownloadError: If download fails or the range is not satisfiable
+            ObjectNotFoundError: If object doesn't exist
+        """
+        if offset < 0 or (length is not None and length < 0):
+            raise ValueError(f"Invalid range: offset={offset}, length={length}")
+        if length == 0:
+            return iter(())
+        try:
+            # length=0 asks minio for the rest of the object
+            response = self.client.get_object(bucket_name, object_name, offset=offset, length=length or 0)
+        except S3Error as e:
+            if e.code in _NOT_FOUND_CODES:
+                raise ObjectNotFoundError(f"Object '{object_name}' not found in bucket '{bucket_name}'")
+            self.logger.error(f"Failed to stream object '{object_name}': {str(e)}")
+            raise ObjectDownloadError(f"Failed to download '{object_name}': {str(e)}")
+        return self._iter_response(response, object_name, chunk_size)
+
+    def _iter_response(self, response: urllib3.HTTPResponse, object_name: str,
+                       chunk_size: int) -> Iterator[bytes]:
+        """Yield the body of a response and release its connection."""
+        try:
+            yield from response.stream(chunk_size)
+        except urllib3.exceptions.HTTPError as e:
+            self.logger.error(f"Failed to stream object '{object_name}': {str(e)}")
+            raise ObjectDownloadError(f"Failed to download '{object_name}': {str(e)}")
+        finally:
+            response.close()
+            response.release_conn()
+
     def delete_object(self, bucket_name: str, object_name: str) -> bool:
         """
         Delete an object from storage.
         
+        Deletion is idempotent, as in S3: deleting a missing object succeeds
+        without an extra existence check.
+        
         Args:
             bucket_name: Name of the bucket
             object_name: Name of the object to delete
@@ -160,21 +300,60 @@ class MinioService(IStorageService):
             
         Raises:
             ObjectDeleteError: If delete fails
-            ObjectNotFoundError: If object doesn't exist
+            ObjectNotFoundError: If the bucket doesn't exist
         """
         try:
-            # Check if object exists
-            if not self.object_exists(bucket_name, object_name):
-                raise ObjectNotFoundError(f"Object '{object_name}' not found in bucket '{bucket_name}'")
-                
             # Remove the object
             self.client.remove_object(bucket_name, object_name)
+            self.url_cache.invalidate(bucket_name, object_name)
             self.logger.info(f"Deleted object '{object_name}' from bucket '{bucket_name}'")
             return True
         except S3Error as e:
+            if e.code == "NoSuchBucket":
+                self._known_buckets.discard(bucket_name)
+                raise ObjectNotFoundError(f"Object '{object_name}' not found in bucket '{bucket_name}'")
             self.logger.error(f"Failed to delete object '{object_name}': {str(e)}")
             raise ObjectDeleteError(f"Failed to delete '{object_name}': {str(e)}")
 
+    def delete_objects(self, bucket_name: str, object_names: Iterable[str]) -> List[str]:
+        """
+        Delete several objects with S3 multi-object delete requests.
+        
+        Objects are deleted in batches of up to 1000 keys, one request per batch.
+        As with delete_object, missing objects count as deleted.
+        
+        Args:
+            bucket_name: Name of the bucket
+            object_names: Names of the objects to delete
+            
+        Returns:
+            List[str]: Names of the objects that could not be deleted
+            
+        Raises:
+            ObjectDeleteError: If a delete request fails
+            BucketNotFoundError: If the bucket doesn't exist
+        """
+        # Deduplicate keeping the order: S3 rejects repeated keys in one request
+        names = list(dict.fromkeys(object_names))
+        for name in names:
+            self.url_cache.invalidate(bucket_name, name)
+        failed: List[str] = []
+        for start in range(0, len(names), _MAX_DELETE_BATCH):
+            batch = [DeleteObject(name) for name in names[start:start + _MAX_DELETE_BATCH]]
+            try:
+                # remove_objects is lazy: the request is sent while its errors are read
+                for error in self.client.remove_objects(bucket_name, batch):
+                    self.logger.error(f"Failed to delete object '{error.name}': {error.code} {error.message}")
+                    failed.append(error.name)
+            except S3Error as e:
+                if e.code == "NoSuchBucket":
+                    self._known_buckets.discard(bucket_name)
+                    raise BucketNotFoundError(f"Bucket '{bucket_name}' does not exist")
+                self.logger.error(f"Failed to delete objects from bucket '{bucket_name}': {str(e)}")
+                raise ObjectDeleteError(f"Failed to delete objects from '{bucket_name}': {str(e)}")
+        self.logger.info(f"Deleted {len(names) - len(failed)} objects from bucket '{bucket_name}'")
+        return failed
+
     def list_objects(self, bucket_name: str, prefix: str = "") -> List[str]:
         """
         List objects in the bucket with optional prefix.
@@ -198,6 +377,11 @@ class MinioService(IStorageService):
         """
         Get a presigned URL for the object.
         
+        URLs are cached per (bucket, object, expires) and handed out again until
+        a safety margin before they expire, without contacting the server. The
+        cache entry is dropped when the object is replaced or deleted through
+        this service.
+        
         Args:
             bucket_name: Name of the bucket
             object_name: Name of the object
@@ -206,6 +390,9 @@ class MinioService(IStorageService):
         Returns:
             Optional[str]: Presigned URL or None if object doesn't exist
         """
+        url = self.url_cache.get(bucket_name, object_name, expires)
+        if url is not None:
+            return url
         try:
             if not self.object_exists(bucket_name, object_name):
                 return None
@@ -213,6 +400,7 @@ class MinioService(IStorageService):
             # Convert seconds to timedelta as required by the minio library
             expires_delta = timedelta(seconds=expires)
             url = self.client.presigned_get_object(bucket_name, object_name, expires=expires_delta)
+            self.url_cache.put(bucket_name, object_name, expires, url)
             return url
         except S3Error as e:
             self.logger.error(f"Failed to get URL for object '{object_name}': {str(e)}")
@@ -239,3 +427,21 @@ class MinioService(IStorageService):
                 return False
             self.logger.error(f"Error checking if object '{object_name}' exists: {str(e)}")
             return False
+
+    def get_object_etag(self, bucket_name: str, object_name: str) -> Optional[str]:
+        """
+        Get the ETag of an object (changes whenever the object is rewritten).
+        
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object
+            
+        Returns:
+            Optional[str]: ETag or None if the object doesn't exist or can't be checked
+        """
+        try:
+            return self.client.stat_object(bucket_name, object_name).etag
+        except S3Error as e:
+            if getattr(e, "code", None) != "NoSuchKey":
+                self.logger.error(f"Error getting ETag of object '{object_name}': {str(e)}")
+            return None
@@ -0,0 +1,80 @@
+"""
+Stream adapters for uploading data that is produced incrementally.
+"""
+import contextlib
+import hashlib
+import io
+import tempfile
+from typing import BinaryIO, Iterable, Iterator, Tuple, Union
+
+# Size of the blocks read while hashing
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class IterableStream(io.RawIOBase):
+    """
+    Read-only file-like object over an iterable of byte chunks.
+
+    Lets a generator (for example, a streaming serializer) be passed where a
+    readable stream is expected without materializing the whole payload.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        # The buffer is filled completely (unless the chunks run out): readers
+        # such as minio's part reader would otherwise glue many small reads of
+        # serializer chunks together with repeated bytes concatenation
+        target = memoryview(buffer).cast('B')
+        filled = 0
+        while filled < len(target):
+            if not self._pending:
+                try:
+                    self._pending = memoryview(next(self._chunks)).cast('B')
+                except StopIteration:
+                    break
+                continue
+            size = min(len(target) - filled, len(self._pending))
+            target[filled:filled + size] = self._pending[:size]
+            self._pending = self._pending[size:]
+            filled += size
+        return filled
+
+
+@contextlib.contextmanager
+def hashed_stream(data: Union[bytes, BinaryIO]) -> Iterator[Tuple[str, BinaryIO]]:
+    """
+    Compute the SHA-256 of data and provide a stream to read it from the start.
+
+    Seekable streams are hashed in place and rewound to their current position;
+    non-seekable ones are copied to a temporary file while they are hashed, so
+    the content can be read again without buffering it in memory.
+
+    Args:
+        data: Bytes or readable file-like object
+
+    Yields:
+        Tuple[str, BinaryIO]: Hex digest and a stream positioned at the start of the data
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        yield hashlib.sha256(data).hexdigest(), io.BytesIO(data)
+        return
+    digest = hashlib.sha256()
+    if data.seekable():
+        start = data.tell()
+        for block in iter(lambda: data.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+        data.seek(start)
+        yield digest.hexdigest(), data
+        return
+    with tempfile.TemporaryFile() as spool:
+        for block in iter(lambda: data.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+            spool.write(block)
+        spool.seek(0)
+        yield digest.hexdigest(), spool
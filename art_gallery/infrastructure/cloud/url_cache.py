@@ -0,0 +1,117 @@
+"""
+Cache of presigned object URLs with expiry-aware eviction.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from art_gallery.infrastructure.config.constants import (
+    DEFAULT_PRESIGNED_URL_CACHE_SIZE,
+    DEFAULT_PRESIGNED_URL_SAFETY_MARGIN
+)
+
+
+class PresignedUrlCache:
+    """
+    LRU cache of presigned URLs keyed by (bucket, object, expiry).
+
+    A URL is handed out again until a safety margin before it expires (at most
+    half of its lifetime, so short-lived URLs are still reused), leaving callers
+    enough time to use it. Entries of an object are dropped when it is replaced
+    or deleted through the owning service.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_PRESIGNED_URL_CACHE_SIZE,
+                 safety_margin: float = DEFAULT_PRESIGNED_URL_SAFETY_MARGIN,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            max_size: Maximum number of cached URLs (0 disables the cache)
+            safety_margin: Seconds before expiry after which a URL is signed anew
+            clock: Monotonic time source
+        """
+        self.max_size = max(0, max_size)
+        self.safety_margin = max(0.0, safety_margin)
+        self._clock = clock
+        self._urls: 'OrderedDict[Tuple[str, str, int], Tuple[str, float]]' = OrderedDict()
+        # Cached expiries of each object, so invalidation doesn't scan the cache
+        self._expiries: Dict[Tuple[str, str], Set[int]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, bucket_name: str, object_name: str, expires: int) -> Optional[str]:
+        """
+        Get a cached URL that is still valid for longer than the safety margin.
+
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object
+            expires: Lifetime the URL was requested with, in seconds
+
+        Returns:
+            Optional[str]: Cached URL or None
+        """
+        key = (bucket_name, object_name, expires)
+        with self._lock:
+            entry = self._urls.get(key)
+            if entry is not None:
+                url, reuse_until = entry
+                if self._clock() < reuse_until:
+                    self._urls.move_to_end(key)
+                    self.hits += 1
+                    return url
+                self._remove(key)
+            self.misses += 1
+            return None
+
+    def put(self, bucket_name: str, object_name: str, expires: int, url: str) -> None:
+        """
+        Cache a URL.
+
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object
+            expires: Lifetime of the URL in seconds
+            url: Presigned URL signed just now
+        """
+        if not self.max_size:
+            return
+        reuse_until = self._clock() + expires - min(self.safety_margin, expires / 2)
+        key = (bucket_name, object_name, expires)
+        with self._lock:
+            self._urls[key] = (url, reuse_until)
+            self._urls.move_to_end(key)
+            self._expiries.setdefault(key[:2], set()).add(expires)
+            while len(self._urls) > self.max_size:
+                self._remove(next(iter(self._urls)))
+
+    def _remove(self, key: Tuple[str, str, int]) -> None:
+        del self._urls[key]
+        expiries = self._expiries.get(key[:2])
+        if expiries is not None:
+            expiries.discard(key[2])
+            if not expiries:
+                del self._expiries[key[:2]]
+
+    def invalidate(self, bucket_name: str, object_name: str) -> None:
+        """
+        Drop the URLs of an object (of every expiry).
+
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object
+        """
+        with self._lock:
+            for expires in self._expiries.pop((bucket_name, object_name), ()):
+                self._urls.pop((bucket_name, object_name, expires), None)
+
+    def clear(self) -> None:
+        """Drop all cached URLs."""
+        with self._lock:
+            self._urls.clear()
+            self._expiries.clear()
+
+    def __len__(self) -> int:
+        return len(self._urls)
@@ -13,7 +13,10 @@ from art_gallery.infrastructure.config.minio_config import MinioConfig
 from art_gallery.infrastructure.config.serialization_config import SerializationConfig
 from art_gallery.infrastructure.config.constants import (
     DEFAULT_SERIALIZATION_FORMAT,
-    SUPPORTED_SERIALIZATION_FORMATS
+    SUPPORTED_SERIALIZATION_FORMATS,
+    DEFAULT_SERIALIZATION_COMPRESSION,
+    SUPPORTED_SERIALIZATION_COMPRESSIONS,
+    DEFAULT_PARALLEL_SCAN_WORKERS
 )
 
 # Тип для аннотирования любого конфига
@@ -143,6 +146,20 @@ class ConfigRegistry:
                 validator=lambda x: x in SUPPORTED_SERIALIZATION_FORMATS,
                 description="Формат сериализации данных (json, xml, yaml, pickle)",
             ),
+            "SERIALIZATION_COMPRESSION": ConfigItem(
+                key="SERIALIZATION_COMPRESSION",
+                required=False,
+                default_value=DEFAULT_SERIALIZATION_COMPRESSION,
+                validator=lambda x: x in SUPPORTED_SERIALIZATION_COMPRESSIONS,
+                description="Сжатие сохраняемых данных (none, gzip, lzma, zstd)",
+            ),
+            "PARALLEL_SCAN_WORKERS": ConfigItem(
+                key="PARALLEL_SCAN_WORKERS",
+                required=False,
+                default_value=str(DEFAULT_PARALLEL_SCAN_WORKERS),
+                validator=lambda x: x.isdigit(),
+                description="Процессы параллельного поиска по экспонатам (0 - отключен)",
+            ),
             "LOCAL_STORAGE_PATH": ConfigItem(
                 key="LOCAL_STORAGE_PATH",
                 required=True,
@@ -344,6 +361,7 @@ class ConfigRegistry:
         
         if self._serialization_config:
             logging.info(f"  Format: {self._serialization_config.format}")
+            logging.info(f"  Compression: {self._serialization_config.compression}")
         
         if self._storage_config and self._storage_config.storage_type.lower() == "cloud":
             logging.info(f"MinIO Config: {'Loaded' if self._minio_config else 'Not loaded'}")
@@ -6,9 +6,20 @@
 DEFAULT_STORAGE_TYPE = 'local'
 DEFAULT_LOCAL_STORAGE_PATH = 'media/artworks'
 DEFAULT_ENABLE_IMAGE_THUMBNAILS = True 
+# Производные изображения (при наличии Pillow): наибольшая сторона миниатюры и веб-версии (пикселей)
+DEFAULT_THUMBNAIL_SIZE = 320
+DEFAULT_WEB_IMAGE_SIZE = 1600
 DEFAULT_ENABLE_DIRECT_URLS = True
 DEFAULT_ENABLE_CACHING = False
+# Хранение изображений по хэшу содержимого (одинаковые файлы хранятся один раз)
+DEFAULT_CONTENT_ADDRESSED_STORAGE = False
+# Локальный кэш загруженных из облака медиафайлов: каталог и максимальный объем (байт)
+DEFAULT_MEDIA_CACHE_PATH = 'media/.cache'
+DEFAULT_MEDIA_CACHE_MAX_BYTES = 512 * 1024 * 1024
 DEFAULT_PRESIGNED_URL_EXPIRY = 3600
+# Кэш подписанных URL: число URL и запас времени (с) до истечения, после которого URL подписывается заново
+DEFAULT_PRESIGNED_URL_CACHE_SIZE = 1024
+DEFAULT_PRESIGNED_URL_SAFETY_MARGIN = 300
 
 # MinioConfig defaults
 DEFAULT_MINIO_ENDPOINT = 'localhost:9000'
@@ -17,6 +28,17 @@ DEFAULT_MINIO_BUCKET = 'art-gallery'
 DEFAULT_ARTWORK_PREFIX = 'artworks/'
 DEFAULT_USER_PREFIX = 'users/'
 DEFAULT_EXHIBITION_PREFIX = 'exhibitions/'
+# Размер части при загрузке потока неизвестной длины (минимум S3 - 5 МБ)
+DEFAULT_MINIO_PART_SIZE = 10 * 1024 * 1024
+# Количество частей multipart-загрузки, отправляемых параллельно
+DEFAULT_MINIO_PARALLEL_UPLOADS = 4
+# Размер фрагмента при потоковом чтении объектов и файлов
+DEFAULT_STREAM_CHUNK_SIZE = 1024 * 1024
+# Общий пул HTTP-соединений MinIO: соединений на хост, таймауты (с) и повторы запросов
+DEFAULT_MINIO_POOL_SIZE = 16
+DEFAULT_MINIO_CONNECT_TIMEOUT = 5.0
+DEFAULT_MINIO_READ_TIMEOUT = 300.0
+DEFAULT_MINIO_MAX_RETRIES = 3
 
 # CLIConfig defaults
 DEFAULT_MAX_RETRIES = 3
@@ -25,4 +47,9 @@ DEFAULT_DEBUG_MODE = False
 
 # SerializationConfig defaults
 DEFAULT_SERIALIZATION_FORMAT = 'json'
-SUPPORTED_SERIALIZATION_FORMATS = ['json', 'xml']
+SUPPORTED_SERIALIZATION_FORMATS = ['json', 'xml', 'binary']
+# Сжатие сохраняемых коллекций (zstd требует пакет zstandard)
+DEFAULT_SERIALIZATION_COMPRESSION = 'none'
+SUPPORTED_SERIALIZATION_COMPRESSIONS = ['none', 'gzip', 'lzma', 'zstd']
+# Процессы параллельного просмотра коллекции экспонатов (0 - отключен)
+DEFAULT_PARALLEL_SCAN_WORKERS = 0
@@ -11,10 +11,26 @@ from .constants import (
     DEFAULT_MINIO_BUCKET,
     DEFAULT_ARTWORK_PREFIX,
     DEFAULT_USER_PREFIX,
-    DEFAULT_EXHIBITION_PREFIX
+    DEFAULT_EXHIBITION_PREFIX,
+    DEFAULT_MINIO_POOL_SIZE,
+    DEFAULT_MINIO_CONNECT_TIMEOUT,
+    DEFAULT_MINIO_READ_TIMEOUT,
+    DEFAULT_MINIO_MAX_RETRIES,
+    DEFAULT_MINIO_PART_SIZE,
+    DEFAULT_MINIO_PARALLEL_UPLOADS,
+    DEFAULT_PRESIGNED_URL_CACHE_SIZE,
+    DEFAULT_PRESIGNED_URL_SAFETY_MARGIN
 )
 
 
+def _env_number(name: str, number_type: type, default):
+    """Read a numeric environment variable, falling back to the default on bad values."""
+    try:
+        return number_type(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
 @dataclass
 class MinioConfig:
     """Configuration for MinIO client."""
@@ -32,6 +48,20 @@ class MinioConfig:
     user_prefix: str = DEFAULT_USER_PREFIX
     event_prefix: str = "events/"
     
+    # HTTP connection pool settings (shared by all clients of the endpoint)
+    pool_size: int = DEFAULT_MINIO_POOL_SIZE
+    connect_timeout: float = DEFAULT_MINIO_CONNECT_TIMEOUT
+    read_timeout: float = DEFAULT_MINIO_READ_TIMEOUT
+    max_retries: int = DEFAULT_MINIO_MAX_RETRIES
+    
+    # Multipart upload settings (part size in bytes, parts sent concurrently)
+    part_size: int = DEFAULT_MINIO_PART_SIZE
+    parallel_uploads: int = DEFAULT_MINIO_PARALLEL_UPLOADS
+    
+    # Presigned URL cache (URLs kept, seconds before expiry a URL is re-signed; 0 size disables)
+    url_cache_size: int = DEFAULT_PRESIGNED_URL_CACHE_SIZE
+    url_safety_margin: float = DEFAULT_PRESIGNED_URL_SAFETY_MARGIN
+    
     @classmethod
     def from_env(cls) -> 'MinioConfig':
         """
@@ -43,6 +73,13 @@ class MinioConfig:
         - MINIO_SECRET_KEY: MinIO secret key
         - MINIO_USE_SSL: Whether to use SSL (True/False)
         - MINIO_DEFAULT_BUCKET: Default bucket name for gallery media
+        - MINIO_POOL_SIZE: Connections kept alive per host in the shared pool
+        - MINIO_CONNECT_TIMEOUT / MINIO_READ_TIMEOUT: Timeouts in seconds
+        - MINIO_MAX_RETRIES: Retries of failed requests
+        - MINIO_PART_SIZE: Multipart upload part size in bytes (at least 5 MiB)
+        - MINIO_PARALLEL_UPLOADS: Parts uploaded concurrently
+        - MINIO_URL_CACHE_SIZE: Presigned URLs kept in the cache (0 disables it)
+        - MINIO_URL_SAFETY_MARGIN: Seconds before expiry a cached URL is re-signed
         
         Returns:
             MinioConfig: Configuration instance
@@ -60,6 +97,16 @@ class MinioConfig:
         user_prefix = os.getenv("MINIO_USER_PREFIX", DEFAULT_USER_PREFIX)
         event_prefix = os.getenv("MINIO_EVENT_PREFIX", "events/")
         
+        # Connection pool tuning
+        pool_size = _env_number("MINIO_POOL_SIZE", int, DEFAULT_MINIO_POOL_SIZE)
+        connect_timeout = _env_number("MINIO_CONNECT_TIMEOUT", float, DEFAULT_MINIO_CONNECT_TIMEOUT)
+        read_timeout = _env_number("MINIO_READ_TIMEOUT", float, DEFAULT_MINIO_READ_TIMEOUT)
+        max_retries = _env_number("MINIO_MAX_RETRIES", int, DEFAULT_MINIO_MAX_RETRIES)
+        part_size = _env_number("MINIO_PART_SIZE", int, DEFAULT_MINIO_PART_SIZE)
+        parallel_uploads = _env_number("MINIO_PARALLEL_UPLOADS", int, DEFAULT_MINIO_PARALLEL_UPLOADS)
+        url_cache_size = _env_number("MINIO_URL_CACHE_SIZE", int, DEFAULT_PRESIGNED_URL_CACHE_SIZE)
+        url_safety_margin = _env_number("MINIO_URL_SAFETY_MARGIN", float, DEFAULT_PRESIGNED_URL_SAFETY_MARGIN)
+        
         # Validate required settings
         if not access_key or not secret_key:
             raise ValueError(
@@ -76,7 +123,15 @@ class MinioConfig:
             artwork_prefix=artwork_prefix,
             exhibition_prefix=exhibition_prefix,
             user_prefix=user_prefix,
-            event_prefix=event_prefix
+            event_prefix=event_prefix,
+            pool_size=pool_size,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            max_retries=max_retries,
+            part_size=part_size,
+            parallel_uploads=parallel_uploads,
+            url_cache_size=url_cache_size,
+            url_safety_margin=url_safety_margin
         )
     
     def get_prefix_for_entity_type(self, entity_type: str) -> str:
@@ -4,13 +4,22 @@
 
 import os
 from dataclasses import dataclass
-from .constants import DEFAULT_SERIALIZATION_FORMAT, SUPPORTED_SERIALIZATION_FORMATS
+from .constants import (
+    DEFAULT_SERIALIZATION_FORMAT,
+    SUPPORTED_SERIALIZATION_FORMATS,
+    DEFAULT_SERIALIZATION_COMPRESSION,
+    SUPPORTED_SERIALIZATION_COMPRESSIONS,
+    DEFAULT_PARALLEL_SCAN_WORKERS
+)
 
 
 @dataclass
 class SerializationConfig:
     """Конфигурация для механизма сериализации данных"""
     format: str = DEFAULT_SERIALIZATION_FORMAT
+    compression: str = DEFAULT_SERIALIZATION_COMPRESSION
+    # Процессы параллельного поиска по загруженной коллекции экспонатов (0 - отключен)
+    parallel_scan_workers: int = DEFAULT_PARALLEL_SCAN_WORKERS
     
     @classmethod
     def from_env(cls) -> 'SerializationConfig':
@@ -21,7 +30,13 @@ class SerializationConfig:
             SerializationConfig: Объект конфигурации с загруженными значениями
         """
         format_value = os.environ.get('SERIALIZATION_FORMAT', DEFAULT_SERIALIZATION_FORMAT)
-        return cls(format=format_value)
+        compression_value = os.environ.get('SERIALIZATION_COMPRESSION', DEFAULT_SERIALIZATION_COMPRESSION)
+        try:
+            parallel_scan_workers = int(os.environ.get('PARALLEL_SCAN_WORKERS', str(DEFAULT_PARALLEL_SCAN_WORKERS)))
+        except ValueError:
+            parallel_scan_workers = DEFAULT_PARALLEL_SCAN_WORKERS
+        return cls(format=format_value, compression=compression_value,
+                   parallel_scan_workers=parallel_scan_workers)
     
     def __post_init__(self):
         """Валидация конфигурации сериализации после инициализации."""
@@ -31,3 +46,14 @@ class SerializationConfig:
                 f"Неподдерживаемый формат сериализации: '{self.format}'. "
                 f"Поддерживаемые форматы: {supported_formats}"
             )
+        if self.compression not in SUPPORTED_SERIALIZATION_COMPRESSIONS:
+            supported_compressions = ', '.join(SUPPORTED_SERIALIZATION_COMPRESSIONS)
+            raise ValueError(
+                f"Неподдерживаемый алгоритм сжатия: '{self.compression}'. "
+                f"Поддерживаемые алгоритмы: {supported_compressions}"
+            )
+        if self.parallel_scan_workers < 0:
+            raise ValueError(
+                f"Количество процессов параллельного просмотра не может быть отрицательным, "
+                f"получено: {self.parallel_scan_workers}"
+            )
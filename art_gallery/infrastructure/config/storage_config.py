@@ -9,6 +9,9 @@ from .constants import (
     DEFAULT_ENABLE_IMAGE_THUMBNAILS,
     DEFAULT_ENABLE_DIRECT_URLS,
     DEFAULT_ENABLE_CACHING,
+    DEFAULT_CONTENT_ADDRESSED_STORAGE,
+    DEFAULT_MEDIA_CACHE_PATH,
+    DEFAULT_MEDIA_CACHE_MAX_BYTES,
     DEFAULT_PRESIGNED_URL_EXPIRY
 )
 
@@ -27,6 +30,13 @@ class StorageConfig:
     enable_direct_urls: bool = DEFAULT_ENABLE_DIRECT_URLS
     enable_caching: bool = DEFAULT_ENABLE_CACHING
     
+    # Хранение изображений по хэшу содержимого (sha256/<префикс>/<хэш>)
+    content_addressed: bool = DEFAULT_CONTENT_ADDRESSED_STORAGE
+    
+    # Локальный кэш облачных медиафайлов (при enable_caching)
+    cache_path: str = DEFAULT_MEDIA_CACHE_PATH
+    cache_max_bytes: int = DEFAULT_MEDIA_CACHE_MAX_BYTES
+    
     # Срок действия временных URL (в секундах)
     presigned_url_expiry: int = DEFAULT_PRESIGNED_URL_EXPIRY
     
@@ -41,16 +51,24 @@ class StorageConfig:
         enable_thumbnails_str = os.getenv('ENABLE_IMAGE_THUMBNAILS', str(int(DEFAULT_ENABLE_IMAGE_THUMBNAILS)))
         enable_direct_urls_str = os.getenv('ENABLE_DIRECT_URLS', str(int(DEFAULT_ENABLE_DIRECT_URLS)))
         enable_caching_str = os.getenv('ENABLE_CACHING', str(int(DEFAULT_ENABLE_CACHING)))
+        content_addressed_str = os.getenv('CONTENT_ADDRESSED_STORAGE', str(int(DEFAULT_CONTENT_ADDRESSED_STORAGE)))
         
         enable_image_thumbnails = enable_thumbnails_str == '1' or enable_thumbnails_str.lower() == 'true'
         enable_direct_urls = enable_direct_urls_str == '1' or enable_direct_urls_str.lower() == 'true'
         enable_caching = enable_caching_str == '1' or enable_caching_str.lower() == 'true'
+        content_addressed = content_addressed_str == '1' or content_addressed_str.lower() == 'true'
         
         # Приведение строкового значения к int с обработкой ошибок
         try:
             presigned_url_expiry = int(os.getenv('PRESIGNED_URL_EXPIRY', str(DEFAULT_PRESIGNED_URL_EXPIRY)))
         except ValueError:
             presigned_url_expiry = DEFAULT_PRESIGNED_URL_EXPIRY
+        
+        cache_path = os.getenv('MEDIA_CACHE_PATH', DEFAULT_MEDIA_CACHE_PATH)
+        try:
+            cache_max_bytes = int(os.getenv('MEDIA_CACHE_MAX_BYTES', str(DEFAULT_MEDIA_CACHE_MAX_BYTES)))
+        except ValueError:
+            cache_max_bytes = DEFAULT_MEDIA_CACHE_MAX_BYTES
             
         # Нормализация пути к локальному хранилищу
         if local_storage_path:
@@ -62,6 +80,9 @@ class StorageConfig:
             enable_image_thumbnails=enable_image_thumbnails,
             enable_direct_urls=enable_direct_urls,
             enable_caching=enable_caching,
+            content_addressed=content_addressed,
+            cache_path=cache_path,
+            cache_max_bytes=cache_max_bytes,
             presigned_url_expiry=presigned_url_expiry
         )
         
@@ -75,6 +96,10 @@ class StorageConfig:
         if self.presigned_url_expiry <= 0:
             raise ValueError(f"Срок действия временных URL должен быть положительным числом, получено: {self.presigned_url_expiry}")
         
+        # Проверка объема кэша
+        if self.cache_max_bytes < 0:
+            raise ValueError(f"Объем кэша не может быть отрицательным, получено: {self.cache_max_bytes}")
+        
         # Проверка пути к локальному хранилищу для типа 'local'
         if self.storage_type == 'local' and not self.local_storage_path:
             raise ValueError("Путь к локальному хранилищу не указан, но тип хранилища установлен как 'local'")
@@ -0,0 +1,247 @@
+"""
+Потоковое преобразование файлов коллекций между форматами сериализации.
+Записи читаются итератором десериализатора исходного формата и сразу пишутся
+потоковым сериализатором целевого формата, поэтому память не зависит от размера
+файла. Файлы коллекций (users, artworks, exhibitions) преобразуются параллельно в
+отдельных процессах, целевой файл пишется во временный и заменяется атомарно.
+"""
+import logging
+import multiprocessing
+import os
+import queue
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from art_gallery.infrastructure.factory.serialization_plugin_factory import SerializationPluginFactory
+from serialization.implementations.compression.compression_codecs import (
+    COMPRESSION_NONE,
+    compression_suffix,
+    find_latest_variant
+)
+
+# Коллекции, хранящиеся в отдельных файлах
+ENTITY_FILES = ('users', 'artworks', 'exhibitions')
+
+# Период отправки сообщений о ходе преобразования (в записях)
+PROGRESS_INTERVAL = 50000
+
+# Обработчик хода преобразования: (коллекция, записей, прочитано байт, размер исходного файла)
+ProgressCallback = Callable[[str, int, int, int], None]
+
+
+@dataclass
+class ConversionResult:
+    """Результат преобразования файла коллекции"""
+    entity: str
+    source_file: str
+    target_file: str
+    records: int = 0
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+def find_data_file(directory: str, entity: str, format_name: str) -> Optional[str]:
+    """
+    Находит непустой файл коллекции (несжатый или с любым сжатием).
+    Если вариантов несколько, берется измененный последним.
+
+    Args:
+        directory (str): Каталог формата
+        entity (str): Имя коллекции
+        format_name (str): Формат файла
+
+    Returns:
+        Optional[str]: Путь к файлу или None, если файла нет или он пуст
+    """
+    return find_latest_variant(os.path.join(directory, f'{entity}.{format_name}'))
+
+
+class _RecordCounter:
+    """Считает записи, проходящие через итератор, и сообщает о ходе чтения"""
+
+    def __init__(self):
+        self.count = 0
+
+    def track(self, records: Iterable[Any], source: Any, entity: str, total_size: int,
+              progress: Optional[ProgressCallback]) -> Iterator[Any]:
+        for record in records:
+            self.count += 1
+            if progress is not None and self.count % PROGRESS_INTERVAL == 0:
+                progress(entity, self.count, source.tell(), total_size)
+            yield record
+        if progress is not None:
+            progress(entity, self.count, total_size, total_size)
+
+
+def convert_file(entity: str, source_file: str, target_file: str, source_format: str,
+                 target_format: str, compression: str = COMPRESSION_NONE,
+                 progress: Optional[ProgressCallback] = None) -> int:
+    """
+    Потоково преобразует файл коллекции в другой формат.
+    Целевой файл пишется во временный файл рядом с ним и заменяет его атомарно,
+    поэтому при ошибке прежнее содержимое целевого файла сохраняется.
+
+    Args:
+        entity (str): Имя коллекции (для сообщений о ходе преобразования)
+        source_file (str): Исходный файл (сжатый или несжатый)
+        target_file (str): Целевой файл
+        source_format (str): Формат исходного файла
+        target_format (str): Формат целевого файла
+        compression (str): Сжатие целевого файла
+        progress (ProgressCallback, optional): Обработчик хода преобразования
+
+    Returns:
+        int: Количество преобразованных записей
+
+    Raises:
+        ValueError: Если формат или алгоритм сжатия не поддерживается
+        SerializationError, DeserializationError: Если возникла ошибка при преобразовании
+    """
+    deserializer = SerializationPluginFactory.get_compressed_deserializer(source_format)
+    serializer = SerializationPluginFactory.get_compressed_serializer(target_format, compression)
+    total_size = os.path.getsize(source_file)
+    temp_file = target_file + '.tmp'
+    counter = _RecordCounter()
+    try:
+        with open(source_file, 'rb') as source, open(temp_file, 'wb') as target:
+            records = deserializer.iter_deserialize_stream(source)
+            serializer.serialize_to_stream(counter.track(records, source, entity, total_size, progress), target)
+            target.flush()
+            os.fsync(target.fileno())
+        os.replace(temp_file, target_file)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+    return counter.count
+
+
+# --- Состояние процесса-воркера ---
+
+_progress_queue: Optional[Any] = None
+
+
+def _init_worker(progress_queue: Any) -> None:
+    global _progress_queue
+    _progress_queue = progress_queue
+
+
+def _report_progress(entity: str, records: int, done: int, total: int) -> None:
+    _progress_queue.put((entity, records, done, total))
+
+
+def _convert_in_worker(entity: str, source_file: str, target_file: str, source_format: str,
+                       target_format: str, compression: str) -> int:
+    return convert_file(entity, source_file, target_file, source_format, target_format, compression,
+                        _report_progress if _progress_queue is not None else None)
+
+
+class DataConverter:
+    """
+    Преобразует файлы коллекций каталога одного формата в каталог другого.
+    Каждая коллекция преобразуется в отдельном процессе; при одном воркере,
+    одном файле или недоступности пула процессов - последовательно в текущем.
+    """
+
+    def __init__(self, workers: Optional[int] = None, progress: Optional[ProgressCallback] = None):
+        """
+        Args:
+            workers: Количество процессов (по умолчанию - число ядер, не больше числа коллекций)
+            progress: Обработчик хода преобразования (вызывается в текущем процессе)
+        """
+        self._logger = logging.getLogger(__name__)
+        self._workers = max(1, workers or os.cpu_count() or 1)
+        self._progress = progress
+
+    def convert(self, source_dir: str, target_dir: str, source_format: str, target_format: str,
+                compression: str = COMPRESSION_NONE,
+                entities: Iterable[str] = ENTITY_FILES) -> List[ConversionResult]:
+        """
+        Преобразует найденные файлы коллекций
+
+        Args:
+            source_dir (str): Каталог исходного формата
+            target_dir (str): Каталог целевого формата (создается при необходимости)
+            source_format (str): Исходный формат
+            target_format (str): Целевой формат
+            compression (str): Сжатие целевых файлов
+            entities (Iterable[str]): Имена коллекций
+
+        Returns:
+            List[ConversionResult]: Результаты по найденным файлам в порядке коллекций
+        """
+        jobs: List[Tuple[str, str, str]] = []
+        for entity in entities:
+            source_file = find_data_file(source_dir, entity, source_format)
+            if source_file is not None:
+                target_file = os.path.join(target_dir, f'{entity}.{target_format}{compression_suffix(compression)}')
+                jobs.append((entity, source_file, target_file))
+        if not jobs:
+            return []
+        os.makedirs(target_dir, exist_ok=True)
+
+        workers = min(self._workers, len(jobs))
+        if workers > 1:
+            results = self._convert_parallel(jobs, workers, source_format, target_format, compression)
+            if results is not None:
+                return results
+        return [self._convert_job(job, source_format, target_format, compression) for job in jobs]
+
+    def _convert_job(self, job: Tuple[str, str, str], source_format: str, target_format: str,
+                     compression: str) -> ConversionResult:
+        entity, source_file, target_file = job
+        result = ConversionResult(entity, source_file, target_file)
+        try:
+            result.records = convert_file(entity, source_file, target_file, source_format, target_format,
+                                          compression, self._progress)
+        except Exception as e:
+            self._logger.error(f"Ошибка преобразования {source_file}: {e}", exc_info=True)
+            result.error = str(e)
+        return result
+
+    def _convert_parallel(self, jobs: List[Tuple[str, str, str]], workers: int, source_format: str,
+                          target_format: str, compression: str) -> Optional[List[ConversionResult]]:
+        try:
+            progress_queue = multiprocessing.Queue() if self._progress is not None else None
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                           initargs=(progress_queue,))
+        except (OSError, ImportError, NotImplementedError) as e:
+            # Например, нет поддержки семафоров в окружении - преобразование выполнится последовательно
+            self._logger.warning(f"Пул процессов недоступен, преобразование выполняется последовательно: {e}")
+            return None
+
+        with executor:
+            futures: Dict[Future, ConversionResult] = {
+                executor.submit(_convert_in_worker, entity, source_file, target_file,
+                                source_format, target_format, compression):
+                    ConversionResult(entity, source_file, target_file)
+                for entity, source_file, target_file in jobs
+            }
+            pending = set(futures)
+            while pending:
+                _, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                self._drain_progress(progress_queue)
+        # Воркеры завершены: оставшиеся сообщения уже в очереди
+        self._drain_progress(progress_queue)
+        if progress_queue is not None:
+            progress_queue.close()
+
+        for future, result in futures.items():
+            try:
+                result.records = future.result()
+            except Exception as e:
+                self._logger.error(f"Ошибка преобразования {result.source_file}: {e}")
+                result.error = str(e)
+        return list(futures.values())
+
+    def _drain_progress(self, progress_queue: Any) -> None:
+        if progress_queue is None:
+            return
+        try:
+            while True:
+                self._progress(*progress_queue.get_nowait())
+        except queue.Empty:
+            pass
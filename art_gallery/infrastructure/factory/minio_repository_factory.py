@@ -13,6 +13,7 @@ from art_gallery.repository.implementations.minio.unit_of_work import MinioUnitO
 
 from art_gallery.application.interfaces.cloud.i_media_service import IMediaService
 from art_gallery.infrastructure.cloud.minio_service import MinioService
+from art_gallery.infrastructure.cloud.minio_client_provider import MinioClientProvider
 from art_gallery.infrastructure.config.minio_config import MinioConfig
 from art_gallery.infrastructure.cloud.media_service import MediaService
 from art_gallery.infrastructure.factory.serialization_plugin_factory import SerializationPluginFactory
@@ -26,7 +27,8 @@ class MinioRepositoryFactory:
     @classmethod
     def create_minio_service(cls, config: Optional[MinioConfig] = None) -> MinioService:
         """
-        Создает сервис для работы с MinIO.
+        Возвращает общий для процесса сервис для работы с MinIO
+        (один клиент и пул соединений на endpoint и учетные данные).
         
         Args:
             config: Конфигурация MinIO. Если не указана, используется конфигурация по умолчанию.
@@ -35,7 +37,7 @@ class MinioRepositoryFactory:
             MinioService: Сервис для работы с MinIO.
         """
         minio_config = config or MinioConfig.from_env()
-        return MinioService(minio_config)
+        return MinioClientProvider.get_service(minio_config)
 
     @classmethod
     def create_media_service(cls, 
@@ -45,7 +47,7 @@ class MinioRepositoryFactory:
         Создает сервис для работы с медиа-файлами.
         
         Args:
-            minio_service: Сервис MinIO. Если не указан, создается новый.
+            minio_service: Сервис MinIO. Если не указан, используется общий сервис процесса.
             config: Конфигурация MinIO. Если не указана, используется конфигурация по умолчанию.
             
         Returns:
@@ -58,6 +60,7 @@ class MinioRepositoryFactory:
     @classmethod
     def create_user_repository(cls, 
                              format_name: str = "json", 
+                             compression: str = "none", 
                              minio_service: Optional[MinioService] = None, 
                              config: Optional[MinioConfig] = None) -> IUserRepository:
         """
@@ -65,7 +68,8 @@ class MinioRepositoryFactory:
         
         Args:
             format_name: Формат сериализации (json, xml).
-            minio_service: Сервис MinIO. Если не указан, создается новый.
+            compression: Сжатие сохраняемых данных (none, gzip, lzma, zstd).
+            minio_service: Сервис MinIO. Если не указан, используется общий сервис процесса.
             config: Конфигурация MinIO. Если не указана, используется конфигурация по умолчанию.
             
         Returns:
@@ -74,8 +78,8 @@ class MinioRepositoryFactory:
         minio_config = config or MinioConfig.from_env()
         service = minio_service or cls.create_minio_service(minio_config)
         
-        serializer = SerializationPluginFactory.get_serializer(format_name)
-        deserializer = SerializationPluginFactory.get_deserializer(format_name)
+        serializer = SerializationPluginFactory.get_compressed_serializer(format_name, compression)
+        deserializer = SerializationPluginFactory.get_compressed_deserializer(format_name)
         
         return UserMinioRepository(
             serializer=serializer,
@@ -87,15 +91,19 @@ class MinioRepositoryFactory:
     @classmethod
     def create_artwork_repository(cls, 
                                 format_name: str = "json", 
+                                compression: str = "none", 
                                 minio_service: Optional[MinioService] = None, 
-                                config: Optional[MinioConfig] = None) -> IArtworkRepository:
+                                config: Optional[MinioConfig] = None,
+                                vectorized: bool = True) -> IArtworkRepository:
         """
         Создает репозиторий экспонатов, использующий MinIO.
         
         Args:
             format_name: Формат сериализации (json, xml).
-            minio_service: Сервис MinIO. Если не указан, создается новый.
+            compression: Сжатие сохраняемых данных (none, gzip, lzma, zstd).
+            minio_service: Сервис MinIO. Если не указан, используется общий сервис процесса.
             config: Конфигурация MinIO. Если не указана, используется конфигурация по умолчанию.
+            vectorized: Векторизованная фильтрация по колонкам NumPy (без numpy отключается).
             
         Returns:
             IArtworkRepository: Репозиторий экспонатов.
@@ -103,19 +111,21 @@ class MinioRepositoryFactory:
         minio_config = config or MinioConfig.from_env()
         service = minio_service or cls.create_minio_service(minio_config)
         
-        serializer = SerializationPluginFactory.get_serializer(format_name)
-        deserializer = SerializationPluginFactory.get_deserializer(format_name)
+        serializer = SerializationPluginFactory.get_compressed_serializer(format_name, compression)
+        deserializer = SerializationPluginFactory.get_compressed_deserializer(format_name)
         
         return ArtworkMinioRepository(
             serializer=serializer,
             deserializer=deserializer,
             minio_service=service,
-            config=minio_config
+            config=minio_config,
+            vectorized=vectorized
         )
 
     @classmethod
     def create_exhibition_repository(cls, 
                                    format_name: str = "json", 
+                                   compression: str = "none", 
                                    minio_service: Optional[MinioService] = None, 
                                    config: Optional[MinioConfig] = None) -> IExhibitionRepository:
         """
@@ -123,7 +133,8 @@ class MinioRepositoryFactory:
         
         Args:
             format_name: Формат сериализации (json, xml).
-            minio_service: Сервис MinIO. Если не указан, создается новый.
+            compression: Сжатие сохраняемых данных (none, gzip, lzma, zstd).
+            minio_service: Сервис MinIO. Если не указан, используется общий сервис процесса.
             config: Конфигурация MinIO. Если не указана, используется конфигурация по умолчанию.
             
         Returns:
@@ -132,8 +143,8 @@ class MinioRepositoryFactory:
         minio_config = config or MinioConfig.from_env()
         service = minio_service or cls.create_minio_service(minio_config)
         
-        serializer = SerializationPluginFactory.get_serializer(format_name)
-        deserializer = SerializationPluginFactory.get_deserializer(format_name)
+        serializer = SerializationPluginFactory.get_compressed_serializer(format_name, compression)
+        deserializer = SerializationPluginFactory.get_compressed_deserializer(format_name)
         
         return ExhibitionMinioRepository(
             serializer=serializer,
@@ -152,7 +163,7 @@ class MinioRepositoryFactory:
         
         Args:
             format_name: Формат сериализации (json, xml).
-            minio_service: Сервис MinIO. Если не указан, создается новый.
+            minio_service: Сервис MinIO. Если не указан, используется общий сервис процесса.
             config: Конфигурация MinIO. Если не указана, используется конфигурация по умолчанию.
             
         Returns:
@@ -19,6 +19,7 @@ from art_gallery.infrastructure.config.minio_config import MinioConfig
 from art_gallery.infrastructure.cloud.minio_service import MinioService
 from art_gallery.infrastructure.factory.serialization_plugin_factory import SerializationPluginFactory
 from art_gallery.infrastructure.factory.minio_repository_factory import MinioRepositoryFactory
+from serialization.implementations.compression.compression_codecs import compression_suffix
 
 import os
 
@@ -36,6 +37,7 @@ class RepositoryFactory:
     def create_user_repository(cls, 
                               storage_type: Literal["file", "minio"] = "file", 
                               format_name: str = "json",
+                              compression: str = "none",
                               minio_service: Optional[MinioService] = None,
                               config: Optional[MinioConfig] = None) -> IUserRepository:
         """
@@ -44,6 +46,7 @@ class RepositoryFactory:
         Args:
             storage_type: Тип хранилища ("file" или "minio").
             format_name: Формат сериализации (json, xml).
+            compression: Сжатие сохраняемых данных (none, gzip, lzma, zstd).
             minio_service: Сервис MinIO для репозиториев MinIO.
             config: Конфигурация MinIO для репозиториев MinIO.
             
@@ -55,11 +58,11 @@ class RepositoryFactory:
         """
         if storage_type == cls.STORAGE_FILE:
             # Получаем сериализатор и десериализатор
-            serializer = SerializationPluginFactory.get_serializer(format_name)
-            deserializer = SerializationPluginFactory.get_deserializer(format_name)
+            serializer = SerializationPluginFactory.get_compressed_serializer(format_name, compression)
+            deserializer = SerializationPluginFactory.get_compressed_deserializer(format_name)
             
             # Определяем путь к файлу в зависимости от формата
-            filename = f"users.{format_name}"
+            filename = f"users.{format_name}{compression_suffix(compression)}"
             filepath = os.path.join("data", "file", filename)
             
             # Создаем и возвращаем файловый репозиторий
@@ -69,6 +72,7 @@ class RepositoryFactory:
             # Используем фабрику для MinIO репозиториев
             return MinioRepositoryFactory.create_user_repository(
                 format_name=format_name,
+                compression=compression,
                 minio_service=minio_service,
                 config=config
             )
@@ -79,16 +83,20 @@ class RepositoryFactory:
     def create_artwork_repository(cls, 
                                  storage_type: Literal["file", "minio"] = "file", 
                                  format_name: str = "json",
+                                 compression: str = "none",
                                  minio_service: Optional[MinioService] = None,
-                                 config: Optional[MinioConfig] = None) -> IArtworkRepository:
+                                 config: Optional[MinioConfig] = None,
+                                 vectorized: bool = True) -> IArtworkRepository:
         """
         Создает репозиторий экспонатов указанного типа.
         
         Args:
             storage_type: Тип хранилища ("file" или "minio").
             format_name: Формат сериализации (json, xml).
+            compression: Сжатие сохраняемых данных (none, gzip, lzma, zstd).
             minio_service: Сервис MinIO для репозиториев MinIO.
             config: Конфигурация MinIO для репозиториев MinIO.
+            vectorized: Векторизованная фильтрация по колонкам NumPy (без numpy отключается).
             
         Returns:
             IArtworkRepository: Репозиторий экспонатов.
@@ -98,22 +106,24 @@ class RepositoryFactory:
         """
         if storage_type == cls.STORAGE_FILE:
             # Получаем сериализатор и десериализатор
-            serializer = SerializationPluginFactory.get_serializer(format_name)
-            deserializer = SerializationPluginFactory.get_deserializer(format_name)
+            serializer = SerializationPluginFactory.get_compressed_serializer(format_name, compression)
+            deserializer = SerializationPluginFactory.get_compressed_deserializer(format_name)
             
             # Определяем путь к файлу в зависимости от формата
-            filename = f"artworks.{format_name}"
+            filename = f"artworks.{format_name}{compression_suffix(compression)}"
             filepath = os.path.join("data", "file", filename)
             
             # Создаем и возвращаем файловый репозиторий
-            return ArtworkFileRepository(filepath, serializer, deserializer)
+            return ArtworkFileRepository(filepath, serializer, deserializer, vectorized=vectorized)
             
         elif storage_type == cls.STORAGE_MINIO:
             # Используем фабрику для MinIO репозиториев
             return MinioRepositoryFactory.create_artwork_repository(
                 format_name=format_name,
+                compression=compression,
                 minio_service=minio_service,
-                config=config
+                config=config,
+                vectorized=vectorized
             )
         else:
             raise ValueError(f"Неизвестный тип хранилища: {storage_type}")
@@ -122,6 +132,7 @@ class RepositoryFactory:
     def create_exhibition_repository(cls, 
                                     storage_type: Literal["file", "minio"] = "file", 
                                     format_name: str = "json",
+                                    compression: str = "none",
                                     minio_service: Optional[MinioService] = None,
                                     config: Optional[MinioConfig] = None) -> IExhibitionRepository:
         """
@@ -130,6 +141,7 @@ class RepositoryFactory:
         Args:
             storage_type: Тип хранилища ("file" или "minio").
             format_name: Формат сериализации (json, xml).
+            compression: Сжатие сохраняемых данных (none, gzip, lzma, zstd).
             minio_service: Сервис MinIO для репозиториев MinIO.
             config: Конфигурация MinIO для репозиториев MinIO.
             
@@ -141,11 +153,11 @@ class RepositoryFactory:
         """
         if storage_type == cls.STORAGE_FILE:
             # Получаем сериализатор и десериализатор
-            serializer = SerializationPluginFactory.get_serializer(format_name)
-            deserializer = SerializationPluginFactory.get_deserializer(format_name)
+            serializer = SerializationPluginFactory.get_compressed_serializer(format_name, compression)
+            deserializer = SerializationPluginFactory.get_compressed_deserializer(format_name)
             
             # Определяем путь к файлу в зависимости от формата
-            filename = f"exhibitions.{format_name}"
+            filename = f"exhibitions.{format_name}{compression_suffix(compression)}"
             filepath = os.path.join("data", "file", filename)
             
             # Создаем и возвращаем файловый репозиторий
@@ -155,6 +167,7 @@ class RepositoryFactory:
             # Используем фабрику для MinIO репозиториев
             return MinioRepositoryFactory.create_exhibition_repository(
                 format_name=format_name,
+                compression=compression,
                 minio_service=minio_service,
                 config=config
             )
@@ -1,11 +1,17 @@
-import pkg_resources
-from typing import Dict, Type, Optional
-from art_gallery.infrastructure.interfaces.serialization_plugin import ISerializationPlugin
+from typing import Any, Dict
+from serialization.factory.plugin_registry import PluginRegistry, SERIALIZATION_GROUP, DESERIALIZATION_GROUP
 from serialization.interfaces.ISerializer import ISerializer
 from serialization.interfaces.IDeserializer import IDeserializer
+from serialization.implementations.compression.compression_codecs import COMPRESSION_NONE
+from serialization.implementations.compression.compressed_serializer import CompressedSerializer
+from serialization.implementations.compression.compressed_deserializer import CompressedDeserializer
 
 class SerializationPluginFactory:
-    """Фабрика для создания и управления плагинами сериализации и десериализации"""
+    """
+    Фабрика для создания и управления плагинами сериализации и десериализации.
+    Плагины находятся через общий реестр точек входа (PluginRegistry) и
+    создаются лениво: модуль формата импортируется при первом запросе.
+    """
     
     _serializers: Dict[str, ISerializer] = {}
     _deserializers: Dict[str, IDeserializer] = {}
@@ -25,74 +31,50 @@ class SerializationPluginFactory:
     
     @classmethod
     def initialize(cls, verbose: bool = False) -> None:
-        """Инициализирует доступные плагины сериализации и десериализации"""
+        """
+        Инициализирует фабрику плагинов сериализации и десериализации.
+        Плагины импортируются и создаются при первом запросе формата, точки
+        входа читаются при первом запросе списка форматов или невстроенного формата.
+        """
         cls._verbose = verbose
         cls._serializers.clear()
         cls._deserializers.clear()
-        cls._supported_formats_cache.clear()
-
+        cls._supported_formats_cache = []
         cls._log("Initializing serialization plugins...")
-        # Показываем путь к пакету pkg_resources для отладки
-        cls._log(f"pkg_resources path: {pkg_resources.__file__}", "DEBUG")
-        
-        loaded_serializer_formats = set()
-        serializer_entry_points = list(pkg_resources.iter_entry_points('gallery.serialization'))
-        cls._log(f"Found {len(serializer_entry_points)} serializer entry points")
-        
-        for entry_point in serializer_entry_points:
-            try:
-                cls._log(f"Loading serializer plugin: {entry_point.name} from {entry_point.module_name}")
-                plugin_class = entry_point.load()
-                instance = plugin_class()
-                if isinstance(instance, ISerializer):
-                    cls._serializers[entry_point.name] = instance
-                    loaded_serializer_formats.add(entry_point.name)
-                    cls._log(f"Successfully loaded serializer plugin: {entry_point.name}")
-                else:
-                    cls._log(f"Plugin {entry_point.name} from 'gallery.serialization' is not an ISerializer.", "WARN")
-            except Exception as e:
-                cls._log(f"Failed to load serializer plugin {entry_point.name}: {e}", "ERROR")
-                if cls._verbose:
-                    import traceback
-                    traceback.print_exc()
 
-        loaded_deserializer_formats = set()
-        deserializer_entry_points = list(pkg_resources.iter_entry_points('gallery.deserialization'))
-        cls._log(f"Found {len(deserializer_entry_points)} deserializer entry points")
-        
-        for entry_point in deserializer_entry_points:
-            try:
-                cls._log(f"Loading deserializer plugin: {entry_point.name} from {entry_point.module_name}")
-                plugin_class = entry_point.load()
-                instance = plugin_class()
-                if isinstance(instance, IDeserializer):
-                    cls._deserializers[entry_point.name] = instance
-                    loaded_deserializer_formats.add(entry_point.name)
-                    cls._log(f"Successfully loaded deserializer plugin: {entry_point.name}")
-                else:
-                    cls._log(f"Plugin {entry_point.name} from 'gallery.deserialization' is not an IDeserializer.", "WARN")
-            except Exception as e:
-                cls._log(f"Failed to load deserializer plugin {entry_point.name}: {e}", "ERROR")
-                if cls._verbose:
-                    import traceback
-                    traceback.print_exc()
-        
-        # Supported formats are those available for BOTH serialization and deserialization
-        cls._supported_formats_cache = list(loaded_serializer_formats.intersection(loaded_deserializer_formats))
-        cls._log(f"Supported formats: {cls._supported_formats_cache}")
-        if not cls._supported_formats_cache:
-            cls._log("No common formats supported by both serializers and deserializers.", "WARN")
+    @classmethod
+    def _load_plugin(cls, group: str, format_name: str, interface: type, plugins: Dict[str, Any]) -> Any:
+        """Импортирует и создает плагин формата при первом обращении"""
+        if format_name in plugins:
+            return plugins[format_name]
+        if PluginRegistry.get_entry_point(group, format_name) is None:
+            return None
+        try:
+            cls._log(f"Loading plugin: {format_name} from '{group}'")
+            instance = PluginRegistry.load(group, format_name)()
+        except Exception as e:
+            cls._log(f"Failed to load plugin {format_name} from '{group}': {e}", "ERROR")
+            if cls._verbose:
+                import traceback
+                traceback.print_exc()
+            return None
+        if not isinstance(instance, interface):
+            cls._log(f"Plugin {format_name} from '{group}' is not an {interface.__name__}.", "WARN")
+            return None
+        plugins[format_name] = instance
+        cls._log(f"Successfully loaded plugin: {format_name}")
+        return instance
 
     @classmethod
     def get_serializer(cls, format_name: str) -> ISerializer:
         """
         Возвращает плагин сериализатора для указанного формата.
         """
-        if not cls._serializers: # Ensure initialized if called before app startup sequence
-            cls.initialize()
-        if format_name not in cls._serializers:
-            raise ValueError(f"Неподдерживаемый формат для сериализации: {format_name}. Доступные: {list(cls._serializers.keys())}")
-        return cls._serializers[format_name]
+        serializer = cls._load_plugin(SERIALIZATION_GROUP, format_name, ISerializer, cls._serializers)
+        if serializer is None:
+            raise ValueError(f"Неподдерживаемый формат для сериализации: {format_name}. "
+                             f"Доступные: {PluginRegistry.names(SERIALIZATION_GROUP)}")
+        return serializer
 
     @classmethod
     def create_serializer(cls, format_name: str) -> ISerializer:
@@ -102,16 +84,38 @@ class SerializationPluginFactory:
         """
         return cls.get_serializer(format_name)
 
+    @classmethod
+    def get_compressed_serializer(cls, format_name: str, compression: str = COMPRESSION_NONE) -> ISerializer:
+        """
+        Возвращает сериализатор для указанного формата, сжимающий вывод.
+        Без сжатия ('none') возвращает плагин формата без обертки.
+        
+        Raises:
+            ValueError: Если формат не поддерживается или алгоритм сжатия недоступен
+        """
+        serializer = cls.get_serializer(format_name)
+        if compression == COMPRESSION_NONE:
+            return serializer
+        return CompressedSerializer(serializer, compression)
+
+    @classmethod
+    def get_compressed_deserializer(cls, format_name: str) -> IDeserializer:
+        """
+        Возвращает десериализатор для указанного формата, читающий как сжатые
+        (алгоритм определяется по сигнатуре), так и несжатые данные.
+        """
+        return CompressedDeserializer(cls.get_deserializer(format_name))
+
     @classmethod
     def get_deserializer(cls, format_name: str) -> IDeserializer:
         """
         Возвращает плагин десериализатора для указанного формата.
         """
-        if not cls._deserializers: # Ensure initialized
-            cls.initialize()
-        if format_name not in cls._deserializers:
-            raise ValueError(f"Неподдерживаемый формат для десериализации: {format_name}. Доступные: {list(cls._deserializers.keys())}")
-        return cls._deserializers[format_name]
+        deserializer = cls._load_plugin(DESERIALIZATION_GROUP, format_name, IDeserializer, cls._deserializers)
+        if deserializer is None:
+            raise ValueError(f"Неподдерживаемый формат для десериализации: {format_name}. "
+                             f"Доступные: {PluginRegistry.names(DESERIALIZATION_GROUP)}")
+        return deserializer
 
     @classmethod
     def create_deserializer(cls, format_name: str) -> IDeserializer:
@@ -126,6 +130,14 @@ class SerializationPluginFactory:
         """
         Возвращает список форматов, поддерживаемых И для сериализации, И для десериализации.
         """
-        if not cls._supported_formats_cache and (not cls._serializers and not cls._deserializers): # Ensure initialized
-            cls.initialize()
+        if not cls._supported_formats_cache:
+            serializer_formats = PluginRegistry.names(SERIALIZATION_GROUP)
+            cls._log(f"Found {len(serializer_formats)} serializer entry points")
+            deserializer_formats = set(PluginRegistry.names(DESERIALIZATION_GROUP))
+            cls._log(f"Found {len(deserializer_formats)} deserializer entry points")
+            # Supported formats are those available for BOTH serialization and deserialization
+            cls._supported_formats_cache = [name for name in serializer_formats if name in deserializer_formats]
+            cls._log(f"Supported formats: {cls._supported_formats_cache}")
+            if not cls._supported_formats_cache:
+                cls._log("No common formats supported by both serializers and deserializers.", "WARN")
         return cls._supported_formats_cache
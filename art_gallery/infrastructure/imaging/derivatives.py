@@ -0,0 +1,195 @@
+"""
+Resized derivatives (thumbnails and web-optimized variants) of artwork images.
+
+Derivatives are JPEG files stored next to the original under a derivatives
+prefix: artworks/1/abc.png -> artworks/1/derivatives/abc.thumb.jpg. Images are
+decoded and resized in a process pool, so generating them doesn't hold the GIL
+of the process serving requests. Requires Pillow; without it derivatives are
+disabled and originals are served.
+"""
+import io
+import logging
+import os
+import posixpath
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Union
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow is an optional dependency
+    Image = None
+    ImageOps = None
+
+from art_gallery.infrastructure.config.constants import (
+    DEFAULT_THUMBNAIL_SIZE,
+    DEFAULT_WEB_IMAGE_SIZE
+)
+
+# Directory of derivatives next to the original
+DERIVATIVES_DIR = 'derivatives'
+# Extension of generated derivatives
+DERIVATIVE_EXTENSION = '.jpg'
+
+
+@dataclass(frozen=True)
+class DerivativeSpec:
+    """Variant of an image: longest side in pixels and JPEG quality."""
+    name: str
+    max_size: int
+    quality: int = 85
+
+
+# Variants from the smallest to the largest
+DERIVATIVE_SPECS = (
+    DerivativeSpec('thumb', DEFAULT_THUMBNAIL_SIZE, 80),
+    DerivativeSpec('web', DEFAULT_WEB_IMAGE_SIZE, 85),
+)
+
+
+def derivatives_available() -> bool:
+    """Check whether derivatives can be generated (Pillow is installed)."""
+    return Image is not None
+
+
+def is_derivative_path(path: str) -> bool:
+    """Check whether a path points to a derivative."""
+    return posixpath.basename(posixpath.dirname(path.replace('\\', '/'))) == DERIVATIVES_DIR
+
+
+def derivative_path(original_path: str, spec: DerivativeSpec) -> str:
+    """
+    Path of a derivative of the original image.
+
+    Args:
+        original_path: Path of the original image
+        spec: Variant of the image
+
+    Returns:
+        str: Path like artworks/1/derivatives/abc.thumb.jpg
+    """
+    directory, filename = posixpath.split(original_path.replace('\\', '/'))
+    stem = os.path.splitext(filename)[0]
+    return posixpath.join(directory, DERIVATIVES_DIR, f"{stem}.{spec.name}{DERIVATIVE_EXTENSION}")
+
+
+def select_spec(max_size: Optional[int], specs: Sequence[DerivativeSpec] = DERIVATIVE_SPECS) -> Optional[DerivativeSpec]:
+    """
+    Smallest variant covering the requested size.
+
+    Args:
+        max_size: Longest side the image is displayed at, None for the original
+        specs: Available variants
+
+    Returns:
+        Optional[DerivativeSpec]: Variant to serve or None if only the original is adequate
+    """
+    if not max_size:
+        return None
+    adequate = [spec for spec in specs if spec.max_size >= max_size]
+    return min(adequate, key=lambda spec: spec.max_size) if adequate else None
+
+
+def render_derivatives(source: Union[bytes, str], specs: Sequence[DerivativeSpec]) -> Dict[str, bytes]:
+    """
+    Decode an image once and encode all its variants.
+
+    JPEG sources are decoded at a reduced scale when the largest variant allows
+    it, and each variant is resized from the previous (larger) one.
+
+    Args:
+        source: Image data or path of a local image file
+        specs: Variants to produce
+
+    Returns:
+        Dict[str, bytes]: JPEG data by variant name
+    """
+    with Image.open(io.BytesIO(source) if isinstance(source, bytes) else source) as image:
+        largest = max(spec.max_size for spec in specs)
+        image.draft('RGB', (largest, largest))
+        image = ImageOps.exif_transpose(image)
+        if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+            # JPEG has no alpha channel: flatten onto a white background
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            image = background
+        elif image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+
+        results = {}
+        for spec in sorted(specs, key=lambda spec: spec.max_size, reverse=True):
+            # thumbnail() never upscales, small images are only re-encoded
+            image.thumbnail((spec.max_size, spec.max_size), Image.LANCZOS)
+            buffer = io.BytesIO()
+            image.save(buffer, 'JPEG', quality=spec.quality, optimize=True, progressive=True)
+            results[spec.name] = buffer.getvalue()
+        return results
+
+
+class DerivativeGenerator:
+    """
+    Generates image derivatives in a process pool.
+
+    The pool is started on first use; with a single worker, or when a process
+    pool is unavailable, derivatives are generated in the current process.
+    """
+
+    def __init__(self, workers: Optional[int] = None, specs: Sequence[DerivativeSpec] = DERIVATIVE_SPECS):
+        """
+        Initialize the generator.
+
+        Args:
+            workers: Number of worker processes (defaults to the number of CPUs)
+            specs: Variants to produce
+
+        Raises:
+            RuntimeError: If Pillow is not installed
+        """
+        if not derivatives_available():
+            raise RuntimeError("Pillow is required to generate image derivatives: pip install Pillow")
+        self.specs: List[DerivativeSpec] = sorted(specs, key=lambda spec: spec.max_size)
+        self._workers = max(1, workers or os.cpu_count() or 1)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pool_failed = False
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def generate(self, source: Union[bytes, str]) -> Dict[str, bytes]:
+        """
+        Generate all variants of an image.
+
+        Args:
+            source: Image data or path of a local image file
+
+        Returns:
+            Dict[str, bytes]: JPEG data by variant name
+
+        Raises:
+            OSError: If the image can't be read or decoded
+        """
+        executor = self._get_executor()
+        if executor is None:
+            return render_derivatives(source, self.specs)
+        return executor.submit(render_derivatives, source, self.specs).result()
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        if self._workers == 1 or self._pool_failed:
+            return None
+        with self._lock:
+            if self._executor is None:
+                try:
+                    self._executor = ProcessPoolExecutor(max_workers=self._workers)
+                except (OSError, ImportError, NotImplementedError) as e:
+                    # For example, semaphores are unsupported - generate in the current process
+                    self.logger.warning(f"Process pool is unavailable, derivatives are generated in-process: {e}")
+                    self._pool_failed = True
+            return self._executor
@@ -2,7 +2,9 @@
 Interface for media file operations.
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List, BinaryIO, Union
+from typing import Iterable, Iterator, Optional, List, BinaryIO, Union
+
+from art_gallery.infrastructure.config.constants import DEFAULT_STREAM_CHUNK_SIZE
 
 
 class IMediaService(ABC):
@@ -38,18 +40,49 @@ class IMediaService(ABC):
         pass
 
     @abstractmethod
-    def delete_artwork_image(self, image_path: str) -> bool:
+    def stream_artwork_image(self, image_path: str, offset: int = 0, length: Optional[int] = None,
+                             chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> Optional[Iterator[bytes]]:
+        """
+        Stream an artwork image (or a byte range of it) in chunks.
+        
+        Args:
+            image_path: Path to the image
+            offset: First byte to read
+            length: Number of bytes to read, None to read to the end of the image
+            chunk_size: Maximum size of a yielded chunk
+            
+        Returns:
+            Optional[Iterator[bytes]]: Chunks of the image data or None if not found
+        """
+        pass
+
+    @abstractmethod
+    def delete_artwork_image(self, image_path: str, artwork_id: Optional[str] = None) -> bool:
         """
         Delete an artwork image.
         
         Args:
             image_path: Path to the image
+            artwork_id: ID of the artwork the image belongs to (required to release shared images)
             
         Returns:
             bool: True if deleted successfully
         """
         pass
 
+    @abstractmethod
+    def delete_artwork_images(self, image_paths: Iterable[str]) -> List[bool]:
+        """
+        Delete several artwork images in batched requests.
+        
+        Args:
+            image_paths: Paths to the images
+            
+        Returns:
+            List[bool]: True for each image deleted successfully
+        """
+        pass
+
     @abstractmethod
     def get_artwork_image_url(self, image_path: str, expires: int = 3600) -> Optional[str]:
         """
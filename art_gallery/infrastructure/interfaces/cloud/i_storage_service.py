@@ -2,7 +2,9 @@
 Interface for cloud storage services.
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Iterable, Iterator, List, Optional
+
+from art_gallery.infrastructure.config.constants import DEFAULT_STREAM_CHUNK_SIZE
 
 
 class IStorageService(ABC):
@@ -22,7 +24,8 @@ class IStorageService(ABC):
         pass
 
     @abstractmethod
-    def upload_data(self, bucket_name: str, object_name: str, data, content_type: str) -> bool:
+    def upload_data(self, bucket_name: str, object_name: str, data, content_type: str,
+                    content_encoding: Optional[str] = None) -> bool:
         """
         Upload data to the storage.
         
@@ -31,12 +34,31 @@ class IStorageService(ABC):
             object_name: Name of the object to store
             data: Data to upload (can be bytes or file-like object)
             content_type: MIME type of the data
+            content_encoding: Content-Encoding of compressed data (e.g. 'gzip'), None if not compressed
             
         Returns:
             bool: True if upload succeeded, False otherwise
         """
         pass
 
+    def upload_file(self, bucket_name: str, object_name: str, file_path: str, content_type: str,
+                    content_encoding: Optional[str] = None) -> bool:
+        """
+        Upload a local file to the storage without reading it into memory.
+        
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object to store
+            file_path: Path to the local file
+            content_type: MIME type of the data
+            content_encoding: Content-Encoding of compressed data (e.g. 'gzip'), None if not compressed
+            
+        Returns:
+            bool: True if upload succeeded, False otherwise
+        """
+        with open(file_path, 'rb') as file:
+            return self.upload_data(bucket_name, object_name, file, content_type, content_encoding)
+
     @abstractmethod
     def download_data(self, bucket_name: str, object_name: str) -> Optional[bytes]:
         """
@@ -51,6 +73,42 @@ class IStorageService(ABC):
         """
         pass
 
+    @abstractmethod
+    def stream_data(self, bucket_name: str, object_name: str, offset: int = 0,
+                    length: Optional[int] = None,
+                    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Stream an object (or a byte range of it) in chunks.
+        
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object to read
+            offset: First byte to read
+            length: Number of bytes to read, None to read to the end of the object
+            chunk_size: Maximum size of a yielded chunk
+            
+        Returns:
+            Iterator[bytes]: Chunks of the object data
+            
+        Raises:
+            ObjectNotFoundError: If the object doesn't exist (raised by the call, not by iteration)
+        """
+        pass
+
+    def get_local_path(self, bucket_name: str, object_name: str) -> Optional[str]:
+        """
+        Get the path of an up-to-date local copy of the object, if the service keeps one.
+        
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object
+            
+        Returns:
+            Optional[str]: Path of the local copy, None if the service has no local copies
+                or the object doesn't exist
+        """
+        return None
+
     @abstractmethod
     def delete_object(self, bucket_name: str, object_name: str) -> bool:
         """
@@ -65,6 +123,20 @@ class IStorageService(ABC):
         """
         pass
 
+    @abstractmethod
+    def delete_objects(self, bucket_name: str, object_names: Iterable[str]) -> List[str]:
+        """
+        Delete several objects, batching them into as few requests as possible.
+        
+        Args:
+            bucket_name: Name of the bucket
+            object_names: Names of the objects to delete (missing objects are ignored)
+            
+        Returns:
+            List[str]: Names of the objects that could not be deleted
+        """
+        pass
+
     @abstractmethod
     def list_objects(self, bucket_name: str, prefix: str = "") -> List[str]:
         """
@@ -107,3 +179,17 @@ class IStorageService(ABC):
             bool: True if object exists, False otherwise
         """
         pass
+
+    @abstractmethod
+    def get_object_etag(self, bucket_name: str, object_name: str) -> Optional[str]:
+        """
+        Get the ETag of an object (changes whenever the object is rewritten).
+        
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object
+            
+        Returns:
+            Optional[str]: ETag or None if the object doesn't exist
+        """
+        pass
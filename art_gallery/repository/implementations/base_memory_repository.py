@@ -41,5 +41,5 @@ class BaseMemoryRepository(Generic[T]):
         del self._items[id]
 
     def find(self, specification: Specification[T]) -> List[T]:
-        return [item for item in self._items.values() 
-                if specification.is_satisfied_by(item)]
+        predicate = specification.compile()
+        return [item for item in self._items.values() if predicate(item)]
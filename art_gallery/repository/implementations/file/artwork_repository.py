@@ -1,15 +1,29 @@
 import os
+import logging
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from art_gallery.domain import Artwork, ArtworkType
+from art_gallery.domain.codecs import ARTWORK_CODEC, bulk_hydration
 from art_gallery.repository.interfaces.artwork_repository import IArtworkRepository
 from art_gallery.repository.specifications.base_specification import Specification
+from art_gallery.repository.specifications.artwork_specifications import ArtworkByTypeSpecification
+from art_gallery.repository.snapshot.snapshot_cache import RepositorySnapshot, SnapshotCache, file_source_key
+from art_gallery.repository.implementations.file.atomic_file import atomic_write
+from art_gallery.repository.snapshot.snapshot_repository import SnapshotRepositoryMixin
+from art_gallery.repository.vectorized.artwork_column_store import ArtworkColumnStore
+from art_gallery.repository.parallel.parallel_scanner import ParallelScanner
 from serialization.interfaces.ISerializer import ISerializer
 from serialization.interfaces.IDeserializer import IDeserializer
 
-class ArtworkFileRepository(IArtworkRepository):
-    def __init__(self, filepath: str, serializer: ISerializer, deserializer: IDeserializer):
+class ArtworkFileRepository(SnapshotRepositoryMixin[Artwork], IArtworkRepository):
+    def __init__(self, filepath: str, serializer: ISerializer, deserializer: IDeserializer,
+                 vectorized: bool = False,
+                 parallel_workers: int = 0,
+                 trusted_load: bool = False,
+                 snapshot_cache: Optional[SnapshotCache] = None):
         self._filepath = filepath
+        self._trusted_load = trusted_load  # Файл записан приложением: не проверять инварианты повторно
+        self._snapshot_cache = snapshot_cache  # Снимки коллекции для быстрого запуска
         self._serializer = serializer  # Сериализатор из плагина
         self._deserializer = deserializer  # Десериализатор из плагина
         
@@ -19,34 +33,69 @@ class ArtworkFileRepository(IArtworkRepository):
             os.makedirs(file_dir, exist_ok=True)
         
         self._artworks: List[Artwork] = []
+        self._column_store: Optional[ArtworkColumnStore] = None
+        self._parallel_scanner: Optional[ParallelScanner[Artwork]] = None
         self._load_data()
 
+        # Векторизованный движок фильтрации (требует numpy)
+        if vectorized:
+            if ArtworkColumnStore.is_available():
+                self._column_store = ArtworkColumnStore()
+                self.add_observer(self._column_store)
+            else:
+                logging.getLogger(__name__).warning("numpy не установлен, векторизованная фильтрация отключена")
+
+        # Параллельный просмотр для спецификаций, которые нельзя вычислить по колонкам
+        if parallel_workers:
+            self._parallel_scanner = ParallelScanner(Artwork.from_dict, workers=parallel_workers)
+            self.add_observer(self._parallel_scanner)
+
     def _load_data(self) -> None:
+        # Файл не менялся с момента снимка: разбор не нужен
+        if self._load_snapshot():
+            return
         try:
-            # Используем десериализатор из плагина
-            list_of_dicts = self._deserializer.deserialize_from_file(self._filepath)
+            # Используем десериализатор из плагина: записи читаются потоково,
+            # поэтому в памяти не держится ни весь файл, ни список словарей
+            records = self._deserializer.iter_deserialize_from_file(self._filepath)
             loaded_artworks = []
-            for artwork_data_dict in list_of_dicts:
-                try:
-                    loaded_artworks.append(Artwork.from_dict(artwork_data_dict))
-                except Exception as e:
-                    print(f"Error creating Artwork from dict: {artwork_data_dict}, error: {e}")
-                    # TODO: Заменить на логирование
+            with bulk_hydration():
+                for artwork_data_dict in records:
+                    try:
+                        loaded_artworks.append(ARTWORK_CODEC.decode(artwork_data_dict, self._trusted_load))
+                    except Exception as e:
+                        print(f"Error creating Artwork from dict: {artwork_data_dict}, error: {e}")
+                        # TODO: Заменить на логирование
             self._artworks = loaded_artworks
+            self._notify_reload(self._artworks)
         except Exception as e:
             # В случае ошибки считаем, что данных нет
             print(f"Error loading data from {self._filepath} using deserializer: {e}")
             # TODO: Заменить на логирование
             self._artworks = []
+            self._notify_reload(self._artworks)
 
     def _save_data(self) -> None:
         try:
-            # Используем сериализатор из плагина
-            data_to_serialize = [artwork.to_dict() for artwork in self._artworks]
-            self._serializer.serialize_to_file(data_to_serialize, self._filepath)
+            # Используем сериализатор из плагина: записи пишутся по одной во временный файл,
+            # который заменяет файл коллекции только после успешной записи
+            with atomic_write(self._filepath) as file:
+                self._serializer.serialize_to_stream((ARTWORK_CODEC.encode(artwork) for artwork in self._artworks), file)
         except Exception as e:
             print(f"Error saving data to {self._filepath} using serializer: {e}")
             # TODO: Заменить на логирование
+            self._invalidate_snapshot()
+
+    # --- Снимки коллекции ---
+
+    def _snapshot_name(self) -> str:
+        return SnapshotCache.snapshot_name('artworks', os.path.abspath(self._filepath))
+
+    def _snapshot_source_key(self):
+        return file_source_key(self._filepath, self._serializer.file_extension, self._trusted_load)
+
+    def _restore_snapshot_state(self, snapshot: RepositorySnapshot) -> None:
+        self._artworks = snapshot.entities
 
     def add(self, artwork: Artwork) -> Artwork:
         # Генерация нового ID (всегда положительный)
@@ -65,6 +114,7 @@ class ArtworkFileRepository(IArtworkRepository):
         
         # Добавляем артефакт и сохраняем
         self._artworks.append(artwork)
+        self._notify_upsert(artwork)
         self._save_data()
         return artwork
 
@@ -78,6 +128,7 @@ class ArtworkFileRepository(IArtworkRepository):
         for i, artwork in enumerate(self._artworks):
             if artwork.id == artwork_to_update.id:
                 self._artworks[i] = artwork_to_update
+                self._notify_upsert(artwork_to_update)
                 self._save_data()
                 return artwork_to_update
         raise ValueError(f"Artwork with id {artwork_to_update.id} not found.")
@@ -86,13 +137,33 @@ class ArtworkFileRepository(IArtworkRepository):
         artwork = self.get_by_id(artwork_id)
         if artwork:
             self._artworks.remove(artwork)
+            self._notify_delete(artwork_id)
             self._save_data()
             
     def find(self, specification: Specification[Artwork]) -> List[Artwork]:
         """
         Найти экспонаты, соответствующие спецификации
         """
-        return [artwork for artwork in self._artworks if specification.is_satisfied_by(artwork)]
+        return self._find_indexed(specification, self._scan)
+
+    def _scan(self, specification: Specification[Artwork]) -> List[Artwork]:
+        if self._column_store is not None:
+            result = self._column_store.find(specification)
+            if result is not None:
+                return result
+        if self._parallel_scanner is not None:
+            result = self._parallel_scanner.find(specification)
+            if result is not None:
+                return result
+        predicate = specification.compile()
+        return [artwork for artwork in self._artworks if predicate(artwork)]
+
+    def close(self) -> None:
+        """
+        Освободить ресурсы репозитория (процессы параллельного просмотра)
+        """
+        if self._parallel_scanner is not None:
+            self._parallel_scanner.close()
         
     def get_by_artist(self, artist: str) -> List[Artwork]:
         """
@@ -112,4 +183,6 @@ class ArtworkFileRepository(IArtworkRepository):
         Returns:
             List[Artwork]: список работ указанного типа
         """
+        if self._column_store is not None:
+            return self.find(ArtworkByTypeSpecification(type))
         return [artwork for artwork in self._artworks if artwork.type == type]
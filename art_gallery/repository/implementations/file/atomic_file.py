@@ -0,0 +1,32 @@
+"""
+Атомарная запись файла коллекции.
+Данные пишутся во временный файл рядом с целевым, который заменяется только после
+успешной записи: ошибка посередине (кодирования, нехватки места, прерывания)
+оставляет прежний файл нетронутым.
+"""
+import os
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator
+
+
+@contextmanager
+def atomic_write(filepath: str) -> Iterator[BinaryIO]:
+    """
+    Открывает временный файл для записи и по выходу из блока атомарно заменяет им filepath
+
+    Args:
+        filepath (str): Целевой файл
+
+    Yields:
+        BinaryIO: Временный файл, открытый на запись в двоичном режиме
+    """
+    temp_path = filepath + '.tmp'
+    try:
+        with open(temp_path, 'wb') as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, filepath)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
@@ -2,14 +2,22 @@ import os
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from art_gallery.domain import Exhibition
+from art_gallery.domain.codecs import EXHIBITION_CODEC, bulk_hydration
 from art_gallery.repository.interfaces.exhibition_repository import IExhibitionRepository
 from art_gallery.repository.specifications.base_specification import Specification
+from art_gallery.repository.snapshot.snapshot_cache import RepositorySnapshot, SnapshotCache, file_source_key
+from art_gallery.repository.implementations.file.atomic_file import atomic_write
+from art_gallery.repository.snapshot.snapshot_repository import SnapshotRepositoryMixin
 from serialization.interfaces.ISerializer import ISerializer
 from serialization.interfaces.IDeserializer import IDeserializer
 
-class ExhibitionFileRepository(IExhibitionRepository):
-    def __init__(self, filepath: str, serializer: ISerializer, deserializer: IDeserializer):
+class ExhibitionFileRepository(SnapshotRepositoryMixin[Exhibition], IExhibitionRepository):
+    def __init__(self, filepath: str, serializer: ISerializer, deserializer: IDeserializer,
+                 trusted_load: bool = False,
+                 snapshot_cache: Optional[SnapshotCache] = None):
         self._filepath = filepath
+        self._trusted_load = trusted_load  # Файл записан приложением: не проверять инварианты повторно
+        self._snapshot_cache = snapshot_cache  # Снимки коллекции для быстрого запуска
         self._serializer = serializer  # Сериализатор из плагина
         self._deserializer = deserializer  # Десериализатор из плагина
         
@@ -22,31 +30,51 @@ class ExhibitionFileRepository(IExhibitionRepository):
         self._load_data()
 
     def _load_data(self) -> None:
+        # Файл не менялся с момента снимка: разбор не нужен
+        if self._load_snapshot():
+            return
         try:
-            # Используем десериализатор из плагина
-            list_of_dicts = self._deserializer.deserialize_from_file(self._filepath)
+            # Используем десериализатор из плагина: записи читаются потоково,
+            # поэтому в памяти не держится ни весь файл, ни список словарей
+            records = self._deserializer.iter_deserialize_from_file(self._filepath)
             loaded_exhibitions = []
-            for exhibition_data_dict in list_of_dicts:
-                try:
-                    loaded_exhibitions.append(Exhibition.from_dict(exhibition_data_dict))
-                except Exception as e:
-                    print(f"Error creating Exhibition from dict: {exhibition_data_dict}, error: {e}")
-                    # TODO: Заменить на логирование
+            with bulk_hydration():
+                for exhibition_data_dict in records:
+                    try:
+                        loaded_exhibitions.append(EXHIBITION_CODEC.decode(exhibition_data_dict, self._trusted_load))
+                    except Exception as e:
+                        print(f"Error creating Exhibition from dict: {exhibition_data_dict}, error: {e}")
+                        # TODO: Заменить на логирование
             self._exhibitions = loaded_exhibitions
+            self._notify_reload(self._exhibitions)
         except Exception as e:
             # В случае ошибки считаем, что данных нет
             print(f"Error loading data from {self._filepath} using deserializer: {e}")
             # TODO: Заменить на логирование
             self._exhibitions = []
+            self._notify_reload(self._exhibitions)
 
     def _save_data(self) -> None:
         try:
-            # Используем сериализатор из плагина
-            data_to_serialize = [exhibition.to_dict() for exhibition in self._exhibitions]
-            self._serializer.serialize_to_file(data_to_serialize, self._filepath)
+            # Используем сериализатор из плагина: записи пишутся по одной во временный файл,
+            # который заменяет файл коллекции только после успешной записи
+            with atomic_write(self._filepath) as file:
+                self._serializer.serialize_to_stream((EXHIBITION_CODEC.encode(exhibition) for exhibition in self._exhibitions), file)
         except Exception as e:
             print(f"Error saving data to {self._filepath} using serializer: {e}")
             # TODO: Заменить на логирование
+            self._invalidate_snapshot()
+
+    # --- Снимки коллекции ---
+
+    def _snapshot_name(self) -> str:
+        return SnapshotCache.snapshot_name('exhibitions', os.path.abspath(self._filepath))
+
+    def _snapshot_source_key(self):
+        return file_source_key(self._filepath, self._serializer.file_extension, self._trusted_load)
+
+    def _restore_snapshot_state(self, snapshot: RepositorySnapshot) -> None:
+        self._exhibitions = snapshot.entities
 
     def add(self, exhibition: Exhibition) -> Exhibition:
         # Добавляем выставку и сохраняем
@@ -64,6 +92,7 @@ class ExhibitionFileRepository(IExhibitionRepository):
             exhibition.id = new_id
         
         self._exhibitions.append(exhibition)
+        self._notify_upsert(exhibition)
         self._save_data()
         return exhibition
         
@@ -77,6 +106,7 @@ class ExhibitionFileRepository(IExhibitionRepository):
         for i, exhibition in enumerate(self._exhibitions):
             if exhibition.id == exhibition_to_update.id:
                 self._exhibitions[i] = exhibition_to_update
+                self._notify_upsert(exhibition_to_update)
                 self._save_data()
                 return exhibition_to_update
         raise ValueError(f"Exhibition with id {exhibition_to_update.id} not found.")
@@ -85,10 +115,15 @@ class ExhibitionFileRepository(IExhibitionRepository):
         exhibition = self.get_by_id(exhibition_id)
         if exhibition:
             self._exhibitions.remove(exhibition)
+            self._notify_delete(exhibition_id)
             self._save_data()
             
     def find(self, specification: Specification[Exhibition]) -> List[Exhibition]:
-        return [exhibition for exhibition in self._exhibitions if specification.is_satisfied_by(exhibition)]
+        return self._find_indexed(specification, self._scan)
+
+    def _scan(self, specification: Specification[Exhibition]) -> List[Exhibition]:
+        predicate = specification.compile()
+        return [exhibition for exhibition in self._exhibitions if predicate(exhibition)]
 
     def get_active(self) -> List[Exhibition]:
         """
@@ -2,14 +2,22 @@ import os
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from art_gallery.domain import User, UserRole
+from art_gallery.domain.codecs import USER_CODEC, bulk_hydration
 from art_gallery.repository.interfaces.user_repository import IUserRepository
 from art_gallery.repository.specifications.base_specification import Specification
+from art_gallery.repository.snapshot.snapshot_cache import RepositorySnapshot, SnapshotCache, file_source_key
+from art_gallery.repository.implementations.file.atomic_file import atomic_write
+from art_gallery.repository.snapshot.snapshot_repository import SnapshotRepositoryMixin
 from serialization.interfaces.ISerializer import ISerializer
 from serialization.interfaces.IDeserializer import IDeserializer
 
-class UserFileRepository(IUserRepository):
-    def __init__(self, filepath: str, serializer: ISerializer, deserializer: IDeserializer):
+class UserFileRepository(SnapshotRepositoryMixin[User], IUserRepository):
+    def __init__(self, filepath: str, serializer: ISerializer, deserializer: IDeserializer,
+                 trusted_load: bool = False,
+                 snapshot_cache: Optional[SnapshotCache] = None):
         self._filepath = filepath
+        self._trusted_load = trusted_load  # Файл записан приложением: не проверять инварианты повторно
+        self._snapshot_cache = snapshot_cache  # Снимки коллекции для быстрого запуска
         self._serializer = serializer  # Сериализатор из плагина
         self._deserializer = deserializer  # Десериализатор из плагина
         
@@ -22,41 +30,65 @@ class UserFileRepository(IUserRepository):
         self._load_data()
 
     def _load_data(self) -> None:
+        # Файл не менялся с момента снимка: разбор не нужен
+        if self._load_snapshot():
+            return
         try:
-            # Используем десериализатор из плагина
-            list_of_dicts = self._deserializer.deserialize_from_file(self._filepath)
+            # Используем десериализатор из плагина: записи читаются потоково,
+            # поэтому в памяти не держится ни весь файл, ни список словарей
+            records = self._deserializer.iter_deserialize_from_file(self._filepath)
             loaded_users = []
             
             # Отдельный список для отслеживания всех ID, включая ID пользователей с ошибками
             self._all_ids = set()
             
-            for user_data_dict in list_of_dicts:
-                try:
-                    # Сохраняем ID в наборе, даже если дальше будет ошибка
-                    if 'id' in user_data_dict:
-                        user_id = int(user_data_dict['id'])
-                        self._all_ids.add(user_id)
-                        
-                    loaded_users.append(User.from_dict(user_data_dict))
-                except Exception as e:
-                    print(f"Error creating User from dict: {user_data_dict}, error: {e}")
-                    # TODO: Заменить на логирование
+            with bulk_hydration():
+                for user_data_dict in records:
+                    try:
+                        # Сохраняем ID в наборе, даже если дальше будет ошибка
+                        if 'id' in user_data_dict:
+                            user_id = int(user_data_dict['id'])
+                            self._all_ids.add(user_id)
+
+                        loaded_users.append(USER_CODEC.decode(user_data_dict, self._trusted_load))
+                    except Exception as e:
+                        print(f"Error creating User from dict: {user_data_dict}, error: {e}")
+                        # TODO: Заменить на логирование
             self._users = loaded_users
+            self._notify_reload(self._users)
         except Exception as e:
             # В случае ошибки считаем, что данных нет
             print(f"Error loading data from {self._filepath} using deserializer: {e}")
             # TODO: Заменить на логирование
             self._users = []
             self._all_ids = set()
+            self._notify_reload(self._users)
 
     def _save_data(self) -> None:
         try:
-            # Используем сериализатор из плагина
-            data_to_serialize = [user.to_dict() for user in self._users]
-            self._serializer.serialize_to_file(data_to_serialize, self._filepath)
+            # Используем сериализатор из плагина: записи пишутся по одной во временный файл,
+            # который заменяет файл коллекции только после успешной записи
+            with atomic_write(self._filepath) as file:
+                self._serializer.serialize_to_stream((USER_CODEC.encode(user) for user in self._users), file)
         except Exception as e:
             print(f"Error saving data to {self._filepath} using serializer: {e}")
             # TODO: Заменить на логирование
+            self._invalidate_snapshot()
+
+    # --- Снимки коллекции ---
+
+    def _snapshot_name(self) -> str:
+        return SnapshotCache.snapshot_name('users', os.path.abspath(self._filepath))
+
+    def _snapshot_source_key(self):
+        return file_source_key(self._filepath, self._serializer.file_extension, self._trusted_load)
+
+    def _snapshot_state(self) -> RepositorySnapshot:
+        return RepositorySnapshot(entities=list(self._users), extra={'all_ids': set(self._all_ids)})
+
+    def _restore_snapshot_state(self, snapshot: RepositorySnapshot) -> None:
+        self._users = snapshot.entities
+        self._all_ids = snapshot.extra.get('all_ids', {user.id for user in self._users})
 
     def add(self, user: User) -> User:
         if self.username_exists(user.username):
@@ -83,6 +115,7 @@ class UserFileRepository(IUserRepository):
             self._all_ids.add(new_id)
             
         self._users.append(user)
+        self._notify_upsert(user)
         self._save_data()
         return user
         
@@ -106,6 +139,7 @@ class UserFileRepository(IUserRepository):
         for i, user in enumerate(self._users):
             if user.id == user_to_update.id:
                 self._users[i] = user_to_update
+                self._notify_upsert(user_to_update)
                 self._save_data()
                 return user_to_update
                 
@@ -115,10 +149,15 @@ class UserFileRepository(IUserRepository):
         user = self.get_by_id(user_id)
         if user:
             self._users.remove(user)
+            self._notify_delete(user_id)
             self._save_data()
             
     def find(self, specification: Specification[User]) -> List[User]:
-        return [user for user in self._users if specification.is_satisfied_by(user)]
+        return self._find_indexed(specification, self._scan)
+
+    def _scan(self, specification: Specification[User]) -> List[User]:
+        predicate = specification.compile()
+        return [user for user in self._users if predicate(user)]
         
     def get_by_username(self, username: str) -> Optional[User]:
         return next((user for user in self._users if user.username.lower() == username.lower()), None)
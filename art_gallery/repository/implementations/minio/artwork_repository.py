@@ -2,12 +2,18 @@
 MinIO-реализация репозитория для экспонатов.
 Реализует интерфейс IArtworkRepository с использованием MinIO для хранения данных.
 """
+import logging
 from typing import List, Dict, Any, Optional
 
 from art_gallery.domain import Artwork, ArtworkType
+from art_gallery.domain.codecs import ARTWORK_CODEC
 from art_gallery.repository.interfaces.artwork_repository import IArtworkRepository
 from art_gallery.repository.implementations.minio.base_minio_repository import BaseMinioRepository
+from art_gallery.repository.snapshot.snapshot_cache import SnapshotCache
 from art_gallery.repository.specifications.base_specification import Specification
+from art_gallery.repository.specifications.artwork_specifications import ArtworkByTypeSpecification
+from art_gallery.repository.vectorized.artwork_column_store import ArtworkColumnStore
+from art_gallery.repository.parallel.parallel_scanner import ParallelScanner
 from art_gallery.infrastructure.config.minio_config import MinioConfig
 from art_gallery.infrastructure.cloud.minio_service import MinioService
 
@@ -25,20 +31,28 @@ class ArtworkMinioRepository(BaseMinioRepository[Artwork], IArtworkRepository):
                  serializer: ISerializer, 
                  deserializer: IDeserializer,
                  minio_service: Optional[MinioService] = None,
-                 config: Optional[MinioConfig] = None):
+                 config: Optional[MinioConfig] = None,
+                 vectorized: bool = False,
+                 parallel_workers: int = 0,
+                 trusted_load: bool = False,
+                 snapshot_cache: Optional[SnapshotCache] = None):
         """
         Инициализирует репозиторий экспонатов с использованием MinIO.
         
         Args:
             serializer: Сериализатор для преобразования данных в строку.
             deserializer: Десериализатор для преобразования строки в данные.
-            minio_service: Сервис для работы с MinIO. Если не указан, создается новый.
+            minio_service: Сервис для работы с MinIO. Если не указан, используется общий сервис процесса.
             config: Конфигурация для подключения к MinIO. Используется, если minio_service не указан.
+            vectorized: Включить векторизованную фильтрацию по колонкам NumPy.
+            parallel_workers: Количество процессов для параллельного просмотра (0 - отключен).
+            trusted_load: Объект записан приложением: не проверять инварианты экспонатов при загрузке.
+            snapshot_cache: Кэш снимков коллекции для быстрого запуска.
         """
         self._config = config or MinioConfig.from_env()
         
         self.ENTITY_TYPE_STR = "artwork"
-        file_extension = "xml" if serializer.__class__.__name__ == 'XMLSerializer' else "json"
+        file_extension = serializer.file_extension or "json"
 
         # Construct the object path using the prefix and file extension
         base_filename = f"{self.ENTITY_TYPE_STR}.{file_extension}"
@@ -50,9 +64,25 @@ class ArtworkMinioRepository(BaseMinioRepository[Artwork], IArtworkRepository):
             serializer=serializer,
             deserializer=deserializer,
             minio_service=minio_service,
-            config=self._config
+            config=self._config,
+            trusted_load=trusted_load,
+            snapshot_cache=snapshot_cache
         )
 
+        self._column_store: Optional[ArtworkColumnStore] = None
+        self._parallel_scanner: Optional[ParallelScanner[Artwork]] = None
+        if vectorized:
+            if ArtworkColumnStore.is_available():
+                self._column_store = ArtworkColumnStore()
+                self.add_observer(self._column_store)
+            else:
+                logging.getLogger(__name__).warning("numpy не установлен, векторизованная фильтрация отключена")
+
+        # Параллельный просмотр для спецификаций, которые нельзя вычислить по колонкам
+        if parallel_workers:
+            self._parallel_scanner = ParallelScanner(Artwork.from_dict, workers=parallel_workers)
+            self.add_observer(self._parallel_scanner)
+
     def _create_entity_from_dict(self, data: Dict[str, Any]) -> Artwork:
         """
         Создает экспонат из словаря.
@@ -63,7 +93,48 @@ class ArtworkMinioRepository(BaseMinioRepository[Artwork], IArtworkRepository):
         Returns:
             Artwork: Созданный экспонат.
         """
-        return Artwork.from_dict(data)
+        return ARTWORK_CODEC.decode(data, self._trusted_load)
+
+    def _entity_to_dict(self, entity: Artwork) -> Dict[str, Any]:
+        """
+        Преобразует экспонат в словарь для сериализации.
+        
+        Args:
+            entity: Экспонат.
+            
+        Returns:
+            Dict[str, Any]: Словарь с данными экспоната.
+        """
+        return ARTWORK_CODEC.encode(entity)
+
+    def _scan(self, specification: Specification[Artwork]) -> List[Artwork]:
+        """
+        Поиск экспонатов без вторичных индексов.
+        При включенном векторизованном движке использует булевы маски по колонкам,
+        затем параллельный просмотр, затем последовательный.
+        
+        Args:
+            specification: Спецификация для поиска.
+            
+        Returns:
+            List[Artwork]: Список найденных экспонатов.
+        """
+        if self._column_store is not None:
+            result = self._column_store.find(specification)
+            if result is not None:
+                return result
+        if self._parallel_scanner is not None:
+            result = self._parallel_scanner.find(specification)
+            if result is not None:
+                return result
+        return super()._scan(specification)
+
+    def close(self) -> None:
+        """
+        Освобождает ресурсы репозитория (процессы параллельного просмотра).
+        """
+        if self._parallel_scanner is not None:
+            self._parallel_scanner.close()
 
     def get_by_artist(self, artist: str) -> List[Artwork]:
         """
@@ -88,5 +159,7 @@ class ArtworkMinioRepository(BaseMinioRepository[Artwork], IArtworkRepository):
         Returns:
             List[Artwork]: Список работ указанного типа.
         """
+        if self._column_store is not None:
+            return self.find(ArtworkByTypeSpecification(type))
         return [artwork for artwork in self._items.values() 
                 if artwork.type == type]
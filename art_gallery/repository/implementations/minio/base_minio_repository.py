@@ -7,10 +7,16 @@ from typing import List, Optional, Dict, Any, TypeVar, Generic, Union, Protocol,
 from abc import ABC, abstractmethod
 
 from art_gallery.domain.base_entity import BaseEntity
+from art_gallery.domain.codecs import bulk_hydration
 from art_gallery.repository.interfaces.base_repository import IBaseRepository
 from art_gallery.repository.specifications.base_specification import Specification
+from art_gallery.repository.snapshot.snapshot_cache import RepositorySnapshot, SnapshotCache
+from art_gallery.repository.snapshot.snapshot_repository import SnapshotRepositoryMixin
 from art_gallery.infrastructure.config.minio_config import MinioConfig
 from art_gallery.infrastructure.cloud.minio_service import MinioService
+from art_gallery.infrastructure.cloud.minio_client_provider import MinioClientProvider
+from art_gallery.infrastructure.cloud.streams import IterableStream
+from art_gallery.exceptions.cloud_exceptions import ObjectNotFoundError
 
 from serialization.interfaces.ISerializer import ISerializer
 from serialization.interfaces.IDeserializer import IDeserializer
@@ -19,7 +25,7 @@ from serialization.interfaces.IDeserializer import IDeserializer
 T = TypeVar('T', bound=BaseEntity)
 
 
-class BaseMinioRepository(Generic[T], IBaseRepository[T], ABC):
+class BaseMinioRepository(SnapshotRepositoryMixin[T], IBaseRepository[T], ABC):
     """
     Базовый класс для всех MinIO репозиториев.
     Реализует общую функциональность для работы с данными через MinIO.
@@ -31,7 +37,9 @@ class BaseMinioRepository(Generic[T], IBaseRepository[T], ABC):
                  serializer: ISerializer, 
                  deserializer: IDeserializer,
                  minio_service: Optional[MinioService] = None,
-                 config: Optional[MinioConfig] = None):
+                 config: Optional[MinioConfig] = None,
+                 trusted_load: bool = False,
+                 snapshot_cache: Optional[SnapshotCache] = None):
         """
         Инициализирует базовый MinIO репозиторий.
         
@@ -40,15 +48,19 @@ class BaseMinioRepository(Generic[T], IBaseRepository[T], ABC):
             object_path: Путь к объекту (файлу) в бакете.
             serializer: Сериализатор для преобразования данных в строку.
             deserializer: Десериализатор для преобразования строки в данные.
-            minio_service: Сервис для работы с MinIO. Если не указан, создается новый.
+            minio_service: Сервис для работы с MinIO. Если не указан, используется общий сервис процесса.
             config: Конфигурация для подключения к MinIO. Используется, если minio_service не указан.
+            trusted_load: Объект записан приложением: не проверять инварианты сущностей при загрузке.
+            snapshot_cache: Кэш снимков коллекции: пока ETag объекта не меняется, объект не скачивается.
         """
         self._bucket_name = bucket_name
+        self._trusted_load = trusted_load
+        self._snapshot_cache = snapshot_cache
         self._object_path = object_path
         self._serializer = serializer
         self._deserializer = deserializer
         self._config = config or MinioConfig.from_env()
-        self._minio_service = minio_service or MinioService(self._config)
+        self._minio_service = minio_service or MinioClientProvider.get_service(self._config)
         
         # Убедимся, что бакет существует
         self._minio_service.ensure_bucket_exists(self._bucket_name)
@@ -61,75 +73,112 @@ class BaseMinioRepository(Generic[T], IBaseRepository[T], ABC):
         """
         Загружает данные из MinIO и преобразует их в сущности.
         """
+        # Объект не менялся с момента снимка: скачивание и разбор не нужны
+        if self._load_snapshot():
+            return
         try:
-            # Проверяем существование объекта
-            if not self._minio_service.object_exists(self._bucket_name, self._object_path):
+            # Скачиваем данные из MinIO (отсутствие объекта сообщает сам запрос)
+            try:
+                data_bytes = self._minio_service.download_data(self._bucket_name, self._object_path)
+            except ObjectNotFoundError:
                 print(f"Object {self._object_path} does not exist in bucket {self._bucket_name}. Starting with empty collection.")
                 self._items = {}
                 return
-            
-            # Скачиваем данные из MinIO
-            data_bytes = self._minio_service.download_data(self._bucket_name, self._object_path)
             if data_bytes is None:
                 print(f"Failed to download data from {self._bucket_name}/{self._object_path}. Starting with empty collection.")
                 self._items = {}
                 return
             
             # Десериализуем данные
-            list_of_dicts = self._deserializer.deserialize(data_bytes.decode('utf-8'))
+            list_of_dicts = self._deserializer.deserialize_bytes(data_bytes)
             
             # Преобразуем словари в сущности
             loaded_items = {}
-            for item_dict in list_of_dicts:
-                try:
-                    entity = self._create_entity_from_dict(item_dict)
-                    loaded_items[entity.id] = entity
-                except Exception as e:
-                    print(f"Error creating entity from dict: {item_dict}, error: {e}")
+            with bulk_hydration():
+                for item_dict in list_of_dicts:
+                    try:
+                        entity = self._create_entity_from_dict(item_dict)
+                        loaded_items[entity.id] = entity
+                    except Exception as e:
+                        print(f"Error creating entity from dict: {item_dict}, error: {e}")
             
             self._items = loaded_items
         except Exception as e:
             print(f"Error loading data from {self._bucket_name}/{self._object_path}: {e}")
             self._items = {}
+        finally:
+            self._notify_reload(self._items.values())
 
     def _save_data(self) -> None:
         """
         Сохраняет данные в MinIO.
         """
         try:
-            # Преобразуем сущности в словари
-            data_to_serialize = [item.to_dict() for item in self._items.values()]
-            
-            # Сериализуем данные
-            serialized_data = self._serializer.serialize(data_to_serialize)
+            # Сущности сериализуются по одной и сразу передаются в загрузку:
+            # ни список словарей, ни весь документ целиком в памяти не строятся
+            records = (self._entity_to_dict(item) for item in list(self._items.values()))
+            chunks = self._serializer.serialize_bytes_iter(records)
             
             # Загружаем данные в MinIO
             success = self._minio_service.upload_data(
                 bucket_name=self._bucket_name,
                 object_name=self._object_path,
-                data=serialized_data.encode('utf-8'),
-                content_type=self._get_content_type()
+                data=IterableStream(chunks),
+                content_type=self._get_content_type(),
+                content_encoding=self._serializer.content_encoding
             )
             
             if not success:
                 print(f"Failed to save data to {self._bucket_name}/{self._object_path}")
         except Exception as e:
             print(f"Error saving data to {self._bucket_name}/{self._object_path}: {e}")
+            self._invalidate_snapshot()
+
+    # --- Снимки коллекции ---
+
+    def _snapshot_name(self) -> str:
+        identity = f"{self._config.endpoint}/{self._bucket_name}/{self._object_path}"
+        return SnapshotCache.snapshot_name(self._object_path.rsplit('/', 1)[-1], identity)
+
+    def _snapshot_source_key(self):
+        etag = self._minio_service.get_object_etag(self._bucket_name, self._object_path)
+        if etag is None:
+            return None
+        return ('minio', self._config.endpoint, self._bucket_name, self._object_path, etag, self._trusted_load)
+
+    def _restore_snapshot_state(self, snapshot: RepositorySnapshot) -> None:
+        self._items = {entity.id: entity for entity in snapshot.entities}
 
     def _get_content_type(self) -> str:
         """
-        Определяет MIME-тип на основе расширения файла.
+        Определяет MIME-тип на основе расширения файла
+        (для сжатых данных - по расширению формата перед суффиксом сжатия).
         
         Returns:
             str: MIME-тип.
         """
-        extension = os.path.splitext(self._object_path)[1].lower()
+        object_path = self._object_path
+        if self._serializer.content_encoding:
+            object_path = os.path.splitext(object_path)[0]
+        extension = os.path.splitext(object_path)[1].lower()
         content_types = {
             '.json': 'application/json',
             '.xml': 'application/xml',
         }
         return content_types.get(extension, 'application/octet-stream')
 
+    def _entity_to_dict(self, entity: T) -> Dict[str, Any]:
+        """
+        Преобразует сущность в словарь для сериализации.
+        
+        Args:
+            entity: Сущность.
+            
+        Returns:
+            Dict[str, Any]: Словарь с данными сущности.
+        """
+        return entity.to_dict()
+
     @abstractmethod
     def _create_entity_from_dict(self, data: Dict[str, Any]) -> T:
         """
@@ -175,6 +224,7 @@ class BaseMinioRepository(Generic[T], IBaseRepository[T], ABC):
             T: Добавленная сущность.
         """
         self._items[entity.id] = entity
+        self._notify_upsert(entity)
         self._save_data()
         return entity
 
@@ -192,6 +242,7 @@ class BaseMinioRepository(Generic[T], IBaseRepository[T], ABC):
             raise ValueError(f"Entity with id {entity.id} not found")
         
         self._items[entity.id] = entity
+        self._notify_upsert(entity)
         self._save_data()
         return entity
 
@@ -206,6 +257,7 @@ class BaseMinioRepository(Generic[T], IBaseRepository[T], ABC):
             raise ValueError(f"Entity with id {id} not found")
         
         del self._items[id]
+        self._notify_delete(id)
         self._save_data()
 
     def find(self, specification: Specification[T]) -> List[T]:
@@ -218,7 +270,12 @@ class BaseMinioRepository(Generic[T], IBaseRepository[T], ABC):
         Returns:
             List[T]: Список найденных сущностей.
         """
-        return [entity for entity in self._items.values() if specification.is_satisfied_by(entity)]
+        return self._find_indexed(specification, self._scan)
+
+    def _scan(self, specification: Specification[T]) -> List[T]:
+        """Поиск полным просмотром коллекции"""
+        predicate = specification.compile()
+        return [entity for entity in self._items.values() if predicate(entity)]
         
     def get_all_items_copy(self) -> Dict[int, T]:
         """
@@ -238,3 +295,4 @@ class BaseMinioRepository(Generic[T], IBaseRepository[T], ABC):
             items_state: Снимок состояния для восстановления.
         """
         self._items = items_state
+        self._notify_reload(self._items.values())
@@ -6,8 +6,10 @@ from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
 
 from art_gallery.domain import Exhibition
+from art_gallery.domain.codecs import EXHIBITION_CODEC
 from art_gallery.repository.interfaces.exhibition_repository import IExhibitionRepository
 from art_gallery.repository.implementations.minio.base_minio_repository import BaseMinioRepository
+from art_gallery.repository.snapshot.snapshot_cache import SnapshotCache
 from art_gallery.repository.specifications.base_specification import Specification
 from art_gallery.infrastructure.config.minio_config import MinioConfig
 from art_gallery.infrastructure.cloud.minio_service import MinioService
@@ -26,20 +28,24 @@ class ExhibitionMinioRepository(BaseMinioRepository[Exhibition], IExhibitionRepo
                  serializer: ISerializer, 
                  deserializer: IDeserializer,
                  minio_service: Optional[MinioService] = None,
-                 config: Optional[MinioConfig] = None):
+                 config: Optional[MinioConfig] = None,
+                 trusted_load: bool = False,
+                 snapshot_cache: Optional[SnapshotCache] = None):
         """
         Инициализирует репозиторий выставок с использованием MinIO.
         
         Args:
             serializer: Сериализатор для преобразования данных в строку.
             deserializer: Десериализатор для преобразования строки в данные.
-            minio_service: Сервис для работы с MinIO. Если не указан, создается новый.
+            minio_service: Сервис для работы с MinIO. Если не указан, используется общий сервис процесса.
             config: Конфигурация для подключения к MinIO. Используется, если minio_service не указан.
+            trusted_load: Объект записан приложением: не проверять инварианты выставок при загрузке.
+            snapshot_cache: Кэш снимков коллекции для быстрого запуска.
         """
         self._config = config or MinioConfig.from_env()
         
         self.ENTITY_TYPE_STR = "exhibition"
-        file_extension = "xml" if serializer.__class__.__name__ == 'XMLSerializer' else "json"
+        file_extension = serializer.file_extension or "json"
         
         # Construct the object path using the prefix and file extension
         base_filename = f"{self.ENTITY_TYPE_STR}.{file_extension}"
@@ -51,7 +57,9 @@ class ExhibitionMinioRepository(BaseMinioRepository[Exhibition], IExhibitionRepo
             serializer=serializer,
             deserializer=deserializer,
             minio_service=minio_service,
-            config=self._config
+            config=self._config,
+            trusted_load=trusted_load,
+            snapshot_cache=snapshot_cache
         )
 
     def _create_entity_from_dict(self, data: Dict[str, Any]) -> Exhibition:
@@ -64,7 +72,19 @@ class ExhibitionMinioRepository(BaseMinioRepository[Exhibition], IExhibitionRepo
         Returns:
             Exhibition: Созданная выставка.
         """
-        return Exhibition.from_dict(data)
+        return EXHIBITION_CODEC.decode(data, self._trusted_load)
+
+    def _entity_to_dict(self, entity: Exhibition) -> Dict[str, Any]:
+        """
+        Преобразует выставку в словарь для сериализации.
+        
+        Args:
+            entity: Выставка.
+            
+        Returns:
+            Dict[str, Any]: Словарь с данными выставки.
+        """
+        return EXHIBITION_CODEC.encode(entity)
 
     def get_active(self) -> List[Exhibition]:
         """
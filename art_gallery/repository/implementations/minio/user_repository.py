@@ -5,8 +5,10 @@ MinIO-реализация репозитория для пользовател
 from typing import List, Dict, Any, Optional, Union
 
 from art_gallery.domain import User, UserRole
+from art_gallery.domain.codecs import USER_CODEC
 from art_gallery.repository.interfaces.user_repository import IUserRepository
 from art_gallery.repository.implementations.minio.base_minio_repository import BaseMinioRepository
+from art_gallery.repository.snapshot.snapshot_cache import SnapshotCache
 from art_gallery.repository.specifications.base_specification import Specification
 from art_gallery.infrastructure.config.minio_config import MinioConfig
 from art_gallery.infrastructure.cloud.minio_service import MinioService
@@ -25,20 +27,24 @@ class UserMinioRepository(BaseMinioRepository[User], IUserRepository):
                  serializer: ISerializer, 
                  deserializer: IDeserializer,
                  minio_service: Optional[MinioService] = None,
-                 config: Optional[MinioConfig] = None):
+                 config: Optional[MinioConfig] = None,
+                 trusted_load: bool = False,
+                 snapshot_cache: Optional[SnapshotCache] = None):
         """
         Инициализирует репозиторий пользователей с использованием MinIO.
         
         Args:
             serializer: Сериализатор для преобразования данных в строку.
             deserializer: Десериализатор для преобразования строки в данные.
-            minio_service: Сервис для работы с MinIO. Если не указан, создается новый.
+            minio_service: Сервис для работы с MinIO. Если не указан, используется общий сервис процесса.
             config: Конфигурация для подключения к MinIO. Используется, если minio_service не указан.
+            trusted_load: Объект записан приложением: не проверять инварианты пользователей при загрузке.
+            snapshot_cache: Кэш снимков коллекции для быстрого запуска.
         """
         self._config = config or MinioConfig.from_env()
         
         self.ENTITY_TYPE_STR = "user"
-        file_extension = "xml" if serializer.__class__.__name__ == 'XMLSerializer' else "json"
+        file_extension = serializer.file_extension or "json"
 
         # Construct the object path using the prefix and file extension
         base_filename = f"{self.ENTITY_TYPE_STR}.{file_extension}"
@@ -50,7 +56,9 @@ class UserMinioRepository(BaseMinioRepository[User], IUserRepository):
             serializer=serializer,
             deserializer=deserializer,
             minio_service=minio_service,
-            config=self._config
+            config=self._config,
+            trusted_load=trusted_load,
+            snapshot_cache=snapshot_cache
         )
 
     def _create_entity_from_dict(self, data: Dict[str, Any]) -> User:
@@ -63,7 +71,19 @@ class UserMinioRepository(BaseMinioRepository[User], IUserRepository):
         Returns:
             User: Созданный пользователь.
         """
-        return User.from_dict(data)
+        return USER_CODEC.decode(data, self._trusted_load)
+
+    def _entity_to_dict(self, entity: User) -> Dict[str, Any]:
+        """
+        Преобразует пользователя в словарь для сериализации.
+        
+        Args:
+            entity: Пользователь.
+            
+        Returns:
+            Dict[str, Any]: Словарь с данными пользователя.
+        """
+        return USER_CODEC.encode(entity)
 
     def get_by_username(self, username: str) -> Optional[User]:
         """
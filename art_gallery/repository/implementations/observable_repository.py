@@ -0,0 +1,67 @@
+from typing import Callable, Generic, Iterable, List, TypeVar, TYPE_CHECKING
+from art_gallery.domain.base_entity import BaseEntity
+from art_gallery.repository.interfaces.repository_observer import IRepositoryObserver
+from art_gallery.repository.specifications.base_specification import Specification
+
+if TYPE_CHECKING:
+    from art_gallery.repository.indexing.index_manager import IndexManager
+
+T = TypeVar('T', bound=BaseEntity)
+
+class ObservableRepositoryMixin(Generic[T]):
+    """
+    Примесь для репозиториев, оповещающих наблюдателей об изменениях коллекции.
+    Наследник обязан реализовать get_all().
+    """
+
+    def _get_observers(self) -> List[IRepositoryObserver[T]]:
+        # Наблюдатели создаются лениво: _load_data вызывается из __init__ до их подключения
+        observers = self.__dict__.get('_observers')
+        if observers is None:
+            observers = []
+            self._observers = observers
+        return observers
+
+    def add_observer(self, observer: IRepositoryObserver[T]) -> None:
+        """Подключает наблюдателя и сразу синхронизирует его с текущими данными"""
+        observers = self._get_observers()
+        if observer not in observers:
+            observers.append(observer)
+            observer.on_reload(self.get_all())
+
+    def remove_observer(self, observer: IRepositoryObserver[T]) -> None:
+        observers = self._get_observers()
+        if observer in observers:
+            observers.remove(observer)
+
+    def _notify_reload(self, entities: Iterable[T]) -> None:
+        observers = self._get_observers()
+        if not observers:
+            return
+        entities = list(entities)
+        for observer in observers:
+            observer.on_reload(entities)
+
+    def _notify_upsert(self, entity: T) -> None:
+        for observer in self._get_observers():
+            observer.on_upsert(entity)
+
+    def _notify_delete(self, entity_id: int) -> None:
+        for observer in self._get_observers():
+            observer.on_delete(entity_id)
+
+    def set_index_manager(self, manager: 'IndexManager[T]') -> None:
+        """Подключает автоматическое индексирование: поиск в find() пойдет через менеджер индексов"""
+        previous = self.__dict__.get('_index_manager')
+        if previous is not None:
+            self.remove_observer(previous)
+        self._index_manager = manager
+        self.add_observer(manager)
+
+    def _find_indexed(self, specification: Specification[T],
+                      scan: Callable[[Specification[T]], List[T]]) -> List[T]:
+        """Выполняет поиск через менеджер индексов, если он подключен, иначе вызывает scan"""
+        manager = self.__dict__.get('_index_manager')
+        if manager is None:
+            return scan(specification)
+        return manager.find(specification, scan)
@@ -0,0 +1,189 @@
+"""
+Советник по индексам.
+По статистике запросов оценивает выигрыш от индекса на каждом поле и выбирает
+набор индексов с наибольшей экономией времени на байт памяти в пределах лимита.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from art_gallery.repository.indexing.query_statistics import QueryStatistics, FieldUsage
+from art_gallery.repository.indexing.secondary_index import SecondaryIndex, HASH, SORTED
+from art_gallery.repository.indexing.predicate_analysis import EQUALITY, RANGE, MEMBER
+
+DEFAULT_MEMORY_LIMIT_BYTES = 32 * 1024 * 1024
+DEFAULT_MIN_QUERIES = 5
+DEFAULT_MAX_SELECTIVITY = 0.3
+DEFAULT_MIN_SAVINGS_MS = 1.0
+
+# Время проверки одной сущности, если полных просмотров в окне еще не было
+_DEFAULT_ROW_COST = 1e-6
+
+CREATE = 'create'
+DROP = 'drop'
+KEEP = 'keep'
+SKIP = 'skip'
+
+_INDEX_KIND_BY_PREDICATE = {EQUALITY: HASH, MEMBER: HASH, RANGE: SORTED}
+
+
+@dataclass(frozen=True)
+class IndexDecision:
+    """
+    Решение советника по одному индексу.
+
+    Attributes:
+        field: Поле сущности
+        kind: Вид индекса (hash, sorted)
+        action: create, drop, keep или skip
+        estimated_savings_ms: Оценка экономии времени на запросах окна статистики
+        estimated_bytes: Оценка занимаемой индексом памяти
+        queries: Количество запросов окна, использовавших поле
+        selectivity: Средняя селективность условий по полю
+        reason: Пояснение
+    """
+    field: str
+    kind: str
+    action: str
+    estimated_savings_ms: float
+    estimated_bytes: int
+    queries: int
+    selectivity: Optional[float]
+    reason: str
+
+
+@dataclass(frozen=True)
+class _Candidate:
+    field: str
+    kind: str
+    savings_ms: float
+    bytes: int
+    queries: int
+    selectivity: Optional[float]
+    eligible: bool
+    reason: str
+
+
+class IndexAdvisor:
+    """Выбирает индексы по статистике нагрузки"""
+
+    def __init__(self, memory_limit_bytes: int = DEFAULT_MEMORY_LIMIT_BYTES,
+                 min_queries: int = DEFAULT_MIN_QUERIES,
+                 max_selectivity: float = DEFAULT_MAX_SELECTIVITY,
+                 min_savings_ms: float = DEFAULT_MIN_SAVINGS_MS):
+        """
+        Args:
+            memory_limit_bytes: Лимит памяти на все индексы репозитория
+            min_queries: Минимальное число запросов по полю в окне
+            max_selectivity: Максимальная доля коллекции, возвращаемая условием
+            min_savings_ms: Минимальная оценка экономии за окно, мс
+        """
+        self.memory_limit_bytes = memory_limit_bytes
+        self.min_queries = min_queries
+        self.max_selectivity = max_selectivity
+        self.min_savings_ms = min_savings_ms
+        # Последняя измеренная стоимость проверки сущности: когда все запросы идут через
+        # индексы, полных просмотров в окне нет, а оценка не должна откатываться к значению по умолчанию
+        self._row_cost: Optional[float] = None
+
+    def advise(self, statistics: QueryStatistics, collection_size: int,
+               current_indexes: Dict[Tuple[str, str], SecondaryIndex]) -> List[IndexDecision]:
+        """
+        Формирует решения по индексам.
+
+        Args:
+            statistics: Статистика запросов репозитория
+            collection_size: Текущий размер коллекции
+            current_indexes: Существующие индексы по ключу (поле, вид)
+
+        Returns:
+            List[IndexDecision]: Решения, упорядоченные по убыванию оценки экономии
+        """
+        measured = statistics.scan_cost_per_row()
+        if measured:
+            self._row_cost = measured
+        row_cost = self._row_cost or _DEFAULT_ROW_COST
+        candidates = self._candidates(statistics.field_usage(), row_cost, collection_size, current_indexes)
+
+        # Жадный выбор по экономии на байт в пределах лимита памяти
+        chosen = set()
+        used_bytes = 0
+        over_limit = set()
+        for candidate in sorted((c for c in candidates.values() if c.eligible),
+                                key=lambda c: c.savings_ms / max(c.bytes, 1), reverse=True):
+            key = (candidate.field, candidate.kind)
+            if used_bytes + candidate.bytes > self.memory_limit_bytes:
+                over_limit.add(key)
+                continue
+            chosen.add(key)
+            used_bytes += candidate.bytes
+
+        decisions = []
+        for key, candidate in candidates.items():
+            exists = key in current_indexes
+            if key in chosen:
+                action, reason = (KEEP, "still pays off") if exists else (CREATE, candidate.reason)
+            elif key in over_limit:
+                action, reason = (DROP if exists else SKIP), "does not fit into the memory limit"
+            else:
+                action, reason = (DROP if exists else SKIP), candidate.reason
+            decisions.append(IndexDecision(
+                field=candidate.field,
+                kind=candidate.kind,
+                action=action,
+                estimated_savings_ms=candidate.savings_ms,
+                estimated_bytes=candidate.bytes,
+                queries=candidate.queries,
+                selectivity=candidate.selectivity,
+                reason=reason
+            ))
+        decisions.sort(key=lambda d: d.estimated_savings_ms, reverse=True)
+        return decisions
+
+    def _candidates(self, usage: Dict[Tuple[str, str], FieldUsage], row_cost: float,
+                    collection_size: int,
+                    current_indexes: Dict[Tuple[str, str], SecondaryIndex]) -> Dict[Tuple[str, str], _Candidate]:
+        # Объединяем условия, которые обслуживает один вид индекса (eq и member -> hash)
+        merged: Dict[Tuple[str, str], FieldUsage] = {}
+        for (field, predicate_kind), item in usage.items():
+            kind = _INDEX_KIND_BY_PREDICATE.get(predicate_kind)
+            if kind is None:
+                continue
+            target = merged.get((field, kind))
+            if target is None:
+                merged[(field, kind)] = FieldUsage(field, kind, item.queries, item.selectivity_sum,
+                                                   item.selectivity_samples, item.latency_sum)
+            else:
+                target.queries += item.queries
+                target.selectivity_sum += item.selectivity_sum
+                target.selectivity_samples += item.selectivity_samples
+                target.latency_sum += item.latency_sum
+
+        candidates: Dict[Tuple[str, str], _Candidate] = {}
+        for key, item in merged.items():
+            field, kind = key
+            selectivity = item.selectivity
+            effective_selectivity = 1.0 if selectivity is None else selectivity
+            # Индекс избавляет от проверки сущностей, не попавших в кандидаты
+            savings_ms = item.queries * row_cost * collection_size * (1.0 - effective_selectivity) * 1000
+            if key in current_indexes:
+                size = current_indexes[key].estimated_bytes()
+            else:
+                distinct = collection_size if kind == SORTED else int(min(collection_size, 1 / max(effective_selectivity, 1e-9)))
+                size = SecondaryIndex.estimate_bytes(kind, collection_size, distinct)
+
+            if item.queries < self.min_queries:
+                eligible, reason = False, f"too few queries ({item.queries} < {self.min_queries})"
+            elif selectivity is None or selectivity > self.max_selectivity:
+                eligible, reason = False, "predicates on this field are not selective enough"
+            elif savings_ms < self.min_savings_ms:
+                eligible, reason = False, "estimated savings are too small"
+            else:
+                eligible, reason = True, f"used by {item.queries} queries, selectivity {selectivity:.1%}"
+            candidates[key] = _Candidate(field, kind, savings_ms, size, item.queries, selectivity, eligible, reason)
+
+        # Существующие индексы, которые больше не используются, тоже попадают в решения
+        for key, index in current_indexes.items():
+            if key not in candidates:
+                candidates[key] = _Candidate(key[0], key[1], 0.0, index.estimated_bytes(), 0, None,
+                                             False, "not used by recent queries")
+        return candidates
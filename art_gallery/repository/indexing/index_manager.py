@@ -0,0 +1,221 @@
+"""
+Автоматическое индексирование репозитория.
+IndexManager подключается к репозиторию как наблюдатель, выполняет поиск через
+вторичные индексы, собирает статистику запросов и периодически пересматривает
+набор индексов с помощью IndexAdvisor.
+"""
+import logging
+import random
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Generic, Iterable, List, Optional, Set, Tuple, TypeVar
+
+from art_gallery.domain.base_entity import BaseEntity
+from art_gallery.repository.interfaces.repository_observer import IRepositoryObserver
+from art_gallery.repository.specifications.base_specification import Specification
+from art_gallery.repository.indexing.predicate_analysis import FieldPredicate, EQUALITY, analyze
+from art_gallery.repository.indexing.query_statistics import (
+    QueryStatistics,
+    QueryRecord,
+    PredicateRecord,
+    DEFAULT_WINDOW_SIZE
+)
+from art_gallery.repository.indexing.secondary_index import SecondaryIndex, create_index, index_kind_for, SORTED
+from art_gallery.repository.indexing.index_advisor import IndexAdvisor, IndexDecision, CREATE, DROP
+
+T = TypeVar('T', bound=BaseEntity)
+
+DEFAULT_REEVALUATE_EVERY = 50
+
+# Размер выборки для оценки селективности условий без индекса
+_SAMPLE_SIZE = 256
+# Выборка обновляется, когда размер коллекции изменился больше чем на эту долю
+_SAMPLE_REFRESH_RATIO = 0.1
+_HISTORY_SIZE = 50
+
+
+class IndexManager(IRepositoryObserver[T], Generic[T]):
+    """Вторичные индексы, статистика запросов и автоматический выбор индексов"""
+
+    def __init__(self, name: str, advisor: Optional[IndexAdvisor] = None,
+                 auto: bool = True,
+                 reevaluate_every: int = DEFAULT_REEVALUATE_EVERY,
+                 window_size: int = DEFAULT_WINDOW_SIZE):
+        """
+        Args:
+            name: Имя коллекции для отчетов (artworks, exhibitions, users)
+            advisor: Советник по индексам (по умолчанию - с лимитами по умолчанию)
+            auto: Автоматически применять решения советника
+            reevaluate_every: Через сколько запросов пересматривать индексы
+            window_size: Размер окна статистики запросов
+        """
+        self.name = name
+        self.advisor = advisor or IndexAdvisor()
+        self.auto = auto
+        self._reevaluate_every = reevaluate_every
+        self._logger = logging.getLogger(__name__)
+        self.statistics = QueryStatistics(window_size)
+        self._entities: Dict[int, T] = {}
+        self._indexes: Dict[Tuple[str, str], SecondaryIndex[T]] = {}
+        self._sample: List[T] = []
+        self._sample_size_basis = 0
+        self._queries_since_review = 0
+        self.last_decisions: List[IndexDecision] = []
+        self.history: Deque[Tuple[float, IndexDecision]] = deque(maxlen=_HISTORY_SIZE)
+
+    # --- IRepositoryObserver ---
+
+    def on_reload(self, entities: Iterable[T]) -> None:
+        self._entities = {entity.id: entity for entity in entities}
+        values = list(self._entities.values())
+        for index in self._indexes.values():
+            index.on_reload(values)
+        self._refresh_sample()
+
+    def on_upsert(self, entity: T) -> None:
+        self._entities[entity.id] = entity
+        for index in self._indexes.values():
+            index.on_upsert(entity)
+
+    def on_delete(self, entity_id: int) -> None:
+        self._entities.pop(entity_id, None)
+        for index in self._indexes.values():
+            index.on_delete(entity_id)
+
+    # --- Поиск ---
+
+    def find(self, specification: Specification[T],
+             scan: Callable[[Specification[T]], List[T]]) -> List[T]:
+        """
+        Находит сущности по спецификации, используя самый селективный подходящий индекс.
+
+        Args:
+            specification: Спецификация поиска
+            scan: Поиск без индексов (обычный find репозитория)
+
+        Returns:
+            List[T]: Найденные сущности; при поиске по индексу - в порядке возрастания id
+        """
+        started = time.perf_counter()
+        indexable, predicates = analyze(specification)
+        collection_size = len(self._entities)
+
+        candidates: Optional[Set[int]] = None
+        index_used: Optional[str] = None
+        selectivity_by_predicate: Dict[int, float] = {}
+        for predicate in indexable:
+            index = self._index_for(predicate)
+            if index is None:
+                continue
+            ids = index.lookup(predicate)
+            if collection_size:
+                selectivity_by_predicate[id(predicate)] = len(ids) / collection_size
+            if candidates is None or len(ids) < len(candidates):
+                candidates, index_used = ids, index.name
+
+        if candidates is not None:
+            predicate_fn = specification.compile()
+            entities = self._entities
+            result = [entities[entity_id] for entity_id in sorted(candidates)
+                      if entity_id in entities and predicate_fn(entities[entity_id])]
+        else:
+            result = scan(specification)
+        latency = time.perf_counter() - started
+
+        self._record(specification, predicates, selectivity_by_predicate, collection_size, len(result), latency, index_used)
+        return result
+
+    def _index_for(self, predicate: FieldPredicate) -> Optional[SecondaryIndex[T]]:
+        kind = index_kind_for(predicate)
+        index = self._indexes.get((predicate.field, kind)) if kind else None
+        if index is None and predicate.kind == EQUALITY:
+            # Условие равенства может обслужить и упорядоченный индекс
+            index = self._indexes.get((predicate.field, SORTED))
+        return index
+
+    # --- Статистика ---
+
+    def _record(self, specification: Specification[T], predicates: List[FieldPredicate], measured: Dict[int, float],
+                collection_size: int, matched: int, latency: float, index_used: Optional[str]) -> None:
+        records = []
+        for predicate in predicates:
+            selectivity = measured.get(id(predicate))
+            if selectivity is None and predicate.indexable:
+                if predicate.specification is specification and collection_size:
+                    # Спецификация состоит из одного условия - селективность известна точно
+                    selectivity = matched / collection_size
+                else:
+                    selectivity = self._sample_selectivity(predicate)
+            records.append(PredicateRecord(predicate.field, predicate.kind, selectivity))
+
+        self.statistics.record(QueryRecord(tuple(records), collection_size, matched, latency, index_used))
+
+        self._queries_since_review += 1
+        if self.auto and self._queries_since_review >= self._reevaluate_every:
+            self.reevaluate()
+
+    def _sample_selectivity(self, predicate: FieldPredicate) -> Optional[float]:
+        size = len(self._entities)
+        if abs(size - self._sample_size_basis) > self._sample_size_basis * _SAMPLE_REFRESH_RATIO:
+            self._refresh_sample()
+        if not self._sample or predicate.specification is None:
+            return None
+        predicate_fn = predicate.specification.compile()
+        try:
+            return sum(1 for entity in self._sample if predicate_fn(entity)) / len(self._sample)
+        except Exception:
+            # Сущность из устаревшей выборки могла измениться так, что условие неприменимо
+            return None
+
+    def _refresh_sample(self) -> None:
+        values = list(self._entities.values())
+        self._sample = random.sample(values, _SAMPLE_SIZE) if len(values) > _SAMPLE_SIZE else values
+        self._sample_size_basis = len(values)
+
+    # --- Управление индексами ---
+
+    def advise(self) -> List[IndexDecision]:
+        """Получает решения советника по текущей статистике, не применяя их"""
+        self._queries_since_review = 0
+        self.last_decisions = self.advisor.advise(self.statistics, len(self._entities), self._indexes)
+        return self.last_decisions
+
+    def reevaluate(self) -> List[IndexDecision]:
+        """Пересматривает набор индексов; при auto=True применяет решения"""
+        decisions = self.advise()
+        if self.auto:
+            self.apply(decisions)
+        return decisions
+
+    def apply(self, decisions: List[IndexDecision]) -> None:
+        """Создает и удаляет индексы по решениям советника"""
+        for decision in decisions:
+            key = (decision.field, decision.kind)
+            if decision.action == CREATE and key not in self._indexes:
+                self.create_index(decision.field, decision.kind)
+            elif decision.action == DROP and key in self._indexes:
+                self.drop_index(decision.field, decision.kind)
+            else:
+                continue
+            self.history.append((time.time(), decision))
+            self._logger.info(f"Index {decision.action} {self.name}.{decision.field} ({decision.kind}): {decision.reason}")
+
+    def create_index(self, field: str, kind: str) -> SecondaryIndex[T]:
+        index = create_index(field, kind)
+        index.on_reload(self._entities.values())
+        self._indexes[(field, kind)] = index
+        return index
+
+    def drop_index(self, field: str, kind: str) -> None:
+        self._indexes.pop((field, kind), None)
+
+    @property
+    def indexes(self) -> List[SecondaryIndex[T]]:
+        return list(self._indexes.values())
+
+    def memory_usage(self) -> int:
+        """Оценка памяти, занимаемой всеми индексами"""
+        return sum(index.estimated_bytes() for index in self._indexes.values())
+
+    def __len__(self) -> int:
+        return len(self._entities)
@@ -0,0 +1,148 @@
+"""
+Анализ спецификаций для индексов.
+Извлекает из дерева спецификаций условия по полям: равенство, диапазон или
+вхождение в коллекцию. Условия из конъюнкции верхнего уровня могут обслуживаться
+индексом, условия внутри Or/Not учитываются только в статистике.
+"""
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+from art_gallery.repository.specifications.base_specification import (
+    Specification,
+    AndSpecification,
+    OrSpecification,
+    NotSpecification
+)
+from art_gallery.repository.specifications.field_specifications import (
+    FieldComparisonSpecification,
+    FieldContainsSpecification
+)
+from art_gallery.repository.specifications.artwork_specifications import (
+    ArtworkByTypeSpecification,
+    ArtworkByYearRangeSpecification,
+    ArtworkCreatedBetweenSpecification,
+    ArtworkByArtistSpecification,
+    ArtworkDescriptionContainsSpecification
+)
+from art_gallery.repository.specifications.exhibition_specifications import (
+    ExhibitionByDateRangeSpecification,
+    HasArtworkSpecification
+)
+
+# Виды условий
+EQUALITY = 'eq'
+RANGE = 'range'
+MEMBER = 'member'
+OTHER = 'other'
+
+
+def normalize_key(value: Any) -> Any:
+    """Ключ индекса: строки сравниваются без учета регистра, как в спецификациях"""
+    return value.lower() if isinstance(value, str) else value
+
+
+@dataclass(frozen=True)
+class FieldPredicate:
+    """
+    Условие по одному полю.
+
+    Attributes:
+        field: Имя атрибута сущности
+        kind: Вид условия (eq, range, member, other)
+        values: Допустимые значения для eq и member
+        low, high: Границы диапазона (None - без границы)
+        low_inclusive, high_inclusive: Включаются ли границы
+        specification: Исходная спецификация условия (для оценки селективности)
+    """
+    field: str
+    kind: str
+    values: Tuple[Any, ...] = ()
+    low: Any = None
+    high: Any = None
+    low_inclusive: bool = True
+    high_inclusive: bool = True
+    specification: Optional[Specification] = None
+
+    @property
+    def indexable(self) -> bool:
+        return self.kind != OTHER
+
+
+def analyze(specification: Specification) -> Tuple[List[FieldPredicate], List[FieldPredicate]]:
+    """
+    Разбирает спецификацию на условия.
+
+    Returns:
+        Tuple: (условия конъюнкции верхнего уровня, которые можно обслужить индексом;
+                все условия спецификации для статистики)
+    """
+    conjuncts: List[FieldPredicate] = []
+    everything: List[FieldPredicate] = []
+    _collect(specification, conjuncts, everything, top_level=True)
+    return [predicate for predicate in conjuncts if predicate.indexable], everything
+
+
+def _collect(specification: Specification, conjuncts: List[FieldPredicate],
+             everything: List[FieldPredicate], top_level: bool) -> None:
+    if isinstance(specification, AndSpecification):
+        for child in specification.specifications:
+            _collect(child, conjuncts, everything, top_level)
+        return
+    if isinstance(specification, (OrSpecification, NotSpecification)):
+        children = (specification.specifications if isinstance(specification, OrSpecification)
+                    else (specification.specification,))
+        for child in children:
+            _collect(child, conjuncts, everything, top_level=False)
+        return
+
+    predicates = _describe_leaf(specification)
+    # Внутри Or/Not условие не сужает результат, поэтому для индекса оно бесполезно
+    everything.extend(predicates if top_level else [_as_other(p) for p in predicates])
+    if top_level:
+        conjuncts.extend(predicates)
+
+
+def _as_other(predicate: FieldPredicate) -> FieldPredicate:
+    return FieldPredicate(predicate.field, OTHER, specification=predicate.specification)
+
+
+def _range(field: str, specification: Specification, low: Any = None, high: Any = None,
+           low_inclusive: bool = True, high_inclusive: bool = True) -> FieldPredicate:
+    return FieldPredicate(field, RANGE, low=low, high=high, low_inclusive=low_inclusive,
+                          high_inclusive=high_inclusive, specification=specification)
+
+
+def _describe_leaf(specification: Specification) -> List[FieldPredicate]:
+    if isinstance(specification, FieldComparisonSpecification):
+        field, value = specification.attribute, normalize_key(specification.value)
+        if specification.op == 'eq':
+            return [FieldPredicate(field, EQUALITY, (value,), specification=specification)]
+        if specification.op in ('lt', 'le'):
+            return [_range(field, specification, high=value, high_inclusive=specification.op == 'le')]
+        if specification.op in ('gt', 'ge'):
+            return [_range(field, specification, low=value, low_inclusive=specification.op == 'ge')]
+        return [FieldPredicate(field, OTHER, specification=specification)]
+    if isinstance(specification, ArtworkByTypeSpecification):
+        return [FieldPredicate('type', EQUALITY, tuple(specification.types), specification=specification)]
+    if isinstance(specification, ArtworkByYearRangeSpecification):
+        return [_range('year', specification, specification.start_year, specification.end_year)]
+    if isinstance(specification, ArtworkCreatedBetweenSpecification):
+        return [_range('created_at', specification, specification.start, specification.end)]
+    if isinstance(specification, ArtworkByArtistSpecification):
+        return [FieldPredicate('artist', EQUALITY, (normalize_key(specification.artist),),
+                               specification=specification)]
+    if isinstance(specification, HasArtworkSpecification):
+        return [FieldPredicate('artwork_ids', MEMBER, (specification.artwork_id,), specification=specification)]
+    if isinstance(specification, ExhibitionByDateRangeSpecification):
+        # Пересечение интервалов: start_date <= end и end_date >= start
+        return [
+            _range('start_date', FieldComparisonSpecification('start_date', 'le', specification.end_date),
+                   high=specification.end_date),
+            _range('end_date', FieldComparisonSpecification('end_date', 'ge', specification.start_date),
+                   low=specification.start_date)
+        ]
+    if isinstance(specification, FieldContainsSpecification):
+        return [FieldPredicate(specification.attribute, OTHER, specification=specification)]
+    if isinstance(specification, ArtworkDescriptionContainsSpecification):
+        return [FieldPredicate('description', OTHER, specification=specification)]
+    return []
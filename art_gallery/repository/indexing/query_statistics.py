@@ -0,0 +1,117 @@
+"""
+Статистика запросов к репозиторию.
+Хранит скользящее окно последних запросов: какие поля и какими условиями
+фильтровались, селективность условий, размер коллекции и время выполнения.
+"""
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Tuple
+
+DEFAULT_WINDOW_SIZE = 500
+
+
+@dataclass(frozen=True)
+class PredicateRecord:
+    """Условие в выполненном запросе"""
+    field: str
+    kind: str
+    # Доля коллекции, удовлетворяющая условию (None - не оценивалась)
+    selectivity: Optional[float]
+
+
+@dataclass(frozen=True)
+class QueryRecord:
+    """Выполненный запрос"""
+    predicates: Tuple[PredicateRecord, ...]
+    collection_size: int
+    matched: int
+    latency: float
+    index_used: Optional[str]
+    timestamp: float = field(default_factory=time.time)
+
+
+@dataclass
+class FieldUsage:
+    """Сводная статистика по паре (поле, вид условия) в окне"""
+    field: str
+    kind: str
+    queries: int = 0
+    selectivity_sum: float = 0.0
+    selectivity_samples: int = 0
+    latency_sum: float = 0.0
+    scanned_queries: int = 0
+    scan_latency_sum: float = 0.0
+    scanned_rows: int = 0
+
+    @property
+    def selectivity(self) -> Optional[float]:
+        if not self.selectivity_samples:
+            return None
+        return self.selectivity_sum / self.selectivity_samples
+
+    @property
+    def average_latency(self) -> float:
+        return self.latency_sum / self.queries if self.queries else 0.0
+
+
+class QueryStatistics:
+    """Скользящее окно запросов одного репозитория"""
+
+    def __init__(self, window_size: int = DEFAULT_WINDOW_SIZE):
+        self._records: Deque[QueryRecord] = deque(maxlen=window_size)
+        self.total_queries = 0
+
+    def record(self, record: QueryRecord) -> None:
+        self._records.append(record)
+        self.total_queries += 1
+
+    def clear(self) -> None:
+        self._records.clear()
+
+    @property
+    def records(self) -> List[QueryRecord]:
+        return list(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def average_latency(self) -> float:
+        if not self._records:
+            return 0.0
+        return sum(record.latency for record in self._records) / len(self._records)
+
+    def scan_cost_per_row(self) -> Optional[float]:
+        """Среднее время проверки одной сущности при полном просмотре (секунды)"""
+        rows = 0
+        latency = 0.0
+        for record in self._records:
+            if record.index_used is None and record.collection_size:
+                rows += record.collection_size
+                latency += record.latency
+        return latency / rows if rows else None
+
+    def field_usage(self) -> Dict[Tuple[str, str], FieldUsage]:
+        """Сводка по полям и видам условий в окне"""
+        usage: Dict[Tuple[str, str], FieldUsage] = {}
+        for record in self._records:
+            # Поле учитывается один раз на запрос, даже если встречается в нескольких условиях
+            seen = set()
+            for predicate in record.predicates:
+                key = (predicate.field, predicate.kind)
+                item = usage.get(key)
+                if item is None:
+                    item = usage[key] = FieldUsage(predicate.field, predicate.kind)
+                if predicate.selectivity is not None:
+                    item.selectivity_sum += predicate.selectivity
+                    item.selectivity_samples += 1
+                if key in seen:
+                    continue
+                seen.add(key)
+                item.queries += 1
+                item.latency_sum += record.latency
+                if record.index_used is None:
+                    item.scanned_queries += 1
+                    item.scan_latency_sum += record.latency
+                    item.scanned_rows += record.collection_size
+        return usage
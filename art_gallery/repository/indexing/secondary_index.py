@@ -0,0 +1,222 @@
+"""
+Вторичные индексы в памяти по полям сущностей.
+Индексы - наблюдатели репозитория и обновляются при каждом изменении коллекции.
+Индекс возвращает множество id-кандидатов, окончательная проверка выполняется
+полной спецификацией.
+"""
+import bisect
+from abc import ABC, abstractmethod
+from collections.abc import Iterable as IterableABC
+from typing import Any, Dict, Generic, Iterable, List, Optional, Set, Tuple, TypeVar
+
+from art_gallery.domain.base_entity import BaseEntity
+from art_gallery.repository.interfaces.repository_observer import IRepositoryObserver
+from art_gallery.repository.indexing.predicate_analysis import (
+    FieldPredicate,
+    EQUALITY,
+    RANGE,
+    MEMBER,
+    normalize_key
+)
+
+T = TypeVar('T', bound=BaseEntity)
+
+# Грубые оценки занимаемой памяти (CPython, 64 бита): запись в dict/set, элемент списка
+_HASH_ENTRY_BYTES = 120
+_HASH_BUCKET_BYTES = 280
+_SORTED_ENTRY_BYTES = 140
+
+HASH = 'hash'
+SORTED = 'sorted'
+
+
+class SecondaryIndex(IRepositoryObserver[T], ABC):
+    """Базовый класс вторичного индекса по одному атрибуту"""
+
+    kind: str = ''
+
+    def __init__(self, field: str):
+        self.field = field
+
+    @property
+    def name(self) -> str:
+        return f"{self.field}:{self.kind}"
+
+    def on_reload(self, entities: Iterable[T]) -> None:
+        self._clear()
+        for entity in entities:
+            self.on_upsert(entity)
+
+    @abstractmethod
+    def _clear(self) -> None:
+        pass
+
+    @abstractmethod
+    def supports(self, predicate: FieldPredicate) -> bool:
+        """Может ли индекс обслужить условие"""
+        pass
+
+    @abstractmethod
+    def lookup(self, predicate: FieldPredicate) -> Set[int]:
+        """Возвращает id сущностей, которые могут удовлетворять условию"""
+        pass
+
+    @abstractmethod
+    def estimated_bytes(self) -> int:
+        """Оценка занимаемой памяти"""
+        pass
+
+    @staticmethod
+    def estimate_bytes(kind: str, entries: int, distinct: int) -> int:
+        """Оценка памяти индекса заданного вида до его построения"""
+        if kind == HASH:
+            return entries * _HASH_ENTRY_BYTES + distinct * _HASH_BUCKET_BYTES
+        return entries * _SORTED_ENTRY_BYTES
+
+
+class HashIndex(SecondaryIndex[T]):
+    """
+    Хэш-индекс для условий равенства. Для атрибутов-коллекций (например, artwork_ids)
+    индексирует каждый элемент и обслуживает условия вхождения.
+    """
+
+    kind = HASH
+
+    def __init__(self, field: str):
+        super().__init__(field)
+        self._buckets: Dict[Any, Set[int]] = {}
+        self._keys_by_id: Dict[int, Tuple[Any, ...]] = {}
+        self._entries = 0
+
+    def _clear(self) -> None:
+        self._buckets = {}
+        self._keys_by_id = {}
+        self._entries = 0
+
+    def _keys_of(self, entity: T) -> Tuple[Any, ...]:
+        value = getattr(entity, self.field, None)
+        if isinstance(value, IterableABC) and not isinstance(value, (str, bytes)):
+            return tuple({normalize_key(item) for item in value})
+        return (normalize_key(value),)
+
+    def on_upsert(self, entity: T) -> None:
+        self.on_delete(entity.id)
+        keys = self._keys_of(entity)
+        for key in keys:
+            self._buckets.setdefault(key, set()).add(entity.id)
+        self._keys_by_id[entity.id] = keys
+        self._entries += len(keys)
+
+    def on_delete(self, entity_id: int) -> None:
+        keys = self._keys_by_id.pop(entity_id, None)
+        if keys is None:
+            return
+        for key in keys:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(entity_id)
+                if not bucket:
+                    del self._buckets[key]
+        self._entries -= len(keys)
+
+    def supports(self, predicate: FieldPredicate) -> bool:
+        return predicate.field == self.field and predicate.kind in (EQUALITY, MEMBER)
+
+    def lookup(self, predicate: FieldPredicate) -> Set[int]:
+        if len(predicate.values) == 1:
+            return set(self._buckets.get(predicate.values[0], ()))
+        result: Set[int] = set()
+        for value in predicate.values:
+            result.update(self._buckets.get(value, ()))
+        return result
+
+    def estimated_bytes(self) -> int:
+        return self.estimate_bytes(HASH, self._entries, len(self._buckets))
+
+
+class SortedIndex(SecondaryIndex[T]):
+    """Упорядоченный индекс для диапазонных условий (поиск границ бинарным поиском)"""
+
+    kind = SORTED
+
+    def __init__(self, field: str):
+        super().__init__(field)
+        self._clear()
+
+    def _clear(self) -> None:
+        self._keys: List[Any] = []
+        self._ids: List[int] = []
+        self._key_by_id: Dict[int, Any] = {}
+
+    def on_reload(self, entities: Iterable[T]) -> None:
+        # Массовое построение сортировкой вместо вставок по одной
+        self._clear()
+        pairs = []
+        for entity in entities:
+            key = normalize_key(getattr(entity, self.field, None))
+            if key is not None:
+                pairs.append((key, entity.id))
+                self._key_by_id[entity.id] = key
+        pairs.sort()
+        self._keys = [key for key, _ in pairs]
+        self._ids = [entity_id for _, entity_id in pairs]
+
+    def on_upsert(self, entity: T) -> None:
+        self.on_delete(entity.id)
+        key = normalize_key(getattr(entity, self.field, None))
+        if key is None:
+            return
+        position = bisect.bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self._ids.insert(position, entity.id)
+        self._key_by_id[entity.id] = key
+
+    def on_delete(self, entity_id: int) -> None:
+        key = self._key_by_id.pop(entity_id, None)
+        if key is None:
+            return
+        position = bisect.bisect_left(self._keys, key)
+        while self._ids[position] != entity_id:
+            position += 1
+        del self._keys[position]
+        del self._ids[position]
+
+    def supports(self, predicate: FieldPredicate) -> bool:
+        return predicate.field == self.field and predicate.kind in (RANGE, EQUALITY)
+
+    def lookup(self, predicate: FieldPredicate) -> Set[int]:
+        if predicate.kind == EQUALITY:
+            result: Set[int] = set()
+            for value in predicate.values:
+                start = bisect.bisect_left(self._keys, value)
+                end = bisect.bisect_right(self._keys, value)
+                result.update(self._ids[start:end])
+            return result
+
+        start, end = 0, len(self._keys)
+        if predicate.low is not None:
+            start = (bisect.bisect_left if predicate.low_inclusive else bisect.bisect_right)(self._keys, predicate.low)
+        if predicate.high is not None:
+            end = (bisect.bisect_right if predicate.high_inclusive else bisect.bisect_left)(self._keys, predicate.high)
+        return set(self._ids[start:end]) if start < end else set()
+
+    def estimated_bytes(self) -> int:
+        return self.estimate_bytes(SORTED, len(self._ids), 0)
+
+
+def create_index(field: str, kind: str) -> SecondaryIndex:
+    """Создает пустой индекс заданного вида"""
+    if kind == HASH:
+        return HashIndex(field)
+    if kind == SORTED:
+        return SortedIndex(field)
+    raise ValueError(f"Unknown index kind: {kind}")
+
+
+def index_kind_for(predicate: FieldPredicate) -> Optional[str]:
+    """Вид индекса, подходящий для условия"""
+    if predicate.kind in (EQUALITY, MEMBER):
+        return HASH
+    if predicate.kind == RANGE:
+        return SORTED
+    return None
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import Any, Generic, Iterable, List, Optional, TypeVar
+from art_gallery.domain.base_entity import BaseEntity
+
+T = TypeVar('T', bound=BaseEntity)
+
+class IRepositoryObserver(Generic[T], ABC):
+    """Наблюдатель за изменениями коллекции репозитория (индексы, кэши колонок и т.п.)"""
+
+    @abstractmethod
+    def on_reload(self, entities: Iterable[T]) -> None:
+        """Коллекция полностью загружена или заменена"""
+        pass
+
+    @abstractmethod
+    def on_upsert(self, entity: T) -> None:
+        """Сущность добавлена или обновлена"""
+        pass
+
+    @abstractmethod
+    def on_delete(self, entity_id: int) -> None:
+        """Сущность удалена"""
+        pass
+
+    def export_snapshot(self) -> Optional[Any]:
+        """Состояние для снимка коллекции (None - наблюдатель в снимок не попадает)"""
+        return None
+
+    def restore_snapshot(self, state: Any, entities: List[T]) -> bool:
+        """
+        Восстанавливает состояние из снимка вместо on_reload.
+        Возвращает False, если состояние не подходит (тогда вызывается on_reload)
+        """
+        return False
@@ -0,0 +1,191 @@
+"""
+Параллельный полный просмотр коллекции.
+Коллекция делится на шарды по id, каждый шард живет в отдельном процессе-воркере
+и загружается в него один раз. При запросе в воркеры передается только спецификация
+(она должна сериализоваться pickle), обратно возвращаются отсортированные id,
+которые сливаются в порядке возрастания.
+"""
+import heapq
+import logging
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, TypeVar
+
+from art_gallery.domain.base_entity import BaseEntity
+from art_gallery.repository.interfaces.repository_observer import IRepositoryObserver
+from art_gallery.repository.specifications.base_specification import Specification
+
+T = TypeVar('T', bound=BaseEntity)
+
+# Ниже этого размера накладные расходы на обмен с процессами выше выигрыша
+DEFAULT_MIN_PARALLEL_SIZE = 20000
+
+# --- Состояние процесса-воркера ---
+
+_shard_factory: Optional[Callable[[Dict[str, Any]], Any]] = None
+_shard_entities: Dict[int, Any] = {}
+
+
+def _init_worker(factory: Callable[[Dict[str, Any]], Any]) -> None:
+    global _shard_factory
+    _shard_factory = factory
+    _shard_entities.clear()
+
+
+def _load_shard(records: List[Dict[str, Any]]) -> int:
+    _shard_entities.clear()
+    for record in records:
+        entity = _shard_factory(record)
+        _shard_entities[entity.id] = entity
+    return len(_shard_entities)
+
+
+def _upsert_entity(record: Dict[str, Any]) -> None:
+    entity = _shard_factory(record)
+    _shard_entities[entity.id] = entity
+
+
+def _delete_entity(entity_id: int) -> None:
+    _shard_entities.pop(entity_id, None)
+
+
+def _scan_shard(specification: Specification) -> List[int]:
+    predicate = specification.compile()
+    return sorted(entity_id for entity_id, entity in _shard_entities.items() if predicate(entity))
+
+
+class ParallelScanner(IRepositoryObserver[T], Generic[T]):
+    """
+    Наблюдатель репозитория, выполняющий поиск по спецификации в пуле процессов.
+    Каждому шарду соответствует отдельный однопроцессный пул, поэтому загрузка шарда,
+    последующие изменения и запросы выполняются в воркере строго по порядку отправки.
+    """
+
+    def __init__(self, entity_factory: Callable[[Dict[str, Any]], T],
+                 workers: Optional[int] = None,
+                 min_parallel_size: int = DEFAULT_MIN_PARALLEL_SIZE):
+        """
+        Args:
+            entity_factory: Функция восстановления сущности из словаря (например, Artwork.from_dict),
+                должна сериализоваться pickle
+            workers: Количество процессов (по умолчанию - число ядер)
+            min_parallel_size: Минимальный размер коллекции для параллельного просмотра
+        """
+        self._logger = logging.getLogger(__name__)
+        self._entity_factory = entity_factory
+        self._workers = max(1, workers or os.cpu_count() or 1)
+        self._min_parallel_size = min_parallel_size
+        self._executors: List[ProcessPoolExecutor] = []
+        self._entities: Dict[int, T] = {}
+        self._broken = False
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def _shard_of(self, entity_id: int) -> int:
+        return entity_id % self._workers
+
+    def _ensure_executors(self) -> None:
+        if not self._executors:
+            self._executors = [
+                ProcessPoolExecutor(max_workers=1, initializer=_init_worker,
+                                    initargs=(self._entity_factory,))
+                for _ in range(self._workers)
+            ]
+
+    def _submit(self, shard: int, fn: Callable, *args) -> Optional[Future]:
+        if self._broken:
+            return None
+        try:
+            return self._executors[shard].submit(fn, *args)
+        except (BrokenProcessPool, RuntimeError) as e:
+            self._mark_broken(e)
+            return None
+
+    def _submit_change(self, shard: int, fn: Callable, *args) -> None:
+        # Ошибка применения изменения означает рассинхронизацию шарда с репозиторием
+        future = self._submit(shard, fn, *args)
+        if future is not None:
+            future.add_done_callback(self._check_future)
+
+    def _check_future(self, future: Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            self._mark_broken(future.exception())
+
+    def _mark_broken(self, error: BaseException) -> None:
+        if not self._broken:
+            self._logger.error(f"Параллельный просмотр отключен: {error}")
+        self._broken = True
+
+    # --- IRepositoryObserver ---
+
+    def on_reload(self, entities: Iterable[T]) -> None:
+        self._entities = {entity.id: entity for entity in entities}
+        if self._broken:
+            self.close(wait=False)
+            self._broken = False
+        self._ensure_executors()
+        shards: List[List[Dict[str, Any]]] = [[] for _ in range(self._workers)]
+        for entity in self._entities.values():
+            shards[self._shard_of(entity.id)].append(entity.to_dict())
+        for shard, records in enumerate(shards):
+            self._submit_change(shard, _load_shard, records)
+
+    def on_upsert(self, entity: T) -> None:
+        self._entities[entity.id] = entity
+        if self._executors:
+            self._submit_change(self._shard_of(entity.id), _upsert_entity, entity.to_dict())
+
+    def on_delete(self, entity_id: int) -> None:
+        self._entities.pop(entity_id, None)
+        if self._executors:
+            self._submit_change(self._shard_of(entity_id), _delete_entity, entity_id)
+
+    # --- Поиск ---
+
+    def find(self, specification: Specification[T]) -> Optional[List[T]]:
+        """
+        Находит сущности по спецификации параллельно во всех шардах.
+
+        Args:
+            specification: Спецификация, сериализуемая pickle
+
+        Returns:
+            Optional[List[T]]: Сущности в порядке возрастания id или None, если коллекция
+            слишком мала или пул процессов недоступен (тогда поиск выполняет вызывающий)
+        """
+        if self._broken or not self._executors or len(self._entities) < self._min_parallel_size:
+            return None
+
+        futures = [self._submit(shard, _scan_shard, specification) for shard in range(self._workers)]
+        if any(future is None for future in futures):
+            return None
+        try:
+            shard_ids = [future.result() for future in futures]
+        except BrokenProcessPool as e:
+            self._mark_broken(e)
+            return None
+        except Exception as e:
+            # Например, спецификация не сериализуется pickle - просмотр выполнит вызывающий
+            self._logger.warning(f"Параллельный просмотр не выполнен: {e}")
+            return None
+
+        entities = self._entities
+        return [entities[entity_id] for entity_id in heapq.merge(*shard_ids) if entity_id in entities]
+
+    def close(self, wait: bool = True) -> None:
+        """Останавливает процессы-воркеры"""
+        for executor in self._executors:
+            executor.shutdown(wait=wait, cancel_futures=True)
+        self._executors = []
+
+    def __enter__(self) -> 'ParallelScanner[T]':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
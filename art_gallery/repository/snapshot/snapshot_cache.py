@@ -0,0 +1,159 @@
+"""
+Кэш снимков загруженных коллекций для быстрого повторного запуска.
+Снимок - pickle восстановленных сущностей и состояния производных структур
+(например, колоночного хранилища). Ключ снимка - идентичность источника: путь,
+размер, время изменения и формат файла или ETag объекта MinIO. Пока источник
+не меняется, репозиторий загружает снимок вместо разбора файла.
+
+Снимки читаются pickle, поэтому каталог кэша должен быть доступен только приложению.
+"""
+import hashlib
+import logging
+import os
+import pickle
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from art_gallery.domain.codecs import bulk_hydration
+
+# Версия формата снимков: увеличить при изменении состава полей сущностей
+SNAPSHOT_VERSION = 1
+
+# Расширение файлов снимков
+SNAPSHOT_EXTENSION = '.snapshot'
+
+
+@dataclass
+class RepositorySnapshot:
+    """Снимок коллекции репозитория"""
+    # Восстановленные сущности в порядке репозитория
+    entities: List[Any]
+    # Дополнительное состояние репозитория (например, id поврежденных записей)
+    extra: Dict[str, Any] = field(default_factory=dict)
+    # Состояние наблюдателей по их ключу (см. observer_snapshot_key)
+    observers: Dict[str, Any] = field(default_factory=dict)
+
+
+def observer_snapshot_key(observer: Any) -> str:
+    """Ключ состояния наблюдателя в снимке"""
+    observer_type = type(observer)
+    return f"{observer_type.__module__}.{observer_type.__qualname__}"
+
+
+def file_source_key(filepath: str, format_name: Optional[str], *extra: Any) -> Optional[Tuple[Any, ...]]:
+    """
+    Возвращает ключ снимка для файла коллекции
+
+    Args:
+        filepath (str): Путь к файлу
+        format_name (str, optional): Формат (расширение) файла
+        *extra: Дополнительные параметры загрузки, влияющие на результат
+
+    Returns:
+        Optional[Tuple]: Ключ или None, если файл не существует или пуст
+    """
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+    if stat.st_size == 0:
+        return None
+    return ('file', os.path.abspath(filepath), stat.st_size, stat.st_mtime_ns, format_name) + extra
+
+
+class SnapshotCache:
+    """Каталог снимков коллекций"""
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory (str): Каталог для файлов снимков (создается при первой записи)
+        """
+        self.directory = directory
+        self._logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def snapshot_name(collection: str, identity: str) -> str:
+        """
+        Возвращает имя снимка для коллекции и ее источника
+
+        Args:
+            collection (str): Имя коллекции (artworks, users, exhibitions)
+            identity (str): Путь к файлу или адрес объекта
+
+        Returns:
+            str: Имя снимка
+        """
+        digest = hashlib.sha1(identity.encode('utf-8')).hexdigest()[:16]
+        return f"{collection}-{digest}"
+
+    def load(self, name: str, key: Tuple[Any, ...]) -> Optional[RepositorySnapshot]:
+        """
+        Загружает снимок, если он сделан для того же состояния источника
+
+        Args:
+            name (str): Имя снимка
+            key (Tuple): Ключ текущего состояния источника
+
+        Returns:
+            Optional[RepositorySnapshot]: Снимок или None, если его нет или он устарел
+        """
+        path = self._path(name)
+        try:
+            with open(path, 'rb') as file:
+                # Заголовок читается отдельно: устаревший снимок не разбирается целиком
+                if pickle.load(file) != (SNAPSHOT_VERSION, key):
+                    return None
+                with bulk_hydration():
+                    snapshot = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self._logger.warning(f"Снимок {path} не прочитан: {e}")
+            return None
+        return snapshot if isinstance(snapshot, RepositorySnapshot) else None
+
+    def store(self, name: str, key: Tuple[Any, ...], snapshot: RepositorySnapshot) -> bool:
+        """
+        Сохраняет снимок (файл заменяется атомарно)
+
+        Args:
+            name (str): Имя снимка
+            key (Tuple): Ключ состояния источника, из которого получен снимок
+            snapshot (RepositorySnapshot): Снимок
+
+        Returns:
+            bool: True, если снимок сохранен
+        """
+        path = self._path(name)
+        temp_path = path + '.tmp'
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp_path, 'wb') as file:
+                pickle.dump((SNAPSHOT_VERSION, key), file, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(snapshot, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+            return True
+        except Exception as e:
+            self._logger.warning(f"Снимок {path} не сохранен: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+
+    def invalidate(self, name: str) -> None:
+        """Удаляет снимок"""
+        try:
+            os.remove(self._path(name))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        """Удаляет все снимки каталога"""
+        if not os.path.isdir(self.directory):
+            return
+        for filename in os.listdir(self.directory):
+            if filename.endswith(SNAPSHOT_EXTENSION):
+                os.remove(os.path.join(self.directory, filename))
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name + SNAPSHOT_EXTENSION)
@@ -0,0 +1,111 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple, TypeVar
+from art_gallery.domain.base_entity import BaseEntity
+from art_gallery.repository.interfaces.repository_observer import IRepositoryObserver
+from art_gallery.repository.implementations.observable_repository import ObservableRepositoryMixin
+from art_gallery.repository.snapshot.snapshot_cache import (
+    RepositorySnapshot,
+    SnapshotCache,
+    observer_snapshot_key
+)
+
+T = TypeVar('T', bound=BaseEntity)
+
+class SnapshotRepositoryMixin(ObservableRepositoryMixin[T], ABC):
+    """
+    Примесь для репозиториев с кэшем снимков коллекции.
+    Наследник задает атрибут _snapshot_cache (None - снимки отключены), вызывает
+    _load_snapshot() в начале _load_data() и _invalidate_snapshot() при ошибке
+    записи источника, а также реализует абстрактные методы ниже.
+    Наблюдатели, подключенные после загрузки снимка, восстанавливают свое
+    состояние из него (restore_snapshot) вместо полного on_reload.
+    """
+
+    _snapshot_cache: Optional[SnapshotCache] = None
+
+    @abstractmethod
+    def _snapshot_name(self) -> str:
+        """Имя снимка коллекции"""
+        pass
+
+    @abstractmethod
+    def _snapshot_source_key(self) -> Optional[Tuple[Any, ...]]:
+        """Ключ текущего состояния источника (None - снимок не используется)"""
+        pass
+
+    def _snapshot_state(self) -> RepositorySnapshot:
+        """Снимок текущей коллекции (без состояния наблюдателей)"""
+        return RepositorySnapshot(entities=self.get_all())
+
+    @abstractmethod
+    def _restore_snapshot_state(self, snapshot: RepositorySnapshot) -> None:
+        """Заменяет коллекцию содержимым снимка"""
+        pass
+
+    def _load_snapshot(self) -> bool:
+        """
+        Загружает коллекцию из снимка, если источник не изменился
+
+        Returns:
+            bool: True, если коллекция загружена из снимка
+        """
+        self._snapshot_key = None
+        if self._snapshot_cache is None:
+            return False
+        key = self._snapshot_source_key()
+        if key is None:
+            return False
+        snapshot = self._snapshot_cache.load(self._snapshot_name(), key)
+        if snapshot is None:
+            return False
+        self._restore_snapshot_state(snapshot)
+        self._notify_reload(self.get_all())
+        self._snapshot_key = key
+        self._observer_snapshots: Dict[str, Any] = dict(snapshot.observers)
+        return True
+
+    def save_snapshot(self) -> bool:
+        """
+        Сохраняет снимок коллекции, если источник изменился с момента последнего
+        снимка (или снимка еще нет)
+
+        Returns:
+            bool: True, если снимок записан
+        """
+        if self._snapshot_cache is None or not self.__dict__.get('_snapshot_valid', True):
+            return False
+        key = self._snapshot_source_key()
+        if key is None or key == self.__dict__.get('_snapshot_key'):
+            return False
+        snapshot = self._snapshot_state()
+        for observer in self._get_observers():
+            state = observer.export_snapshot()
+            if state is not None:
+                snapshot.observers.setdefault(observer_snapshot_key(observer), state)
+        if not self._snapshot_cache.store(self._snapshot_name(), key, snapshot):
+            return False
+        self._snapshot_key = key
+        return True
+
+    def _invalidate_snapshot(self) -> None:
+        """Источник мог быть записан частично: снимок удаляется и больше не сохраняется"""
+        self._snapshot_valid = False
+        if self._snapshot_cache is not None:
+            self._snapshot_cache.invalidate(self._snapshot_name())
+
+    # --- Наблюдатели ---
+
+    def add_observer(self, observer: IRepositoryObserver[T]) -> None:
+        states = self.__dict__.get('_observer_snapshots')
+        observers = self._get_observers()
+        if states and observer not in observers:
+            state = states.pop(observer_snapshot_key(observer), None)
+            if state is not None and observer.restore_snapshot(state, self.get_all()):
+                observers.append(observer)
+                return
+        super().add_observer(observer)
+
+    def _notify_reload(self, entities) -> None:
+        # Состояние наблюдателей из снимка относится только к загрузке из снимка
+        self.__dict__.pop('_observer_snapshots', None)
+        super()._notify_reload(entities)
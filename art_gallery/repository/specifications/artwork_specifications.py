@@ -0,0 +1,90 @@
+from datetime import datetime
+from typing import Optional
+from art_gallery.domain import Artwork, ArtworkType
+from .base_specification import Specification
+
+class ArtworkByTypeSpecification(Specification[Artwork]):
+    def __init__(self, *types: ArtworkType):
+        self.types = frozenset(types)
+
+    def is_satisfied_by(self, item: Artwork) -> bool:
+        return item.type in self.types
+
+    def _compile_predicate(self):
+        if not self.types:
+            return False
+        types = self.types
+        return lambda item: item.type in types
+
+class ArtworkByYearRangeSpecification(Specification[Artwork]):
+    """Год создания в диапазоне [start_year, end_year], границы необязательны"""
+    def __init__(self, start_year: Optional[int] = None, end_year: Optional[int] = None):
+        self.start_year = start_year
+        self.end_year = end_year
+
+    def is_satisfied_by(self, item: Artwork) -> bool:
+        if self.start_year is not None and item.year < self.start_year:
+            return False
+        if self.end_year is not None and item.year > self.end_year:
+            return False
+        return True
+
+    def _compile_predicate(self):
+        start_year, end_year = self.start_year, self.end_year
+        if start_year is not None and end_year is not None:
+            if start_year > end_year:
+                return False
+            return lambda item: start_year <= item.year <= end_year
+        if start_year is not None:
+            return lambda item: item.year >= start_year
+        if end_year is not None:
+            return lambda item: item.year <= end_year
+        return True
+
+class ContemporaryArtworkSpecification(Specification[Artwork]):
+    """Современные произведения (см. Artwork.is_contemporary)"""
+    def is_satisfied_by(self, item: Artwork) -> bool:
+        return item.is_contemporary()
+
+    def _compile_predicate(self):
+        min_year = datetime.now().year - 50
+        return lambda item: item.year >= min_year
+
+class ArtworkCreatedBetweenSpecification(Specification[Artwork]):
+    """Дата добавления в диапазоне [start, end], границы необязательны"""
+    def __init__(self, start: Optional[datetime] = None, end: Optional[datetime] = None):
+        self.start = start
+        self.end = end
+
+    def is_satisfied_by(self, item: Artwork) -> bool:
+        if self.start is not None and item.created_at < self.start:
+            return False
+        if self.end is not None and item.created_at > self.end:
+            return False
+        return True
+
+class ArtworkByArtistSpecification(Specification[Artwork]):
+    """Работы художника (регистр не имеет значения)"""
+    def __init__(self, artist: str):
+        self.artist = artist
+
+    def is_satisfied_by(self, item: Artwork) -> bool:
+        return item.artist.lower() == self.artist.lower()
+
+    def _compile_predicate(self):
+        artist = self.artist.lower()
+        return lambda item: item.artist.lower() == artist
+
+class ArtworkDescriptionContainsSpecification(Specification[Artwork]):
+    """Описание содержит подстроку (регистр не имеет значения)"""
+    def __init__(self, text: str):
+        self.text = text
+
+    def is_satisfied_by(self, item: Artwork) -> bool:
+        return self.text.lower() in item.description.lower()
+
+    def _compile_predicate(self):
+        text = self.text.lower()
+        if not text:
+            return True
+        return lambda item: text in item.description.lower()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, List
+from typing import TypeVar, Generic, List, Callable, Union
 from domain.base_entity import BaseEntity
 
 T = TypeVar('T', bound=BaseEntity)
@@ -9,6 +9,31 @@ class Specification(Generic[T], ABC):
     def is_satisfied_by(self, item: T) -> bool:
         pass
 
+    def compile(self) -> Callable[[T], bool]:
+        """
+        Возвращает скомпилированный предикат для спецификации.
+        Дерево And/Or/Not сворачивается в одно замыкание, результат кэшируется в экземпляре.
+        """
+        compiled = self.__dict__.get('_compiled_predicate')
+        if compiled is None:
+            from .specification_compiler import compile_specification
+            compiled = compile_specification(self)
+            self._compiled_predicate = compiled
+        return compiled
+
+    def _compile_predicate(self) -> Union[Callable[[T], bool], bool]:
+        """
+        Возвращает предикат листовой спецификации для компилятора.
+        Может вернуть True/False, если результат не зависит от элемента.
+        """
+        return self.is_satisfied_by
+
+    def __getstate__(self):
+        # Замыкания не сериализуются pickle, поэтому кэш предиката не передается в другие процессы
+        state = self.__dict__.copy()
+        state.pop('_compiled_predicate', None)
+        return state
+
     def __and__(self, other: 'Specification[T]') -> 'Specification[T]':
         return AndSpecification(self, other)
 
@@ -18,6 +43,22 @@ class Specification(Generic[T], ABC):
     def __not__(self) -> 'Specification[T]':
         return NotSpecification(self)
 
+class TrueSpecification(Specification[T]):
+    """Спецификация, которой удовлетворяет любой элемент"""
+    def is_satisfied_by(self, item: T) -> bool:
+        return True
+
+    def _compile_predicate(self) -> bool:
+        return True
+
+class FalseSpecification(Specification[T]):
+    """Спецификация, которой не удовлетворяет ни один элемент"""
+    def is_satisfied_by(self, item: T) -> bool:
+        return False
+
+    def _compile_predicate(self) -> bool:
+        return False
+
 class AndSpecification(Specification[T]):
     def __init__(self, *specifications: Specification[T]):
         self.specifications = specifications
@@ -14,9 +14,17 @@ class ExhibitionByDateRangeSpecification(Specification[Exhibition]):
     def is_satisfied_by(self, item: Exhibition) -> bool:
         return item.start_date <= self.end_date and item.end_date >= self.start_date
 
+    def _compile_predicate(self):
+        start_date, end_date = self.start_date, self.end_date
+        return lambda item: item.start_date <= end_date and item.end_date >= start_date
+
 class HasArtworkSpecification(Specification[Exhibition]):
     def __init__(self, artwork_id: int):
         self.artwork_id = artwork_id
 
     def is_satisfied_by(self, item: Exhibition) -> bool:
         return self.artwork_id in item.artwork_ids
+
+    def _compile_predicate(self):
+        artwork_id = self.artwork_id
+        return lambda item: artwork_id in item.artwork_ids
@@ -0,0 +1,70 @@
+"""
+Универсальные спецификации сравнения по атрибуту сущности.
+Хранят имя атрибута и имя оператора, а не функции, поэтому сериализуются pickle
+и подходят для параллельного просмотра.
+"""
+import operator
+from typing import Any
+from .base_specification import Specification, T
+
+_OPERATORS = {
+    'eq': operator.eq,
+    'ne': operator.ne,
+    'lt': operator.lt,
+    'le': operator.le,
+    'gt': operator.gt,
+    'ge': operator.ge
+}
+
+
+class FieldComparisonSpecification(Specification[T]):
+    """
+    Сравнение значения атрибута с константой.
+    Строки сравниваются без учета регистра, сущности с пустым значением (None) не подходят.
+    """
+    def __init__(self, attribute: str, op: str, value: Any):
+        if op not in _OPERATORS:
+            raise ValueError(f"Unknown comparison operator: {op}")
+        self.attribute = attribute
+        self.op = op
+        self.value = value
+
+    def is_satisfied_by(self, item: T) -> bool:
+        return self.compile()(item)
+
+    def _compile_predicate(self):
+        get = operator.attrgetter(self.attribute)
+        compare = _OPERATORS[self.op]
+        value = self.value
+        if isinstance(value, str):
+            value = value.lower()
+
+            def predicate(item):
+                actual = get(item)
+                return actual is not None and compare(actual.lower(), value)
+            return predicate
+
+        def predicate(item):
+            actual = get(item)
+            return actual is not None and compare(actual, value)
+        return predicate
+
+
+class FieldContainsSpecification(Specification[T]):
+    """Строковый атрибут содержит подстроку (регистр не имеет значения)"""
+    def __init__(self, attribute: str, text: str):
+        self.attribute = attribute
+        self.text = text
+
+    def is_satisfied_by(self, item: T) -> bool:
+        actual = getattr(item, self.attribute)
+        return actual is not None and self.text.lower() in actual.lower()
+
+    def _compile_predicate(self):
+        get = operator.attrgetter(self.attribute)
+        text = self.text.lower()
+
+        def predicate(item):
+            actual = get(item)
+            return actual is not None and text in actual.lower()
+        return predicate
@@ -0,0 +1,144 @@
+"""
+Компилятор спецификаций.
+Превращает дерево AndSpecification/OrSpecification/NotSpecification в одно плоское
+замыкание с сокращенным вычислением и свёрткой констант.
+"""
+from typing import Any, Callable, Iterator, List, Sequence, Type, Union
+
+from .base_specification import (
+    Specification,
+    AndSpecification,
+    OrSpecification,
+    NotSpecification
+)
+
+Predicate = Callable[[Any], bool]
+
+# Результат компиляции узла: предикат или константа, если результат известен заранее
+CompiledNode = Union[Predicate, bool]
+
+# Длинные цепочки собираем циклом, чтобы не упираться в глубину вложенных замыканий
+_MAX_NESTED_CHAIN = 8
+
+
+def _always_true(item: Any) -> bool:
+    return True
+
+
+def _always_false(item: Any) -> bool:
+    return False
+
+
+def compile_specification(specification: Specification) -> Predicate:
+    """
+    Компилирует спецификацию в предикат.
+
+    Args:
+        specification: Корень дерева спецификаций
+
+    Returns:
+        Predicate: Функция item -> bool, эквивалентная specification.is_satisfied_by
+    """
+    node = _compile_node(specification)
+    if node is True:
+        return _always_true
+    if node is False:
+        return _always_false
+    return node
+
+
+def _compile_node(specification: Specification) -> CompiledNode:
+    if isinstance(specification, AndSpecification):
+        return _compile_and(specification.specifications)
+    if isinstance(specification, OrSpecification):
+        return _compile_or(specification.specifications)
+    if isinstance(specification, NotSpecification):
+        inner = specification.specification
+        # Двойное отрицание сокращается
+        if isinstance(inner, NotSpecification):
+            return _compile_node(inner.specification)
+        node = _compile_node(inner)
+        if isinstance(node, bool):
+            return not node
+        return lambda item: not node(item)
+    return specification._compile_predicate()
+
+
+def _flatten(specifications: Sequence[Specification],
+             composite_type: Type[Specification]) -> Iterator[Specification]:
+    """Разворачивает вложенные узлы того же типа: And(a, And(b, c)) -> a, b, c"""
+    for specification in specifications:
+        if type(specification) is composite_type:
+            yield from _flatten(specification.specifications, composite_type)
+        else:
+            yield specification
+
+
+def _compile_and(specifications: Sequence[Specification]) -> CompiledNode:
+    predicates: List[Predicate] = []
+    for child in _flatten(specifications, AndSpecification):
+        node = _compile_node(child)
+        if node is False:
+            return False
+        if node is True:
+            continue
+        predicates.append(node)
+    if not predicates:
+        return True
+    return _chain_all(predicates)
+
+
+def _compile_or(specifications: Sequence[Specification]) -> CompiledNode:
+    predicates: List[Predicate] = []
+    for child in _flatten(specifications, OrSpecification):
+        node = _compile_node(child)
+        if node is True:
+            return True
+        if node is False:
+            continue
+        predicates.append(node)
+    if not predicates:
+        return False
+    return _chain_any(predicates)
+
+
+def _chain_all(predicates: List[Predicate]) -> Predicate:
+    if len(predicates) == 1:
+        return predicates[0]
+    if len(predicates) == 2:
+        first, second = predicates
+        return lambda item: first(item) and second(item)
+    if len(predicates) <= _MAX_NESTED_CHAIN:
+        head = predicates[0]
+        tail = _chain_all(predicates[1:])
+        return lambda item: head(item) and tail(item)
+
+    chain = tuple(predicates)
+
+    def all_of(item: Any) -> bool:
+        for predicate in chain:
+            if not predicate(item):
+                return False
+        return True
+    return all_of
+
+
+def _chain_any(predicates: List[Predicate]) -> Predicate:
+    if len(predicates) == 1:
+        return predicates[0]
+    if len(predicates) == 2:
+        first, second = predicates
+        return lambda item: first(item) or second(item)
+    if len(predicates) <= _MAX_NESTED_CHAIN:
+        head = predicates[0]
+        tail = _chain_any(predicates[1:])
+        return lambda item: head(item) or tail(item)
+
+    chain = tuple(predicates)
+
+    def any_of(item: Any) -> bool:
+        for predicate in chain:
+            if predicate(item):
+                return True
+        return False
+    return any_of
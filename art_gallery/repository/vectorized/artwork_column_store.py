@@ -0,0 +1,262 @@
+"""
+Векторизованный движок фильтрации экспонатов.
+Хранит колонки NumPy (id, год, код типа, created_at в секундах epoch), синхронизированные
+с репозиторием через IRepositoryObserver, и вычисляет числовые и перечислимые
+предикаты как булевы маски.
+"""
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy - необязательная зависимость
+    np = None
+
+from art_gallery.domain import Artwork, ArtworkType
+from art_gallery.repository.interfaces.repository_observer import IRepositoryObserver
+from art_gallery.repository.specifications.base_specification import (
+    Specification,
+    AndSpecification,
+    OrSpecification,
+    NotSpecification,
+    TrueSpecification,
+    FalseSpecification
+)
+from art_gallery.repository.specifications.artwork_specifications import (
+    ArtworkByTypeSpecification,
+    ArtworkByYearRangeSpecification,
+    ContemporaryArtworkSpecification,
+    ArtworkCreatedBetweenSpecification
+)
+
+# Коды типов: позиция в перечислении
+_TYPE_CODES: Dict[ArtworkType, int] = {artwork_type: code for code, artwork_type in enumerate(ArtworkType)}
+
+_INITIAL_CAPACITY = 1024
+
+# Колонки хранилища
+_COLUMNS = ('_ids', '_years', '_type_codes', '_created_at')
+
+
+def _layout_key() -> Tuple[Any, ...]:
+    """
+    Условия, при которых колонки из снимка совпадают с пересчитанными:
+    коды типов и часовой пояс (created_at без пояса переводится в epoch по местному времени)
+    """
+    return tuple(artwork_type.value for artwork_type in ArtworkType), time.timezone, time.altzone, time.daylight
+
+
+class _NotVectorizable(Exception):
+    """Спецификация не может быть вычислена над колонками"""
+    pass
+
+
+class ArtworkColumnStore(IRepositoryObserver[Artwork]):
+    """
+    Колоночное представление коллекции экспонатов.
+    Удаление выполняется перестановкой последней строки на место удаленной, поэтому
+    все изменения стоят O(1), а порядок строк не совпадает с порядком репозитория.
+    """
+
+    def __init__(self):
+        if np is None:
+            raise ImportError("Для векторизованной фильтрации требуется пакет numpy (pip install numpy)")
+        self._logger = logging.getLogger(__name__)
+        self._allocate(_INITIAL_CAPACITY)
+
+    @staticmethod
+    def is_available() -> bool:
+        """Проверяет, установлен ли NumPy"""
+        return np is not None
+
+    def _allocate(self, capacity: int) -> None:
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._years = np.zeros(capacity, dtype=np.int32)
+        self._type_codes = np.zeros(capacity, dtype=np.uint8)
+        self._created_at = np.zeros(capacity, dtype=np.float64)
+        self._entities: List[Artwork] = []
+        self._row_by_id: Dict[int, int] = {}
+
+    def _grow(self) -> None:
+        capacity = len(self._ids) * 2
+        for name in _COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    # --- IRepositoryObserver ---
+
+    def on_reload(self, entities: Iterable[Artwork]) -> None:
+        entities = list(entities)
+        capacity = _INITIAL_CAPACITY
+        while capacity < len(entities):
+            capacity *= 2
+        self._allocate(capacity)
+        for artwork in entities:
+            self.on_upsert(artwork)
+
+    def on_upsert(self, entity: Artwork) -> None:
+        row = self._row_by_id.get(entity.id)
+        if row is None:
+            row = len(self._entities)
+            if row == len(self._ids):
+                self._grow()
+            self._entities.append(entity)
+            self._row_by_id[entity.id] = row
+        else:
+            self._entities[row] = entity
+        self._write_row(row, entity)
+
+    def on_delete(self, entity_id: int) -> None:
+        row = self._row_by_id.pop(entity_id, None)
+        if row is None:
+            return
+        last = len(self._entities) - 1
+        if row != last:
+            moved = self._entities[last]
+            self._entities[row] = moved
+            self._row_by_id[moved.id] = row
+            for column in (self._ids, self._years, self._type_codes, self._created_at):
+                column[row] = column[last]
+        self._entities.pop()
+
+    def export_snapshot(self) -> Optional[Any]:
+        size = len(self._entities)
+        columns = {name: getattr(self, name)[:size].copy() for name in _COLUMNS}
+        return {'layout': _layout_key(), 'columns': columns}
+
+    def restore_snapshot(self, state: Any, entities: List[Artwork]) -> bool:
+        if not isinstance(state, dict) or state.get('layout') != _layout_key():
+            return False
+        columns = state['columns']
+        ids = columns['_ids'].tolist()
+        by_id = {artwork.id: artwork for artwork in entities}
+        if len(ids) != len(by_id) or len(ids) != len(entities):
+            return False
+        try:
+            rows = [by_id[entity_id] for entity_id in ids]
+        except KeyError:
+            return False
+        capacity = _INITIAL_CAPACITY
+        while capacity < len(rows):
+            capacity *= 2
+        self._allocate(capacity)
+        for name in _COLUMNS:
+            getattr(self, name)[:len(rows)] = columns[name]
+        self._entities = rows
+        self._row_by_id = {entity_id: row for row, entity_id in enumerate(ids)}
+        return True
+
+    def _write_row(self, row: int, artwork: Artwork) -> None:
+        self._ids[row] = artwork.id
+        self._years[row] = artwork.year
+        self._type_codes[row] = _TYPE_CODES[artwork.type]
+        self._created_at[row] = artwork.created_at.timestamp()
+
+    # --- Фильтрация ---
+
+    def supports(self, specification: Specification[Artwork]) -> bool:
+        """Проверяет, может ли спецификация быть вычислена целиком над колонками"""
+        try:
+            self._mask(specification, 0)
+            return True
+        except _NotVectorizable:
+            return False
+
+    def find(self, specification: Specification[Artwork]) -> Optional[List[Artwork]]:
+        """
+        Находит экспонаты по спецификации с помощью булевых масок.
+        Для And-спецификаций с невекторизуемыми частями маска строится по векторизуемым
+        частям, а остаток проверяется скомпилированным предикатом.
+
+        Returns:
+            Optional[List[Artwork]]: Экспонаты в порядке возрастания id или None,
+            если ни одна часть спецификации не векторизуема
+        """
+        size = len(self._entities)
+        vectorized, residual = self._split(specification)
+        if vectorized is None:
+            return None
+
+        mask = self._mask(vectorized, size)
+        rows = np.flatnonzero(mask)
+        rows = rows[np.argsort(self._ids[rows], kind='stable')]
+        entities = self._entities
+        result = [entities[row] for row in rows.tolist()]
+        if residual is not None:
+            predicate = residual.compile()
+            result = [artwork for artwork in result if predicate(artwork)]
+        return result
+
+    def filter(self, start_year: Optional[int] = None, end_year: Optional[int] = None,
+               types: Optional[Iterable[ArtworkType]] = None,
+               contemporary: Optional[bool] = None) -> List[Artwork]:
+        """Упрощенный интерфейс фильтрации по году, типу и признаку современности"""
+        specifications: List[Specification[Artwork]] = []
+        if start_year is not None or end_year is not None:
+            specifications.append(ArtworkByYearRangeSpecification(start_year, end_year))
+        if types is not None:
+            specifications.append(ArtworkByTypeSpecification(*types))
+        if contemporary is not None:
+            contemporary_spec = ContemporaryArtworkSpecification()
+            specifications.append(contemporary_spec if contemporary else NotSpecification(contemporary_spec))
+        return self.find(AndSpecification(*specifications)) or []
+
+    def _split(self, specification: Specification[Artwork]) -> Tuple[Optional[Specification[Artwork]], Optional[Specification[Artwork]]]:
+        """Делит спецификацию на векторизуемую часть и остаток"""
+        if self.supports(specification):
+            return specification, None
+        if type(specification) is not AndSpecification:
+            return None, specification
+        vectorized = []
+        residual = []
+        for child in specification.specifications:
+            (vectorized if self.supports(child) else residual).append(child)
+        if not vectorized:
+            return None, specification
+        return AndSpecification(*vectorized), AndSpecification(*residual)
+
+    def _mask(self, specification: Specification[Artwork], size: int):
+        if isinstance(specification, AndSpecification):
+            mask = np.ones(size, dtype=bool)
+            for child in specification.specifications:
+                mask &= self._mask(child, size)
+            return mask
+        if isinstance(specification, OrSpecification):
+            mask = np.zeros(size, dtype=bool)
+            for child in specification.specifications:
+                mask |= self._mask(child, size)
+            return mask
+        if isinstance(specification, NotSpecification):
+            return ~self._mask(specification.specification, size)
+        if isinstance(specification, TrueSpecification):
+            return np.ones(size, dtype=bool)
+        if isinstance(specification, FalseSpecification):
+            return np.zeros(size, dtype=bool)
+        if isinstance(specification, ArtworkByTypeSpecification):
+            codes = [_TYPE_CODES[artwork_type] for artwork_type in specification.types]
+            return np.isin(self._type_codes[:size], codes)
+        if isinstance(specification, ArtworkByYearRangeSpecification):
+            return self._range_mask(self._years[:size], specification.start_year, specification.end_year)
+        if isinstance(specification, ContemporaryArtworkSpecification):
+            return self._years[:size] >= datetime.now().year - 50
+        if isinstance(specification, ArtworkCreatedBetweenSpecification):
+            start = specification.start.timestamp() if specification.start else None
+            end = specification.end.timestamp() if specification.end else None
+            return self._range_mask(self._created_at[:size], start, end)
+        raise _NotVectorizable(type(specification).__name__)
+
+    @staticmethod
+    def _range_mask(column, start, end):
+        mask = np.ones(len(column), dtype=bool)
+        if start is not None:
+            mask &= column >= start
+        if end is not None:
+            mask &= column <= end
+        return mask
@@ -1,20 +1,26 @@
+import io
 import shlex
 from typing import Tuple, List
 from art_gallery.ui.interfaces.command_parser import ICommandParser
+from art_gallery.application.query.query_parser import QuotedArgument
 from art_gallery.exceptions.command_exceptions import InvalidCommandFormatError
 
+# Символы, которыми shlex экранирует часть аргумента
+_QUOTING_CHARS = frozenset('"\'\\')
+
 class CommandParser(ICommandParser):
     def parse(self, input_string: str) -> Tuple[str, List[str]]:
         """
         Парсит строку команды в кортеж (команда, [аргументы])
-        Использует shlex для корректной обработки кавычек и пробелов
+        Использует shlex для корректной обработки кавычек и пробелов.
+        Аргументы, записанные в кавычках или с экранированием, возвращаются как QuotedArgument
         """
         if not input_string or input_string.isspace():
             raise InvalidCommandFormatError("Empty command")
             
         try:
             # Разбиваем строку, сохраняя аргументы в кавычках как единое целое
-            parts = shlex.split(input_string)
+            parts = self._split(input_string)
             if not parts:
                 raise InvalidCommandFormatError("Empty command")
                 
@@ -26,6 +32,27 @@ class CommandParser(ICommandParser):
         except ValueError as e:
             raise InvalidCommandFormatError(f"Invalid command format: {str(e)}")
 
+    @staticmethod
+    def _split(input_string: str) -> List[str]:
+        """Разбивает строку как shlex.split, отмечая аргументы с кавычками"""
+        stream = io.StringIO(input_string)
+        lexer = shlex.shlex(stream, posix=True)
+        lexer.whitespace_split = True
+        lexer.commenters = ''
+        parts: List[str] = []
+        start = stream.tell()
+        while True:
+            part = lexer.get_token()
+            if part is None:
+                return parts
+            # shlex читает поток посимвольно, поэтому по позиции виден исходный текст аргумента
+            end = stream.tell()
+            raw = input_string[start:end]
+            if _QUOTING_CHARS.intersection(raw):
+                part = QuotedArgument(part, raw)
+            parts.append(part)
+            start = end
+
     def validate(self, command: str, args: List[str]) -> bool:
         """
         Проверяет базовую валидность команды и аргументов
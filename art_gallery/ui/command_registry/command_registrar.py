@@ -7,6 +7,8 @@ from art_gallery.ui.interfaces.command import ICommand
 from art_gallery.ui.commands.utility.help_command import HelpCommand
 from art_gallery.ui.commands.utility.exit_command import ExitCommand
 from art_gallery.ui.commands.utility.stats_command import StatsCommand
+from art_gallery.ui.commands.utility.query_command import QueryCommand
+from art_gallery.ui.commands.utility.indexes_command import IndexesCommand
 
 from art_gallery.ui.commands.user.login_command import LoginCommand
 from art_gallery.ui.commands.user.logout_command import LogoutCommand
@@ -48,6 +50,12 @@ def register_commands(registry: CommandRegistry, services: ServiceCollection, lo
             "artwork_service": services.artwork_service, 
             "exhibition_service": services.exhibition_service
         }),
+        (QueryCommand, {
+            "user_service": services.user_service,
+            "artwork_service": services.artwork_service,
+            "exhibition_service": services.exhibition_service
+        }),
+        (IndexesCommand, {"user_service": services.user_service, "index_managers": services.index_managers}),
         
         # User Commands
         (LoginCommand, {"command_registry": registry, "user_service": services.user_service}),
@@ -36,14 +36,13 @@ class AddArtworkCommand(BaseCommand):
             if raw_image_path_arg and os.path.isfile(raw_image_path_arg):
                 self._logger.info(f"Attempting to add artwork with image: {raw_image_path_arg}")
                 try:
-                    with open(raw_image_path_arg, 'rb') as image_file:
-                        image_data = image_file.read()
                     image_filename = os.path.basename(raw_image_path_arg)
-                    
-                    artwork = self._artwork_service.add_artwork_with_image(
-                        title, artist, year, description, artwork_type, 
-                        image_data, image_filename
-                    )
+                    # The open file is streamed to the storage instead of being read into memory
+                    with open(raw_image_path_arg, 'rb') as image_file:
+                        artwork = self._artwork_service.add_artwork_with_image(
+                            title, artist, year, description, artwork_type, 
+                            image_file, image_filename
+                        )
                     print(f"Artwork with image added successfully with ID: {artwork.id}")
                     if artwork.image_path:
                         print(f"Image stored at: {artwork.image_path}")
@@ -6,6 +6,7 @@ from art_gallery.ui.utils.image_viewer import ImageViewer
 from art_gallery.exceptions.validation_exceptions import InvalidInputError
 from art_gallery.exceptions.command_exceptions import CommandExecutionError
 from art_gallery.infrastructure.config.cli_config import CLIConfig
+from art_gallery.infrastructure.config.constants import DEFAULT_THUMBNAIL_SIZE, DEFAULT_WEB_IMAGE_SIZE
 
 class OpenArtworkImageCommand(BaseCommand):
     def __init__(self, artwork_service: IArtworkService, user_service, cli_config: CLIConfig):
@@ -16,18 +17,25 @@ class OpenArtworkImageCommand(BaseCommand):
 
     def execute(self, args: Sequence[str]) -> Optional[str]:
         if len(args) < 1:
-            raise InvalidInputError("Required: artwork_id [--web]")
+            raise InvalidInputError("Required: artwork_id [--web] [--thumb | --original]")
         
         try:
             artwork_id = int(args[0])
             use_web = "--web" in args
+            # Наименьшая подходящая версия: миниатюра, веб-версия или оригинал
+            if "--original" in args:
+                max_size = None
+            elif "--thumb" in args:
+                max_size = DEFAULT_THUMBNAIL_SIZE
+            else:
+                max_size = DEFAULT_WEB_IMAGE_SIZE
             
             artwork = self._artwork_service.get_artwork(artwork_id)
             if not artwork:
                 raise CommandExecutionError(f"Artwork {artwork_id} not found")
             
             # Пытаемся получить URL или путь к изображению через сервис
-            image_url = self._artwork_service.get_artwork_image_url(artwork_id)
+            image_url = self._artwork_service.get_artwork_image_url(artwork_id, max_size)
             
             # Если изображение отсутствует, пытаемся использовать классическое свойство image_path
             if not image_url and hasattr(artwork, 'image_path') and artwork.image_path:
@@ -38,8 +46,15 @@ class OpenArtworkImageCommand(BaseCommand):
             if not image_url:
                 raise CommandExecutionError(f"Artwork {artwork_id} has no image")
             
+            # Ссылка на оригинал в HTML-просмотрщике, если показывается уменьшенная версия
+            original_url = None
+            if use_web and max_size is not None:
+                original_url = self._artwork_service.get_artwork_image_url(artwork_id)
+                if original_url == image_url:
+                    original_url = None
+            
             # Открываем изображение через просмотрщик
-            viewer_message = self._image_viewer.open_image(image_url, use_web)
+            viewer_message = self._image_viewer.open_image(image_url, use_web, original_url)
 
             # Check if viewer_message indicates an error
             if viewer_message and (
@@ -64,14 +79,19 @@ class OpenArtworkImageCommand(BaseCommand):
         return "Open artwork image in default viewer or web browser"
 
     def get_usage(self) -> str:
-        return "open_image <artwork_id> [--web]"
+        return "open_image <artwork_id> [--web] [--thumb | --original]"
         
     def get_help(self) -> str:
         return ("Opens the artwork's image either in system's default image viewer or web browser.\n"
                 "Parameters:\n"
                 "  - artwork_id: The unique identifier of the artwork\n"
-                "  - --web: Optional flag to open image in web browser instead of default viewer\n\n"
+                "  - --web: Optional flag to open image in web browser instead of default viewer\n"
+                "  - --thumb: Open the thumbnail\n"
+                "  - --original: Open the full-size original instead of the web-sized version\n\n"
                 "Examples:\n"
                 "  1. open_image 1      # Opens in default system image viewer\n"
-                "  2. open_image 1 --web # Opens in web browser\n\n"
+                "  2. open_image 1 --web # Opens in web browser\n"
+                "  3. open_image 1 --original # Opens the original image\n\n"
+                "Resized versions are used when thumbnails are enabled (ENABLE_IMAGE_THUMBNAILS, requires Pillow);\n"
+                "the web viewer links to the original.\n"
                 "Note: Image must exist and be accessible in the specified path")
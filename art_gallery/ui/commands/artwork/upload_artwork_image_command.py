@@ -33,16 +33,15 @@ class UploadArtworkImageCommand(BaseCommand):
             if not os.path.exists(image_path):
                 raise CommandExecutionError(f"Image file not found: {image_path}")
                 
-            # Read the image file
+            # Stream the image file (large scans are uploaded in parts, not read into memory)
             try:
                 with open(image_path, 'rb') as image_file:
-                    image_data = image_file.read()
                     filename = os.path.basename(image_path)
                     
                     # Upload the image
                     artwork = self._artwork_service.update_artwork_image(
                         artwork_id, 
-                        image_data, 
+                        image_file, 
                         filename
                     )
                     
@@ -8,9 +8,11 @@ from art_gallery.application.interfaces.user_service import IUserService
 from art_gallery.domain import User
 from art_gallery.infrastructure.factory.serialization_plugin_factory import SerializationPluginFactory
 from art_gallery.infrastructure.config import ConfigRegistry
+from art_gallery.infrastructure.conversion.data_converter import DataConverter
+from serialization.implementations.compression.compression_codecs import COMPRESSION_NONE
 
 class ConvertDataCommand(ICommand):
-    """Command for converting data files between different formats (json, xml). (Admin only)"""
+    """Command for converting data files between different formats (json, xml, binary). (Admin only)"""
     
     def __init__(self, command_registry: CommandRegistry, user_service: IUserService, 
                  serialization_factory: SerializationPluginFactory):
@@ -24,7 +26,7 @@ class ConvertDataCommand(ICommand):
         return "convert_data"
         
     def get_description(self) -> str:
-        return "Convert data files between different formats (json, xml)"
+        return "Convert data files between different formats (json, xml, binary)"
         
     def get_usage(self) -> str:
         return "convert_data <source_format> <target_format>"
@@ -91,8 +93,8 @@ class ConvertDataCommand(ICommand):
         Converts data from one format to another.
         
         Args:
-            source_format: source format (json, xml)
-            target_format: target format (json, xml)
+            source_format: source format (json, xml, binary)
+            target_format: target format (json, xml, binary)
             
         Returns:
             bool: True if conversion was successful
@@ -113,60 +115,31 @@ class ConvertDataCommand(ICommand):
             
         os.makedirs(target_dir, exist_ok=True)
         
-        # List of entities to convert
-        entities = ['users', 'artworks', 'exhibitions']
+        # Target files are written with the configured compression
+        compression = self._get_compression()
         
-        # Counter for successful conversions
-        converted_count = 0
+        # Each entity file is streamed from the source deserializer to the target
+        # serializer in a separate worker process and replaces the target atomically
+        converter = DataConverter(progress=_print_progress)
+        results = converter.convert(source_dir, target_dir, source_format, target_format, compression)
         
-        # Create serializers/deserializers
-        source_deserializer = self._serialization_factory.get_deserializer(source_format)
-        target_serializer = self._serialization_factory.get_serializer(target_format)
-        
-        for entity in entities:
-            source_file = os.path.join(source_dir, f'{entity}.{source_format}')
-            target_file = os.path.join(target_dir, f'{entity}.{target_format}')
-            
-            # Check if the source file exists and is not empty
-            print(f"Checking source file: {source_file}")
-            file_exists = os.path.exists(source_file)
-            print(f"  - File exists: {file_exists}")
-            
-            if file_exists:
-                file_size = os.path.getsize(source_file)
-                print(f"  - File size: {file_size} bytes")
-                
-                if file_size > 0:
-                    try:
-                        # Read data
-                        with open(source_file, 'r', encoding='utf-8') as f:
-                            file_content = f.read()
-                            print(f"  - Successfully read file content ({len(file_content)} chars)")
-                            
-                        # Deserialize data
-                        data = source_deserializer.deserialize(file_content)
-                        print(f"  - Successfully deserialized data")
-                        if isinstance(data, list):
-                            print(f"  - Data contains {len(data)} items")
-                        
-                        # Serialize to target format
-                        serialized_data = target_serializer.serialize(data)
-                        print(f"  - Successfully serialized to {target_format} format")
-                        
-                        # Write in new format
-                        with open(target_file, 'w', encoding='utf-8') as f:
-                            f.write(serialized_data)
-                            print(f"  - Successfully wrote data to {target_file}")
-                            
-                        print(f"Converted {entity} from {source_format} to {target_format}")
-                        converted_count += 1
-                    except Exception as e:
-                        logging.error(f"Error converting {entity}: {str(e)}", exc_info=True)
-                        print(f"Error converting {entity}: {str(e)}")
-                        print(f"Detailed error:", e.__class__.__name__, e)
-                else:
-                    print(f"File for {entity} in {source_format} format is empty (0 bytes).")
+        for result in results:
+            if result.success:
+                print(f"Converted {result.entity} from {source_format} to {target_format} "
+                      f"({result.records} items, {result.target_file})")
             else:
-                print(f"File for {entity} in {source_format} format does not exist.")
+                print(f"Error converting {result.entity}: {result.error}")
         
-        return converted_count > 0
+        return any(result.success for result in results)
+
+    def _get_compression(self) -> str:
+        try:
+            return self._config_registry.get_serialization_config().compression
+        except Exception as e:
+            logging.warning(f"Error reading compression from ConfigRegistry: {e}")
+            return COMPRESSION_NONE
+
+
+def _print_progress(entity: str, records: int, done: int, total: int) -> None:
+    percent = done * 100 // total if total else 100
+    print(f"  - {entity}: {percent}% ({records} items)")
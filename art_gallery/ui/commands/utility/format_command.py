@@ -9,6 +9,8 @@ from art_gallery.application.interfaces.user_service import IUserService
 from art_gallery.domain import User
 from art_gallery.infrastructure.factory.serialization_plugin_factory import SerializationPluginFactory
 from art_gallery.infrastructure.config import ConfigRegistry, SerializationConfig
+from art_gallery.infrastructure.conversion.data_converter import DataConverter, ENTITY_FILES, find_data_file
+from serialization.implementations.compression.compression_codecs import COMPRESSION_NONE
 
 
 class FormatCommand(ICommand):
@@ -33,21 +35,22 @@ class FormatCommand(ICommand):
         return "format"
         
     def get_description(self) -> str:
-        return "Switch data format between JSON and XML"
+        return "Switch data format between JSON, XML and binary"
         
     def get_usage(self) -> str:
-        return "format [json|xml]"
+        return "format [json|xml|binary]"
     
     def set_current_user(self, user: Optional[User]) -> None:
         self._current_user = user  # type: ignore[assignment]
         
     def get_help(self) -> str:
         return (
-            "(Admin only) Command for switching data format between JSON and XML.\n"
-            "Usage: format [json|xml]\n"
+            "(Admin only) Command for switching data format between JSON, XML and binary.\n"
+            "Usage: format [json|xml|binary]\n"
             "  format - show current data format\n"
             "  format json - switch to JSON format\n"
-            "  format xml - switch to XML format"
+            "  format xml - switch to XML format\n"
+            "  format binary - switch to the compact binary format"
         )
 
     @admin_only  
@@ -58,7 +61,7 @@ class FormatCommand(ICommand):
         if not args:
             print(f"Current data format: {self._current_format.upper()}")
             print(f"Available formats: {', '.join(available_formats)}")
-            print(f"Usage: format [json|xml]")
+            print(f"Usage: format [json|xml|binary]")
             return
         
         # Get the requested format and check its availability
@@ -83,28 +86,16 @@ class FormatCommand(ICommand):
         # Create the new format directory if it doesn't exist
         os.makedirs(new_format_dir, exist_ok=True)
         
-        # Paths to files in the current format
-        old_users_file = os.path.join(old_format_dir, f'users.{self._current_format}')
-        old_artworks_file = os.path.join(old_format_dir, f'artworks.{self._current_format}')
-        old_exhibitions_file = os.path.join(old_format_dir, f'exhibitions.{self._current_format}')
-        
-        # Paths to files in the new format
-        new_users_file = os.path.join(new_format_dir, f'users.{requested_format}')
-        new_artworks_file = os.path.join(new_format_dir, f'artworks.{requested_format}')
-        new_exhibitions_file = os.path.join(new_format_dir, f'exhibitions.{requested_format}')
-        
-        # Check if files exist for the current format
+        # Check if files exist for the current format (plain or compressed)
         old_files_exist = [
-            os.path.exists(old_users_file),
-            os.path.exists(old_artworks_file),
-            os.path.exists(old_exhibitions_file)
+            find_data_file(old_format_dir, entity, self._current_format) is not None
+            for entity in ENTITY_FILES
         ]
         
         # Check if files already exist for the new format
         new_files_exist = [
-            os.path.exists(new_users_file),
-            os.path.exists(new_artworks_file),
-            os.path.exists(new_exhibitions_file)
+            find_data_file(new_format_dir, entity, requested_format) is not None
+            for entity in ENTITY_FILES
         ]
         
         # If files for the new format already exist, inform the user how to switch
@@ -152,7 +143,7 @@ class FormatCommand(ICommand):
         return
 
     def _export_data(self, source_format: str, target_format: str) -> None:
-        """Exports data from one format to another."""
+        """Exports data from one format to another (streaming, entity files in parallel)."""
         base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
         data_dir = os.path.join(base_dir, 'data')
         
@@ -160,25 +151,22 @@ class FormatCommand(ICommand):
         source_dir = os.path.join(data_dir, source_format)
         target_dir = os.path.join(data_dir, target_format)
         
-        # Create the target format directory if it doesn't exist
-        os.makedirs(target_dir, exist_ok=True)
-        
-        # List of files to export
-        entities = ['users', 'artworks', 'exhibitions']
-        
-        # For each entity type
-        for entity in entities:
-            source_file = os.path.join(source_dir, f'{entity}.{source_format}')
-            target_file = os.path.join(target_dir, f'{entity}.{target_format}')
-            
-            # Skip if the source file doesn't exist
-            if not os.path.exists(source_file):
-                continue
-                
-            # Load data from the source file
-            source_deserializer = self._serialization_factory.get_deserializer(source_format)
-            data = source_deserializer.deserialize_from_file(source_file)
-            
-            # Save to the target file
-            target_serializer = self._serialization_factory.get_serializer(target_format)
-            target_serializer.serialize_to_file(data, target_file)
+        # Target files keep the configured compression, source files are read with any
+        compression = COMPRESSION_NONE
+        try:
+            compression = self._config_registry.get_serialization_config().compression
+        except Exception as e:
+            logging.warning(f"Error reading compression from ConfigRegistry: {e}")
+        
+        converter = DataConverter(progress=_print_progress)
+        results = converter.convert(source_dir, target_dir, source_format, target_format, compression)
+        
+        # Target files are replaced atomically, so failed entities keep no partial output
+        failed = [result for result in results if not result.success]
+        if failed:
+            raise RuntimeError("; ".join(f"{result.entity}: {result.error}" for result in failed))
+
+
+def _print_progress(entity: str, records: int, done: int, total: int) -> None:
+    percent = done * 100 // total if total else 100
+    print(f"  - {entity}: {percent}% ({records} items)")
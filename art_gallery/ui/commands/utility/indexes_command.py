@@ -0,0 +1,127 @@
+from typing import Sequence, Optional, Dict, List
+from datetime import datetime
+from art_gallery.ui.commands.base_command import BaseCommand
+from art_gallery.ui.decorators.admin_only import admin_only
+from art_gallery.application.interfaces.user_service import IUserService
+from art_gallery.repository.indexing.index_manager import IndexManager
+from art_gallery.repository.indexing.index_advisor import IndexDecision
+from art_gallery.exceptions.validation_exceptions import ValidationError
+
+class IndexesCommand(BaseCommand):
+    def __init__(self, user_service: IUserService, index_managers: Dict[str, IndexManager]):
+        super().__init__(user_service)
+        self._index_managers = index_managers
+
+    @admin_only
+    def execute(self, args: Sequence[str]) -> Optional[str]:
+        if not self._index_managers:
+            return "Automatic indexing is not available with the current storage."
+
+        action = args[0].lower() if args else 'show'
+        if action in self._index_managers:
+            # indexes <collection> - краткая форма show
+            action, args = 'show', ['show', *args]
+        managers = self._select_managers(args[1:] if action != 'auto' else args[2:])
+
+        if action == 'show':
+            return "\n\n".join(self._format_report(manager) for manager in managers)
+        if action in ('advise', 'apply'):
+            output_lines = []
+            for manager in managers:
+                decisions = manager.advise()
+                if action == 'apply':
+                    manager.apply(decisions)
+                output_lines.append(f"=== {manager.name.upper()} ===")
+                output_lines.extend(self._format_decisions(decisions))
+            if action == 'advise':
+                output_lines.append("")
+                output_lines.append("Decisions were not applied. Use 'indexes apply' to apply them.")
+            return "\n".join(output_lines)
+        if action == 'auto':
+            if len(args) < 2 or args[1].lower() not in ('on', 'off'):
+                raise ValidationError("Usage: indexes auto <on|off> [collection]")
+            enabled = args[1].lower() == 'on'
+            for manager in managers:
+                manager.auto = enabled
+            names = ", ".join(manager.name for manager in managers)
+            return f"Automatic index selection {'enabled' if enabled else 'disabled'} for: {names}"
+        raise ValidationError(f"Unknown action: {action}. Usage: {self.get_usage()}")
+
+    def _select_managers(self, args: Sequence[str]) -> List[IndexManager]:
+        if not args:
+            return list(self._index_managers.values())
+        name = args[0].lower()
+        if name not in self._index_managers:
+            raise ValidationError(f"Unknown collection: {name}. Available: {', '.join(self._index_managers)}")
+        return [self._index_managers[name]]
+
+    def _format_report(self, manager: IndexManager) -> str:
+        statistics = manager.statistics
+        output_lines = [f"=== {manager.name.upper()} ==="]
+        output_lines.append(f"Entities: {len(manager)}")
+        output_lines.append(f"Queries: {statistics.total_queries} total, {len(statistics)} in window, "
+                            f"average {statistics.average_latency() * 1000:.3f} ms")
+        output_lines.append(f"Automatic selection: {'on' if manager.auto else 'off'}")
+        output_lines.append(f"Index memory: {self._format_bytes(manager.memory_usage())} "
+                            f"of {self._format_bytes(manager.advisor.memory_limit_bytes)}")
+
+        output_lines.append("Indexes:")
+        if manager.indexes:
+            for index in manager.indexes:
+                output_lines.append(f"  {index.name:<24} ~{self._format_bytes(index.estimated_bytes())}")
+        else:
+            output_lines.append("  (none)")
+
+        usage = statistics.field_usage()
+        if usage:
+            output_lines.append("Workload (field, predicate, queries, selectivity, avg latency):")
+            for item in sorted(usage.values(), key=lambda u: u.queries, reverse=True):
+                selectivity = f"{item.selectivity:.1%}" if item.selectivity is not None else "n/a"
+                output_lines.append(f"  {item.field:<16} {item.kind:<6} {item.queries:>6} "
+                                    f"{selectivity:>8} {item.average_latency * 1000:>10.3f} ms")
+
+        if manager.last_decisions:
+            output_lines.append("Last decisions:")
+            output_lines.extend(self._format_decisions(manager.last_decisions))
+
+        if manager.history:
+            output_lines.append("History:")
+            for timestamp, decision in manager.history:
+                output_lines.append(f"  {datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')} "
+                                    f"{decision.action} {decision.field}:{decision.kind}")
+        return "\n".join(output_lines)
+
+    def _format_decisions(self, decisions: List[IndexDecision]) -> List[str]:
+        if not decisions:
+            return ["  No candidates yet: run some queries first."]
+        return [f"  {decision.action.upper():<6} {decision.field + ':' + decision.kind:<24} "
+                f"saves ~{decision.estimated_savings_ms:.2f} ms, ~{self._format_bytes(decision.estimated_bytes)} "
+                f"- {decision.reason}" for decision in decisions]
+
+    @staticmethod
+    def _format_bytes(size: int) -> str:
+        if size < 1024:
+            return f"{size} B"
+        if size < 1024 * 1024:
+            return f"{size / 1024:.1f} KB"
+        return f"{size / (1024 * 1024):.1f} MB"
+
+    def get_name(self) -> str:
+        return "indexes"
+
+    def get_description(self) -> str:
+        return "Show query statistics and automatic index decisions (admin only)"
+
+    def get_usage(self) -> str:
+        return "indexes [show|advise|apply] [collection] | indexes auto <on|off> [collection]"
+
+    def get_help(self) -> str:
+        return ("Shows workload statistics and in-memory secondary indexes chosen automatically.\n"
+                "Usage:\n"
+                "  indexes [show] [collection]  - statistics, current indexes and last decisions\n"
+                "  indexes advise [collection]  - show what the advisor would create or drop\n"
+                "  indexes apply [collection]   - run the advisor and apply its decisions now\n"
+                "  indexes auto <on|off> [collection] - enable or disable automatic selection\n"
+                "Collections: artworks, exhibitions, users.\n"
+                "Savings are estimated for the queries in the statistics window.\n"
+                "This command is available to administrators only.")
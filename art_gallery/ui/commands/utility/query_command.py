@@ -0,0 +1,83 @@
+from typing import Sequence, Optional, List, Any
+from art_gallery.ui.commands.base_command import BaseCommand
+from art_gallery.application.interfaces.user_service import IUserService
+from art_gallery.application.interfaces.artwork_service import IArtworkService
+from art_gallery.application.interfaces.exhibition_service import IExhibitionService
+from art_gallery.application.query.query_executor import QueryExecutor, QueryResult
+from art_gallery.exceptions.validation_exceptions import ValidationError
+from art_gallery.exceptions.auth_exceptions import PermissionDeniedError
+from art_gallery.domain import UserRole
+
+class QueryCommand(BaseCommand):
+    def __init__(self, user_service: IUserService, artwork_service: IArtworkService,
+                 exhibition_service: IExhibitionService):
+        super().__init__(user_service)
+        self._executor = QueryExecutor(artwork_service, exhibition_service, user_service)
+
+    def execute(self, args: Sequence[str]) -> Optional[str]:
+        if not args:
+            raise ValidationError("No query provided. Usage: " + self.get_usage())
+
+        # User data is available to administrators only, as in list_users
+        if args[0].lower() == 'users' and (not self._current_user or self._current_user.role != UserRole.ADMIN):
+            raise PermissionDeniedError("Querying users is available to administrators only")
+
+        try:
+            result = self._executor.execute(args)
+        except ValueError as e:
+            raise ValidationError(f"Invalid query: {e}")
+
+        output_lines = []
+        if result.items:
+            output_lines.append(f"Rows: {len(result.items)} (matched: {result.matched})")
+            output_lines.append("-" * 60)
+            output_lines.extend(self._format_rows(result.query.entity, result.items))
+            output_lines.append("-" * 60)
+        else:
+            output_lines.append("No results found for your query.")
+        output_lines.append(self._format_timing(result))
+        return "\n".join(output_lines)
+
+    def _format_rows(self, entity: str, items: List[Any]) -> List[str]:
+        if entity == 'artworks':
+            return [f"{a.id:>5} | {a.title} | {a.artist} | {a.year} | {a.type.value}" for a in items]
+        if entity == 'exhibitions':
+            return [f"{e.id:>5} | {e.title} | {e.start_date.strftime('%Y-%m-%d')} - {e.end_date.strftime('%Y-%m-%d')} | "
+                    f"artworks: {len(e.artwork_ids)} | {'active' if e.is_active() else 'inactive'}" for e in items]
+        return [f"{u.id:>5} | {u.username} | {u.role.name} | {'active' if u.is_active else 'deactivated'}" for u in items]
+
+    @staticmethod
+    def _format_timing(result: QueryResult) -> str:
+        return (f"Query time: {result.total_time * 1000:.2f} ms "
+                f"(parse {result.parse_time * 1000:.2f} ms, "
+                f"filter {result.filter_time * 1000:.2f} ms, "
+                f"order/limit {result.select_time * 1000:.2f} ms)")
+
+    def get_name(self) -> str:
+        return "query"
+
+    def get_description(self) -> str:
+        return "Query artworks, exhibitions or users with filters, ordering and limit"
+
+    def get_usage(self) -> str:
+        return "query <artworks|exhibitions|users> [where <condition>] [order by <field> [asc|desc]] [limit <n>]"
+
+    def get_help(self) -> str:
+        return ("Query artworks, exhibitions or users.\n"
+                "Usage: " + self.get_usage() + "\n"
+                "Conditions:\n"
+                "  <field> =|!=|<|<=|>|>= <value>\n"
+                "  <field> between <low> and <high>\n"
+                "  <field> contains \"<text>\"\n"
+                "  combine with and, or, not and parentheses\n"
+                "Fields:\n"
+                "  artworks: id, title, artist, year, description, type, created_at\n"
+                "  exhibitions: id, title, description, start_date, end_date, created_at,\n"
+                "               max_capacity, active (true/false), artwork (artwork id)\n"
+                "  users: id, username, role, active, created_at, last_login (admin only)\n"
+                "Dates use ISO format (YYYY-MM-DD). Text comparisons ignore case.\n"
+                "Examples:\n"
+                "  query artworks where type=painting and year between 1800 and 1900 order by year desc limit 20\n"
+                "  query artworks where description contains \"still life\" or artist=\"Claude Monet\"\n"
+                "  query exhibitions where active=true order by start_date\n"
+                "  query users where role=admin")
@@ -11,7 +11,9 @@ from art_gallery.infrastructure.logging.implementations.filtered_logger import F
 from art_gallery.ui.handlers.error_handler import ConsoleErrorHandler
 from art_gallery.ui.command_registry.command_registry import CommandRegistry
 from art_gallery.ui.command_registry.command_parser import CommandParser
-from art_gallery.ui.services import create_real_services, create_mock_services  
+from art_gallery.ui.services import (
+    create_real_services, create_mock_services, save_snapshots, log_storage_stats, close_services
+)
 from art_gallery.infrastructure.config import ConfigRegistry, SerializationConfig
 from art_gallery.infrastructure.logging.interfaces.logger import LogLevel
 from art_gallery.ui.command_registry.command_registrar import register_commands
@@ -27,8 +29,8 @@ class Application:
         # Парсинг аргументов командной строки, если не переданы
         if args is None:
             parser = argparse.ArgumentParser(description='Art Gallery Management System')
-            parser.add_argument('--format', type=str, choices=['json', 'xml'], default=None,
-                                help='Формат данных для использования (json или xml)')
+            parser.add_argument('--format', type=str, choices=['json', 'xml', 'binary'], default=None,
+                                help='Формат данных для использования (json, xml или binary)')
             parser.add_argument('--test', action='store_true', help='Использовать тестовые сервисы')
             args = parser.parse_args()
             
@@ -46,6 +48,20 @@ class Application:
                 # Используем значение по умолчанию
                 format_name = "json"
         
+        # Сжатие файлов данных задается только через ConfigRegistry (.env файл)
+        try:
+            compression = self.config_registry.get_serialization_config().compression
+        except Exception as e:
+            logging.warning(f"Ошибка при чтении сжатия из ConfigRegistry: {e}")
+            compression = "none"
+        
+        # Параллельный поиск по экспонатам также задается через ConfigRegistry
+        try:
+            parallel_workers = self.config_registry.get_serialization_config().parallel_scan_workers
+        except Exception as e:
+            logging.warning(f"Ошибка при чтении PARALLEL_SCAN_WORKERS из ConfigRegistry: {e}")
+            parallel_workers = 0
+        
         # Сохранение формата в .env файл, если он задан через аргументы
         if args.format:
             # Обновляем .env файл через ConfigRegistry
@@ -84,7 +100,8 @@ class Application:
         if args.test:
             self.services = create_mock_services()
         else:
-            self.services = create_real_services(format_name=format_name)
+            self.services = create_real_services(format_name=format_name, compression=compression,
+                                                 parallel_workers=parallel_workers)
             
         # Инициализация команд
         self.command_parser = CommandParser()
@@ -119,6 +136,10 @@ class Application:
             except Exception as e:
                 self.error_handler.handle_error(e)
 
+        # Снимки коллекций для быстрого следующего запуска (только изменившиеся)
+        save_snapshots(self.services)
+        close_services(self.services)
+        log_storage_stats()
         self.logger.info("Application stopped")
 
 def main() -> None:
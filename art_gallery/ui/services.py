@@ -1,7 +1,7 @@
 import os
 import logging
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
 
 from art_gallery.infrastructure.config.config_registry import ConfigRegistry
 
@@ -18,7 +18,10 @@ from art_gallery.application.interfaces.cloud.i_file_storage_strategy import IFi
 from art_gallery.application.interfaces.cloud.i_media_service import IMediaService
 from art_gallery.application.services.cloud.local_file_storage_strategy import LocalFileStorageStrategy
 from art_gallery.application.services.cloud.cloud_file_storage_strategy import CloudFileStorageStrategy
-from art_gallery.infrastructure.cloud.minio_service import MinioService
+from art_gallery.infrastructure.cloud.minio_client_provider import MinioClientProvider
+from art_gallery.infrastructure.cloud.caching_storage_service import CachingStorageService
+from art_gallery.infrastructure.cloud.media_cache import MediaDiskCache
+from art_gallery.infrastructure.imaging.derivatives import DerivativeGenerator, derivatives_available
 from art_gallery.infrastructure.config.minio_config import MinioConfig
 from art_gallery.infrastructure.interfaces.cloud.i_storage_service import IStorageService
 
@@ -26,6 +29,12 @@ from art_gallery.infrastructure.interfaces.cloud.i_storage_service import IStora
 from art_gallery.infrastructure.config.cli_config import CLIConfig
 from art_gallery.infrastructure.config.storage_config import StorageConfig
 from art_gallery.infrastructure.factory.serialization_plugin_factory import SerializationPluginFactory
+from serialization.implementations.compression.compression_codecs import (
+    COMPRESSION_NONE,
+    compression_suffix,
+    find_latest_variant,
+    recompress_file
+)
 
 # Реальные сервисы
 from art_gallery.application.services.file.user_service import UserService
@@ -36,6 +45,8 @@ from art_gallery.application.services.file.exhibition_service import ExhibitionS
 from art_gallery.repository.implementations.file.user_repository import UserFileRepository
 from art_gallery.repository.implementations.file.artwork_repository import ArtworkFileRepository
 from art_gallery.repository.implementations.file.exhibition_repository import ExhibitionFileRepository
+from art_gallery.repository.indexing.index_manager import IndexManager
+from art_gallery.repository.snapshot.snapshot_cache import SnapshotCache
 
 # Интерфейсы репозиториев (если нужны для типизации, но сервисы ожидают конкретные реализации или интерфейсы)
 from art_gallery.repository.interfaces.user_repository import IUserRepository
@@ -54,6 +65,10 @@ class ServiceCollection:
     storage_service: Optional[IStorageService] = None
     media_service: Optional[IMediaService] = None
     file_storage_strategy: Optional[IFileStorageStrategy] = None
+    # Менеджеры автоматических индексов по коллекциям (только для реальных репозиториев)
+    index_managers: Dict[str, IndexManager] = field(default_factory=dict)
+    # Репозитории коллекций со снимками для быстрого запуска (только для реальных репозиториев)
+    repositories: Dict[str, Any] = field(default_factory=dict)
 
 def create_mock_services() -> ServiceCollection:
     """Создает и настраивает тестовые сервисы с тестовыми хранилищами"""
@@ -92,11 +107,57 @@ def create_mock_services() -> ServiceCollection:
         file_storage_strategy=file_storage
     )
 
-def create_real_services(format_name: str = 'json'):
+def _adopt_data_file(filepath: str, compression: str) -> None:
+    """
+    Переносит коллекцию в файл с текущим сжатием, если последним изменялся ее
+    вариант с другим сжатием (или несжатый). После успешной перепаковки исходный
+    файл удаляется, чтобы при следующей смене сжатия не загрузить устаревшие данные.
+    """
+    base_path = filepath[:len(filepath) - len(compression_suffix(compression))]
+    source = find_latest_variant(base_path)
+    if source is None or source == filepath:
+        return
+    try:
+        recompress_file(source, filepath, compression)
+        os.remove(source)
+        logging.info(f"Data file {source} converted to {filepath}")
+    except Exception as e:
+        logging.warning(f"Failed to convert data file {source} to {filepath}: {e}")
+
+def log_storage_stats() -> None:
+    """Логирует статистику повторного использования соединений с MinIO"""
+    stats = MinioClientProvider.stats()
+    if stats.clients:
+        logging.info(f"Storage connections: {stats}")
+
+def save_snapshots(services: ServiceCollection) -> None:
+    """Сохраняет снимки коллекций, изменившихся с момента последнего снимка"""
+    for name, repository in services.repositories.items():
+        try:
+            repository.save_snapshot()
+        except Exception as e:
+            logging.warning(f"Failed to save snapshot of {name}: {e}")
+
+def close_services(services: ServiceCollection) -> None:
+    """Освобождает ресурсы репозиториев (процессы параллельного просмотра)"""
+    for name, repository in services.repositories.items():
+        close = getattr(repository, 'close', None)
+        if close is None:
+            continue
+        try:
+            close()
+        except Exception as e:
+            logging.warning(f"Failed to close repository {name}: {e}")
+
+def create_real_services(format_name: str = 'json', compression: str = COMPRESSION_NONE,
+                         snapshots: bool = True, parallel_workers: int = 0):
     """Создает экземпляры реальных сервисов с рабочими репозиториями и стратегиями хранения
     
     Args:
-        format_name (str, optional): Формат данных для хранения ('json' или 'xml'). По умолчанию 'json'.
+        format_name (str, optional): Формат данных для хранения ('json', 'xml' или 'binary'). По умолчанию 'json'.
+        compression (str, optional): Сжатие файлов данных ('none', 'gzip', 'lzma' или 'zstd'). По умолчанию без сжатия.
+        snapshots (bool, optional): Загружать коллекции из снимков, если файлы данных не менялись. По умолчанию True.
+        parallel_workers (int, optional): Процессы параллельного поиска по экспонатам (PARALLEL_SCAN_WORKERS). По умолчанию 0 - отключен.
     
     Returns:
         ServiceCollection: Коллекция всех сервисов для работы приложения
@@ -107,7 +168,7 @@ def create_real_services(format_name: str = 'json'):
     os.makedirs(data_dir, exist_ok=True)
     
     # Проверяем и нормализуем формат
-    if format_name.lower() not in ['json', 'xml']:
+    if format_name.lower() not in ['json', 'xml', 'binary']:
         print(f"Предупреждение: Неподдерживаемый формат '{format_name}'. Используем JSON по умолчанию.")
         format_name = 'json'
     
@@ -115,25 +176,54 @@ def create_real_services(format_name: str = 'json'):
     format_dir = os.path.join(data_dir, format_name.lower())
     os.makedirs(format_dir, exist_ok=True)
     
-    # Создаем пути к файлам в соответствующей подпапке
-    users_file = os.path.join(format_dir, 'users.{}'.format(format_name.lower()))
-    artworks_file = os.path.join(format_dir, 'artworks.{}'.format(format_name.lower()))
-    exhibitions_file = os.path.join(format_dir, 'exhibitions.{}'.format(format_name.lower()))
-    
-    
     # Инициализация фабрики плагинов сериализации
     factory = SerializationPluginFactory()
     factory.initialize(verbose=False)  # Загрузка всех плагинов без подробного вывода
     
-    # Получаем сериализатор и десериализатор выбранного формата
-    serializer = factory.get_serializer(format_name)
-    deserializer = factory.get_deserializer(format_name)
+    # Получаем сериализатор и десериализатор выбранного формата.
+    # Десериализатор читает и сжатые, и несжатые файлы
+    try:
+        serializer = factory.get_compressed_serializer(format_name, compression)
+    except ValueError as e:
+        print(f"Предупреждение: {e}. Данные сохраняются без сжатия.")
+        compression = COMPRESSION_NONE
+        serializer = factory.get_serializer(format_name)
+    deserializer = factory.get_compressed_deserializer(format_name)
+    
+    # Создаем пути к файлам в соответствующей подпапке (с суффиксом сжатия)
+    suffix = compression_suffix(compression)
+    users_file = os.path.join(format_dir, 'users.{}{}'.format(format_name.lower(), suffix))
+    artworks_file = os.path.join(format_dir, 'artworks.{}{}'.format(format_name.lower(), suffix))
+    exhibitions_file = os.path.join(format_dir, 'exhibitions.{}{}'.format(format_name.lower(), suffix))
+    for data_file in (users_file, artworks_file, exhibitions_file):
+        _adopt_data_file(data_file, compression)
+    
+    # Снимки разобранных коллекций: повторный запуск без разбора неизменившихся файлов
+    snapshot_cache = SnapshotCache(os.path.join(data_dir, '.snapshots')) if snapshots else None
     
     # Инициализация реальных репозиториев
-    # Передаем сериализаторы и десериализаторы в репозитории
-    user_repo = UserFileRepository(users_file, serializer, deserializer)
-    artwork_repo = ArtworkFileRepository(artworks_file, serializer, deserializer)
-    exhibition_repo = ExhibitionFileRepository(exhibitions_file, serializer, deserializer)
+    # Передаем сериализаторы и десериализаторы в репозитории.
+    # Файлы данных пишет само приложение, поэтому при загрузке инварианты сущностей не перепроверяются
+    user_repo = UserFileRepository(users_file, serializer, deserializer, trusted_load=True,
+                                   snapshot_cache=snapshot_cache)
+    artwork_repo = ArtworkFileRepository(artworks_file, serializer, deserializer, vectorized=True,
+                                         parallel_workers=parallel_workers, trusted_load=True,
+                                         snapshot_cache=snapshot_cache)
+    exhibition_repo = ExhibitionFileRepository(exhibitions_file, serializer, deserializer, trusted_load=True,
+                                               snapshot_cache=snapshot_cache)
+
+    # Автоматические вторичные индексы по статистике запросов
+    index_managers = {
+        'artworks': IndexManager('artworks'),
+        'exhibitions': IndexManager('exhibitions'),
+        'users': IndexManager('users')
+    }
+    artwork_repo.set_index_manager(index_managers['artworks'])
+    exhibition_repo.set_index_manager(index_managers['exhibitions'])
+    user_repo.set_index_manager(index_managers['users'])
+
+    # Снимки пишутся после подключения наблюдателей: в них попадает и состояние колонок
+    repositories = {'artworks': artwork_repo, 'exhibitions': exhibition_repo, 'users': user_repo}
 
     # Получаем конфигурации из централизованного реестра
     config_registry = ConfigRegistry()
@@ -162,17 +252,35 @@ def create_real_services(format_name: str = 'json'):
     media_service = None
     file_storage: Optional[IFileStorageStrategy] = None
     
+    # Миниатюры и веб-версии изображений создаются в пуле процессов (нужен Pillow)
+    derivatives = None
+    if storage_config.enable_image_thumbnails:
+        if derivatives_available():
+            derivatives = DerivativeGenerator()
+        else:
+            logging.info("Pillow is not installed, image thumbnails are disabled")
+    
     try:
         # Настраиваем стратегию хранения файлов в соответствии с конфигурацией
         if storage_config.storage_type.lower() == "cloud" and minio_config:
             try:
                 logging.debug("Initializing MinIO services from registry configuration...")
-                storage_service = MinioService(minio_config)
+                storage_service = MinioClientProvider.get_service(minio_config)
                 logging.debug("MinioService initialized successfully.")
                 
+                # Загрузки изображений читаются через локальный кэш (ENABLE_CACHING)
+                if storage_config.enable_caching:
+                    storage_service = CachingStorageService(
+                        storage_service,
+                        MediaDiskCache(storage_config.cache_path, storage_config.cache_max_bytes)
+                    )
+                    logging.info(f"Media cache enabled at {storage_config.cache_path}")
+                
                 # Создаем стратегию облачного хранения с правильным бакетом
                 logging.debug("Creating CloudFileStorageStrategy with bucket: " + minio_config.default_bucket)
-                file_storage = CloudFileStorageStrategy(storage_service, minio_config.default_bucket)
+                file_storage = CloudFileStorageStrategy(storage_service, minio_config.default_bucket,
+                                                        content_addressed=storage_config.content_addressed,
+                                                        derivatives=derivatives)
                 
                 # Установим media_service в None, так как мы не используем этот интерфейс
                 media_service = None
@@ -180,11 +288,15 @@ def create_real_services(format_name: str = 'json'):
             except Exception as cloud_error:
                 logging.warning(f"Failed to initialize cloud storage: {str(cloud_error)}", exc_info=True)
                 # Если произошла ошибка, используем локальную стратегию как запасной вариант
-                file_storage = LocalFileStorageStrategy(storage_config.local_storage_path)
+                file_storage = LocalFileStorageStrategy(storage_config.local_storage_path,
+                                                        content_addressed=storage_config.content_addressed,
+                                                        derivatives=derivatives)
                 logging.info("Using local file storage as fallback after cloud init failure")
         else:
             logging.info("Using local file storage strategy (from configuration or as fallback)")
-            file_storage = LocalFileStorageStrategy(storage_config.local_storage_path)
+            file_storage = LocalFileStorageStrategy(storage_config.local_storage_path,
+                                                    content_addressed=storage_config.content_addressed,
+                                                    derivatives=derivatives)
             logging.info("Initialized local file storage strategy")
     except Exception as e:
         logging.warning(f"Failed to initialize file storage strategy: {str(e)}", exc_info=True)
@@ -211,5 +323,7 @@ def create_real_services(format_name: str = 'json'):
         serialization_factory=factory,
         storage_service=storage_service,
         media_service=media_service,
-        file_storage_strategy=file_storage
+        file_storage_strategy=file_storage,
+        index_managers=index_managers,
+        repositories=repositories
     )
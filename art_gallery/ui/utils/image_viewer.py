@@ -32,12 +32,14 @@ class ImageViewer:
         # os.path.normpath('/usr/local') -> '/usr/local' (POSIX) or '\usr\local' (Win)
         return os.path.normpath(path)
 
-    def _create_html_viewer(self, image_src: str, title: str = "Artwork View") -> str:
+    def _create_html_viewer(self, image_src: str, title: str = "Artwork View",
+                            original_src: Optional[str] = None) -> str:
         """Creates a temporary HTML file to view the image
         
         Args:
             image_src: Path or URL to the image
             title: Title for the HTML page
+            original_src: URL of the full-size original when image_src is a resized version
             
         Returns:
             str: Path to the generated HTML file
@@ -46,6 +48,8 @@ class ImageViewer:
         is_url = self._is_url(image_src)
         
         image_tag = f'<img src="{image_src}" alt="{title}">' if is_url else f'<img src="file:///{image_src}" alt="{title}">'  
+        # Уменьшенная версия открывает оригинал по щелчку
+        original_link = f'<a class="original-link" href="{original_src}">Open original</a>' if original_src else ''
         
         html_content = f"""
         <!DOCTYPE html>
@@ -78,6 +82,13 @@ class ImageViewer:
                     min-width: 300px;
                     min-height: 200px;
                 }}
+                .original-link {{
+                    display: block;
+                    margin-top: 10px;
+                    color: #aaa;
+                    font-family: Arial, sans-serif;
+                    text-align: center;
+                }}
                 .error-message {{
                     color: #ff5555;
                     padding: 20px;
@@ -96,6 +107,7 @@ class ImageViewer:
             <h1>{title}</h1>
             <div class="image-container">
                 {image_tag.replace('"', '"')} <!-- заменяем кавычки для корректного отображения в строке -->
+                {original_link}
                 <div id="error-message" class="error-message">
                     Error loading image. The image might be unavailable or the URL might be incorrect.
                 </div>
@@ -148,12 +160,13 @@ class ImageViewer:
         normalized_path = image_path.replace('media/', '')
         return os.path.normpath(os.path.join(base_path, normalized_path))
     
-    def open_image(self, image_path: str, use_web: bool = False) -> Optional[str]:
+    def open_image(self, image_path: str, use_web: bool = False, original_url: Optional[str] = None) -> Optional[str]:
         """Opens image in default viewer or web browser
 
         Args:
             image_path: Path or URL to the image
             use_web: Whether to open in web browser
+            original_url: URL of the full-size original when image_path is a resized version
 
         Returns:
             Optional[str]: A message string (URL, success, or error).
@@ -184,7 +197,7 @@ class ImageViewer:
             if use_web:
                 # path_for_html_src is 'C:/path/img.jpg' or a web URL.
                 # _create_html_viewer handles both, creates an HTML file, and returns its path.
-                created_html_file_path = self._create_html_viewer(path_for_html_src, title)
+                created_html_file_path = self._create_html_viewer(path_for_html_src, title, original_url)
                 
                 # Ensure the path is absolute for webbrowser.open
                 abs_html_path = os.path.abspath(created_html_file_path).replace("\\", "/")
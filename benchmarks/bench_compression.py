@@ -0,0 +1,74 @@
+"""
+Бенчмарк сжатия сохраняемых коллекций.
+Для каждого формата и алгоритма сжатия измеряет размер файла, потоковую запись
+(как при сохранении файлового репозитория) и потоковое чтение файла с проверкой,
+что распакованные записи совпадают с исходными.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_compression.py --size 100000 --formats json binary
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT_DIR, os.path.join(ROOT_DIR, 'art_gallery')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from serialization.implementations.compression.compression_codecs import COMPRESSION_NONE, available_compressions
+from serialization.implementations.compression.compressed_serializer import CompressedSerializer
+from serialization.implementations.compression.compressed_deserializer import CompressedDeserializer
+from bench_serialization_formats import FORMATS, generate_collections, measure
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сравнение алгоритмов сжатия коллекций")
+    parser.add_argument('--size', type=int, default=100000, help="Количество экспонатов")
+    parser.add_argument('--formats', nargs='*', default=list(FORMATS), choices=list(FORMATS))
+    parser.add_argument('--repeat', type=int, default=3, help="Количество повторов (берется лучшее)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    compressions = [COMPRESSION_NONE] + available_compressions()
+    print(f"Алгоритмы сжатия: {', '.join(compressions)}")
+    print(f"Генерация данных ({args.size} экспонатов)...")
+    entities = generate_collections(args.size, args.seed)['artworks'][0]
+    records = [entity.to_dict() for entity in entities]
+
+    with tempfile.TemporaryDirectory() as directory:
+        for format_name in args.formats:
+            serializer_class, deserializer_class = FORMATS[format_name]
+            # Несжатый файл читается первым: с его записями сверяются остальные
+            reference = None
+            print(f"\n=== {format_name.upper()} ({len(records)} экспонатов) ===")
+            print(f"{'сжатие':>8} {'размер, КБ':>12} {'доля':>7} {'запись, с':>10} {'чтение, с':>10}")
+            plain_size = None
+            for compression in compressions:
+                serializer = serializer_class()
+                if compression != COMPRESSION_NONE:
+                    serializer = CompressedSerializer(serializer, compression)
+                deserializer = CompressedDeserializer(deserializer_class())
+                filepath = os.path.join(directory, f"artworks.{serializer.file_extension}")
+
+                def write():
+                    with open(filepath, 'wb') as file:
+                        serializer.serialize_to_stream(iter(records), file)
+
+                write_time = measure(write, args.repeat)
+                loaded = list(deserializer.iter_deserialize_from_file(filepath))
+                if reference is None:
+                    reference = loaded
+                elif loaded != reference:
+                    raise RuntimeError(f"Записи {format_name}/{compression} не совпадают с несжатыми")
+                read_time = measure(lambda: list(deserializer.iter_deserialize_from_file(filepath)), args.repeat)
+
+                size = os.path.getsize(filepath)
+                plain_size = plain_size or size
+                print(f"{compression:>8} {size / 1024:>12,.1f} {size / plain_size:>7.1%} "
+                      f"{write_time:>10.3f} {read_time:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Бенчмарк кодеков сущностей.
+Сравнивает общий путь to_dict/from_dict со специализированными кодеками
+(с проверкой инвариантов и в доверенном режиме массовой загрузки): отдельно
+восстановление сущностей из готовых словарей и полную загрузку файла так же,
+как это делают файловые репозитории.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_entity_codecs.py --size 100000
+
+Замеры на 100 000 экспонатов (один CPU, CPython 3.11, разброс между запусками
+заметный): восстановление из словарей в доверенном режиме быстрее from_dict
+в 2.6-2.8 раза для экспонатов, в 1.6-2.1 раза для пользователей и в 1.7-2.0 раза
+для выставок. Остаток времени уходит на разбор дат, создание словаря состояния
+и самого объекта. Полная загрузка файла ускоряется лишь в 1.0-1.5 раза (бинарный
+формат - около 1.0-1.2): основное время занимает разбор файла.
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT_DIR, os.path.join(ROOT_DIR, 'art_gallery')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from art_gallery.domain.codecs import ARTWORK_CODEC, USER_CODEC, EXHIBITION_CODEC, bulk_hydration
+from bench_serialization_formats import FORMATS, generate_collections, measure, normalize
+
+CODECS = {'artworks': ARTWORK_CODEC, 'users': USER_CODEC, 'exhibitions': EXHIBITION_CODEC}
+
+
+def hydrate_generic(entity_class, records):
+    return [entity_class.from_dict(record) for record in records]
+
+
+def hydrate_codec(codec, records, trusted: bool):
+    with bulk_hydration():
+        return [codec.decode(record, trusted) for record in records]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сравнение кодеков сущностей с to_dict/from_dict")
+    parser.add_argument('--size', type=int, default=100000, help="Количество экспонатов "
+                                                                  "(пользователей - в 10 раз меньше, выставок - в 100)")
+    parser.add_argument('--formats', nargs='*', default=['json', 'binary'], choices=list(FORMATS),
+                        help="Форматы файлов для полной загрузки")
+    parser.add_argument('--repeat', type=int, default=3, help="Количество повторов (берется лучшее)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"Генерация данных ({args.size} экспонатов)...")
+    collections = generate_collections(args.size, args.seed)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, (entities, entity_class) in collections.items():
+            codec = CODECS[name]
+            records = [entity.to_dict() for entity in entities]
+            if [codec.encode(entity) for entity in entities] != records:
+                raise RuntimeError(f"Кодек {name} не совпадает с to_dict")
+            for trusted in (False, True):
+                decoded = [normalize(entity.to_dict()) for entity in hydrate_codec(codec, records, trusted)]
+                if decoded != [normalize(dict(record)) for record in records]:
+                    raise RuntimeError(f"Кодек {name} не совпадает с from_dict")
+
+            count = len(entities)
+            print(f"\n=== {name.upper()} ({count}) ===")
+            print(f"{'операция':>24} {'общий, зап/с':>14} {'кодек, зап/с':>14} {'доверенный':>14} {'ускорение':>10}")
+
+            def report(operation, generic, checked, trusted=None):
+                best = trusted if trusted is not None else checked
+                trusted_rate = f"{count / trusted:>14,.0f}" if trusted is not None else f"{'-':>14}"
+                print(f"{operation:>24} {count / generic:>14,.0f} {count / checked:>14,.0f} "
+                      f"{trusted_rate} {generic / best:>9.2f}x")
+
+            report('сохранение в словари',
+                   measure(lambda: [entity.to_dict() for entity in entities], args.repeat),
+                   measure(lambda: [codec.encode(entity) for entity in entities], args.repeat))
+            report('восстановление',
+                   measure(lambda: hydrate_generic(entity_class, records), args.repeat),
+                   measure(lambda: hydrate_codec(codec, records, False), args.repeat),
+                   measure(lambda: hydrate_codec(codec, records, True), args.repeat))
+
+            for format_name in args.formats:
+                serializer_class, deserializer_class = FORMATS[format_name]
+                serializer, deserializer = serializer_class(), deserializer_class()
+                filepath = os.path.join(directory, f"{name}.{format_name}")
+                with open(filepath, 'wb') as file:
+                    serializer.serialize_to_stream((codec.encode(entity) for entity in entities), file)
+
+                report(f'загрузка файла {format_name}',
+                       measure(lambda: hydrate_generic(entity_class, deserializer.iter_deserialize_from_file(filepath)),
+                               args.repeat),
+                       measure(lambda: hydrate_codec(codec, deserializer.iter_deserialize_from_file(filepath), False),
+                               args.repeat),
+                       measure(lambda: hydrate_codec(codec, deserializer.iter_deserialize_from_file(filepath), True),
+                               args.repeat))
+
+
+if __name__ == '__main__':
+    main()
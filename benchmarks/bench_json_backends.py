@@ -0,0 +1,65 @@
+"""
+Микробенчмарк реализаций JSON (orjson, ujson, стандартный json) на записях сущностей.
+Для каждой установленной реализации измеряет потоковую запись массива записей
+(как при сохранении репозитория), чтение документа из байтов (как при загрузке
+из MinIO) и проверяет, что вывод побайтно совпадает со стандартным модулем.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_json_backends.py --size 100000
+"""
+import argparse
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT_DIR, os.path.join(ROOT_DIR, 'art_gallery')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from serialization.implementations.json.json_backend import available_backends
+from serialization.implementations.json.json_serializer import JsonSerializer
+from serialization.implementations.json.json_deserializer import JsonDeserializer
+from bench_serialization_formats import generate_collections, measure
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сравнение реализаций JSON")
+    parser.add_argument('--size', type=int, default=100000, help="Количество экспонатов "
+                                                                  "(пользователей - в 10 раз меньше, выставок - в 100)")
+    parser.add_argument('--repeat', type=int, default=3, help="Количество повторов (берется лучшее)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    backends = available_backends()
+    print(f"Доступные реализации: {', '.join(backends)}")
+    print(f"Генерация данных ({args.size} экспонатов)...")
+    collections = generate_collections(args.size, args.seed)
+
+    for name, (entities, _) in collections.items():
+        records = [entity.to_dict() for entity in entities]
+        reference = b''.join(JsonSerializer('json').serialize_bytes_iter(records))
+        print(f"\n=== {name.upper()} ({len(records)}, {len(reference) / 1024:.1f} КБ) ===")
+        print(f"{'реализация':>10} {'запись, с':>10} {'зап/с':>12} {'чтение, с':>10} {'зап/с':>12} {'ускорение':>18}")
+        baseline = None
+        # Стандартный модуль первым: относительно него считается ускорение
+        for backend in sorted(backends, key=lambda backend: backend != 'json'):
+            serializer, deserializer = JsonSerializer(backend), JsonDeserializer(backend)
+            document = b''.join(serializer.serialize_bytes_iter(records))
+            if document != reference:
+                raise RuntimeError(f"Вывод {backend} отличается от стандартного json")
+            if deserializer.deserialize_bytes(document) != records:
+                raise RuntimeError(f"Чтение {backend} отличается от стандартного json")
+
+            write_time = measure(lambda: b''.join(serializer.serialize_bytes_iter(records)), args.repeat)
+            read_time = measure(lambda: deserializer.deserialize_bytes(document), args.repeat)
+            if backend == 'json':
+                baseline = (write_time, read_time)
+            speedup = "-"
+            if baseline:
+                speedup = f"{baseline[0] / write_time:.2f}x / {baseline[1] / read_time:.2f}x"
+            print(f"{backend:>10} {write_time:>10.3f} {len(records) / write_time:>12,.0f} "
+                  f"{read_time:>10.3f} {len(records) / read_time:>12,.0f} {speedup:>18}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Бенчмарк параллельного просмотра коллекции экспонатов.
+Сравнивает последовательный поиск по скомпилированной спецификации с ParallelScanner
+при разном количестве процессов.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_parallel_scan.py --size 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT_DIR, os.path.join(ROOT_DIR, 'art_gallery')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from art_gallery.domain import Artwork, ArtworkType
+from art_gallery.repository.parallel.parallel_scanner import ParallelScanner
+from art_gallery.repository.specifications.artwork_specifications import (
+    ArtworkByArtistSpecification,
+    ArtworkDescriptionContainsSpecification
+)
+
+WORDS = ['oil', 'canvas', 'marble', 'bronze', 'portrait', 'landscape', 'still', 'life',
+         'abstract', 'sea', 'storm', 'light', 'shadow', 'city', 'garden', 'river']
+
+
+def generate_artworks(size: int, seed: int):
+    rng = random.Random(seed)
+    types = list(ArtworkType)
+    now = datetime.now()
+    artworks = []
+    for artwork_id in range(1, size + 1):
+        artwork = Artwork(
+            title=f"Artwork {artwork_id}",
+            artist=f"Artist {rng.randrange(1000)}",
+            year=rng.randint(1400, now.year),
+            description=' '.join(rng.choice(WORDS) for _ in range(12)),
+            type=rng.choice(types),
+            created_at=now
+        )
+        artwork.id = artwork_id
+        artworks.append(artwork)
+    return artworks
+
+
+def measure(fn, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Масштабирование параллельного просмотра")
+    parser.add_argument('--size', type=int, default=200000, help="Количество экспонатов")
+    parser.add_argument('--workers', type=int, nargs='*', help="Список количеств процессов")
+    parser.add_argument('--repeat', type=int, default=3, help="Количество повторов (берется лучшее)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    cpu_count = os.cpu_count() or 1
+    worker_counts = args.workers or sorted({1, 2, 4, 8, cpu_count} & set(range(1, cpu_count + 1)))
+
+    print(f"Генерация {args.size} экспонатов...")
+    artworks = generate_artworks(args.size, args.seed)
+    specification = (ArtworkDescriptionContainsSpecification('storm light')
+                     | ArtworkByArtistSpecification('Artist 7'))
+
+    predicate = specification.compile()
+    expected = [artwork for artwork in artworks if predicate(artwork)]
+    sequential = measure(lambda: [artwork for artwork in artworks if predicate(artwork)], args.repeat)
+    print(f"Найдено: {len(expected)}")
+    print(f"{'процессы':>10} {'загрузка, с':>12} {'запрос, с':>10} {'ускорение':>10}")
+    print(f"{'послед.':>10} {'-':>12} {sequential:>10.3f} {1.0:>10.2f}")
+
+    for workers in worker_counts:
+        scanner = ParallelScanner(Artwork.from_dict, workers=workers, min_parallel_size=0)
+        try:
+            started = time.perf_counter()
+            scanner.on_reload(artworks)
+            # Первый запрос дожидается загрузки шардов
+            result = scanner.find(specification)
+            load_time = time.perf_counter() - started
+            if result != expected:
+                raise RuntimeError(f"Результат для {workers} процессов не совпадает с последовательным")
+            elapsed = measure(lambda: scanner.find(specification), args.repeat)
+            print(f"{workers:>10} {load_time:>12.3f} {elapsed:>10.3f} {sequential / elapsed:>10.2f}")
+        finally:
+            scanner.close()
+
+
+if __name__ == '__main__':
+    main()
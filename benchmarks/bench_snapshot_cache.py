@@ -0,0 +1,79 @@
+"""
+Бенчмарк кэша снимков коллекций.
+Сравнивает холодный запуск (разбор файлов коллекций, восстановление сущностей и
+колоночного хранилища) с теплым (загрузка снимков) так же, как репозитории
+создаются при старте приложения, и проверяет, что коллекции совпадают.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_snapshot_cache.py --size 100000
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT_DIR, os.path.join(ROOT_DIR, 'art_gallery')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from art_gallery.domain.codecs import ARTWORK_CODEC, USER_CODEC, EXHIBITION_CODEC
+from art_gallery.repository.implementations.file.artwork_repository import ArtworkFileRepository
+from art_gallery.repository.implementations.file.user_repository import UserFileRepository
+from art_gallery.repository.implementations.file.exhibition_repository import ExhibitionFileRepository
+from art_gallery.repository.snapshot.snapshot_cache import SnapshotCache
+from bench_serialization_formats import FORMATS, generate_collections, measure, normalize
+
+REPOSITORIES = {
+    'artworks': (ArtworkFileRepository, ARTWORK_CODEC, {'vectorized': True}),
+    'users': (UserFileRepository, USER_CODEC, {}),
+    'exhibitions': (ExhibitionFileRepository, EXHIBITION_CODEC, {})
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Холодный и теплый запуск с кэшем снимков")
+    parser.add_argument('--size', type=int, default=100000, help="Количество экспонатов "
+                                                                  "(пользователей - в 10 раз меньше, выставок - в 100)")
+    parser.add_argument('--formats', nargs='*', default=['json', 'binary'], choices=list(FORMATS),
+                        help="Форматы файлов коллекций")
+    parser.add_argument('--repeat', type=int, default=3, help="Количество повторов (берется лучшее)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"Генерация данных ({args.size} экспонатов)...")
+    collections = generate_collections(args.size, args.seed)
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = SnapshotCache(os.path.join(directory, '.snapshots'))
+        for format_name in args.formats:
+            serializer_class, deserializer_class = FORMATS[format_name]
+            serializer, deserializer = serializer_class(), deserializer_class()
+            print(f"\n=== {format_name.upper()} ===")
+            print(f"{'коллекция':>12} {'записей':>9} {'холодный, с':>12} {'теплый, с':>10} {'ускорение':>10}")
+            for name, (entities, _) in collections.items():
+                repository_class, codec, options = REPOSITORIES[name]
+                filepath = os.path.join(directory, f"{name}.{format_name}")
+                with open(filepath, 'wb') as file:
+                    serializer.serialize_to_stream((codec.encode(entity) for entity in entities), file)
+
+                def cold():
+                    return repository_class(filepath, serializer, deserializer, trusted_load=True, **options)
+
+                def warm():
+                    return repository_class(filepath, serializer, deserializer, trusted_load=True,
+                                            snapshot_cache=cache, **options)
+
+                warm().save_snapshot()
+                expected = [normalize(entity.to_dict()) for entity in cold().get_all()]
+                if [normalize(entity.to_dict()) for entity in warm().get_all()] != expected:
+                    raise RuntimeError(f"Снимок {name} не совпадает с файлом {format_name}")
+
+                cold_time = measure(cold, args.repeat)
+                warm_time = measure(warm, args.repeat)
+                print(f"{name:>12} {len(entities):>9} {cold_time:>12.3f} {warm_time:>10.3f} "
+                      f"{cold_time / warm_time:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+"""
+Реестр плагинов сериализации.
+Встроенные форматы загружаются без обращения к метаданным пакетов (и без установки
+пакета - при запуске из исходников). Точки входа групп gallery.serialization и
+gallery.deserialization читаются через importlib.metadata один раз за процесс и только
+когда нужен список форматов или запрошен невстроенный формат; модуль плагина
+импортируется при первом обращении к формату. Встроенные форматы точками входа не
+переопределяются.
+"""
+import importlib
+from typing import Any, Dict, List, Optional, Tuple
+
+# Группы точек входа плагинов
+SERIALIZATION_GROUP = 'gallery.serialization'
+DESERIALIZATION_GROUP = 'gallery.deserialization'
+
+# Встроенные плагины (совпадают с точками входа в setup.py)
+BUILTIN_PLUGINS: Dict[str, Dict[str, str]] = {
+    SERIALIZATION_GROUP: {
+        'json': 'serialization.implementations.json.json_serializer:JsonSerializer',
+        'xml': 'serialization.implementations.xml.xml_serializer:XmlSerializer',
+        'binary': 'serialization.implementations.binary.binary_serializer:BinarySerializer',
+    },
+    DESERIALIZATION_GROUP: {
+        'json': 'serialization.implementations.json.json_deserializer:JsonDeserializer',
+        'xml': 'serialization.implementations.xml.xml_deserializer:XmlDeserializer',
+        'binary': 'serialization.implementations.binary.binary_deserializer:BinaryDeserializer',
+    },
+}
+
+
+def _installed_entry_points(group: str, entry_points: Any) -> List[Any]:
+    if hasattr(entry_points, 'select'):
+        return list(entry_points.select(group=group))
+    # Python 3.8/3.9: словарь {группа: точки входа}
+    return list(entry_points.get(group, ()))
+
+
+def _load_object(value: str) -> Any:
+    """Импортирует объект по ссылке вида 'модуль:атрибут'"""
+    module_name, _, attribute = value.partition(':')
+    obj = importlib.import_module(module_name)
+    for name in attribute.split('.') if attribute else ():
+        obj = getattr(obj, name)
+    return obj
+
+
+class PluginRegistry:
+    """Кэш точек входа и классов плагинов сериализации"""
+
+    _entry_points: Dict[str, Dict[str, str]] = {}
+    _classes: Dict[Tuple[str, str], type] = {}
+
+    @classmethod
+    def entry_points(cls, group: str) -> Dict[str, str]:
+        """
+        Возвращает плагины группы (без импорта плагинов)
+
+        Args:
+            group (str): Группа точек входа
+
+        Returns:
+            Dict[str, str]: Ссылки 'модуль:класс' по имени формата
+        """
+        if not cls._entry_points:
+            cls._discover()
+        return cls._entry_points.get(group, {})
+
+    @classmethod
+    def _discover(cls) -> None:
+        # importlib.metadata импортируется только здесь: его загрузка и просмотр
+        # метаданных установленных пакетов заметно удлиняют запуск
+        from importlib import metadata
+        installed = metadata.entry_points()
+        for group in (SERIALIZATION_GROUP, DESERIALIZATION_GROUP):
+            discovered = {entry_point.name: entry_point.value
+                          for entry_point in _installed_entry_points(group, installed)}
+            discovered.update(BUILTIN_PLUGINS.get(group, {}))
+            cls._entry_points[group] = discovered
+
+    @classmethod
+    def names(cls, group: str) -> List[str]:
+        """
+        Возвращает имена форматов группы
+
+        Args:
+            group (str): Группа точек входа
+
+        Returns:
+            List[str]: Имена форматов
+        """
+        return list(cls.entry_points(group))
+
+    @classmethod
+    def get_entry_point(cls, group: str, name: str) -> Optional[str]:
+        """Возвращает ссылку 'модуль:класс' формата или None, если формат не зарегистрирован"""
+        builtin = BUILTIN_PLUGINS.get(group, {}).get(name)
+        if builtin is not None:
+            return builtin
+        return cls.entry_points(group).get(name)
+
+    @classmethod
+    def load(cls, group: str, name: str) -> type:
+        """
+        Импортирует класс плагина (один раз за процесс)
+
+        Args:
+            group (str): Группа точек входа
+            name (str): Имя формата
+
+        Returns:
+            type: Класс плагина
+
+        Raises:
+            ValueError: Если формат не зарегистрирован в группе
+        """
+        key = (group, name)
+        if key not in cls._classes:
+            reference = cls.get_entry_point(group, name)
+            if reference is None:
+                raise ValueError(f"Формат {name} не зарегистрирован в группе {group}. "
+                                 f"Доступные: {cls.names(group)}")
+            cls._classes[key] = _load_object(reference)
+        return cls._classes[key]
+
+    @classmethod
+    def reset(cls) -> None:
+        """Сбрасывает кэш: точки входа будут прочитаны заново при следующем обращении"""
+        cls._entry_points.clear()
+        cls._classes.clear()
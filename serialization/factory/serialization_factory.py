@@ -1,25 +1,21 @@
 from enum import Enum, auto
-from typing import Type, Dict, Tuple
 
 from serialization.interfaces.ISerializer import ISerializer
 from serialization.interfaces.IDeserializer import IDeserializer
-from serialization.implementations.json.json_serializer import JsonSerializer
-from serialization.implementations.json.json_deserializer import JsonDeserializer
-from serialization.implementations.xml.xml_serializer import XmlSerializer
-from serialization.implementations.xml.xml_deserializer import XmlDeserializer
+from serialization.factory.plugin_registry import PluginRegistry, SERIALIZATION_GROUP, DESERIALIZATION_GROUP
 
 class SerializationFormat(Enum):
     """Поддерживаемые форматы сериализации"""
     JSON = auto()
     XML = auto()
+    BINARY = auto()
 
 class SerializationFactory:
-    """Фабрика для создания сериализаторов и десериализаторов"""
-    
-    _formats: Dict[SerializationFormat, Tuple[Type[ISerializer], Type[IDeserializer]]] = {
-        SerializationFormat.JSON: (JsonSerializer, JsonDeserializer),
-        SerializationFormat.XML: (XmlSerializer, XmlDeserializer)
-    }
+    """
+    Фабрика для создания сериализаторов и десериализаторов.
+    Классы берутся из общего реестра плагинов (см. PluginRegistry), модуль
+    формата импортируется при первом создании его сериализатора.
+    """
     
     @classmethod
     def create_serializer(cls, format: SerializationFormat) -> ISerializer:
@@ -35,10 +31,10 @@ class SerializationFactory:
         Raises:
             ValueError: Если формат не поддерживается
         """
-        if format not in cls._formats:
+        if not isinstance(format, SerializationFormat):
             raise ValueError(f"Неподдерживаемый формат сериализации: {format}")
             
-        serializer_class = cls._formats[format][0]
+        serializer_class = PluginRegistry.load(SERIALIZATION_GROUP, format.name.lower())
         return serializer_class()
         
     @classmethod
@@ -55,10 +51,10 @@ class SerializationFactory:
         Raises:
             ValueError: Если формат не поддерживается
         """
-        if format not in cls._formats:
+        if not isinstance(format, SerializationFormat):
             raise ValueError(f"Неподдерживаемый формат десериализации: {format}")
             
-        deserializer_class = cls._formats[format][1]
+        deserializer_class = PluginRegistry.load(DESERIALIZATION_GROUP, format.name.lower())
         return deserializer_class()
 
     @classmethod
@@ -0,0 +1,205 @@
+import base64
+import os
+from typing import Any, BinaryIO, Iterator, Tuple
+from serialization.interfaces.IDeserializer import IDeserializer
+from serialization.serialization_exceptions import DeserializationError
+from serialization.implementations.binary.binary_codec import (
+    MAGIC,
+    DOCUMENT_LIST,
+    DOCUMENT_VALUE,
+    BinaryFormatError,
+    RecordDecoder
+)
+
+# Размер блока потокового чтения
+READ_BLOCK_SIZE = 256 * 1024
+# Максимальная длина varint длины записи (64 бита)
+_MAX_VARINT_SIZE = 10
+
+class BinaryDeserializer(IDeserializer):
+    """Реализация десериализатора для компактного бинарного формата"""
+
+    def deserialize(self, data: str) -> Any:
+        """
+        Десериализует бинарный документ, представленный строкой base64
+
+        Args:
+            data (str): Документ в base64
+
+        Returns:
+            Any: Десериализованные данные
+
+        Raises:
+            DeserializationError: Если возникла ошибка при десериализации
+        """
+        try:
+            raw = base64.b64decode(data, validate=True)
+        except Exception as e:
+            raise DeserializationError(f"Ошибка бинарной десериализации: некорректный base64: {str(e)}")
+        return self.deserialize_bytes(raw)
+
+    def deserialize_bytes(self, data: bytes) -> Any:
+        """
+        Десериализует бинарный документ
+
+        Args:
+            data (bytes): Бинарный документ
+
+        Returns:
+            Any: Список записей или одно значение
+
+        Raises:
+            DeserializationError: Если возникла ошибка при десериализации
+        """
+        if not data:
+            return []
+        try:
+            kind = self._read_header(data[:len(MAGIC) + 1])
+            decoder = RecordDecoder()
+            if kind == DOCUMENT_VALUE:
+                decoder.reset(data, len(MAGIC) + 1)
+                value = decoder.read_value()
+                if decoder.position != len(data):
+                    raise BinaryFormatError("Лишние байты после документа")
+                return value
+
+            records = []
+            decoder.reset(data, len(MAGIC) + 1)
+            while True:
+                size = decoder.read_varint()
+                if size == 0:
+                    break
+                start = decoder.position
+                if start + size > len(data):
+                    raise BinaryFormatError("Неожиданный конец документа")
+                records.append(decoder.decode_record(data, start, start + size))
+                decoder.reset(data, start + size)
+            if decoder.position != len(data):
+                raise BinaryFormatError("Лишние байты после документа")
+            return records
+        except BinaryFormatError as e:
+            raise DeserializationError(f"Ошибка формата бинарного документа: {str(e)}")
+        except Exception as e:
+            raise DeserializationError(f"Ошибка бинарной десериализации: {str(e)}")
+
+    def deserialize_from_file(self, filepath: str) -> Any:
+        """
+        Читает и десериализует данные из бинарного файла
+
+        Args:
+            filepath (str): Путь к файлу для чтения
+
+        Returns:
+            Any: Десериализованные данные (пустой список, если файл не существует или пуст)
+
+        Raises:
+            DeserializationError: Если возникла ошибка при чтении или десериализации
+        """
+        if not os.path.exists(filepath) or os.path.getsize(filepath) == 0:
+            return []
+        try:
+            with open(filepath, 'rb') as file:
+                data = file.read()
+        except Exception as e:
+            raise DeserializationError(f"Ошибка чтения из бинарного файла {filepath}: {str(e)}")
+        return self.deserialize_bytes(data)
+
+    def iter_deserialize_from_file(self, filepath: str) -> Iterator[Any]:
+        """
+        Потоково читает бинарный файл: записи читаются по длине и декодируются по одной
+
+        Args:
+            filepath (str): Путь к файлу для чтения
+
+        Returns:
+            Iterator[Any]: Записи списка (ничего, если файл не существует или пуст)
+
+        Raises:
+            DeserializationError: Если возникла ошибка при чтении или десериализации
+        """
+        if not os.path.exists(filepath) or os.path.getsize(filepath) == 0:
+            return
+        try:
+            with open(filepath, 'rb') as file:
+                yield from self._iter_items(file)
+        except DeserializationError:
+            raise
+        except BinaryFormatError as e:
+            raise DeserializationError(f"Ошибка формата бинарного файла {filepath}: {str(e)}")
+        except Exception as e:
+            raise DeserializationError(f"Ошибка чтения из бинарного файла {filepath}: {str(e)}")
+
+    def iter_deserialize_stream(self, stream: BinaryIO) -> Iterator[Any]:
+        """
+        Потоково читает бинарный документ из потока: записи читаются по длине и декодируются по одной
+
+        Args:
+            stream (BinaryIO): Поток для чтения
+
+        Returns:
+            Iterator[Any]: Записи списка (ничего, если поток пуст)
+
+        Raises:
+            DeserializationError: Если возникла ошибка при чтении или десериализации
+        """
+        try:
+            yield from self._iter_items(stream)
+        except DeserializationError:
+            raise
+        except BinaryFormatError as e:
+            raise DeserializationError(f"Ошибка формата бинарного документа: {str(e)}")
+        except Exception as e:
+            raise DeserializationError(f"Ошибка чтения бинарного документа из потока: {str(e)}")
+
+    def _iter_items(self, stream: BinaryIO) -> Iterator[Any]:
+        header = stream.read(len(MAGIC) + 1)
+        if not header:
+            return
+        kind = self._read_header(header)
+        if kind == DOCUMENT_VALUE:
+            yield self.deserialize_bytes(header + stream.read())
+            return
+        # Поток читается блоками, записи декодируются прямо из буфера
+        decoder = RecordDecoder()
+        buffer = b''
+        pos = 0
+        while True:
+            if len(buffer) - pos < _MAX_VARINT_SIZE:
+                buffer = buffer[pos:] + stream.read(READ_BLOCK_SIZE)
+                pos = 0
+            size, pos = self._read_buffered_varint(buffer, pos)
+            if size == 0:
+                break
+            end = pos + size
+            if end > len(buffer):
+                buffer = buffer[pos:] + stream.read(max(READ_BLOCK_SIZE, end - len(buffer)))
+                pos, end = 0, size
+                if end > len(buffer):
+                    raise BinaryFormatError("Неожиданный конец файла")
+            yield decoder.decode_record(buffer, pos, end)
+            pos = end
+        if pos < len(buffer) or stream.read(1):
+            raise BinaryFormatError("Лишние байты после документа")
+
+    @staticmethod
+    def _read_header(header: bytes) -> int:
+        if len(header) != len(MAGIC) + 1 or not header.startswith(MAGIC):
+            raise BinaryFormatError("Неизвестная сигнатура документа")
+        kind = header[len(MAGIC)]
+        if kind not in (DOCUMENT_LIST, DOCUMENT_VALUE):
+            raise BinaryFormatError(f"Неизвестный вид документа {kind}")
+        return kind
+
+    @staticmethod
+    def _read_buffered_varint(buffer: bytes, pos: int) -> Tuple[int, int]:
+        result = 0
+        shift = 0
+        while True:
+            if pos >= len(buffer):
+                raise BinaryFormatError("Неожиданный конец файла")
+            byte = buffer[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result, pos
+            shift += 7
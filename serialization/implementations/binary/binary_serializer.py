@@ -0,0 +1,111 @@
+import base64
+from typing import Any, Iterable, Iterator, Optional
+from serialization.interfaces.ISerializer import ISerializer
+from serialization.serialization_exceptions import SerializationError
+from serialization.implementations.binary.binary_codec import (
+    MAGIC,
+    DOCUMENT_LIST,
+    DOCUMENT_VALUE,
+    RecordEncoder,
+    encode_varint
+)
+
+class BinarySerializer(ISerializer):
+    """
+    Реализация сериализатора для компактного бинарного формата.
+    Строковый API (serialize) возвращает документ в base64, файлы и хранилище
+    используют байтовые методы.
+    """
+
+    file_extension = 'binary'
+
+    def serialize(self, data: Any) -> str:
+        """
+        Сериализует данные в бинарный документ, представленный строкой base64
+
+        Args:
+            data: Данные для сериализации
+
+        Returns:
+            str: Документ в base64
+
+        Raises:
+            SerializationError: Если возникла ошибка при сериализации
+        """
+        return base64.b64encode(self.serialize_bytes(data)).decode('ascii')
+
+    def serialize_bytes(self, data: Any) -> bytes:
+        """
+        Сериализует данные в бинарный документ
+
+        Args:
+            data: Данные для сериализации
+
+        Returns:
+            bytes: Бинарный документ
+
+        Raises:
+            SerializationError: Если возникла ошибка при сериализации
+        """
+        if isinstance(data, list):
+            return b''.join(self.serialize_bytes_iter(data))
+        try:
+            out = bytearray(MAGIC)
+            out.append(DOCUMENT_VALUE)
+            RecordEncoder().write_value(out, data)
+            return bytes(out)
+        except Exception as e:
+            raise SerializationError(f"Ошибка бинарной сериализации: {str(e)}")
+
+    def serialize_bytes_iter(self, records: Iterable[Any]) -> Iterator[bytes]:
+        """
+        Сериализует записи по одной: каждая запись предваряется своей длиной
+
+        Args:
+            records: Записи списка (может быть генератором)
+
+        Returns:
+            Iterator[bytes]: Заголовок, записи и завершающий маркер
+
+        Raises:
+            SerializationError: Если возникла ошибка при сериализации
+        """
+        try:
+            encoder = RecordEncoder()
+            yield MAGIC + bytes((DOCUMENT_LIST,))
+            for record in records:
+                payload = encoder.encode_record(record)
+                yield encode_varint(len(payload)) + payload
+            yield encode_varint(0)
+        except Exception as e:
+            raise SerializationError(f"Ошибка бинарной сериализации: {str(e)}")
+
+    def serialize_iter(self, records: Iterable[Any]) -> Iterator[str]:
+        """
+        Строковый вариант потоковой сериализации (base64 всего документа).
+        Для потоковой записи используйте serialize_bytes_iter или serialize_to_stream.
+        """
+        yield self.serialize(list(records))
+
+    def serialize_to_file(self, data: Any, filepath: str, format: Optional[str] = None) -> None:
+        """
+        Сериализует данные и записывает их в бинарный файл
+
+        Args:
+            data: Данные для сериализации
+            filepath (str): Путь к файлу для сохранения
+            format (str, optional): Игнорируется для бинарного сериализатора
+
+        Raises:
+            SerializationError: Если возникла ошибка при сериализации или записи
+        """
+        try:
+            with open(filepath, 'wb') as file:
+                if isinstance(data, list):
+                    self.serialize_to_stream(data, file)
+                else:
+                    file.write(self.serialize_bytes(data))
+        except SerializationError:
+            raise
+        except Exception as e:
+            raise SerializationError(f"Ошибка записи в бинарный файл: {str(e)}")
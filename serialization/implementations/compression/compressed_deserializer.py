@@ -0,0 +1,161 @@
+import base64
+import io
+import os
+from typing import Any, BinaryIO, Iterator, Optional
+from serialization.interfaces.IDeserializer import IDeserializer
+from serialization.serialization_exceptions import DeserializationError
+from serialization.implementations.compression.compression_codecs import CompressionCodec, detect_compression
+
+# Длина сигнатуры, достаточная для распознавания любого алгоритма
+_HEADER_SIZE = 6
+
+class CompressedDeserializer(IDeserializer):
+    """
+    Обертка над десериализатором, распаковывающая сжатые данные.
+    Алгоритм определяется по сигнатуре данных, несжатые данные передаются
+    десериализатору формата без изменений (данные, сохраненные до включения
+    сжатия, читаются так же). Файлы и потоки распаковываются потоково.
+    """
+
+    def __init__(self, deserializer: IDeserializer):
+        """
+        Args:
+            deserializer (IDeserializer): Десериализатор формата данных
+        """
+        self._deserializer = deserializer
+
+    @property
+    def inner(self) -> IDeserializer:
+        """Десериализатор формата данных"""
+        return self._deserializer
+
+    def deserialize(self, data: str) -> Any:
+        """
+        Десериализует сжатый документ, представленный строкой base64
+        (строки без сжатия передаются десериализатору формата)
+
+        Args:
+            data (str): Документ в base64 или несжатый документ
+
+        Returns:
+            Any: Десериализованные данные
+
+        Raises:
+            DeserializationError: Если возникла ошибка при распаковке или десериализации
+        """
+        try:
+            raw = base64.b64decode(data, validate=True)
+        except Exception:
+            raw = None
+        if raw is None or self._detect(raw) is None:
+            return self._deserializer.deserialize(data)
+        return self.deserialize_bytes(raw)
+
+    def deserialize_bytes(self, data: bytes) -> Any:
+        """
+        Распаковывает и десериализует документ
+
+        Args:
+            data (bytes): Сжатый или несжатый документ
+
+        Returns:
+            Any: Десериализованные данные
+
+        Raises:
+            DeserializationError: Если возникла ошибка при распаковке или десериализации
+        """
+        codec = self._detect(data)
+        if codec is not None:
+            try:
+                data = codec.decompress(data)
+            except Exception as e:
+                raise DeserializationError(f"Ошибка распаковки {codec.name}: {str(e)}")
+        return self._deserializer.deserialize_bytes(data)
+
+    def deserialize_from_file(self, filepath: str) -> Any:
+        """
+        Читает, распаковывает и десериализует данные из файла
+
+        Args:
+            filepath (str): Путь к файлу для чтения
+
+        Returns:
+            Any: Десериализованные данные (пустой список, если файл не существует или пуст)
+
+        Raises:
+            DeserializationError: Если возникла ошибка при чтении или десериализации
+        """
+        if not os.path.exists(filepath) or os.path.getsize(filepath) == 0:
+            return []
+        try:
+            with open(filepath, 'rb') as file:
+                data = file.read()
+        except Exception as e:
+            raise DeserializationError(f"Ошибка чтения из сжатого файла {filepath}: {str(e)}")
+        return self.deserialize_bytes(data)
+
+    def iter_deserialize_from_file(self, filepath: str) -> Iterator[Any]:
+        """
+        Потоково читает файл: данные распаковываются по частям и передаются
+        потоковому чтению десериализатора формата
+
+        Args:
+            filepath (str): Путь к файлу для чтения
+
+        Returns:
+            Iterator[Any]: Записи списка (ничего, если файл не существует или пуст)
+
+        Raises:
+            DeserializationError: Если возникла ошибка при чтении или десериализации
+        """
+        if not os.path.exists(filepath) or os.path.getsize(filepath) == 0:
+            return
+        try:
+            with open(filepath, 'rb') as file:
+                yield from self._iter_items(file)
+        except DeserializationError:
+            raise
+        except Exception as e:
+            raise DeserializationError(f"Ошибка чтения из сжатого файла {filepath}: {str(e)}")
+
+    def iter_deserialize_stream(self, stream: BinaryIO) -> Iterator[Any]:
+        """
+        Потоково читает сжатый или несжатый документ из потока
+
+        Args:
+            stream (BinaryIO): Поток для чтения
+
+        Returns:
+            Iterator[Any]: Записи списка (ничего, если поток пуст)
+
+        Raises:
+            DeserializationError: Если возникла ошибка при чтении или десериализации
+        """
+        try:
+            yield from self._iter_items(stream)
+        except DeserializationError:
+            raise
+        except Exception as e:
+            raise DeserializationError(f"Ошибка чтения сжатого документа из потока: {str(e)}")
+
+    def _iter_items(self, stream: BinaryIO) -> Iterator[Any]:
+        if stream.seekable():
+            start = stream.tell()
+            header = stream.read(_HEADER_SIZE)
+            stream.seek(start)
+        else:
+            stream = io.BufferedReader(stream)
+            header = stream.peek(_HEADER_SIZE)[:_HEADER_SIZE]
+        codec = self._detect(header)
+        if codec is None:
+            yield from self._deserializer.iter_deserialize_stream(stream)
+            return
+        with codec.open_reader(stream) as reader:
+            yield from self._deserializer.iter_deserialize_stream(reader)
+
+    @staticmethod
+    def _detect(header: bytes) -> Optional[CompressionCodec]:
+        try:
+            return detect_compression(header[:_HEADER_SIZE])
+        except ValueError as e:
+            raise DeserializationError(str(e))
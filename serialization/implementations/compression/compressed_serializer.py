@@ -0,0 +1,143 @@
+import base64
+from typing import Any, BinaryIO, Iterable, Iterator, Optional
+from serialization.interfaces.ISerializer import ISerializer
+from serialization.serialization_exceptions import SerializationError
+from serialization.implementations.compression.compression_codecs import get_compression
+
+class CompressedSerializer(ISerializer):
+    """
+    Обертка над сериализатором, сжимающая его вывод (gzip, lzma или zstd).
+    Записи сжимаются потоково по мере сериализации; строковый API (serialize)
+    возвращает сжатый документ в base64.
+    """
+
+    def __init__(self, serializer: ISerializer, compression: str, level: Optional[int] = None):
+        """
+        Args:
+            serializer (ISerializer): Сериализатор формата данных
+            compression (str): Алгоритм сжатия ('gzip', 'lzma', 'zstd')
+            level (int, optional): Уровень сжатия
+
+        Raises:
+            ValueError: Если алгоритм сжатия недоступен
+        """
+        self._serializer = serializer
+        self._codec = get_compression(compression, level)
+        inner_extension = serializer.file_extension or 'dat'
+        self.file_extension = inner_extension + self._codec.suffix
+        self.content_encoding = self._codec.content_encoding
+
+    @property
+    def inner(self) -> ISerializer:
+        """Сериализатор формата данных"""
+        return self._serializer
+
+    @property
+    def compression(self) -> str:
+        """Имя алгоритма сжатия"""
+        return self._codec.name
+
+    def serialize(self, data: Any) -> str:
+        """
+        Сериализует и сжимает данные
+
+        Args:
+            data: Данные для сериализации
+
+        Returns:
+            str: Сжатый документ в base64
+
+        Raises:
+            SerializationError: Если возникла ошибка при сериализации
+        """
+        return base64.b64encode(self.serialize_bytes(data)).decode('ascii')
+
+    def serialize_bytes(self, data: Any) -> bytes:
+        """
+        Сериализует и сжимает данные
+
+        Args:
+            data: Данные для сериализации
+
+        Returns:
+            bytes: Сжатый документ
+
+        Raises:
+            SerializationError: Если возникла ошибка при сериализации или сжатии
+        """
+        content = self._serializer.serialize_bytes(data)
+        try:
+            return self._codec.compress(content)
+        except Exception as e:
+            raise SerializationError(f"Ошибка сжатия {self._codec.name}: {str(e)}")
+
+    def serialize_iter(self, records: Iterable[Any]) -> Iterator[str]:
+        """
+        Строковый вариант потоковой сериализации (base64 всего сжатого документа).
+        Для потоковой записи используйте serialize_bytes_iter или serialize_to_stream.
+        """
+        yield self.serialize(list(records))
+
+    def serialize_bytes_iter(self, records: Iterable[Any]) -> Iterator[bytes]:
+        """
+        Сериализует записи и сжимает фрагменты по мере готовности
+
+        Args:
+            records: Записи списка (может быть генератором)
+
+        Returns:
+            Iterator[bytes]: Фрагменты сжатого документа
+
+        Raises:
+            SerializationError: Если возникла ошибка при сериализации или сжатии
+        """
+        chunks = self._serializer.serialize_bytes_iter(records)
+        try:
+            yield from self._codec.compress_iter(chunks)
+        except SerializationError:
+            raise
+        except Exception as e:
+            raise SerializationError(f"Ошибка сжатия {self._codec.name}: {str(e)}")
+
+    def serialize_to_stream(self, records: Iterable[Any], stream: BinaryIO) -> None:
+        """
+        Сериализует записи сериализатором формата (включая его обрамление документа,
+        например XML декларацию) и пишет их в поток в сжатом виде
+
+        Args:
+            records: Записи списка (может быть генератором)
+            stream: Поток для записи
+
+        Raises:
+            SerializationError: Если возникла ошибка при сериализации или сжатии
+        """
+        try:
+            with self._codec.open_writer(stream) as writer:
+                self._serializer.serialize_to_stream(records, writer)
+        except SerializationError:
+            raise
+        except Exception as e:
+            raise SerializationError(f"Ошибка сжатия {self._codec.name}: {str(e)}")
+
+    def serialize_to_file(self, data: Any, filepath: str, format: Optional[str] = None) -> None:
+        """
+        Сериализует данные и записывает их в файл в сжатом виде
+
+        Args:
+            data: Данные для сериализации
+            filepath (str): Путь к файлу для сохранения
+            format (str, optional): Игнорируется
+
+        Raises:
+            SerializationError: Если возникла ошибка при сериализации или записи
+        """
+        try:
+            with open(filepath, 'wb') as file:
+                if isinstance(data, list):
+                    self.serialize_to_stream(data, file)
+                else:
+                    file.write(self.serialize_bytes(data))
+        except SerializationError:
+            raise
+        except Exception as e:
+            raise SerializationError(f"Ошибка записи в сжатый файл: {str(e)}")
@@ -0,0 +1,268 @@
+"""
+Алгоритмы сжатия для обертки сериализации: gzip, lzma (xz) и zstd.
+gzip и lzma входят в стандартную библиотеку, zstd доступен при установленном
+пакете zstandard. Все алгоритмы работают потоково: сжатие по частям и чтение
+распаковываемого файла без загрузки его в память целиком.
+"""
+import gzip
+import lzma
+import os
+import shutil
+import zlib
+from abc import ABC, abstractmethod
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import zstandard
+except ImportError:  # zstandard - необязательная зависимость
+    zstandard = None
+
+# Без сжатия
+COMPRESSION_NONE = 'none'
+
+
+class CompressionCodec(ABC):
+    """Базовый класс алгоритма сжатия"""
+
+    # Имя алгоритма в конфигурации
+    name: str = ''
+    # Суффикс имени файла/объекта
+    suffix: str = ''
+    # Значение заголовка Content-Encoding
+    content_encoding: str = ''
+    # Сигнатура сжатых данных
+    magic: bytes = b''
+
+    def __init__(self, level: Optional[int] = None):
+        self.level = level
+
+    @abstractmethod
+    def compressor(self):
+        """Объект потокового сжатия с методами compress(bytes) и flush()"""
+        pass
+
+    @abstractmethod
+    def decompressor(self):
+        """Объект потоковой распаковки с методом decompress(bytes)"""
+        pass
+
+    @abstractmethod
+    def open_reader(self, stream: BinaryIO) -> BinaryIO:
+        """Поток распакованных данных поверх сжатого потока (stream не закрывается)"""
+        pass
+
+    @abstractmethod
+    def open_writer(self, stream: BinaryIO) -> BinaryIO:
+        """Поток, сжимающий записываемые данные в stream (stream не закрывается)"""
+        pass
+
+    def compress(self, data: bytes) -> bytes:
+        compressor = self.compressor()
+        return compressor.compress(data) + compressor.flush()
+
+    def decompress(self, data: bytes) -> bytes:
+        return self.decompressor().decompress(data)
+
+    def compress_iter(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Сжимает последовательность частей, не собирая ее целиком"""
+        compressor = self.compressor()
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        tail = compressor.flush()
+        if tail:
+            yield tail
+
+
+class GzipCodec(CompressionCodec):
+    name = 'gzip'
+    suffix = '.gz'
+    content_encoding = 'gzip'
+    magic = b'\x1f\x8b'
+
+    def compressor(self):
+        # wbits=31 - формат gzip
+        return zlib.compressobj(6 if self.level is None else self.level, zlib.DEFLATED, 31)
+
+    def decompressor(self):
+        return zlib.decompressobj(31)
+
+    def open_reader(self, stream: BinaryIO) -> BinaryIO:
+        return gzip.GzipFile(fileobj=stream, mode='rb')
+
+    def open_writer(self, stream: BinaryIO) -> BinaryIO:
+        # Без имени файла и времени в заголовке: одинаковые данные дают одинаковый файл
+        return gzip.GzipFile(filename='', fileobj=stream, mode='wb', mtime=0,
+                             compresslevel=6 if self.level is None else self.level)
+
+
+class LzmaCodec(CompressionCodec):
+    name = 'lzma'
+    suffix = '.xz'
+    content_encoding = 'xz'
+    magic = b'\xfd7zXZ\x00'
+
+    def compressor(self):
+        return lzma.LZMACompressor(format=lzma.FORMAT_XZ, preset=self.level)
+
+    def decompressor(self):
+        return lzma.LZMADecompressor(format=lzma.FORMAT_XZ)
+
+    def open_reader(self, stream: BinaryIO) -> BinaryIO:
+        return lzma.LZMAFile(stream, mode='rb', format=lzma.FORMAT_XZ)
+
+    def open_writer(self, stream: BinaryIO) -> BinaryIO:
+        return lzma.LZMAFile(stream, mode='wb', format=lzma.FORMAT_XZ, preset=self.level)
+
+
+class ZstdCodec(CompressionCodec):
+    name = 'zstd'
+    suffix = '.zst'
+    content_encoding = 'zstd'
+    magic = b'\x28\xb5\x2f\xfd'
+
+    def _compressor_context(self):
+        return zstandard.ZstdCompressor(level=3 if self.level is None else self.level)
+
+    def compressor(self):
+        return self._compressor_context().compressobj()
+
+    def decompressor(self):
+        return zstandard.ZstdDecompressor().decompressobj()
+
+    def open_reader(self, stream: BinaryIO) -> BinaryIO:
+        return zstandard.ZstdDecompressor().stream_reader(stream, read_across_frames=True, closefd=False)
+
+    def open_writer(self, stream: BinaryIO) -> BinaryIO:
+        return self._compressor_context().stream_writer(stream, closefd=False)
+
+
+_CODECS: Dict[str, type] = {'gzip': GzipCodec, 'lzma': LzmaCodec}
+if zstandard is not None:
+    _CODECS['zstd'] = ZstdCodec
+
+# Все известные алгоритмы (для распознавания файлов по сигнатуре)
+_KNOWN_CODECS = (GzipCodec, LzmaCodec, ZstdCodec)
+
+# Суффиксы файлов всех известных алгоритмов
+SUPPORTED_SUFFIXES = tuple(codec_class.suffix for codec_class in _KNOWN_CODECS)
+
+
+def available_compressions() -> List[str]:
+    """
+    Возвращает имена доступных алгоритмов сжатия
+
+    Returns:
+        List[str]: Имена алгоритмов ('gzip', 'lzma' и 'zstd', если установлен zstandard)
+    """
+    return list(_CODECS)
+
+
+def get_compression(name: str, level: Optional[int] = None) -> CompressionCodec:
+    """
+    Возвращает алгоритм сжатия по имени
+
+    Args:
+        name (str): Имя алгоритма ('gzip', 'lzma', 'zstd')
+        level (int, optional): Уровень сжатия (по умолчанию - умеренный уровень алгоритма)
+
+    Returns:
+        CompressionCodec: Алгоритм сжатия
+
+    Raises:
+        ValueError: Если алгоритм неизвестен или его библиотека не установлена
+    """
+    if name == 'zstd' and zstandard is None:
+        raise ValueError("Для сжатия zstd требуется пакет zstandard (pip install zstandard)")
+    if name not in _CODECS:
+        raise ValueError(f"Неизвестный алгоритм сжатия: '{name}'. Доступны: {', '.join(_CODECS)}")
+    return _CODECS[name](level)
+
+
+def compression_suffix(name: str) -> str:
+    """
+    Возвращает суффикс имени файла/объекта для алгоритма сжатия
+
+    Args:
+        name (str): Имя алгоритма ('none', 'gzip', 'lzma', 'zstd')
+
+    Returns:
+        str: Суффикс ('.gz', '.xz', '.zst') или пустая строка без сжатия
+    """
+    if name == COMPRESSION_NONE:
+        return ''
+    return get_compression(name).suffix
+
+
+def find_latest_variant(base_path: str) -> Optional[str]:
+    """
+    Находит последний измененный непустой вариант файла: несжатый или с любым сжатием
+
+    Args:
+        base_path (str): Путь к файлу без суффикса сжатия
+
+    Returns:
+        Optional[str]: Путь к варианту или None, если непустых вариантов нет
+    """
+    latest_path, latest_mtime = None, None
+    for suffix in ('',) + SUPPORTED_SUFFIXES:
+        path = base_path + suffix
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        if stat.st_size > 0 and (latest_mtime is None or stat.st_mtime_ns > latest_mtime):
+            latest_path, latest_mtime = path, stat.st_mtime_ns
+    return latest_path
+
+
+def detect_compression(header: bytes) -> Optional[CompressionCodec]:
+    """
+    Определяет алгоритм сжатия по сигнатуре данных
+
+    Args:
+        header (bytes): Начало данных (не меньше 6 байт)
+
+    Returns:
+        Optional[CompressionCodec]: Алгоритм или None, если данные не сжаты
+
+    Raises:
+        ValueError: Если данные сжаты zstd, а пакет zstandard не установлен
+    """
+    for codec_class in _KNOWN_CODECS:
+        if header.startswith(codec_class.magic):
+            return get_compression(codec_class.name)
+    return None
+
+
+def recompress_file(source_path: str, target_path: str, compression: str) -> None:
+    """
+    Потоково перепаковывает файл с другим сжатием (алгоритм исходного файла
+    определяется по сигнатуре). Целевой файл заменяется атомарно.
+
+    Args:
+        source_path (str): Исходный файл (сжатый или несжатый)
+        target_path (str): Целевой файл
+        compression (str): Сжатие целевого файла ('none', 'gzip', 'lzma', 'zstd')
+
+    Raises:
+        ValueError: Если алгоритм сжатия недоступен
+        OSError: Если возникла ошибка чтения или записи
+    """
+    target_codec = None if compression == COMPRESSION_NONE else get_compression(compression)
+    temp_path = target_path + '.tmp'
+    try:
+        with open(source_path, 'rb') as source, open(temp_path, 'wb') as target:
+            source_codec = detect_compression(source.read(6))
+            source.seek(0)
+            reader = source_codec.open_reader(source) if source_codec else source
+            if target_codec is None:
+                shutil.copyfileobj(reader, target)
+            else:
+                with target_codec.open_writer(target) as writer:
+                    shutil.copyfileobj(reader, writer)
+        os.replace(temp_path, target_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
@@ -0,0 +1,246 @@
+"""
+Реализации JSON для плагина: orjson, ujson и стандартный модуль json.
+
+Ускоренные библиотеки необязательны и выбираются автоматически, если установлены.
+Вывод всех реализаций побайтно совпадает с json.dumps(data, indent=4, ensure_ascii=False):
+- ускоренная реализация используется только для значений, которые она гарантированно
+  записывает так же, как стандартный модуль (строки, bool, None, целые в 64-битном
+  диапазоне, списки и словари со строковыми ключами; для orjson также конечные
+  числа с плавающей точкой без экспоненты). Остальные значения, включая типы,
+  которые стандартный модуль не поддерживает, записываются стандартным модулем;
+- при импорте вывод реализации сверяется со стандартным на контрольном документе,
+  несовпадающая реализация не используется.
+
+Чтение принимает str и bytes. Документы, которые ускоренная реализация не принимает
+(NaN, целые вне 64-битного диапазона), читаются стандартным модулем, он же
+формирует сообщение об ошибке для некорректного JSON.
+"""
+import json
+import math
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # orjson - необязательная зависимость
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # ujson - необязательная зависимость
+    ujson = None
+
+_MIN_INT = -2 ** 63
+_MAX_INT = 2 ** 64 - 1
+
+# orjson поддерживает только отступ в 2 пробела, поэтому отступы удваиваются.
+# Переводы строк внутри JSON строк экранированы, поэтому строка вывода начинается
+# с отступа, а управляющий символ NUL в выводе не встречается и служит меткой
+# уже обработанных строк
+_MARK = b'\x00'
+
+
+def _double_indent(text: bytes, nested: bool) -> bytes:
+    """
+    Переводит вывод с отступом 2 пробела в отступ 4 пробела (nested - дополнительно
+    сдвигает все строки на уровень элемента верхнеуровневого массива)
+    """
+    depth = 0
+    while b'\n' + b'  ' * (depth + 1) in text:
+        depth += 1
+    # От глубоких уровней к мелким: префикс мелкого уровня не должен задеть глубокий
+    for level in range(depth, 0, -1):
+        text = text.replace(b'\n' + b'  ' * level, _MARK + b'    ' * level)
+    if nested:
+        text = text.replace(b'\n', b'\n    ')
+        return text.replace(_MARK, b'\n    ')
+    return text.replace(_MARK, b'\n')
+
+
+# Контрольный документ для сверки вывода ускоренной реализации со стандартной
+_PROBE = [
+    {
+        'id': 1,
+        'title': 'Звёздная ночь "1889"',
+        'year': -1889,
+        'image_path': None,
+        'is_active': True,
+        'artwork_ids': [],
+        'extra': {},
+        'nested': {'ids': [1, [2, {}], 18446744073709551615], 'ratio': 0.30000000000000004},
+        'text': 'a/b\\c\n\t\r\b\f\x1f\x7f \U0001F3A8'
+    },
+    []
+]
+
+
+def _is_portable(value: Any, allow_floats: bool) -> bool:
+    """Проверяет, что значение записывается ускоренной реализацией так же, как стандартной"""
+    value_type = type(value)
+    if value_type is str or value_type is bool or value is None:
+        return True
+    if value_type is int:
+        return _MIN_INT <= value <= _MAX_INT
+    if value_type is float:
+        return allow_floats and math.isfinite(value) and 'e' not in repr(value)
+    if value_type is dict:
+        for key, item in value.items():
+            if type(key) is not str or not _is_portable(item, allow_floats):
+                return False
+        return True
+    if value_type is list or value_type is tuple:
+        for item in value:
+            if not _is_portable(item, allow_floats):
+                return False
+        return True
+    return False
+
+
+class JsonBackend:
+    """Стандартный модуль json"""
+
+    name = 'json'
+
+    def dumps(self, data: Any) -> bytes:
+        """
+        Сериализует значение в JSON документ с отступом 4 пробела
+
+        Args:
+            data: Данные для сериализации
+
+        Returns:
+            bytes: JSON документ в UTF-8
+        """
+        return json.dumps(data, indent=4, ensure_ascii=False).encode('utf-8')
+
+    def dumps_element(self, data: Any) -> bytes:
+        """
+        Сериализует элемент верхнеуровневого массива: вложенные строки
+        сдвинуты на уровень массива
+
+        Args:
+            data: Элемент массива
+
+        Returns:
+            bytes: Фрагмент JSON документа в UTF-8
+        """
+        return json.dumps(data, indent=4, ensure_ascii=False).replace('\n', '\n    ').encode('utf-8')
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """
+        Десериализует JSON документ
+
+        Args:
+            data: JSON документ (str или bytes в UTF-8)
+
+        Returns:
+            Any: Десериализованные данные
+
+        Raises:
+            json.JSONDecodeError: Если документ некорректен
+        """
+        return json.loads(data)
+
+
+class OrjsonBackend(JsonBackend):
+    """orjson (запись с OPT_INDENT_2 и удвоением отступов)"""
+
+    name = 'orjson'
+
+    def dumps(self, data: Any) -> bytes:
+        if not _is_portable(data, True):
+            return super().dumps(data)
+        return _double_indent(orjson.dumps(data, option=orjson.OPT_INDENT_2), False)
+
+    def dumps_element(self, data: Any) -> bytes:
+        if not _is_portable(data, True):
+            return super().dumps_element(data)
+        return _double_indent(orjson.dumps(data, option=orjson.OPT_INDENT_2), True)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return super().loads(data)
+
+
+class UjsonBackend(JsonBackend):
+    """ujson (числа с плавающей точкой записываются стандартным модулем)"""
+
+    name = 'ujson'
+
+    def _dumps_text(self, data: Any) -> str:
+        return ujson.dumps(data, indent=4, ensure_ascii=False, escape_forward_slashes=False)
+
+    def dumps(self, data: Any) -> bytes:
+        if not _is_portable(data, False):
+            return super().dumps(data)
+        return self._dumps_text(data).encode('utf-8')
+
+    def dumps_element(self, data: Any) -> bytes:
+        if not _is_portable(data, False):
+            return super().dumps_element(data)
+        return self._dumps_text(data).replace('\n', '\n    ').encode('utf-8')
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return ujson.loads(data)
+        except ValueError:
+            return super().loads(data)
+
+
+def _is_compatible(backend: JsonBackend) -> bool:
+    """Сверяет вывод и чтение реализации со стандартным модулем на контрольном документе"""
+    reference = JsonBackend()
+    try:
+        probe = backend.dumps(_PROBE)
+        return (probe == reference.dumps(_PROBE)
+                and backend.dumps_element(_PROBE[0]) == reference.dumps_element(_PROBE[0])
+                and backend.loads(probe) == _PROBE)
+    except Exception:
+        return False
+
+
+def _detect_backends() -> Dict[str, JsonBackend]:
+    backends: Dict[str, JsonBackend] = {}
+    if orjson is not None:
+        backends['orjson'] = OrjsonBackend()
+    if ujson is not None:
+        backends['ujson'] = UjsonBackend()
+    backends = {name: backend for name, backend in backends.items() if _is_compatible(backend)}
+    backends['json'] = JsonBackend()
+    return backends
+
+
+# Доступные реализации в порядке предпочтения
+_BACKENDS = _detect_backends()
+
+
+def available_backends() -> List[str]:
+    """
+    Возвращает имена доступных реализаций JSON в порядке предпочтения
+
+    Returns:
+        List[str]: Имена реализаций (последняя - стандартный модуль json)
+    """
+    return list(_BACKENDS)
+
+
+def get_backend(name: Optional[str] = None) -> JsonBackend:
+    """
+    Возвращает реализацию JSON
+
+    Args:
+        name (str, optional): Имя реализации ('orjson', 'ujson', 'json');
+            если не указано - самая быстрая из доступных
+
+    Returns:
+        JsonBackend: Реализация JSON
+
+    Raises:
+        ValueError: Если реализация не установлена или несовместима
+    """
+    if name is None:
+        return next(iter(_BACKENDS.values()))
+    if name not in _BACKENDS:
+        raise ValueError(f"Реализация JSON '{name}' недоступна. Доступны: {', '.join(_BACKENDS)}")
+    return _BACKENDS[name]
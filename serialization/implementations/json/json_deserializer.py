@@ -1,10 +1,132 @@
+import io
 import json
-from typing import Any
+import os
+import re
+from typing import Any, BinaryIO, Iterator, Optional, TextIO
 from serialization.interfaces.IDeserializer import IDeserializer
 from serialization.serialization_exceptions import DeserializationError
+from serialization.implementations.json.json_backend import get_backend
+
+# Размер порции чтения файла при потоковой десериализации (символов)
+_CHUNK_SIZE = 64 * 1024
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_NUMBER_CHARS = frozenset('0123456789.eE+-')
+
+
+class _JsonArrayStream:
+    """
+    Инкрементальный разбор JSON массива из файла: элементы верхнего уровня
+    декодируются по одному, в буфере хранится только еще не разобранная часть.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int = _CHUNK_SIZE):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        # Сколько символов файла уже отброшено из буфера (для сообщений об ошибках)
+        self._offset = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Дочитывает порцию файла; False - файл закончился"""
+        if self._eof:
+            return False
+        # Незавершенный крупный элемент дочитываем порциями растущего размера,
+        # чтобы повторные попытки декодирования оставались линейными
+        chunk = self._file.read(max(self._chunk_size, len(self._buffer) - self._pos))
+        if not chunk:
+            self._eof = True
+            return False
+        if self._pos:
+            self._offset += self._pos
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        self._buffer += chunk
+        return True
+
+    def _peek(self) -> Optional[str]:
+        """Пропускает пробельные символы и возвращает следующий символ (None - конец файла)"""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return None
+
+    def _decode_value(self) -> Any:
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Элемент мог оборваться на границе порции
+                if self._fill():
+                    continue
+                raise
+            # Число на границе порции могло быть прочитано не полностью ("12" из "123", "2" из "2.5")
+            if (end == len(self._buffer) or self._buffer[end] in _NUMBER_CHARS) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _error(self, message: str) -> DeserializationError:
+        return DeserializationError(f"{message} (позиция {self._offset + self._pos})")
+
+    def _expect_end(self) -> None:
+        if self._peek() is not None:
+            raise self._error("Лишние данные после JSON значения")
+
+    def items(self) -> Iterator[Any]:
+        first = self._peek()
+        if first is None:
+            return
+        if first != '[':
+            # Не массив - значение возвращается целиком
+            value = self._decode_value()
+            self._expect_end()
+            yield value
+            return
+
+        self._pos += 1
+        if self._peek() == ']':
+            self._pos += 1
+            self._expect_end()
+            return
+        while True:
+            if self._peek() is None:
+                raise self._error("Неожиданный конец JSON массива")
+            yield self._decode_value()
+            separator = self._peek()
+            self._pos += 1
+            if separator == ',':
+                continue
+            if separator == ']':
+                break
+            raise self._error("Ожидалась ',' или ']' в JSON массиве")
+        self._expect_end()
+
 
 class JsonDeserializer(IDeserializer):
-    """Реализация десериализатора для формата JSON"""
+    """
+    Реализация десериализатора для формата JSON.
+    Документы целиком читаются самой быстрой из установленных реализаций JSON
+    (orjson, ujson, стандартный json); потоковое чтение файла использует
+    инкрементальный декодер стандартного модуля.
+    """
+
+    def __init__(self, backend: Optional[str] = None):
+        """
+        Args:
+            backend (str, optional): Имя реализации JSON ('orjson', 'ujson', 'json');
+                по умолчанию выбирается автоматически
+        """
+        self._backend = get_backend(backend)
+
+    @property
+    def backend_name(self) -> str:
+        """Имя используемой реализации JSON"""
+        return self._backend.name
     
     def deserialize(self, data: str) -> Any:
         """
@@ -20,7 +142,25 @@ class JsonDeserializer(IDeserializer):
             DeserializationError: Если возникла ошибка при десериализации
         """
         try:
-            return json.loads(data)
+            return self._backend.loads(data)
+        except Exception as e:
+            raise DeserializationError(f"Ошибка десериализации из JSON: {str(e)}")
+
+    def deserialize_bytes(self, data: bytes) -> Any:
+        """
+        Десериализует JSON документ из байтов без промежуточного декодирования в строку
+        
+        Args:
+            data (bytes): JSON документ в UTF-8
+            
+        Returns:
+            Any: Десериализованные данные
+            
+        Raises:
+            DeserializationError: Если возникла ошибка при десериализации
+        """
+        try:
+            return self._backend.loads(data)
         except Exception as e:
             raise DeserializationError(f"Ошибка десериализации из JSON: {str(e)}")
 
@@ -37,8 +177,6 @@ class JsonDeserializer(IDeserializer):
         Raises:
             DeserializationError: Если возникла ошибка при чтении или десериализации
         """
-        import os
-        
         # Проверяем существование файла
         if not os.path.exists(filepath):
             return []  # Возвращаем пустой список, если файл не существует
@@ -48,9 +186,70 @@ class JsonDeserializer(IDeserializer):
             return []  # Возвращаем пустой список для пустого файла
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                return json.load(file)
+            with open(filepath, 'rb') as file:
+                content = file.read()
+            return self._backend.loads(content)
         except json.JSONDecodeError as e:
             raise DeserializationError(f"Ошибка формата JSON в файле {filepath}: {str(e)}")
         except Exception as e:
             raise DeserializationError(f"Ошибка чтения из JSON файла {filepath}: {str(e)}")
+
+    def iter_deserialize_from_file(self, filepath: str) -> Iterator[Any]:
+        """
+        Потоково читает JSON файл и возвращает элементы верхнеуровневого массива по одному.
+        Файл читается порциями, поэтому пиковый расход памяти ограничен одной записью,
+        а не размером всего файла.
+        
+        Args:
+            filepath (str): Путь к файлу для чтения
+            
+        Returns:
+            Iterator[Any]: Элементы массива (ничего, если файл не существует или пуст)
+            
+        Raises:
+            DeserializationError: Если возникла ошибка при чтении или десериализации
+        """
+        if not os.path.exists(filepath) or os.path.getsize(filepath) == 0:
+            return
+
+        try:
+            with open(filepath, 'rb') as file:
+                yield from self._iter_items(file)
+        except DeserializationError as e:
+            raise DeserializationError(f"Ошибка формата JSON в файле {filepath}: {e.message}")
+        except json.JSONDecodeError as e:
+            raise DeserializationError(f"Ошибка формата JSON в файле {filepath}: {str(e)}")
+        except Exception as e:
+            raise DeserializationError(f"Ошибка чтения из JSON файла {filepath}: {str(e)}")
+
+    def iter_deserialize_stream(self, stream: BinaryIO) -> Iterator[Any]:
+        """
+        Потоково читает JSON документ из бинарного потока (UTF-8) и возвращает
+        элементы верхнеуровневого массива по одному
+        
+        Args:
+            stream (BinaryIO): Поток для чтения
+            
+        Returns:
+            Iterator[Any]: Элементы массива (ничего, если поток пуст)
+            
+        Raises:
+            DeserializationError: Если возникла ошибка при чтении или десериализации
+        """
+        try:
+            yield from self._iter_items(stream)
+        except DeserializationError as e:
+            raise DeserializationError(f"Ошибка формата JSON в потоке: {e.message}")
+        except json.JSONDecodeError as e:
+            raise DeserializationError(f"Ошибка формата JSON в потоке: {str(e)}")
+        except Exception as e:
+            raise DeserializationError(f"Ошибка чтения JSON из потока: {str(e)}")
+
+    @staticmethod
+    def _iter_items(stream: BinaryIO) -> Iterator[Any]:
+        text = io.TextIOWrapper(stream, encoding='utf-8')
+        try:
+            yield from _JsonArrayStream(text).items()
+        finally:
+            # Поток закрывает владелец, а не обертка
+            text.detach()
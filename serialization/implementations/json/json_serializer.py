@@ -1,10 +1,29 @@
-import json
-from typing import Any
+from typing import Any, Iterable, Iterator, Optional
 from serialization.interfaces.ISerializer import ISerializer
 from serialization.serialization_exceptions import SerializationError
+from serialization.implementations.json.json_backend import get_backend
 
 class JsonSerializer(ISerializer):
-    """Реализация сериализатора для формата JSON"""
+    """
+    Реализация сериализатора для формата JSON.
+    Использует самую быструю из установленных реализаций JSON (orjson, ujson,
+    стандартный json); вывод не зависит от выбранной реализации.
+    """
+
+    file_extension = 'json'
+
+    def __init__(self, backend: Optional[str] = None):
+        """
+        Args:
+            backend (str, optional): Имя реализации JSON ('orjson', 'ujson', 'json');
+                по умолчанию выбирается автоматически
+        """
+        self._backend = get_backend(backend)
+
+    @property
+    def backend_name(self) -> str:
+        """Имя используемой реализации JSON"""
+        return self._backend.name
     
     def serialize(self, data: Any) -> str:
         """
@@ -16,11 +35,26 @@ class JsonSerializer(ISerializer):
         Returns:
             str: JSON строка
             
+        Raises:
+            SerializationError: Если возникла ошибка при сериализации
+        """
+        return self.serialize_bytes(data).decode('utf-8')
+
+    def serialize_bytes(self, data: Any) -> bytes:
+        """
+        Сериализует данные в JSON документ в кодировке UTF-8
+        
+        Args:
+            data: Данные для сериализации
+            
+        Returns:
+            bytes: JSON документ
+            
         Raises:
             SerializationError: Если возникла ошибка при сериализации
         """
         try:
-            return json.dumps(data, indent=4, ensure_ascii=False)
+            return self._backend.dumps(data)
         except Exception as e:
             raise SerializationError(f"Ошибка сериализации в JSON: {str(e)}")
 
@@ -37,7 +71,53 @@ class JsonSerializer(ISerializer):
             SerializationError: Если возникла ошибка при сериализации или записи
         """
         try:
-            with open(filepath, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=4, ensure_ascii=False)
+            if isinstance(data, list):
+                # Списки пишутся по записям, без построения всего документа в памяти
+                with open(filepath, 'wb') as file:
+                    self.serialize_to_stream(data, file)
+                return
+            content = self.serialize_bytes(data)
+            with open(filepath, 'wb') as file:
+                file.write(content)
         except Exception as e:
             raise SerializationError(f"Ошибка записи в JSON файл: {str(e)}")
+
+    def serialize_iter(self, records: Iterable[Any]) -> Iterator[str]:
+        """
+        Сериализует записи в JSON массив по одной. Результат побайтно совпадает
+        с serialize(list(records)), но в памяти находится только текущая запись.
+        
+        Args:
+            records: Записи массива (может быть генератором)
+            
+        Returns:
+            Iterator[str]: Фрагменты JSON документа
+            
+        Raises:
+            SerializationError: Если возникла ошибка при сериализации
+        """
+        for chunk in self.serialize_bytes_iter(records):
+            yield chunk.decode('utf-8')
+
+    def serialize_bytes_iter(self, records: Iterable[Any]) -> Iterator[bytes]:
+        """
+        Байтовый вариант serialize_iter: фрагменты JSON документа в UTF-8
+        
+        Args:
+            records: Записи массива (может быть генератором)
+            
+        Returns:
+            Iterator[bytes]: Фрагменты JSON документа
+            
+        Raises:
+            SerializationError: Если возникла ошибка при сериализации
+        """
+        try:
+            dumps_element = self._backend.dumps_element
+            first = True
+            for record in records:
+                yield (b'[\n    ' if first else b',\n    ') + dumps_element(record)
+                first = False
+            yield b'[]' if first else b'\n]'
+        except Exception as e:
+            raise SerializationError(f"Ошибка сериализации в JSON: {str(e)}")
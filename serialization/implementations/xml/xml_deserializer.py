@@ -1,8 +1,11 @@
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, List
+from typing import Any, BinaryIO, Dict, Iterator, List
 from serialization.interfaces.IDeserializer import IDeserializer
 from serialization.serialization_exceptions import DeserializationError
 
+# Размер порции чтения файла при потоковом разборе (байт)
+_CHUNK_SIZE = 64 * 1024
+
 class XmlDeserializer(IDeserializer):
     """Реализация десериализатора для формата XML"""
     
@@ -86,3 +89,100 @@ class XmlDeserializer(IDeserializer):
             print(f"[ОШИБКА] При чтении XML файла {filepath}: {str(e)}")
             # В случае ошибки возвращаем пустой список вместо исключения
             return []
+
+    def iter_deserialize_from_file(self, filepath: str) -> Iterator[Any]:
+        """
+        Потоково читает XML файл через iterparse и возвращает элементы <item>
+        верхнего уровня по одному. Обработанные элементы удаляются из дерева,
+        поэтому в памяти одновременно находится только одна запись.
+        
+        Args:
+            filepath (str): Путь к файлу для чтения
+            
+        Returns:
+            Iterator[Any]: Элементы списка (ничего, если файл не существует или пуст);
+                если корень содержит не список, возвращается одно значение целиком
+            
+        Raises:
+            DeserializationError: Если возникла ошибка при чтении или разборе XML
+        """
+        import os
+        if not os.path.exists(filepath) or os.path.getsize(filepath) == 0:
+            return
+
+        try:
+            with open(filepath, 'rb') as file:
+                yield from self._iter_items(file)
+        except DeserializationError as e:
+            raise DeserializationError(f"Ошибка разбора XML файла {filepath}: {e.message}")
+        except ET.ParseError as e:
+            raise DeserializationError(f"Ошибка формата XML в файле {filepath}: {str(e)}")
+        except Exception as e:
+            raise DeserializationError(f"Ошибка чтения из XML файла {filepath}: {str(e)}")
+
+    def iter_deserialize_stream(self, stream: BinaryIO) -> Iterator[Any]:
+        """
+        Потоково читает XML документ из бинарного потока и возвращает
+        элементы <item> верхнего уровня по одному
+        
+        Args:
+            stream (BinaryIO): Поток для чтения
+            
+        Returns:
+            Iterator[Any]: Элементы списка (ничего, если поток пуст);
+                если корень содержит не список, возвращается одно значение целиком
+            
+        Raises:
+            DeserializationError: Если возникла ошибка при чтении или разборе XML
+        """
+        try:
+            yield from self._iter_items(stream)
+        except DeserializationError as e:
+            raise DeserializationError(f"Ошибка разбора XML потока: {e.message}")
+        except ET.ParseError as e:
+            raise DeserializationError(f"Ошибка формата XML в потоке: {str(e)}")
+        except Exception as e:
+            raise DeserializationError(f"Ошибка чтения XML из потока: {str(e)}")
+
+    def _iter_items(self, stream: BinaryIO) -> Iterator[Any]:
+        parser = ET.XMLPullParser(events=('start', 'end'))
+        root = None
+        depth = 0
+        streaming = None  # None - еще не ясно, список ли в корне
+        received = False
+        while True:
+            chunk = stream.read(_CHUNK_SIZE)
+            if chunk:
+                received = True
+                parser.feed(chunk)
+            elif not received:
+                # Пустой поток - пустой список
+                return
+            else:
+                # close() проверяет, что документ завершен
+                parser.close()
+            for event, element in parser.read_events():
+                if event == 'start':
+                    if root is None:
+                        root = element
+                    depth += 1
+                    continue
+                depth -= 1
+                if depth != 1:
+                    continue
+                # Закрыт дочерний элемент корня
+                if streaming is None:
+                    streaming = element.tag == 'item'
+                if not streaming:
+                    # Корень - словарь: разбираем целиком после окончания потока
+                    continue
+                if element.tag != 'item':
+                    raise DeserializationError(f"Неожиданный элемент <{element.tag}> в списке <item>")
+                yield self._xml_to_dict(element)
+                element.clear()
+                root.remove(element)
+            if not chunk:
+                break
+
+        if root is not None and streaming is False:
+            yield self._xml_to_dict(root)
@@ -1,10 +1,14 @@
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional
 from serialization.interfaces.ISerializer import ISerializer
 from serialization.serialization_exceptions import SerializationError
 
+_XML_DECLARATION = "<?xml version='1.0' encoding='utf-8'?>\n"
+
 class XmlSerializer(ISerializer):
     """Реализация сериализатора для формата XML"""
+
+    file_extension = 'xml'
     
     def _dict_to_xml(self, parent: ET.Element, data: Any) -> None:
         """
@@ -65,9 +69,58 @@ class XmlSerializer(ISerializer):
             SerializationError: Если возникла ошибка при сериализации или записи
         """
         try:
+            if isinstance(data, list):
+                # Списки пишутся по элементам <item>, без построения всего дерева
+                with open(filepath, 'wb') as file:
+                    self.serialize_to_stream(data, file)
+                return
             root = ET.Element('root')
             self._dict_to_xml(root, data)
             tree = ET.ElementTree(root)
             tree.write(filepath, encoding='utf-8', xml_declaration=True)
         except Exception as e:
             raise SerializationError(f"Ошибка записи в XML файл: {str(e)}")
+
+    def serialize_iter(self, records: Iterable[Any]) -> Iterator[str]:
+        """
+        Сериализует записи в XML по одному элементу <item>. Результат совпадает
+        с serialize(list(records)), но дерево строится только для текущей записи.
+        
+        Args:
+            records: Записи списка (может быть генератором)
+            
+        Returns:
+            Iterator[str]: Фрагменты XML документа
+            
+        Raises:
+            SerializationError: Если возникла ошибка при сериализации
+        """
+        try:
+            first = True
+            for record in records:
+                item = ET.Element('item')
+                if isinstance(record, (dict, list)):
+                    self._dict_to_xml(item, record)
+                else:
+                    item.text = str(record)
+                text = ET.tostring(item, encoding='unicode', method='xml')
+                yield '<root>' + text if first else text
+                first = False
+            yield '<root />' if first else '</root>'
+        except Exception as e:
+            raise SerializationError(f"Ошибка сериализации в XML: {str(e)}")
+
+    def serialize_to_stream(self, records: Iterable[Any], stream: BinaryIO) -> None:
+        """
+        Сериализует записи и пишет их в бинарный поток в кодировке UTF-8
+        с XML декларацией, как serialize_to_file.
+        
+        Args:
+            records: Записи списка (может быть генератором)
+            stream: Поток для записи
+            
+        Raises:
+            SerializationError: Если возникла ошибка при сериализации
+        """
+        stream.write(_XML_DECLARATION.encode('utf-8'))
+        super().serialize_to_stream(records, stream)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, BinaryIO, Iterator
 
 class IDeserializer(ABC):
     """Базовый интерфейс для десериализации данных"""
@@ -35,3 +35,67 @@ class IDeserializer(ABC):
             DeserializationError: Если возникла ошибка при чтении или десериализации
         """
         pass
+
+    def iter_deserialize_from_file(self, filepath: str) -> Iterator[Any]:
+        """
+        Читает файл и возвращает элементы верхнеуровневого списка по одному.
+        Реализация по умолчанию загружает файл целиком через deserialize_from_file;
+        потоковые десериализаторы переопределяют метод, чтобы в памяти
+        находилась только одна запись.
+        
+        Args:
+            filepath (str): Путь к файлу для чтения
+            
+        Returns:
+            Iterator[Any]: Элементы списка (или единственное значение, если в файле не список)
+            
+        Raises:
+            DeserializationError: Если возникла ошибка при чтении или десериализации
+        """
+        data = self.deserialize_from_file(filepath)
+        if isinstance(data, list):
+            yield from data
+        elif data:
+            yield data
+
+    def iter_deserialize_stream(self, stream: BinaryIO) -> Iterator[Any]:
+        """
+        Читает бинарный поток (например, распаковываемый файл) и возвращает
+        элементы верхнеуровневого списка по одному. Реализация по умолчанию
+        читает поток целиком и вызывает deserialize_bytes; потоковые
+        десериализаторы переопределяют метод.
+        
+        Args:
+            stream (BinaryIO): Поток для чтения
+            
+        Returns:
+            Iterator[Any]: Элементы списка (или единственное значение, если в потоке не список)
+            
+        Raises:
+            DeserializationError: Если возникла ошибка при чтении или десериализации
+        """
+        content = stream.read()
+        if not content:
+            return
+        data = self.deserialize_bytes(content)
+        if isinstance(data, list):
+            yield from data
+        elif data:
+            yield data
+
+    def deserialize_bytes(self, data: bytes) -> Any:
+        """
+        Десериализует данные из байтов (например, скачанного объекта хранилища).
+        По умолчанию декодирует UTF-8 и вызывает deserialize; бинарные форматы
+        переопределяют метод.
+        
+        Args:
+            data (bytes): Данные для десериализации
+            
+        Returns:
+            Any: Десериализованные данные
+            
+        Raises:
+            DeserializationError: Если возникла ошибка при десериализации
+        """
+        return self.deserialize(data.decode('utf-8'))
@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, BinaryIO, Iterable, Iterator, Optional
 
 class ISerializer(ABC):
     """Базовый интерфейс для сериализации данных"""
+
+    # Расширение файлов/объектов формата (None - не задано плагином)
+    file_extension: Optional[str] = None
+    # Значение Content-Encoding для сохраненных данных (None - данные не сжаты)
+    content_encoding: Optional[str] = None
     
     @abstractmethod
     def serialize(self, data: Any) -> str:
@@ -34,3 +39,68 @@ class ISerializer(ABC):
             SerializationError: Если возникла ошибка при сериализации или записи
         """
         pass
+
+    def serialize_iter(self, records: Iterable[Any]) -> Iterator[str]:
+        """
+        Сериализует список записей по частям: каждая часть соответствует
+        одной записи (плюс обрамление документа). Реализация по умолчанию
+        собирает записи в список и возвращает результат serialize одной частью;
+        потоковые сериализаторы переопределяют метод.
+        
+        Args:
+            records: Записи верхнеуровневого списка (может быть генератором)
+            
+        Returns:
+            Iterator[str]: Фрагменты документа, совпадающего с serialize(list(records))
+            
+        Raises:
+            SerializationError: Если возникла ошибка при сериализации
+        """
+        yield self.serialize(list(records))
+
+    def serialize_to_stream(self, records: Iterable[Any], stream: BinaryIO) -> None:
+        """
+        Сериализует записи и по мере готовности пишет их в бинарный поток (UTF-8).
+        
+        Args:
+            records: Записи верхнеуровневого списка (может быть генератором)
+            stream: Поток для записи (файл, буфер загрузки)
+            
+        Raises:
+            SerializationError: Если возникла ошибка при сериализации
+        """
+        for chunk in self.serialize_bytes_iter(records):
+            stream.write(chunk)
+
+    def serialize_bytes(self, data: Any) -> bytes:
+        """
+        Сериализует данные в байты. По умолчанию - результат serialize в UTF-8;
+        бинарные форматы переопределяют метод.
+        
+        Args:
+            data: Данные для сериализации
+            
+        Returns:
+            bytes: Сериализованные данные
+            
+        Raises:
+            SerializationError: Если возникла ошибка при сериализации
+        """
+        return self.serialize(data).encode('utf-8')
+
+    def serialize_bytes_iter(self, records: Iterable[Any]) -> Iterator[bytes]:
+        """
+        Сериализует список записей по частям в байтах (для записи в файл
+        или потоковой загрузки). По умолчанию кодирует части serialize_iter в UTF-8.
+        
+        Args:
+            records: Записи верхнеуровневого списка (может быть генератором)
+            
+        Returns:
+            Iterator[bytes]: Фрагменты документа
+            
+        Raises:
+            SerializationError: Если возникла ошибка при сериализации
+        """
+        for chunk in self.serialize_iter(records):
+            yield chunk.encode('utf-8')
@@ -6,14 +6,19 @@ setup(
     packages=find_packages(),
     install_requires=[
         'lxml>=4.9.0',  # для XML сериализации
-    ],    entry_points={
+    ],
+    extras_require={
+        'fast-json': ['orjson>=3.6'],  # ускоренная реализация JSON
+    },    entry_points={
         'gallery.serialization': [
             'json = serialization.implementations.json.json_serializer:JsonSerializer',
             'xml = serialization.implementations.xml.xml_serializer:XmlSerializer',
+            'binary = serialization.implementations.binary.binary_serializer:BinarySerializer',
         ],
         'gallery.deserialization': [
             'json = serialization.implementations.json.json_deserializer:JsonDeserializer',
             'xml = serialization.implementations.xml.xml_deserializer:XmlDeserializer',
+            'binary = serialization.implementations.binary.binary_deserializer:BinaryDeserializer',
         ],
     },
     python_requires='>=3.8',
@@ -22,7 +27,7 @@ setup(
     description="Плагин сериализации для системы управления художественной галереей",
     long_description=open('README.md').read() if open('README.md') else "",
     long_description_content_type="text/markdown",
-    keywords="serialization, json, xml, gallery",
+    keywords="serialization, json, xml, binary, gallery",
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",